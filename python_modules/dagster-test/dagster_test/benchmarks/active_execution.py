@@ -0,0 +1,167 @@
+# ruff: noqa: T201
+import argparse
+import time
+from collections import deque
+from typing import Deque, List
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Time how long `ActiveExecution` takes to schedule every step of plans with 10k+ steps, without
+executing any of them.
+
+Each plan fans out a `DynamicOut` to a chain of mapped steps, which are then collected, so almost
+all of its steps are only known once the dynamic output is resolved. Steps are completed one at a
+time while keeping `--max-concurrent` steps in flight, the way the multiprocess executor drives the
+active execution.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    nargs="+",
+    default=[10_000, 50_000, 100_000],
+    help="Set the approximate number of steps in each plan.",
+)
+
+parser.add_argument(
+    "--chain-length",
+    type=int,
+    default=2,
+    help="Set the number of mapped steps downstream of each dynamic output.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=16,
+    help="Set the maximum number of steps in flight.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def define_fan_out_job(num_mapped: int, chain_length: int) -> JobDefinition:
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(num_mapped):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def process(x):
+        return x
+
+    @op
+    def collect(xs):
+        return sum(xs)
+
+    @job
+    def fan_out_job():
+        mapped = emit()
+        for _ in range(chain_length):
+            mapped = mapped.map(process)
+        collect(mapped.collect())
+
+    return fan_out_job
+
+
+def output_event(job_name: str, step_key: str, mapping_key=None) -> DagsterEvent:
+    handle = StepOutputHandle(step_key, "result", mapping_key)
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        job_name=job_name,
+        step_key=step_key,
+        event_specific_data=StepOutputData(step_output_handle=handle),
+    )
+
+
+def success_event(job_name: str, step_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        job_name=job_name,
+        step_key=step_key,
+        event_specific_data=StepSuccessData(duration_ms=1.0),
+    )
+
+
+def drive_execution(job_def: JobDefinition, num_mapped: int, max_concurrent: int) -> int:
+    """Complete every step of the plan, returning the number of steps that were executed."""
+    num_executed = 0
+    in_flight: Deque[str] = deque()
+    with create_execution_plan(job_def).start(
+        RetryMode.DISABLED, max_concurrent=max_concurrent
+    ) as active_execution:
+        while True:
+            # dynamic outputs are only resolved when the next steps are requested, so this needs to
+            # happen before checking whether the plan is complete
+            for step in active_execution.get_steps_to_execute():
+                in_flight.append(step.key)
+                num_executed += 1
+
+            if not in_flight:
+                break
+
+            step_key = in_flight.popleft()
+            if step_key == "emit":
+                for i in range(num_mapped):
+                    active_execution.handle_event(output_event(job_def.name, step_key, str(i)))
+            else:
+                active_execution.handle_event(output_event(job_def.name, step_key))
+            active_execution.handle_event(success_event(job_def.name, step_key))
+
+    return num_executed
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: List[int], chain_length: int, max_concurrent: int) -> None:
+    session = ProfilingSession(
+        name="Active execution",
+        experiment_settings={
+            "num_steps": num_steps,
+            "chain_length": chain_length,
+            "max_concurrent": max_concurrent,
+        },
+    ).start()
+    session.log_start_message()
+
+    results = []
+    for total in num_steps:
+        num_mapped = max(total // chain_length, 1)
+        job_def = define_fan_out_job(num_mapped, chain_length)
+        with session.logged_execution_time(f"{total} steps"):
+            start = time.perf_counter()
+            num_executed = drive_execution(job_def, num_mapped, max_concurrent)
+            elapsed = time.perf_counter() - start
+
+        assert num_executed == num_mapped * chain_length + 2
+        results.append(
+            f"{num_executed} steps: {elapsed:.2f}s ({elapsed / num_executed * 1e6:.1f}us per step)"
+        )
+
+    session.log_result_summary()
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.chain_length, args.max_concurrent)
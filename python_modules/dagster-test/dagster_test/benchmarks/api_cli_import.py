@@ -0,0 +1,87 @@
+# ruff: noqa: T201
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how long it takes to import the `dagster api` CLI commands, on top of `import dagster`.
+
+`dagster api execute_run` / `execute_step` are launched once per run or step, so their import time
+is paid on every run and step launch. Each iteration imports the CLI in a fresh interpreter with
+`-X importtime`, and sums the cumulative import time of the top-level imports that come after
+`import dagster`. The import of the api commands used to take ~900ms, and ~200ms once the other CLI
+commands were loaded lazily.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="api_cli_import",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=10,
+    help="Set the number of fresh interpreters that import the api CLI.",
+)
+
+API_CLI_IMPORT = "import dagster; from dagster._cli import cli; cli.get_command(None, 'api')"
+
+
+def cumulative_import_ms_after(import_profile: str, module: str) -> float:
+    """Sums the cumulative import time, in milliseconds, of the top-level imports in an
+    `-X importtime` profile that come after the import of the given module.
+    """
+    top_level_imports = []
+    for line in import_profile.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, imported_module = line.split("|")
+        # nested imports are indented below the module that imports them
+        if cumulative_us.strip().isdigit() and not imported_module.startswith("  "):
+            top_level_imports.append((imported_module.strip(), int(cumulative_us)))
+
+    names = [name for name, _ in top_level_imports]
+    return sum(us for _, us in top_level_imports[names.index(module) + 1 :]) / 1000
+
+
+def measure_api_cli_import_ms() -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", API_CLI_IMPORT],
+        check=True,
+        capture_output=True,
+    )
+    return cumulative_import_ms_after(result.stderr.decode("utf-8"), "dagster")
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="api CLI import",
+        experiment_settings={"num_iterations": num_iterations},
+    ).start()
+    session.log_start_message()
+
+    import_ms: List[float] = []
+    with session.logged_execution_time(f"Import the api CLI {num_iterations} times"):
+        for _ in range(num_iterations):
+            import_ms.append(measure_api_cli_import_ms())
+
+    session.log_result_summary()
+    print(
+        f"api CLI import after `import dagster`: median {statistics.median(import_ms):.0f}ms,"
+        f" min {min(import_ms):.0f}ms, max {max(import_ms):.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_iterations)
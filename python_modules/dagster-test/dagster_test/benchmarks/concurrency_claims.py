@@ -0,0 +1,179 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Tuple
+
+import sqlalchemy as db
+from dagster import job, op
+from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the number of database queries (and the execution time) required for runs to get all of
+their steps through a shared global op concurrency pool, when each step claims its slot on its own
+through `InstanceConcurrencyContext.claim` against claiming slots for all of the runnable steps at
+once through `InstanceConcurrencyContext.claim_batch`.
+
+Each run drives its steps the way `ActiveExecution` does: every tick it tries to claim slots for
+all of its unlaunched steps, and frees the slot of each step once it has "run" for
+`--step-duration` seconds. Runs execute concurrently in threads and contend for the same pool.
+Queries are counted by listening for SQLAlchemy `before_cursor_execute` events.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="concurrency_claims",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=2000,
+    help="Set the number of concurrency limited steps in each run.",
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    default=1,
+    help="Set the number of runs that contend for the pool at the same time.",
+)
+
+parser.add_argument(
+    "--num-slots",
+    type=int,
+    default=50,
+    help="Set the number of slots in the pool.",
+)
+
+parser.add_argument(
+    "--step-duration",
+    type=float,
+    default=0.01,
+    help="Set how long each step holds its slot, in seconds.",
+)
+
+CONCURRENCY_KEY = "benchmark_pool"
+TICK_INTERVAL = 0.005
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *_args) -> None:
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+def drive_run(instance: DagsterInstance, num_steps: int, step_duration: float, batched: bool):
+    run = instance.create_run_for_job(noop_job, run_id=make_new_run_id())
+    unlaunched: Dict[str, None] = {f"step_{i}": None for i in range(num_steps)}
+    running: Deque[Tuple[float, str]] = deque()
+
+    with InstanceConcurrencyContext(instance, run) as context:
+        while unlaunched or running:
+            now = time.perf_counter()
+            while running and running[0][0] <= now:
+                _, step_key = running.popleft()
+                context.free_step(step_key)
+
+            if batched:
+                context.claim_batch([(CONCURRENCY_KEY, step_key, 0) for step_key in unlaunched])
+
+            launched: List[str] = [
+                step_key for step_key in unlaunched if context.claim(CONCURRENCY_KEY, step_key)
+            ]
+            for step_key in launched:
+                del unlaunched[step_key]
+                running.append((now + step_duration, step_key))
+
+            time.sleep(TICK_INTERVAL)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: int, num_runs: int, num_slots: int, step_duration: float) -> None:
+    query_counter = QueryCounter()
+    db.event.listen(db.engine.Engine, "before_cursor_execute", query_counter)
+
+    session = ProfilingSession(
+        name="Concurrency claims",
+        experiment_settings={
+            "num_steps": num_steps,
+            "num_runs": num_runs,
+            "num_slots": num_slots,
+            "step_duration": step_duration,
+        },
+    ).start()
+    session.log_start_message()
+
+    queries = {}
+    try:
+        for mode in ["claim", "claim_batch"]:
+            with tempfile.TemporaryDirectory() as base_dir, instance_for_test(
+                overrides={
+                    "event_log_storage": {
+                        "module": "dagster.utils.test",
+                        "class": "ConcurrencyEnabledSqliteTestEventLogStorage",
+                        "config": {"base_dir": base_dir},
+                    },
+                }
+            ) as instance:
+                instance.event_log_storage.set_concurrency_slots(CONCURRENCY_KEY, num_slots)
+                query_counter.reset()
+                with session.logged_execution_time(
+                    f"Run {num_runs} x {num_steps} steps with `{mode}`"
+                ):
+                    with ThreadPoolExecutor(max_workers=num_runs) as executor:
+                        futures = [
+                            executor.submit(
+                                drive_run,
+                                instance,
+                                num_steps,
+                                step_duration,
+                                mode == "claim_batch",
+                            )
+                            for _ in range(num_runs)
+                        ]
+                        for future in futures:
+                            future.result()
+                queries[mode] = query_counter.count
+    finally:
+        db.event.remove(db.engine.Engine, "before_cursor_execute", query_counter)
+
+    session.log_result_summary()
+    total_steps = num_steps * num_runs
+    for mode, count in queries.items():
+        print(f"{mode}: {count} queries, {count / total_steps:.1f} queries per step")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.num_runs, args.num_slots, args.step_duration)
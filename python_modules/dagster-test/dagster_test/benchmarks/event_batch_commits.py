@@ -0,0 +1,184 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from typing import Any, List, Mapping, Sequence
+
+import sqlalchemy as db
+from dagster import AssetKey, AssetMaterialization
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.storage.event_log import SqlEventLogStorage
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the number of database commits (and the execution time) required to store asset
+materializations one at a time through `store_event` against storing them in batches through
+`store_event_batch`.
+
+N partitioned materializations are stored for each of K assets, with a `dagster/partition/*` tag
+on each materialization so that `asset_event_tags` rows are written as well. Commits are counted
+by listening for SQLAlchemy `commit` events on the storage's engines.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_batch_commits",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=1000,
+    help="Set the number of materialized partitions per asset.",
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=5,
+    help="Set the number of materialized assets.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=100,
+    help="Set the number of events passed to each `store_event_batch` call.",
+)
+
+parser.add_argument(
+    "--storage",
+    choices=["sqlite", "consolidated_sqlite"],
+    default="consolidated_sqlite",
+    help="Select the event log storage to benchmark.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+class CommitCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, _conn) -> None:
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+def build_materialization_events(
+    run_id: str, num_assets: int, num_partitions: int
+) -> List[EventLogEntry]:
+    events = []
+    for asset_index in range(num_assets):
+        asset_key = AssetKey(f"asset_{asset_index}")
+        for partition_index in range(num_partitions):
+            partition = f"partition_{partition_index}"
+            materialization = AssetMaterialization(
+                asset_key=asset_key,
+                partition=partition,
+                tags={"dagster/partition/benchmark": partition},
+            )
+            events.append(
+                EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message="",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        "nonce",
+                        event_specific_data=StepMaterializationData(materialization),
+                    ),
+                )
+            )
+    return events
+
+
+def _chunks(events: Sequence[EventLogEntry], size: int) -> List[Sequence[EventLogEntry]]:
+    return [events[i : i + size] for i in range(0, len(events), size)]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_partitions: int, num_assets: int, batch_size: int, storage_type: str) -> None:
+    with tempfile.TemporaryDirectory() as base_dir:
+        overrides = (
+            {
+                "event_log_storage": {
+                    "module": "dagster._core.storage.event_log",
+                    "class": "ConsolidatedSqliteEventLogStorage",
+                    "config": {"base_dir": base_dir},
+                }
+            }
+            if storage_type == "consolidated_sqlite"
+            else {}
+        )
+        run_benchmark(num_partitions, num_assets, batch_size, storage_type, overrides)
+
+
+def run_benchmark(
+    num_partitions: int,
+    num_assets: int,
+    batch_size: int,
+    storage_type: str,
+    overrides: Mapping[str, Any],
+) -> None:
+    num_events = num_partitions * num_assets
+    commit_counter = CommitCounter()
+    db.event.listen(db.engine.Engine, "commit", commit_counter)
+
+    session = ProfilingSession(
+        name="Event batch commits",
+        experiment_settings={
+            "num_partitions": num_partitions,
+            "num_assets": num_assets,
+            "batch_size": batch_size,
+            "storage": storage_type,
+        },
+    ).start()
+    session.log_start_message()
+
+    commits = {}
+    try:
+        with instance_for_test(overrides=overrides) as instance:
+            storage = instance.event_log_storage
+            assert isinstance(storage, SqlEventLogStorage)
+
+            events = build_materialization_events(make_new_run_id(), num_assets, num_partitions)
+            commit_counter.reset()
+            with session.logged_execution_time(f"Store {num_events} events with `store_event`"):
+                for event in events:
+                    storage.store_event(event)
+            commits["store_event"] = commit_counter.count
+
+            events = build_materialization_events(make_new_run_id(), num_assets, num_partitions)
+            commit_counter.reset()
+            with session.logged_execution_time(
+                f"Store {num_events} events with `store_event_batch`"
+            ):
+                for batch in _chunks(events, batch_size):
+                    storage.store_event_batch(batch)
+            commits["store_event_batch"] = commit_counter.count
+    finally:
+        db.event.remove(db.engine.Engine, "commit", commit_counter)
+
+    session.log_result_summary()
+    for method, count in commits.items():
+        print(f"{method}: {count} commits, {count / num_events:.3f} commits per materialization")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.num_assets, args.batch_size, args.storage)
@@ -0,0 +1,171 @@
+# ruff: noqa: T201
+import argparse
+import time
+import zlib
+from typing import Callable, Dict, Tuple, TypeVar
+
+from dagster import (
+    AssetExecutionContext,
+    Definitions,
+    StaticPartitionsDefinition,
+    asset,
+    define_asset_job,
+)
+from dagster._core.remote_representation.external_data import external_repository_data_from_def
+from dagster._serdes import (
+    deserialize_value,
+    deserialize_value_from_binary,
+    serialize_value,
+    serialize_value_to_binary,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the JSON and binary serdes formats on the payloads that dominate code location loads and
+run launches: the `ExternalRepositoryData` of a synthetic repository and the `JobSnapshot` of each
+of its jobs.
+
+The repository has N partitioned assets, each depending on the few assets defined before it, and
+one asset job for every `--assets-per-job` assets. For each payload, the best serialize and
+deserialize times over K iterations are reported along with the raw and zlib-compressed sizes.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes_formats",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=300,
+    help="Set the number of assets in the repository.",
+)
+
+parser.add_argument(
+    "--assets-per-job",
+    type=int,
+    default=30,
+    help="Set the number of assets selected by each asset job.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=10,
+    help="Set the number of times each payload is serialized and deserialized.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+T = TypeVar("T")
+
+
+def build_definitions(num_assets: int, assets_per_job: int) -> Definitions:
+    partitions_def = StaticPartitionsDefinition([f"partition_{i}" for i in range(20)])
+
+    def make_asset(index: int):
+        @asset(
+            name=f"asset_{index}",
+            deps=[f"asset_{j}" for j in range(max(0, index - 3), index)],
+            partitions_def=partitions_def,
+            group_name=f"group_{index % 10}",
+            description=f"Asset number {index}",
+            metadata={"owner": "team", "index": index},
+        )
+        def _asset(context: AssetExecutionContext):
+            return index
+
+        return _asset
+
+    return Definitions(
+        assets=[make_asset(i) for i in range(num_assets)],
+        jobs=[
+            define_asset_job(
+                f"job_{start}",
+                selection=[
+                    f"asset_{i}" for i in range(start, min(start + assets_per_job, num_assets))
+                ],
+            )
+            for start in range(0, num_assets, assets_per_job)
+        ],
+    )
+
+
+def best_time(fn: Callable[[], T], num_iterations: int) -> Tuple[float, T]:
+    best = float("inf")
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def compare_formats(name: str, val: object, num_iterations: int) -> Dict[str, str]:
+    json_ser_time, json_str = best_time(lambda: serialize_value(val), num_iterations)
+    binary_ser_time, binary_bytes = best_time(
+        lambda: serialize_value_to_binary(val), num_iterations
+    )
+    json_de_time, json_val = best_time(lambda: deserialize_value(json_str), num_iterations)
+    binary_de_time, binary_val = best_time(
+        lambda: deserialize_value_from_binary(binary_bytes), num_iterations
+    )
+    assert json_val == binary_val, f"{name}: formats deserialized to different values"
+
+    json_bytes = json_str.encode("utf-8")
+    return {
+        "payload": name,
+        "json serialize": f"{json_ser_time * 1000:.2f}ms",
+        "binary serialize": f"{binary_ser_time * 1000:.2f}ms",
+        "json deserialize": f"{json_de_time * 1000:.2f}ms",
+        "binary deserialize": f"{binary_de_time * 1000:.2f}ms",
+        "json size": f"{len(json_bytes)} ({len(zlib.compress(json_bytes))} compressed)",
+        "binary size": f"{len(binary_bytes)} ({len(zlib.compress(binary_bytes))} compressed)",
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, assets_per_job: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Serdes formats",
+        experiment_settings={
+            "num_assets": num_assets,
+            "assets_per_job": assets_per_job,
+            "num_iterations": num_iterations,
+        },
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build repository definitions"):
+        repo_def = build_definitions(num_assets, assets_per_job).get_repository_def()
+    with session.logged_execution_time("Build external repository data"):
+        external_repository_data = external_repository_data_from_def(repo_def)
+
+    results = []
+    with session.logged_execution_time("Compare formats for ExternalRepositoryData"):
+        results.append(
+            compare_formats("ExternalRepositoryData", external_repository_data, num_iterations)
+        )
+    with session.logged_execution_time("Compare formats for JobSnapshots"):
+        for job_def in repo_def.get_all_jobs():
+            results.append(
+                compare_formats(
+                    f"JobSnapshot[{job_def.name}]", job_def.get_job_snapshot(), num_iterations
+                )
+            )
+
+    session.log_result_summary()
+    for result in results:
+        print(", ".join(f"{key}: {value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.assets_per_job, args.num_iterations)
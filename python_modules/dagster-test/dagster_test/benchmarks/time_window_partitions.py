@@ -0,0 +1,177 @@
+# ruff: noqa: T201
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+from dagster import TimeWindowPartitionsDefinition
+from dagster._time import create_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Time the `TimeWindowPartitionsDefinition` operations that backfills and the asset daemon rely on,
+for partitions definitions with 100k+ partitions.
+
+Each partitions definition is timed twice: once with a cron schedule that repeats with a fixed
+period (e.g. `0 * * * *`), which uses closed-form index arithmetic, and once with an equivalent
+cron schedule that is not recognized as fixed-period (e.g. `0 0-23 * * *`), which iterates the cron
+schedule. Both produce the same partitions, so the results are also checked for equality.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-keys",
+    type=int,
+    default=1000,
+    help="Set the number of random partition keys used by the per-key operations.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=3,
+    help="Set the number of times each operation is run.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+T = TypeVar("T")
+
+CURRENT_TIME = create_datetime(2024, 1, 1)
+
+# (name, fixed-period cron schedule, equivalent cron schedule, start, fmt, timezone)
+PARTITIONS_DEFS = [
+    (
+        "every 5 minutes, 2 years",
+        "*/5 * * * *",
+        "0-55/5 * * * *",
+        "2022-01-01-00:00",
+        "%Y-%m-%d-%H:%M",
+        "UTC",
+    ),
+    ("hourly, 15 years", "0 * * * *", "0 0-23 * * *", "2009-01-01-00:00", "%Y-%m-%d-%H:%M", "UTC"),
+    ("daily, 300 years", "0 0 * * *", "0 0 1-31 * *", "1724-01-01", "%Y-%m-%d", "UTC"),
+    (
+        "daily, 20 years, DST",
+        "0 6 * * *",
+        "0 6 1-31 * *",
+        "2004-01-01",
+        "%Y-%m-%d",
+        "America/New_York",
+    ),
+]
+
+
+def clear_caches() -> None:
+    # equal partitions definitions share the results cached by these methods
+    for method in (
+        TimeWindowPartitionsDefinition.time_window_for_partition_key,
+        TimeWindowPartitionsDefinition.time_windows_for_partition_keys,
+        TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+        TimeWindowPartitionsDefinition._get_first_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_last_partition_window,  # noqa: SLF001
+    ):
+        method.cache_clear()
+
+
+def best_time(
+    new_partitions_def: Callable[[], TimeWindowPartitionsDefinition],
+    operation: Callable[[TimeWindowPartitionsDefinition], T],
+    num_iterations: int,
+) -> Tuple[float, T]:
+    best = float("inf")
+    for _ in range(num_iterations):
+        clear_caches()
+        start = time.perf_counter()
+        result = operation(new_partitions_def())
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def time_operations(
+    cron_schedule: str,
+    start: str,
+    fmt: str,
+    timezone: str,
+    num_partitions: int,
+    keys: List[str],
+    num_iterations: int,
+) -> Dict[str, Tuple[float, object]]:
+    def new_partitions_def() -> TimeWindowPartitionsDefinition:
+        return TimeWindowPartitionsDefinition(
+            cron_schedule=cron_schedule, start=start, fmt=fmt, timezone=timezone, end_offset=1
+        )
+
+    operations: Dict[str, Callable[[TimeWindowPartitionsDefinition], object]] = {
+        "get_num_partitions": lambda pd: pd.get_num_partitions(CURRENT_TIME),
+        "get_partition_keys": lambda pd: pd.get_partition_keys(CURRENT_TIME),
+        "get_partition_keys_between_indexes (last 100)": lambda pd: (
+            pd.get_partition_keys_between_indexes(
+                num_partitions - 100, num_partitions, CURRENT_TIME
+            )
+        ),
+        "has_partition_key": lambda pd: [pd.has_partition_key(key, CURRENT_TIME) for key in keys],
+        "time_windows_for_partition_keys": lambda pd: (
+            pd.time_windows_for_partition_keys(frozenset(keys), validate=False)
+        ),
+        "time_window_for_partition_key": lambda pd: [
+            pd.time_window_for_partition_key(key) for key in keys
+        ],
+    }
+    return {
+        name: best_time(new_partitions_def, operation, num_iterations)
+        for name, operation in operations.items()
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_keys: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Time window partitions",
+        experiment_settings={"num_keys": num_keys, "num_iterations": num_iterations},
+    ).start()
+    session.log_start_message()
+
+    results = []
+    for name, fixed_cron, equivalent_cron, start, fmt, timezone in PARTITIONS_DEFS:
+        all_keys = TimeWindowPartitionsDefinition(
+            cron_schedule=fixed_cron, start=start, fmt=fmt, timezone=timezone, end_offset=1
+        ).get_partition_keys(CURRENT_TIME)
+        keys = random.Random(0).sample(all_keys, min(num_keys, len(all_keys)))
+
+        with session.logged_execution_time(f"{name} ({len(all_keys)} partitions)"):
+            fixed = time_operations(
+                fixed_cron, start, fmt, timezone, len(all_keys), keys, num_iterations
+            )
+            iterated = time_operations(
+                equivalent_cron, start, fmt, timezone, len(all_keys), keys, num_iterations
+            )
+
+        for operation, (fixed_time, fixed_result) in fixed.items():
+            iterated_time, iterated_result = iterated[operation]
+            assert fixed_result == iterated_result, f"{name}: {operation} results differ"
+            results.append(
+                f"{name}, {operation}: {fixed_time * 1000:.2f}ms fixed-period,"
+                f" {iterated_time * 1000:.2f}ms cron iteration"
+                f" ({iterated_time / max(fixed_time, 1e-9):.1f}x)"
+            )
+
+    session.log_result_summary()
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_keys, args.num_iterations)
@@ -6,6 +6,7 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from starlette.applications import Starlette
 
+from dagster_webserver.graphql_response_cache import GraphQLResponseCache
 from dagster_webserver.webserver import DagsterWebserver
 
 
@@ -13,12 +14,15 @@ def create_app_from_workspace_process_context(
     workspace_process_context: IWorkspaceProcessContext,
     path_prefix: str = "",
     live_data_poll_rate: Optional[int] = None,
+    graphql_response_cache_size: int = 0,
+    graphql_response_cache_max_age: float = 10.0,
     **kwargs,
 ) -> Starlette:
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
     )
     check.str_param(path_prefix, "path_prefix")
+    check.int_param(graphql_response_cache_size, "graphql_response_cache_size")
 
     instance = workspace_process_context.instance
 
@@ -36,4 +40,9 @@ def create_app_from_workspace_process_context(
         workspace_process_context,
         path_prefix,
         live_data_poll_rate,
+        graphql_response_cache=(
+            GraphQLResponseCache(graphql_response_cache_size, graphql_response_cache_max_age)
+            if graphql_response_cache_size > 0
+            else None
+        ),
     ).create_asgi_app(**kwargs)
@@ -179,6 +179,30 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--graphql-response-cache-size",
+    help=(
+        "Maximum number of GraphQL query responses to cache in memory. Cached responses are"
+        " invalidated when new events, run updates or code location reloads are stored, and are"
+        " served with an ETag. Set to 0 to disable the cache."
+    ),
+    type=click.INT,
+    required=False,
+    default=0,
+    show_default=True,
+)
+@click.option(
+    "--graphql-response-cache-max-age",
+    help=(
+        "Maximum age in seconds of a cached GraphQL query response. Bounds how stale responses"
+        " that depend on state other than events, runs and code locations (e.g. schedule ticks)"
+        " can get."
+    ),
+    type=click.FLOAT,
+    required=False,
+    default=10.0,
+    show_default=True,
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -194,6 +218,8 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    graphql_response_cache_size: int,
+    graphql_response_cache_max_age: float,
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -230,6 +256,8 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                graphql_response_cache_size,
+                graphql_response_cache_max_age,
             )
 
 
@@ -253,6 +281,8 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: Optional[int] = None,
+    graphql_response_cache_size: int = 0,
+    graphql_response_cache_max_age: float = 10.0,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -265,7 +295,12 @@ def host_dagster_ui_with_workspace_process_context(
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        graphql_response_cache_size=graphql_response_cache_size,
+        graphql_response_cache_max_age=graphql_response_cache_max_age,
+        lifespan=_lifespan,
     )
 
     if not port:
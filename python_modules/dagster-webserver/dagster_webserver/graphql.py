@@ -22,17 +22,18 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster_graphql.implementation.utils import ErrorCapture
 from graphene import Schema
-from graphql import GraphQLError, GraphQLFormattedError
+from graphql import GraphQLError, GraphQLFormattedError, OperationType, get_operation_ast, parse
 from graphql.execution import ExecutionResult
 from starlette import status
 from starlette.applications import Starlette
 from starlette.concurrency import run_in_threadpool
 from starlette.middleware import Middleware
 from starlette.requests import HTTPConnection, Request
-from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 from starlette.routing import BaseRoute
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
+from dagster_webserver.graphql_response_cache import GraphQLResponseCache, GraphQLResponseCacheEntry
 from dagster_webserver.templates.graphiql import TEMPLATE
 
 if TYPE_CHECKING:
@@ -56,8 +57,13 @@ class GraphQLWS(str, Enum):
 
 
 class GraphQLServer(ABC):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(
+        self,
+        app_path_prefix: str = "",
+        graphql_response_cache: Optional[GraphQLResponseCache] = None,
+    ):
         self._app_path_prefix = app_path_prefix
+        self._graphql_response_cache = graphql_response_cache
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
@@ -86,6 +92,20 @@ def monitor_threadqueue_latency(self, latency: float) -> None:
         """
         pass
 
+    def get_graphql_response_cache_watermark(self, request_context) -> Optional[str]:
+        """Returns a token that changes whenever the storage state that graphql query responses
+        are computed from changes. Cached responses are only served while the watermark they were
+        computed against is unchanged. Returning None skips the response cache for the request,
+        which is the default.
+        """
+        return None
+
+    def get_graphql_response_cache_viewer_key(self, request_context) -> str:
+        """Returns a key identifying everything about the viewer that graphql responses can depend
+        on, such as their permissions. Cached responses are never shared across viewer keys.
+        """
+        return ""
+
     def handle_graphql_errors(self, errors: Sequence[GraphQLError]):
         results = []
         for err in errors:
@@ -164,6 +184,31 @@ async def graphql_http_endpoint(self, request: Request):
                     status_code=status.HTTP_400_BAD_REQUEST,
                 )
 
+        if self._graphql_response_cache is not None:
+            operation_type = _get_operation_type(query, operation_name)
+            if operation_type == OperationType.QUERY:
+                return await self._cached_graphql_http_response(
+                    request, self._graphql_response_cache, query, variables, operation_name
+                )
+            elif operation_type == OperationType.MUTATION:
+                # mutations can change state that isn't captured by the watermark, e.g. deleting
+                # events or runs
+                try:
+                    return await self._graphql_http_response(
+                        request, query, variables, operation_name
+                    )
+                finally:
+                    self._graphql_response_cache.clear()
+
+        return await self._graphql_http_response(request, query, variables, operation_name)
+
+    async def _graphql_http_response(
+        self,
+        request: Request,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> JSONResponse:
         captured_errors: List[Exception] = []
         with ErrorCapture.watch(captured_errors.append):
             result = await self.execute_graphql_request(request, query, variables, operation_name)
@@ -181,6 +226,50 @@ async def graphql_http_endpoint(self, request: Request):
             ),
         )
 
+    async def _cached_graphql_http_response(
+        self,
+        request: Request,
+        cache: GraphQLResponseCache,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Response:
+        request_context = self.make_request_context(request)
+        generation = cache.generation
+
+        # the watermark is read before the query executes, so that a response is never stored
+        # against a watermark that is newer than the state it was computed from
+        def _get_cache_key_and_watermark() -> Tuple[Optional[str], Optional[str]]:
+            watermark = self.get_graphql_response_cache_watermark(request_context)
+            if watermark is None:
+                return None, None
+            viewer_key = self.get_graphql_response_cache_viewer_key(request_context)
+            return cache.make_key(viewer_key, query, variables, operation_name), watermark
+
+        cache_key, watermark = await run_in_threadpool(_get_cache_key_and_watermark)
+        if cache_key is None or watermark is None:
+            return await self._graphql_http_response(request, query, variables, operation_name)
+
+        entry = cache.get(cache_key, watermark)
+        if entry is None:
+            response = await self._graphql_http_response(request, query, variables, operation_name)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            entry = cache.set(cache_key, watermark, bytes(response.body), generation)
+
+        return self._make_cached_graphql_response(request, cache, entry)
+
+    def _make_cached_graphql_response(
+        self, request: Request, cache: GraphQLResponseCache, entry: GraphQLResponseCacheEntry
+    ) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and entry.etag in {tag.strip() for tag in if_none_match.split(",")}:
+            cache.record_not_modified()
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(entry.body, media_type="application/json", headers=headers)
+
     async def graphql_ws_endpoint(self, websocket: WebSocket):
         """Implementation of websocket ASGI endpoint for GraphQL.
         Once we are free of conflicting deps, we should be able to use an impl from
@@ -345,6 +434,16 @@ def _determine_status_code(
         return status.HTTP_200_OK
 
 
+def _get_operation_type(query: str, operation_name: Optional[str]) -> Optional[OperationType]:
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return None
+
+    operation = get_operation_ast(document, operation_name)
+    return operation.operation if operation else None
+
+
 async def _handle_async_results(results: AsyncGenerator, operation_id: str, websocket: WebSocket):
     try:
         async for result in results:
@@ -0,0 +1,114 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, NamedTuple, Optional
+
+import dagster._check as check
+from dagster._seven import json
+
+
+class GraphQLResponseCacheEntry(NamedTuple):
+    body: bytes
+    etag: str
+    watermark: str
+    created_at: float
+
+
+class GraphQLResponseCache:
+    """An in-memory, size-bounded LRU cache of serialized GraphQL query responses.
+
+    Entries are stored alongside the watermark of the storage state they were computed against,
+    and are only served while that watermark is unchanged and the entry is younger than
+    `max_age_seconds`. The watermark is provided by the server, see
+    `GraphQLServer.get_graphql_response_cache_watermark`. The max age bounds how stale a response
+    can get when it depends on state that the watermark does not capture.
+    """
+
+    def __init__(self, max_entries: int, max_age_seconds: float):
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        check.invariant(self._max_entries > 0, "max_entries must be positive")
+        self._max_age_seconds = check.numeric_param(max_age_seconds, "max_age_seconds")
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, GraphQLResponseCacheEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        # incremented on every clear, so that responses that were being computed while the cache
+        # was cleared are not stored
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    @staticmethod
+    def make_key(
+        viewer_key: str,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        operation_name: Optional[str],
+    ) -> str:
+        return hashlib.sha256(
+            json.dumps([viewer_key, operation_name, query, variables]).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str, watermark: str) -> Optional[GraphQLResponseCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if (
+                entry.watermark != watermark
+                or time.monotonic() - entry.created_at > self._max_age_seconds
+            ):
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def set(
+        self, key: str, watermark: str, body: bytes, generation: int
+    ) -> GraphQLResponseCacheEntry:
+        entry = GraphQLResponseCacheEntry(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()}"',
+            watermark=watermark,
+            created_at=time.monotonic(),
+        )
+        with self._lock:
+            if generation != self._generation:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self._not_modified += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> Mapping[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "not_modified": self._not_modified,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
@@ -3,7 +3,7 @@
 import mimetypes
 import uuid
 from os import path, walk
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, List, Mapping, Optional, TypeVar
 
 import dagster._check as check
 from dagster import __version__ as dagster_version
@@ -14,6 +14,7 @@
 from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
+from dagster._core.workspace.permissions import PermissionResult
 from dagster._seven import json
 from dagster._utils import Counter, traced_counter
 from dagster_graphql import __version__ as dagster_graphql_version
@@ -40,10 +41,16 @@
     handle_report_asset_observation_request,
 )
 from dagster_webserver.graphql import GraphQLServer
+from dagster_webserver.graphql_response_cache import GraphQLResponseCache
 from dagster_webserver.version import __version__
 
 mimetypes.init()
 
+
+def _permissions_key(permissions: Mapping[str, PermissionResult]) -> Mapping[str, bool]:
+    return {name: result.enabled for name, result in permissions.items()}
+
+
 T_IWorkspaceProcessContext = TypeVar("T_IWorkspaceProcessContext", bound=IWorkspaceProcessContext)
 
 
@@ -57,11 +64,12 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: Optional[int] = None,
         uses_app_path_prefix: bool = True,
+        graphql_response_cache: Optional[GraphQLResponseCache] = None,
     ):
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
-        super().__init__(app_path_prefix)
+        super().__init__(app_path_prefix, graphql_response_cache)
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
@@ -75,6 +83,55 @@ def relative_path(self, rel: str) -> str:
     def make_request_context(self, conn: HTTPConnection) -> BaseWorkspaceRequestContext:
         return self._process_context.create_request_context(conn)
 
+    def get_graphql_response_cache_watermark(
+        self, request_context: BaseWorkspaceRequestContext
+    ) -> Optional[str]:
+        instance = request_context.instance
+        event_log_storage = instance.event_log_storage
+        # the max storage id of a run-sharded event log does not cover the events of every run
+        if event_log_storage.is_run_sharded or not isinstance(instance.run_storage, SqlRunStorage):
+            return None
+
+        try:
+            max_event_id = event_log_storage.get_maximum_record_id()
+        except NotImplementedError:
+            return None
+
+        last_updated_run = next(
+            iter(instance.get_run_records(limit=1, order_by="update_timestamp")), None
+        )
+        return json.dumps(
+            {
+                "event_log": max_event_id,
+                "runs": (
+                    [last_updated_run.dagster_run.run_id, last_updated_run.update_timestamp]
+                    if last_updated_run
+                    else None
+                ),
+                "code_locations": sorted(
+                    [name, entry.version_key, entry.update_timestamp, entry.load_status.value]
+                    for name, entry in request_context.get_code_location_entries().items()
+                ),
+            },
+            default=str,
+        )
+
+    def get_graphql_response_cache_viewer_key(
+        self, request_context: BaseWorkspaceRequestContext
+    ) -> str:
+        return json.dumps(
+            {
+                "tags": request_context.get_viewer_tags(),
+                "permissions": _permissions_key(request_context.permissions),
+                "location_permissions": {
+                    name: _permissions_key(
+                        request_context.permissions_for_location(location_name=name)
+                    )
+                    for name in request_context.get_code_location_entries()
+                },
+            }
+        )
+
     def build_middleware(self) -> List[Middleware]:
         return [Middleware(DagsterTracedCounterMiddleware)]
 
@@ -103,13 +160,14 @@ def make_csp_header(self, nonce: str) -> str:
             )
 
     async def webserver_info_endpoint(self, _request: Request):
-        return JSONResponse(
-            {
-                "dagster_webserver_version": __version__,
-                "dagster_version": dagster_version,
-                "dagster_graphql_version": dagster_graphql_version,
-            }
-        )
+        info = {
+            "dagster_webserver_version": __version__,
+            "dagster_version": dagster_version,
+            "dagster_graphql_version": dagster_graphql_version,
+        }
+        if self._graphql_response_cache is not None:
+            info["graphql_response_cache"] = self._graphql_response_cache.stats()
+        return JSONResponse(info)
 
     async def download_debug_file_endpoint(self, request: Request):
         run_id = request.path_params["run_id"]
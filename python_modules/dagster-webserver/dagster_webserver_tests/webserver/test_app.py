@@ -1,4 +1,5 @@
 import gc
+import tempfile
 
 import objgraph
 import pytest
@@ -7,13 +8,17 @@
     job,
     op,
 )
+from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
 from dagster._core.events import DagsterEventType
+from dagster._core.test_utils import instance_for_test
 from dagster._serdes import unpack_value
 from dagster._seven import json
 from dagster._utils.error import SerializableErrorInfo
 from dagster_graphql.version import __version__ as dagster_graphql_version
 from dagster_webserver.graphql import GraphQLWS
+from dagster_webserver.graphql_response_cache import GraphQLResponseCache
 from dagster_webserver.version import __version__ as dagster_webserver_version
+from dagster_webserver.webserver import DagsterWebserver
 from starlette.testclient import TestClient
 
 EVENT_LOG_SUBSCRIPTION = """
@@ -203,6 +208,92 @@ def test_graphql_error(test_client: TestClient):
     assert isinstance(original_err, SerializableErrorInfo)
 
 
+RUNS_QUERY = """
+query RunsQuery {
+    runsOrError {
+        ... on Runs {
+            results {
+                runId
+            }
+        }
+    }
+}
+"""
+
+
+def test_graphql_response_cache(test_client: TestClient):
+    # the sqlite event log is sharded by run, so its max storage id can't be used as a watermark
+    response = test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+    assert "ETag" not in response.headers
+
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test(
+        overrides={
+            "event_log_storage": {
+                "module": "dagster._core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": temp_dir},
+            }
+        }
+    ) as instance:
+        process_context = get_workspace_process_context_from_kwargs(
+            instance=instance,
+            version=dagster_version,
+            read_only=False,
+            kwargs={"empty_workspace": True},
+        )
+        cache = GraphQLResponseCache(max_entries=10, max_age_seconds=60)
+        client = TestClient(
+            DagsterWebserver(process_context, graphql_response_cache=cache).create_asgi_app()
+        )
+
+        response = client.post("/graphql", json={"query": RUNS_QUERY})
+        assert response.status_code == 200, response.text
+        assert response.json() == {"data": {"runsOrError": {"results": []}}}
+        etag = response.headers["ETag"]
+
+        response = client.post("/graphql", json={"query": RUNS_QUERY})
+        assert response.status_code == 200, response.text
+        assert response.json() == {"data": {"runsOrError": {"results": []}}}
+        assert response.headers["ETag"] == etag
+
+        response = client.post(
+            "/graphql", json={"query": RUNS_QUERY}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert not response.content
+
+        # storing a run moves the watermark forward
+        run_id = _add_run(instance)
+        response = client.post(
+            "/graphql", json={"query": RUNS_QUERY}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200, response.text
+        assert response.json() == {"data": {"runsOrError": {"results": [{"runId": run_id}]}}}
+        assert response.headers["ETag"] != etag
+
+        # mutations clear the cache
+        response = client.post(
+            "/graphql",
+            json={
+                "query": "mutation Delete($runId: String!) { deletePipelineRun(runId: $runId) { __typename } }",
+                "variables": {"runId": run_id},
+            },
+        )
+        assert response.status_code == 200, response.text
+        assert "ETag" not in response.headers
+        assert cache.stats()["entries"] == 0
+
+        assert client.get("/server_info").json()["graphql_response_cache"] == {
+            "entries": 0,
+            "max_entries": 10,
+            "hits": 2,
+            "misses": 2,
+            "not_modified": 1,
+            "hit_rate": 0.5,
+        }
+
+
 def test_graphql_ws_error(test_client: TestClient):
     # wtf pylint
 
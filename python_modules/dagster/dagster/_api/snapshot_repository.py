@@ -5,11 +5,13 @@
 from dagster._core.remote_representation.external_data import (
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
+    ExternalRepositorySnapshotPieces,
 )
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation import CodeLocation
+    from dagster._core.remote_representation.snapshot_cache import RepositorySnapshotCache
     from dagster._grpc.client import DagsterGrpcClient
 
 
@@ -82,3 +84,53 @@ async def gen_streaming_external_repositories_data_grpc(
 
         repo_datas[repository_name] = result
     return repo_datas
+
+
+def sync_get_external_repositories_data_from_snapshot_pieces_grpc(
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    snapshot_cache: "RepositorySnapshotCache",
+) -> Mapping[str, ExternalRepositoryData]:
+    """Load the repository data of the code location by fetching only the pieces of each
+    repository snapshot that are not already in the snapshot cache.
+
+    Falls back to fetching the full repository snapshots from servers that do not support
+    splitting them into pieces.
+    """
+    from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
+    from dagster._grpc.types import RepositorySnapshotPiecesArgs
+
+    check.inst_param(code_location, "code_location", CodeLocation)
+
+    repo_datas = {}
+    for repository_name in code_location.repository_names:  # type: ignore
+        repository_origin = RemoteRepositoryOrigin(code_location.origin, repository_name)
+        known_piece_ids = snapshot_cache.get_known_piece_ids(code_location.name, repository_name)
+
+        repository_data = None
+        while repository_data is None:
+            serialized_result = api_client.streaming_external_repository_snapshot_pieces(
+                RepositorySnapshotPiecesArgs(
+                    repository_origin=repository_origin,
+                    known_piece_ids=known_piece_ids,
+                )
+            )
+            if serialized_result is None:
+                return sync_get_streaming_external_repositories_data_grpc(api_client, code_location)
+
+            result = deserialize_value(
+                serialized_result,
+                (ExternalRepositorySnapshotPieces, ExternalRepositoryErrorData),
+            )
+            if isinstance(result, ExternalRepositoryErrorData):
+                raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+            repository_data = snapshot_cache.get_repository_data(
+                code_location.name, repository_name, result
+            )
+            # A cached piece went missing after its id was sent to the server, so fetch the
+            # whole snapshot instead
+            known_piece_ids = []
+
+        repo_datas[repository_name] = repository_data
+    return repo_datas
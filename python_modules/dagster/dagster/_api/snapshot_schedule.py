@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
 
 import dagster._check as check
 from dagster._core.definitions.schedule_definition import ScheduleExecutionData
@@ -7,13 +7,25 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.remote_representation.external_data import ExternalScheduleExecutionErrorData
 from dagster._core.remote_representation.handle import RepositoryHandle
-from dagster._grpc.types import ExternalScheduleExecutionArgs
+from dagster._grpc.types import ExternalScheduleExecutionArgs, ExternalScheduleExecutionBatchArgs
+from dagster._grpc.utils import default_schedule_batch_max_workers
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
     from dagster._grpc.client import DagsterGrpcClient
 
 
+class ScheduleExecutionRequest(NamedTuple):
+    """A tick of a schedule to evaluate along with the ticks of other schedules in the same code
+    location.
+    """
+
+    repository_handle: RepositoryHandle
+    schedule_name: str
+    scheduled_execution_time: Optional[TimestampWithTimezone]
+    log_key: Optional[Sequence[str]]
+
+
 def sync_get_external_schedule_execution_data_ephemeral_grpc(
     instance: DagsterInstance,
     repository_handle: RepositoryHandle,
@@ -77,3 +89,52 @@ def sync_get_external_schedule_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_schedule_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: DagsterInstance,
+    schedule_execution_requests: Sequence[ScheduleExecutionRequest],
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[int, Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]]]:
+    """Evaluate many schedule ticks with a single call to the code server, yielding the index of
+    each tick in `schedule_execution_requests` along with its result as soon as it is available.
+
+    Yields nothing if the code server is too old to evaluate schedule ticks in batches.
+    """
+    check.sequence_param(
+        schedule_execution_requests, "schedule_execution_requests", of_type=ScheduleExecutionRequest
+    )
+    check.opt_int_param(max_workers, "max_workers")
+
+    instance_ref = instance.get_ref()
+    batch_args = ExternalScheduleExecutionBatchArgs(
+        schedule_execution_args=[
+            ExternalScheduleExecutionArgs(
+                repository_origin=request.repository_handle.get_external_origin(),
+                instance_ref=instance_ref,
+                schedule_name=request.schedule_name,
+                scheduled_execution_timestamp=(
+                    request.scheduled_execution_time.timestamp
+                    if request.scheduled_execution_time
+                    else None
+                ),
+                scheduled_execution_timezone=(
+                    request.scheduled_execution_time.timezone
+                    if request.scheduled_execution_time
+                    else None
+                ),
+                log_key=request.log_key,
+            )
+            for request in schedule_execution_requests
+        ],
+        max_workers=max_workers or default_schedule_batch_max_workers(),
+    )
+
+    for index, serialized_result in api_client.external_schedule_execution_batch(batch_args):
+        yield (
+            index,
+            deserialize_value(
+                serialized_result, (ScheduleExecutionData, ExternalScheduleExecutionErrorData)
+            ),
+        )
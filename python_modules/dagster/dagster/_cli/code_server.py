@@ -14,6 +14,7 @@
     python_origin_target_argument,
 )
 from dagster._core.instance import InstanceRef
+from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import FuturesAwareThreadPoolExecutor
 from dagster._serdes import deserialize_value
@@ -251,3 +252,364 @@ def start_command(
         logger.info("Code proxy server was interrupted")
     finally:
         logger.info("Shutting down %s", server_desc)
+
+
+@click.command(name="grpc", help="Serve the Dagster inter-process API over GRPC")
+@click.option(
+    "--port",
+    "-p",
+    type=click.INT,
+    required=False,
+    help="Port over which to serve. You must pass one and only one of --port/-p or --socket/-s.",
+    envvar="DAGSTER_GRPC_PORT",
+)
+@click.option(
+    "--socket",
+    "-s",
+    type=click.Path(),
+    required=False,
+    help="Serve over a UDS socket. You must pass one and only one of --port/-p or --socket/-s.",
+    envvar="DAGSTER_GRPC_SOCKET",
+)
+@click.option(
+    "--host",
+    "-h",
+    type=click.STRING,
+    required=False,
+    default="localhost",
+    help="Hostname at which to serve. Default is localhost.",
+    envvar="DAGSTER_GRPC_HOST",
+)
+@click.option(
+    "--max-workers",
+    "--max_workers",  # for backwards compatibility
+    "-n",
+    type=click.INT,
+    required=False,
+    default=None,
+    help="Maximum number of (threaded) workers to use in the GRPC server",
+    envvar="DAGSTER_GRPC_MAX_WORKERS",
+)
+@click.option(
+    "--heartbeat",
+    is_flag=True,
+    help=(
+        "If set, the GRPC server will shut itself down when it fails to receive a heartbeat "
+        "after a timeout configurable with --heartbeat-timeout."
+    ),
+)
+@click.option(
+    "--heartbeat-timeout",
+    type=click.INT,
+    required=False,
+    default=30,
+    help="Timeout after which to shutdown if --heartbeat is set and a heartbeat is not received",
+)
+@click.option(
+    "--lazy-load-user-code",
+    is_flag=True,
+    required=False,
+    default=False,
+    help=(
+        "Wait until the first LoadRepositories call to actually load the repositories, instead of"
+        " waiting to load them when the server is launched. Useful for surfacing errors when the"
+        " server is managed directly from the Dagster UI."
+    ),
+    envvar="DAGSTER_LAZY_LOAD_USER_CODE",
+)
+@python_origin_target_argument
+@click.option(
+    "--use-python-environment-entry-point",
+    is_flag=True,
+    required=False,
+    default=False,
+    help=(
+        "If this flag is set, the server will signal to clients that they should launch "
+        "dagster commands using `<this server's python executable> -m dagster`, instead of the "
+        "default `dagster` entry point. This is useful when there are multiple Python environments "
+        "running in the same machine, so a single `dagster` entry point is not enough to uniquely "
+        "determine the environment."
+    ),
+    envvar="DAGSTER_USE_PYTHON_ENVIRONMENT_ENTRY_POINT",
+)
+@click.option(
+    "--empty-working-directory",
+    is_flag=True,
+    required=False,
+    default=False,
+    help=(
+        "Indicates that the working directory should be empty and should not set to the current "
+        "directory as a default"
+    ),
+    envvar="DAGSTER_EMPTY_WORKING_DIRECTORY",
+)
+@click.option(
+    "--fixed-server-id",
+    type=click.STRING,
+    required=False,
+    help=(
+        "[INTERNAL] This option should generally not be used by users. Internal param used by "
+        "dagster to spawn a gRPC server with the specified server id."
+    ),
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["critical", "error", "warning", "info", "debug"], case_sensitive=False),
+    show_default=True,
+    required=False,
+    default="info",
+    help="Level at which to log output from the code server process",
+)
+@click.option(
+    "--log-format",
+    type=click.Choice(["colored", "json", "rich"], case_sensitive=False),
+    show_default=True,
+    required=False,
+    default="colored",
+    help="Format of the log output from the code server process",
+)
+@click.option(
+    "--container-image",
+    type=click.STRING,
+    required=False,
+    help="Container image to use to run code from this server.",
+    envvar="DAGSTER_CONTAINER_IMAGE",
+)
+@click.option(
+    "--container-context",
+    type=click.STRING,
+    required=False,
+    help=(
+        "Serialized JSON with configuration for any containers created to run the "
+        "code from this server."
+    ),
+    envvar="DAGSTER_CONTAINER_CONTEXT",
+)
+@click.option(
+    "--inject-env-vars-from-instance",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Whether to load env vars from the instance and inject them into the environment.",
+    envvar="DAGSTER_INJECT_ENV_VARS_FROM_INSTANCE",
+)
+@click.option(
+    "--location-name",
+    type=click.STRING,
+    required=False,
+    help="Name of the code location this server corresponds to.",
+    envvar="DAGSTER_LOCATION_NAME",
+)
+@click.option(
+    "--instance-ref",
+    type=click.STRING,
+    required=False,
+    help="[INTERNAL] Serialized InstanceRef to use for accessing the instance",
+    envvar="DAGSTER_INSTANCE_REF",
+)
+@click.option(
+    "--enable-metrics",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="[INTERNAL] Retrieves current utilization metrics from GRPC server.",
+    envvar="DAGSTER_ENABLE_SERVER_METRICS",
+)
+@click.option(
+    "--snapshot-cache-dir",
+    type=click.Path(file_okay=False),
+    required=False,
+    help=(
+        "Directory in which to store the snapshots of the loaded repositories, so that restarting "
+        "the server with unchanged code skips building them. Only use this if the definitions "
+        "are fully determined by their code, e.g. they do not depend on environment variables "
+        "read while they are loaded."
+    ),
+    envvar="DAGSTER_GRPC_SNAPSHOT_CACHE_DIR",
+)
+def grpc_command(
+    port=None,
+    socket=None,
+    host=None,
+    max_workers=None,
+    heartbeat=False,
+    heartbeat_timeout=30,
+    lazy_load_user_code=False,
+    fixed_server_id=None,
+    log_level="INFO",
+    log_format="colored",
+    use_python_environment_entry_point=False,
+    container_image=None,
+    container_context=None,
+    location_name=None,
+    instance_ref=None,
+    inject_env_vars_from_instance=False,
+    enable_metrics=False,
+    snapshot_cache_dir=None,
+    **kwargs,
+):
+    check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
+
+    check.invariant(
+        max_workers is None or max_workers > 1 if heartbeat else True,
+        "max_workers must be greater than 1 or set to None if heartbeat is True. "
+        "If set to None, the server will use the gRPC default.",
+    )
+
+    if seven.IS_WINDOWS and port is None:
+        raise click.UsageError(
+            "You must pass a valid --port/-p on Windows: --socket/-s not supported."
+        )
+    if not (port or socket and not (port and socket)):
+        raise click.UsageError("You must pass one and only one of --port/-p or --socket/-s.")
+
+    setup_interrupt_handlers()
+
+    configure_loggers(formatter=log_format, log_level=log_level.upper())
+    logger = logging.getLogger("dagster.code_server")
+
+    container_image = container_image or os.getenv("DAGSTER_CURRENT_IMAGE")
+
+    loadable_target_origin = None
+    if any(
+        kwargs[key]
+        for key in [
+            "attribute",
+            "working_directory",
+            "module_name",
+            "package_name",
+            "python_file",
+            "empty_working_directory",
+        ]
+    ):
+        # in the gRPC api CLI we never load more than one module or python file at a time
+        module_name = check.opt_str_elem(kwargs, "module_name")
+        python_file = check.opt_str_elem(kwargs, "python_file")
+
+        loadable_target_origin = LoadableTargetOrigin(
+            executable_path=sys.executable,
+            attribute=kwargs["attribute"],
+            working_directory=(
+                None
+                if kwargs.get("empty_working_directory")
+                else get_working_directory_from_kwargs(kwargs)
+            ),
+            module_name=module_name,
+            python_file=python_file,
+            package_name=kwargs["package_name"],
+        )
+
+    code_desc = " "
+    if loadable_target_origin:
+        if loadable_target_origin.python_file:
+            code_desc = f" for file {loadable_target_origin.python_file} "
+        elif loadable_target_origin.package_name:
+            code_desc = f" for package {loadable_target_origin.package_name} "
+        elif loadable_target_origin.module_name:
+            code_desc = f" for module {loadable_target_origin.module_name} "
+
+    server_desc = (
+        f"Dagster code server{code_desc}on port {port} in process {os.getpid()}"
+        if port
+        else f"Dagster code server{code_desc}in process {os.getpid()}"
+    )
+
+    logger.info("Starting %s", server_desc)
+
+    from dagster._grpc import DagsterGrpcServer
+    from dagster._grpc.server import DagsterApiServer
+
+    server_termination_event = threading.Event()
+    threadpool_executor = FuturesAwareThreadPoolExecutor(max_workers=max_workers)
+    api_servicer = DagsterApiServer(
+        server_termination_event=server_termination_event,
+        logger=logger,
+        loadable_target_origin=loadable_target_origin,
+        heartbeat=heartbeat,
+        heartbeat_timeout=heartbeat_timeout,
+        lazy_load_user_code=lazy_load_user_code,
+        fixed_server_id=fixed_server_id,
+        entry_point=(
+            get_python_environment_entry_point(sys.executable)
+            if use_python_environment_entry_point
+            else DEFAULT_DAGSTER_ENTRY_POINT
+        ),
+        container_image=container_image,
+        container_context=(
+            json.loads(container_context) if container_context is not None else None
+        ),
+        inject_env_vars_from_instance=inject_env_vars_from_instance,
+        instance_ref=deserialize_value(instance_ref, InstanceRef) if instance_ref else None,
+        location_name=location_name,
+        enable_metrics=enable_metrics,
+        server_threadpool_executor=threadpool_executor,
+        snapshot_cache_dir=snapshot_cache_dir,
+    )
+
+    server = DagsterGrpcServer(
+        server_termination_event=server_termination_event,
+        dagster_api_servicer=api_servicer,
+        port=port,
+        socket=socket,
+        host=host,
+        logger=logger,
+        enable_metrics=enable_metrics,
+        threadpool_executor=threadpool_executor,
+    )
+
+    logger.info("Started %s", server_desc)
+
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        # Terminate cleanly on interrupt
+        logger.info("Code server was interrupted")
+    finally:
+        logger.info("Shutting down %s", server_desc)
+
+
+@click.command(name="grpc-health-check", help="Check the status of a dagster GRPC server")
+@click.option(
+    "--port",
+    "-p",
+    type=click.INT,
+    required=False,
+    help="Port over which to serve. You must pass one and only one of --port/-p or --socket/-s.",
+)
+@click.option(
+    "--socket",
+    "-s",
+    type=click.Path(),
+    required=False,
+    help="Serve over a UDS socket. You must pass one and only one of --port/-p or --socket/-s.",
+)
+@click.option(
+    "--host",
+    "-h",
+    type=click.STRING,
+    required=False,
+    default="localhost",
+    help="Hostname at which to serve. Default is localhost.",
+)
+@click.option(
+    "--use-ssl",
+    is_flag=True,
+    help="Whether to connect to the gRPC server over SSL",
+)
+def grpc_health_check_command(port=None, socket=None, host="localhost", use_ssl=False):
+    if seven.IS_WINDOWS and port is None:
+        raise click.UsageError(
+            "You must pass a valid --port/-p on Windows: --socket/-s not supported."
+        )
+    if not (port or socket and not (port and socket)):
+        raise click.UsageError("You must pass one and only one of --port/-p or --socket/-s.")
+
+    from dagster._grpc import DagsterGrpcClient
+
+    client = DagsterGrpcClient(port=port, socket=socket, host=host, use_ssl=use_ssl)
+    status = client.health_check_query()
+    if status != "SERVING":
+        click.echo(f"Unable to connect to gRPC server: {status}")
+        sys.exit(1)
+    else:
+        click.echo("gRPC connection successful")
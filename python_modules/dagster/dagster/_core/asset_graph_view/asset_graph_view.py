@@ -30,7 +30,7 @@
     from dagster._core.definitions.definitions_class import Definitions
     from dagster._core.definitions.partition import PartitionsDefinition
     from dagster._core.instance import DagsterInstance
-    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer, InstanceQueryerCache
 
 
 class TemporalContext(NamedTuple):
@@ -106,6 +106,7 @@ def __init__(
         temporal_context: TemporalContext,
         instance: "DagsterInstance",
         asset_graph: "BaseAssetGraph",
+        queryer_cache: Optional["InstanceQueryerCache"] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -119,6 +120,7 @@ def __init__(
             asset_graph=asset_graph,
             loading_context=self,
             evaluation_time=temporal_context.effective_dt,
+            cache=queryer_cache,
         )
 
     @property
@@ -0,0 +1,233 @@
+"""Compact representation of an asset graph used to resolve asset selections.
+
+Each asset key is assigned a dense integer id, parent and child edges are stored in CSR-style
+offset / id arrays, and the asset attributes that selections filter on (group, tag, owner, key
+prefix, partitions definition) are indexed up front. Traversals then only touch integers, and
+attribute lookups don't need to scan every node of the graph.
+"""
+
+from array import array
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from dagster._core.definitions.asset_key import AssetKey
+from dagster._core.definitions.partition import PartitionsDefinition
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.base_asset_graph import BaseAssetGraph
+
+
+def _build_adjacency(
+    edges_by_id: Sequence[Iterable[int]],
+) -> Tuple["array[int]", "array[int]"]:
+    """Returns (offsets, ids), where the neighbors of node i are ids[offsets[i] : offsets[i + 1]]."""
+    offsets = array("l", [0])
+    ids = array("l")
+    for edges in edges_by_id:
+        ids.extend(sorted(edges))
+        offsets.append(len(ids))
+    return offsets, ids
+
+
+class AssetGraphIndex:
+    """Integer-id view of the assets in a BaseAssetGraph.
+
+    Self-dependencies are not stored as edges. They never change which assets are selected by a
+    traversal, since the asset itself is always reachable from itself.
+    """
+
+    def __init__(self, asset_graph: "BaseAssetGraph"):
+        nodes = list(asset_graph.asset_nodes)
+        keys: List[AssetKey] = [node.key for node in nodes]
+        id_by_key: Dict[AssetKey, int] = {key: i for i, key in enumerate(keys)}
+
+        # keys that are referenced as dependencies without being in the graph get an id too, so
+        # that traversals can pass through them
+        for node in nodes:
+            for key in (*node.parent_keys, *node.child_keys):
+                if key not in id_by_key:
+                    id_by_key[key] = len(keys)
+                    keys.append(key)
+
+        parents: List[Set[int]] = [set() for _ in keys]
+        children: List[Set[int]] = [set() for _ in keys]
+        for i, node in enumerate(nodes):
+            for key in node.parent_keys:
+                parent_id = id_by_key[key]
+                if parent_id != i:
+                    parents[i].add(parent_id)
+                    children[parent_id].add(i)
+            for key in node.child_keys:
+                child_id = id_by_key[key]
+                if child_id != i:
+                    children[i].add(child_id)
+                    parents[child_id].add(i)
+
+        self._keys = keys
+        self._id_by_key = id_by_key
+        self._parent_offsets, self._parent_ids = _build_adjacency(parents)
+        self._child_offsets, self._child_ids = _build_adjacency(children)
+
+        ids_by_group: Dict[str, List[int]] = defaultdict(list)
+        ids_by_tag: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        ids_by_owner: Dict[str, List[int]] = defaultdict(list)
+        ids_by_key_prefix: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+        materializable_ids: Set[int] = set()
+        external_ids: Set[int] = set()
+        # partitions definitions are not all hashable, so they're grouped by identity and then
+        # merged by equality
+        ids_by_partitions_def_id: Dict[int, List[int]] = defaultdict(list)
+        partitions_defs_by_id: Dict[int, PartitionsDefinition] = {}
+        for i, node in enumerate(nodes):
+            if node.group_name is not None:
+                ids_by_group[node.group_name].append(i)
+            for tag_key, tag_value in node.tags.items():
+                ids_by_tag[(tag_key, tag_value)].append(i)
+            for owner in node.owners:
+                ids_by_owner[owner].append(i)
+            path = tuple(node.key.path)
+            for prefix_len in range(1, len(path) + 1):
+                ids_by_key_prefix[path[:prefix_len]].append(i)
+            if node.is_materializable:
+                materializable_ids.add(i)
+            if node.is_external:
+                external_ids.add(i)
+            partitions_def = node.partitions_def
+            if partitions_def is not None:
+                partitions_defs_by_id[id(partitions_def)] = partitions_def
+                ids_by_partitions_def_id[id(partitions_def)].append(i)
+
+        self._ids_by_group = {k: frozenset(v) for k, v in ids_by_group.items()}
+        self._ids_by_tag = {k: frozenset(v) for k, v in ids_by_tag.items()}
+        self._ids_by_owner = {k: frozenset(v) for k, v in ids_by_owner.items()}
+        self._ids_by_key_prefix = {k: frozenset(v) for k, v in ids_by_key_prefix.items()}
+        self._all_ids = frozenset(range(len(nodes)))
+        self._materializable_ids = frozenset(materializable_ids)
+        self._external_ids = frozenset(external_ids)
+
+        partitions_def_groups: List[Tuple[PartitionsDefinition, Set[int]]] = []
+        for def_id, ids in ids_by_partitions_def_id.items():
+            partitions_def = partitions_defs_by_id[def_id]
+            for existing_def, existing_ids in partitions_def_groups:
+                if existing_def == partitions_def:
+                    existing_ids.update(ids)
+                    break
+            else:
+                partitions_def_groups.append((partitions_def, set(ids)))
+        self._ids_by_partitions_def = [
+            (partitions_def, frozenset(ids)) for partitions_def, ids in partitions_def_groups
+        ]
+
+    def to_ids(self, keys: Iterable[AssetKey]) -> Set[int]:
+        """Returns the ids of the given keys, ignoring keys that are not part of the graph."""
+        id_by_key = self._id_by_key
+        return {id_by_key[key] for key in keys if key in id_by_key}
+
+    def to_keys(self, ids: Iterable[int]) -> Set[AssetKey]:
+        keys = self._keys
+        return {keys[i] for i in ids}
+
+    def _base_ids(self, include_sources: bool) -> FrozenSet[int]:
+        return self._all_ids if include_sources else self._materializable_ids
+
+    def ids_for_groups(self, group_names: Iterable[str], include_sources: bool) -> AbstractSet[int]:
+        ids = set()
+        for group_name in group_names:
+            ids.update(self._ids_by_group.get(group_name, ()))
+        return ids & self._base_ids(include_sources)
+
+    def ids_for_tag(self, key: str, value: str, include_sources: bool) -> AbstractSet[int]:
+        return self._ids_by_tag.get((key, value), frozenset()) & self._base_ids(include_sources)
+
+    def ids_for_owner(self, owner: str) -> AbstractSet[int]:
+        return self._ids_by_owner.get(owner, frozenset())
+
+    def ids_for_key_prefixes(
+        self, key_prefixes: Iterable[Sequence[str]], include_sources: bool
+    ) -> AbstractSet[int]:
+        base_ids = self._base_ids(include_sources)
+        ids = set()
+        for prefix in key_prefixes:
+            if not prefix:
+                return set(base_ids)
+            ids.update(self._ids_by_key_prefix.get(tuple(prefix), ()))
+        return ids & base_ids
+
+    def ids_for_partitions_def(self, partitions_def: PartitionsDefinition) -> AbstractSet[int]:
+        for existing_def, ids in self._ids_by_partitions_def:
+            if existing_def == partitions_def:
+                return ids
+        return frozenset()
+
+    @property
+    def materializable_ids(self) -> FrozenSet[int]:
+        return self._materializable_ids
+
+    @property
+    def external_ids(self) -> FrozenSet[int]:
+        return self._external_ids
+
+    def _traverse(
+        self,
+        offsets: "array[int]",
+        edge_ids: "array[int]",
+        start_ids: Iterable[int],
+        depth: Optional[int],
+    ) -> Set[int]:
+        # breadth-first from all start ids at once, so that each id ends up at its minimum distance
+        # from any of them
+        reached: Set[int] = set()
+        frontier = list(start_ids)
+        level = 0
+        while frontier and (depth is None or level < depth):
+            next_frontier = []
+            for node_id in frontier:
+                for i in range(offsets[node_id], offsets[node_id + 1]):
+                    edge_id = edge_ids[i]
+                    if edge_id not in reached:
+                        reached.add(edge_id)
+                        next_frontier.append(edge_id)
+            frontier = next_frontier
+            level += 1
+        return reached
+
+    def upstream_ids(self, ids: Iterable[int], depth: Optional[int] = None) -> Set[int]:
+        """Returns the ids that are strict ancestors of any of the given ids, up to `depth` levels
+        away.
+        """
+        return self._traverse(self._parent_offsets, self._parent_ids, ids, depth)
+
+    def downstream_ids(self, ids: Iterable[int], depth: Optional[int] = None) -> Set[int]:
+        """Returns the ids that are strict descendants of any of the given ids, up to `depth`
+        levels away.
+        """
+        return self._traverse(self._child_offsets, self._child_ids, ids, depth)
+
+    def upstream_keys(
+        self, keys: AbstractSet[AssetKey], depth: Optional[int] = None
+    ) -> Set[AssetKey]:
+        return self.to_keys(self.upstream_ids(self.to_ids(keys), depth))
+
+    def downstream_keys(
+        self, keys: AbstractSet[AssetKey], depth: Optional[int] = None
+    ) -> Set[AssetKey]:
+        return self.to_keys(self.downstream_ids(self.to_ids(keys), depth))
+
+    def source_keys(self, keys: AbstractSet[AssetKey]) -> Set[AssetKey]:
+        """Returns the keys that have no upstream dependencies within the given keys."""
+        return set(keys) - self.downstream_keys(keys)
+
+    def sink_keys(self, keys: AbstractSet[AssetKey]) -> Set[AssetKey]:
+        """Returns the keys that have no downstream dependencies within the given keys."""
+        return set(keys) - self.upstream_keys(keys)
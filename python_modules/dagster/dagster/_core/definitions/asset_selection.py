@@ -2,7 +2,7 @@
 import operator
 from abc import ABC, abstractmethod
 from functools import reduce
-from typing import AbstractSet, Iterable, List, Optional, Sequence, Union, cast
+from typing import AbstractSet, Hashable, Iterable, List, Optional, Sequence, Union, cast
 
 from typing_extensions import TypeAlias, TypeGuard
 
@@ -21,13 +21,9 @@
 from dagster._core.definitions.resolved_asset_deps import resolve_similar_asset_names
 from dagster._core.definitions.source_asset import SourceAsset
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import parse_clause
 from dagster._model import DagsterModel
+from dagster._model.pydantic_compat_layer import model_fields
 from dagster._serdes.serdes import whitelist_for_serdes
 
 CoercibleToAssetSelection: TypeAlias = Union[
@@ -433,7 +429,16 @@ def resolve(
             check.iterable_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
             asset_graph = AssetGraph.from_assets(all_assets)
 
-        return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+        cache_key = _get_resolve_cache_key(self, allow_missing)
+        if cache_key is None:
+            return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+
+        resolved = asset_graph.resolved_asset_selections.get(cache_key)
+        if resolved is None:
+            resolved = frozenset(self.resolve_inner(asset_graph, allow_missing=allow_missing))
+            asset_graph.resolved_asset_selections[cache_key] = resolved
+        # callers are free to modify the returned set
+        return set(resolved)
 
     @abstractmethod
     def resolve_inner(
@@ -528,6 +533,40 @@ def operand__str__(self) -> str:
         return f"({self})" if self.needs_parentheses_when_operand() else str(self)
 
 
+class _UncacheableSelection(Exception):
+    pass
+
+
+def _freeze_selection_value(value: object) -> Hashable:
+    if isinstance(value, AssetSelection):
+        # selections defined outside of this module may depend on state other than their fields
+        if type(value).__module__ != __name__:
+            raise _UncacheableSelection()
+        return (
+            type(value),
+            tuple(
+                _freeze_selection_value(getattr(value, field_name))
+                for field_name in model_fields(type(value))
+            ),
+        )
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze_selection_value(item) for item in value)
+    elif isinstance(value, (str, int, bool, type(None), AssetKey, AssetCheckKey)):
+        return value
+    else:
+        raise _UncacheableSelection()
+
+
+def _get_resolve_cache_key(selection: AssetSelection, allow_missing: bool) -> Optional[Hashable]:
+    """Returns a hashable key identifying the result of resolving the selection, or None if the
+    result of resolving the selection can't be cached.
+    """
+    try:
+        return (_freeze_selection_value(selection), allow_missing)
+    except _UncacheableSelection:
+        return None
+
+
 @whitelist_for_serdes
 class AllSelection(AssetSelection):
     include_sources: Optional[bool] = None
@@ -755,7 +794,7 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        return asset_graph.index.sink_keys(selection)
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self.model_copy(
@@ -790,7 +829,7 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        return asset_graph.index.source_keys(selection)
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self.model_copy(
@@ -809,19 +848,7 @@ def resolve_inner(
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
         return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
+            selection | asset_graph.index.downstream_keys(selection, self.depth),
             selection if not self.include_self else set(),
         )
 
@@ -839,17 +866,9 @@ class GroupsAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        base_set = (
-            asset_graph.all_asset_keys
-            if self.include_sources
-            else asset_graph.materializable_asset_keys
+        return asset_graph.index.to_keys(
+            asset_graph.index.ids_for_groups(self.selected_groups, self.include_sources)
         )
-        return {
-            key
-            for group in self.selected_groups
-            for key in asset_graph.asset_keys_for_group(group)
-            if key in base_set
-        }
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self
@@ -870,14 +889,10 @@ class TagAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        base_set = (
-            asset_graph.all_asset_keys
-            if self.include_sources
-            else asset_graph.materializable_asset_keys
+        return asset_graph.index.to_keys(
+            asset_graph.index.ids_for_tag(self.key, self.value, self.include_sources)
         )
 
-        return {key for key in base_set if asset_graph.get(key).tags.get(self.key) == self.value}
-
     def __str__(self) -> str:
         return f"tag:{self.key}={self.value}"
 
@@ -889,11 +904,7 @@ class OwnerAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        return {
-            key
-            for key in asset_graph.all_asset_keys
-            if self.selected_owner in asset_graph.get(key).owners
-        }
+        return asset_graph.index.to_keys(asset_graph.index.ids_for_owner(self.selected_owner))
 
     def __str__(self) -> str:
         return f"owner:{self.selected_owner}"
@@ -975,16 +986,9 @@ class KeyPrefixesAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        base_set = (
-            asset_graph.all_asset_keys
-            if self.include_sources
-            else asset_graph.materializable_asset_keys
+        return asset_graph.index.to_keys(
+            asset_graph.index.ids_for_key_prefixes(self.selected_key_prefixes, self.include_sources)
         )
-        return {
-            key
-            for key in base_set
-            if any(key.has_prefix(prefix) for prefix in self.selected_key_prefixes)
-        }
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self
@@ -1004,20 +1008,7 @@ def _fetch_all_upstream(
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
     return operator.sub(
-        reduce(
-            operator.or_,
-            [
-                {asset_key}
-                | fetch_connected(
-                    item=asset_key,
-                    graph=asset_graph.asset_dep_graph,
-                    direction="upstream",
-                    depth=depth,
-                )
-                for asset_key in selection
-            ],
-            set(),
-        ),
+        selection | asset_graph.index.upstream_keys(selection, depth),
         selection if not include_self else set(),
     )
 
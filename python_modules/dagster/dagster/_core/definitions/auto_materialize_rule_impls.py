@@ -296,7 +296,7 @@ def passes(
             run_ids_to_fetch = list(asset_partitions_by_latest_run_id.keys())
             for i in range(0, len(run_ids_to_fetch), run_step):
                 run_ids = run_ids_to_fetch[i : i + run_step]
-                runs = context.legacy_context.instance_queryer.instance.get_runs(
+                runs = context.legacy_context.instance_queryer.instance.get_run_summary_records(
                     filters=RunsFilter(run_ids=run_ids)
                 )
                 run_ids_with_required_tags.update(
@@ -44,6 +44,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.instance import DagsterInstance
+    from dagster._utils.caching_instance_queryer import InstanceQueryerCache
 
 
 class AutomationTickEvaluationContext:
@@ -59,6 +60,8 @@ def __init__(
         asset_selection: AssetSelection,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        queryer_cache: Optional["InstanceQueryerCache"] = None,
+        evaluation_max_workers: Optional[int] = None,
     ):
         resolved_entity_keys = {
             entity_key
@@ -75,6 +78,8 @@ def __init__(
             cursor=cursor,
             evaluation_time=evaluation_time,
             logger=logger,
+            queryer_cache=queryer_cache,
+            max_workers=evaluation_max_workers,
         )
         self._materialize_run_tags = materialize_run_tags
         self._observe_run_tags = observe_run_tags
@@ -9,6 +9,7 @@
     Callable,
     Dict,
     Generic,
+    Hashable,
     Iterable,
     Iterator,
     List,
@@ -26,6 +27,7 @@
 
 import dagster._check as check
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
+from dagster._core.definitions.asset_graph_index import AssetGraphIndex
 from dagster._core.definitions.asset_key import AssetKey, EntityKey, T_EntityKey
 from dagster._core.definitions.backfill_policy import BackfillPolicy
 from dagster._core.definitions.events import AssetKeyPartitionKey
@@ -305,11 +307,14 @@ def toposorted_entity_keys(self) -> Sequence[EntityKey]:
         """Return topologically sorted entity keys in graph. Keys with the same topological level are
         sorted alphabetically to provide stability.
         """
-        return [
-            item
-            for items_in_level in toposort(self.entity_dep_graph["upstream"])
-            for item in sorted(items_in_level)
-        ]
+        return [item for level in self.toposorted_entity_keys_by_level for item in level]
+
+    @cached_property
+    def toposorted_entity_keys_by_level(self) -> Sequence[Sequence[EntityKey]]:
+        """Return topologically sorted entity keys grouped into lists containing keys of the same
+        topological level, sorted alphabetically. No key depends on another key in the same level.
+        """
+        return [sorted(level) for level in toposort(self.entity_dep_graph["upstream"])]
 
     @cached_property
     def toposorted_asset_keys_by_level(self) -> Sequence[AbstractSet[AssetKey]]:
@@ -322,14 +327,28 @@ def toposorted_asset_keys_by_level(self) -> Sequence[AbstractSet[AssetKey]]:
     def unpartitioned_asset_keys(self) -> AbstractSet[AssetKey]:
         return {node.key for node in self.asset_nodes if not node.is_partitioned}
 
+    @cached_property
+    def index(self) -> AssetGraphIndex:
+        """Integer-id representation of this graph, with indexes of the asset attributes that
+        asset selections filter on.
+        """
+        return AssetGraphIndex(self)
+
+    @cached_property
+    def resolved_asset_selections(self) -> Dict[Hashable, AbstractSet[AssetKey]]:
+        """Results of AssetSelection.resolve against this graph, keyed by selection. The graph is
+        not modified after it is built, so entries never need to be invalidated.
+        """
+        return {}
+
     def asset_keys_for_group(self, group_name: str) -> AbstractSet[AssetKey]:
-        return {node.key for node in self.asset_nodes if node.group_name == group_name}
+        return self.index.to_keys(self.index.ids_for_groups([group_name], include_sources=True))
 
     @cached_method
     def asset_keys_for_partitions_def(
         self, partitions_def: PartitionsDefinition
     ) -> AbstractSet[AssetKey]:
-        return {node.key for node in self.asset_nodes if node.partitions_def == partitions_def}
+        return self.index.to_keys(self.index.ids_for_partitions_def(partitions_def))
 
     @cached_property
     def root_materializable_asset_keys(self) -> AbstractSet[AssetKey]:
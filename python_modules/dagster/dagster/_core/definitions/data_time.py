@@ -345,8 +345,8 @@ def _calculate_data_time_by_key(
     @cached_method
     def _get_in_progress_run_ids(self, current_time: datetime.datetime) -> Sequence[str]:
         return [
-            record.dagster_run.run_id
-            for record in self.instance_queryer.instance.get_run_records(
+            record.run_id
+            for record in self.instance_queryer.instance.get_run_summary_records(
                 filters=RunsFilter(
                     statuses=[
                         status for status in DagsterRunStatus if status not in FINISHED_STATUSES
@@ -99,6 +99,15 @@ def my_asset(): ...
     def requires_cursor(self) -> bool:
         return True
 
+    @property
+    def memoizable(self) -> bool:
+        """Whether the result of evaluating this condition only depends on its position in the
+        condition tree, the entity and candidate subset it is evaluated over, and the previous
+        tick, so that it can be shared between evaluations of different root entities within a
+        single tick.
+        """
+        return not self.requires_cursor and all(child.memoizable for child in self.children)
+
     @property
     def children(self) -> Sequence["AutomationCondition"]:
         return []
@@ -1,11 +1,13 @@
 import datetime
 import logging
 from collections import defaultdict
+from contextlib import ExitStack
 from dataclasses import replace
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Dict,
+    Hashable,
     Iterable,
     List,
     Mapping,
@@ -25,10 +27,13 @@
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
 from dagster._core.definitions.events import AssetKey
 from dagster._core.instance import DagsterInstance
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
-    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+    from concurrent.futures import Future
+
+    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer, InstanceQueryerCache
 
 
 class AutomationConditionEvaluator:
@@ -41,20 +46,35 @@ def __init__(
         cursor: AssetDaemonCursor,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        queryer_cache: Optional["InstanceQueryerCache"] = None,
+        max_workers: Optional[int] = None,
     ):
         self.entity_keys = entity_keys
+        # entities in the same topological level are evaluated in parallel if set
+        self.max_workers = max_workers
+        last_event_id = instance.event_log_storage.get_maximum_record_id()
+        if queryer_cache is not None:
+            updated_asset_keys = queryer_cache.refresh(instance, last_event_id)
+            logger.debug(
+                f"Evicted {len(updated_asset_keys)} updated assets from the queryer cache "
+                f"({queryer_cache.metrics})."
+            )
         self.asset_graph_view = AssetGraphView(
             temporal_context=TemporalContext(
                 effective_dt=evaluation_time or get_current_datetime(),
-                last_event_id=instance.event_log_storage.get_maximum_record_id(),
+                last_event_id=last_event_id,
             ),
             instance=instance,
             asset_graph=asset_graph,
+            queryer_cache=queryer_cache,
         )
         self.logger = logger
         self.cursor = cursor
 
         self.current_results_by_key: Dict[EntityKey, AutomationResult] = {}
+        # results of sub-conditions that can be shared between entities on this tick, see
+        # AutomationContext.evaluate_memoized
+        self.memoized_results: Dict[Hashable, AutomationResult] = {}
         self.condition_cursors = []
         self.expected_data_time_mapping = defaultdict()
 
@@ -106,47 +126,79 @@ def prefetch(self) -> None:
         )
         self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
         self.logger.info("Done prefetching asset records.")
+        self.instance_queryer.prefetch_asset_status_cache_values(self.asset_records_to_prefetch)
+        self.logger.info("Done prefetching asset status cache values.")
 
     def evaluate(self) -> Tuple[Iterable[AutomationResult], Iterable[EntitySubset[EntityKey]]]:
         self.prefetch()
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
-        for entity_key in self.asset_graph.toposorted_entity_keys:
-            if entity_key not in self.entity_keys:
-                continue
-
-            self.logger.debug(
-                f"Evaluating {entity_key.to_user_string()} ({num_evaluated+1}/{num_conditions})"
+        with ExitStack() as stack:
+            executor = (
+                stack.enter_context(
+                    InheritContextThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="automation_condition_evaluator_worker",
+                    )
+                )
+                if self.max_workers and self.max_workers > 1
+                else None
             )
+            for level in self.asset_graph.toposorted_entity_keys_by_level:
+                level_keys = [key for key in level if key in self.entity_keys]
 
-            try:
-                self.evaluate_entity(entity_key)
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for {entity_key.to_user_string()}"
-                ) from e
-
-            result = self.current_results_by_key[entity_key]
-            num_requested = result.true_subset.size
-            if result.true_subset.is_partitioned:
-                requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
-            else:
-                requested_str = "(no partition)"
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-            log_fn(
-                f"{entity_key.to_user_string()} evaluation result: {num_requested} "
-                f"requested ({requested_str}) "
-                f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
-            )
-            num_evaluated += 1
+                # no entity depends on another entity in the same level, so their conditions can be
+                # evaluated at the same time. results are still recorded one at a time, in order.
+                futures: Dict[EntityKey, "Future[AutomationResult]"] = {}
+                if executor and len(level_keys) > 1:
+                    futures = {
+                        entity_key: executor.submit(self._evaluate_condition, entity_key)
+                        for entity_key in level_keys
+                    }
+
+                for entity_key in level_keys:
+                    self.logger.debug(
+                        f"Evaluating {entity_key.to_user_string()} ({num_evaluated+1}/{num_conditions})"
+                    )
+
+                    try:
+                        if entity_key in futures:
+                            self._record_result(futures[entity_key].result())
+                        else:
+                            self.evaluate_entity(entity_key)
+                    except Exception as e:
+                        raise Exception(
+                            f"Error while evaluating conditions for {entity_key.to_user_string()}"
+                        ) from e
+
+                    result = self.current_results_by_key[entity_key]
+                    num_requested = result.true_subset.size
+                    if result.true_subset.is_partitioned:
+                        requested_str = ",".join(
+                            result.true_subset.expensively_compute_partition_keys()
+                        )
+                    else:
+                        requested_str = "(no partition)"
+                    log_fn = self.logger.info if num_requested > 0 else self.logger.debug
+                    log_fn(
+                        f"{entity_key.to_user_string()} evaluation result: {num_requested} "
+                        f"requested ({requested_str}) "
+                        f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+                    )
+                    num_evaluated += 1
         return self.current_results_by_key.values(), self._get_entity_subsets()
 
     def evaluate_entity(self, key: EntityKey) -> None:
+        self._record_result(self._evaluate_condition(key))
+
+    def _evaluate_condition(self, key: EntityKey) -> AutomationResult:
         # evaluate the condition of this asset
         context = AutomationContext.create(key=key, evaluator=self)
-        result = context.condition.evaluate(context)
+        return context.condition.evaluate(context)
 
+    def _record_result(self, result: AutomationResult) -> None:
         # update dictionaries to keep track of this result
+        key = result.key
         self.current_results_by_key[key] = result
 
         if isinstance(key, AssetKey):
@@ -1,7 +1,7 @@
 import datetime
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, Mapping, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Dict, Generic, Hashable, Mapping, Optional, Type, TypeVar
 
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
@@ -10,6 +10,7 @@
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
     AutomationResult,
+    _compute_subset_value_str,
 )
 from dagster._core.definitions.declarative_automation.legacy.legacy_context import (
     LegacyRuleEvaluationContext,
@@ -62,6 +63,8 @@ class AutomationContext(Generic[T_EntityKey]):
 
     _root_log: logging.Logger
 
+    _memoized_results: Dict[Hashable, AutomationResult]
+
     @staticmethod
     def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "AutomationContext":
         asset_graph = evaluator.asset_graph
@@ -87,6 +90,7 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
             _root_log=evaluator.logger,
+            _memoized_results=evaluator.memoized_results,
         )
 
     def for_child_condition(
@@ -113,7 +117,40 @@ def for_child_condition(
             if self._legacy_context
             else None,
             _root_log=self._root_log,
+            _memoized_results=self._memoized_results,
+        )
+
+    def evaluate_memoized(self) -> AutomationResult[T_EntityKey]:
+        """Evaluates the condition of this context, reusing the result of an earlier evaluation on
+        this tick at the same position in an identical condition tree, over the same candidates.
+
+        This allows the operands of conditions such as `any_deps_match` to be evaluated once per
+        dependency rather than once per dependency per downstream asset.
+        """
+        from dagster._core.definitions.asset_graph import executable_in_same_run
+
+        if not self.condition.memoizable or self._legacy_context is not None:
+            return self.condition.evaluate(self)
+
+        root_key = self.root_context.key
+        memo_key = (
+            self.condition_unique_id,
+            self.condition,
+            self.key,
+            _compute_subset_value_str(self.candidate_subset.convert_to_serializable_subset()),
+            self.previous_max_storage_id,
+            self.previous_evaluation_time,
+            # will_be_requested() depends on whether the entity can be executed in the same run as
+            # the root entity
+            executable_in_same_run(self.asset_graph, root_key, self.key)
+            if isinstance(root_key, AssetKey) and isinstance(self.key, AssetKey)
+            else None,
         )
+        result = self._memoized_results.get(memo_key)
+        if result is None:
+            result = self.condition.evaluate(self)
+            self._memoized_results[memo_key] = result
+        return result
 
     @property
     def log(self) -> logging.Logger:
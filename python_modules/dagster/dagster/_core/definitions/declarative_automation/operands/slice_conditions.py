@@ -123,6 +123,11 @@ def description(self) -> str:
     def name(self) -> str:
         return "newly_requested"
 
+    @property
+    def memoizable(self) -> bool:
+        # depends on the cursor of the root entity being evaluated
+        return False
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset[AssetKey]:
         return context.previous_requested_subset or context.get_empty_subset()
 
@@ -58,6 +58,11 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def memoizable(self) -> bool:
+        # the conditions that are expanded depend on the ancestors of this node
+        return False
+
     def _get_ignored_conditions(
         self, context: AutomationContext[AssetKey]
     ) -> AbstractSet[AutomationCondition]:
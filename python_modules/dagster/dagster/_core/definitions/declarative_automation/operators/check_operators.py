@@ -60,6 +60,11 @@ def description(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def memoizable(self) -> bool:
+        # the operand is evaluated over other entities
+        return False
+
     def _get_check_keys(
         self, key: AssetKey, asset_graph: BaseAssetGraph[BaseAssetNode]
     ) -> AbstractSet[AssetCheckKey]:
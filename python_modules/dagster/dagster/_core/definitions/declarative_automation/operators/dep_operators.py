@@ -41,8 +41,9 @@ def evaluate(self, context: AutomationContext[T_EntityKey]) -> AutomationResult[
             child_condition=self.operand, child_index=0, candidate_subset=dep_candidate_subset
         )
 
-        # evaluate condition against the dependency
-        dep_result = self.operand.evaluate(dep_context)
+        # evaluate condition against the dependency, reusing the result of evaluating the same
+        # condition against the same dependency for another asset on this tick if possible
+        dep_result = dep_context.evaluate_memoized()
 
         # find all children of the true dep subset
         true_subset = dep_result.true_subset.compute_child_subset(context.key)
@@ -75,6 +76,11 @@ def description(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def memoizable(self) -> bool:
+        # the operand is evaluated over other entities
+        return False
+
     def allow(self, selection: "AssetSelection") -> "DepCondition":
         """Returns a copy of this condition that will only consider dependencies within the provided
         AssetSelection.
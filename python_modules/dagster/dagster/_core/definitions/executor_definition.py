@@ -322,7 +322,10 @@ def execute_in_process_executor(_) -> "InProcessExecutor":
 
 
 def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "MultiprocessExecutor":
-    from dagster._core.executor.multiprocess import MultiprocessExecutor
+    from dagster._core.executor.multiprocess import (
+        MultiprocessExecutor,
+        MultiprocessWorkerPoolConfig,
+    )
 
     # unpack optional selector
     start_method = None
@@ -331,12 +334,23 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
+    worker_pool_config = (
+        MultiprocessWorkerPoolConfig(
+            max_steps_per_worker=check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker"),
+            max_memory_mb=check.opt_int_elem(worker_pool_cfg, "max_memory_mb"),
+        )
+        if worker_pool_cfg is not None
+        else None
+    )
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        worker_pool_config=worker_pool_config,
     )
 
 
@@ -389,6 +403,32 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Recycle a worker process after it has executed this many steps. By "
+                        "default, worker processes are reused for the duration of the run."
+                    ),
+                ),
+                "max_memory_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Recycle a worker process once its peak resident memory exceeds this "
+                        "many megabytes."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Reuse a bounded pool of long-lived worker processes, each of which loads the "
+                "instance, job code and run config once, instead of starting a new process for "
+                "each step. The pool holds at most `max_concurrent` workers."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -418,6 +458,18 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default a new process is started for each step. Setting ``worker_pool`` instead dispatches
+    steps to a bounded pool of long-lived worker processes, which avoids reloading code and
+    instance state for every step:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -47,12 +47,14 @@
 from dagster._core.storage.tags import COMPUTE_KIND_TAG, LEGACY_COMPUTE_KIND_TAG
 from dagster._core.types.dagster_type import DagsterType, DagsterTypeKind
 from dagster._utils import IHasInternalInit
+from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import deprecation_warning, normalize_renamed_param
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_layer import AssetLayer
     from dagster._core.definitions.composition import PendingNodeInvocation
     from dagster._core.definitions.decorators.op_decorator import DecoratedOpFunction
+    from dagster._core.snap.node import OpDefSnap
 
 OpComputeFunction: TypeAlias = Callable[..., Any]
 
@@ -320,6 +322,14 @@ def iterate_node_defs(self) -> Iterator[NodeDefinition]:
     def iterate_op_defs(self) -> Iterator["OpDefinition"]:
         yield self
 
+    @cached_method
+    def get_op_def_snap(self) -> "OpDefSnap":
+        # an op is usually part of several jobs (e.g. the asset base job and each asset job that
+        # selects it), so its snapshot is shared between their job snapshots
+        from dagster._core.snap.node import build_op_def_snap
+
+        return build_op_def_snap(self)
+
     def resolve_output_to_origin(
         self, output_name: str, handle: Optional[NodeHandle]
     ) -> Tuple[OutputDefinition, Optional[NodeHandle]]:
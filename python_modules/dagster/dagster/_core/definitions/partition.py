@@ -1,6 +1,9 @@
+import base64
 import copy
 import hashlib
 import json
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
@@ -10,12 +13,16 @@
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -33,6 +40,7 @@
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.utils import normalize_tags
 from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
     DagsterInvalidDefinitionError,
     DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
@@ -41,6 +49,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import normalize_renamed_param
@@ -329,6 +338,14 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_method
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        return PartitionKeyIndex(self._partition_keys, growable=False)
+
     @public
     def get_partition_keys(
         self,
@@ -473,6 +490,18 @@ def _validated_name(self) -> str:
             )
         return self.name
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_method
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        # keys are added to and deleted from dynamic partitions definitions at runtime, so their
+        # subsets share an index that assigns ordinals to keys as they are first seen. The index
+        # lives as long as this definition, and is bounded so that deleted keys can not grow it
+        # indefinitely.
+        return PartitionKeyIndex(growable=True, max_size=MAX_DYNAMIC_PARTITION_KEY_INDEX_SIZE)
+
     def __eq__(self, other):
         return (
             isinstance(other, DynamicPartitionsDefinition)
@@ -934,6 +963,134 @@ def cron_schedule_from_schedule_type_and_offsets(
         check.assert_never(schedule_type)
 
 
+class PartitionKeyIndex:
+    """Maps partition keys to ordinals, so that subsets of the partitions of a
+    `StaticPartitionsDefinition` or `DynamicPartitionsDefinition` can be stored as bitmaps.
+
+    The ordinals of a static partitions definition are the positions of its partition keys. Indexes
+    of dynamic partitions definitions are growable, and assign the next ordinal to each key the
+    first time that it is seen, until they hold `max_size` keys. Ordinals are never reassigned, so
+    bitmaps built against an index remain valid as it grows.
+    """
+
+    def __init__(
+        self,
+        partition_keys: Iterable[str] = (),
+        growable: bool = False,
+        max_size: Optional[int] = None,
+    ):
+        self._keys: List[str] = []
+        self._ordinals: Dict[str, int] = {}
+        self._max_size = check.opt_int_param(max_size, "max_size")
+        self._growable = True
+        self._lock = threading.Lock()
+        self._add_keys(partition_keys)
+        self._growable = growable
+
+    @property
+    def growable(self) -> bool:
+        return self._growable
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals.get(partition_key)
+
+    def get_key(self, ordinal: int) -> str:
+        return self._keys[ordinal]
+
+    def get_ordinals(self, partition_keys: Iterable[str]) -> Tuple[List[int], List[str]]:
+        """Returns the ordinals of the given keys, and the keys that are not in the index. Keys
+        are added to growable indexes that are not full, so all of them have ordinals.
+        """
+        if self._growable and not self._is_full():
+            partition_keys = list(partition_keys)
+            if any(key not in self._ordinals for key in partition_keys):
+                self._add_keys(partition_keys)
+
+        ordinals = []
+        missing_keys = []
+        for key in partition_keys:
+            ordinal = self._ordinals.get(key)
+            if ordinal is None:
+                missing_keys.append(key)
+            else:
+                ordinals.append(ordinal)
+        return ordinals, missing_keys
+
+    def _is_full(self) -> bool:
+        return self._max_size is not None and len(self._keys) >= self._max_size
+
+    def _add_keys(self, partition_keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in partition_keys:
+                if self._is_full():
+                    # keys that are not in a full index are stored as the extra keys of subsets
+                    break
+                if key not in self._ordinals:
+                    self._ordinals[key] = len(self._keys)
+                    self._keys.append(key)
+
+    @cached_method
+    def get_keys_fingerprint(self) -> str:
+        """The serializable unique identifier of a static partitions definition with these keys."""
+        check.invariant(not self._growable, "Only fixed indexes have a stable fingerprint")
+        return hashlib.sha1(json.dumps(self._keys).encode("utf-8")).hexdigest()
+
+
+# the number of keys that a dynamic partitions definition assigns ordinals to, which bounds the
+# size of its bitmaps
+MAX_DYNAMIC_PARTITION_KEY_INDEX_SIZE = 100_000
+
+
+def _bitmap_from_ordinals(ordinals: Sequence[int]) -> int:
+    if not ordinals:
+        return 0
+    if len(ordinals) == 1:
+        return 1 << ordinals[0]
+    # building the bitmap from a string of binary digits is linear in the number of partitions,
+    # while setting each bit of an int creates a new int each time
+    bits = bytearray(b"0" * (max(ordinals) + 1))
+    for ordinal in ordinals:
+        bits[ordinal] = 49  # ord("1")
+    bits.reverse()
+    return int(bits, 2)
+
+
+def _bitmap_from_ranges(ranges: Sequence[Tuple[int, int]]) -> int:
+    if not ranges:
+        return 0
+    bits = bytearray(b"0" * (max(end for _, end in ranges) + 1))
+    for start, end in ranges:
+        bits[start : end + 1] = b"1" * (end - start + 1)
+    bits.reverse()
+    return int(bits, 2)
+
+
+def _ordinals_in_bitmap(bitmap: int) -> Iterator[int]:
+    # binary digits of the bitmap, from the lowest ordinal to the highest
+    bits = bin(bitmap)[:1:-1]
+    ordinal = bits.find("1")
+    while ordinal != -1:
+        yield ordinal
+        ordinal = bits.find("1", ordinal + 1)
+
+
+def _ranges_in_bitmap(bitmap: int) -> List[Tuple[int, int]]:
+    """Run-length encodes the bitmap into inclusive ranges of ordinals."""
+    bits = bin(bitmap)[:1:-1]
+    ranges = []
+    start = bits.find("1")
+    while start != -1:
+        end = bits.find("0", start)
+        if end == -1:
+            end = len(bits)
+        ranges.append((start, end - 1))
+        start = bits.find("1", end)
+    return ranges
+
+
 class PartitionsSubset(ABC, Generic[T_str]):
     """Represents a subset of the partitions within a PartitionsDefinition."""
 
@@ -1188,6 +1345,8 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1206,6 +1365,339 @@ def empty_subset(
         return cls()
 
 
+class BitmapPartitionsSubsetSerializer(NamedTupleSerializer):
+    # Bitmaps are only meaningful within the process that built the key index of the partitions
+    # definition, so BitmapPartitionsSubsets are stored as the equivalent DefaultPartitionsSubset.
+    def pack_items(self, value, whitelist_map, object_handler, descent_path):
+        serializer = whitelist_map.object_serializers[DefaultPartitionsSubset.__name__]
+        return serializer.pack_items(
+            value.to_serializable_subset(), whitelist_map, object_handler, descent_path
+        )
+
+
+@whitelist_for_serdes(serializer=BitmapPartitionsSubsetSerializer)
+class BitmapPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [
+            ("partitions_def", PartitionsDefinition),
+            ("bitmap", int),
+            # keys that are not partitions of a static partitions definition
+            ("extra_keys", FrozenSet[str]),
+        ],
+    ),
+):
+    """A subset of the partitions of a `StaticPartitionsDefinition` or
+    `DynamicPartitionsDefinition`, stored as a bitmap over the ordinals of the
+    `PartitionKeyIndex` of the partitions definition.
+
+    Set operations between subsets that share an index are bitwise operations on the bitmaps. With
+    serdes, these subsets are stored as, and loaded back as, the equivalent `DefaultPartitionsSubset`.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # Versions up to DefaultPartitionsSubset.SERIALIZATION_VERSION store a list of keys, and can
+    # still be deserialized.
+    SERIALIZATION_VERSION = 2
+
+    def __new__(
+        cls,
+        partitions_def: PartitionsDefinition,
+        bitmap: int = 0,
+        extra_keys: AbstractSet[str] = frozenset(),
+    ):
+        check.inst_param(
+            partitions_def,
+            "partitions_def",
+            (StaticPartitionsDefinition, DynamicPartitionsDefinition),
+        )
+        return super(BitmapPartitionsSubset, cls).__new__(
+            cls,
+            partitions_def=partitions_def,
+            bitmap=check.int_param(bitmap, "bitmap"),
+            extra_keys=frozenset(extra_keys),
+        )
+
+    @property
+    def key_index(self) -> PartitionKeyIndex:
+        return cast(
+            Union[StaticPartitionsDefinition, DynamicPartitionsDefinition], self.partitions_def
+        ).get_partition_key_index()
+
+    @classmethod
+    def from_partition_keys(
+        cls, partitions_def: PartitionsDefinition, partition_keys: Iterable[str]
+    ) -> "BitmapPartitionsSubset":
+        return cls.empty_subset(partitions_def).with_partition_keys(partition_keys)
+
+    def _with_bitmap(
+        self, bitmap: Optional[int] = None, extra_keys: Optional[AbstractSet[str]] = None
+    ) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(
+            self.partitions_def,
+            self.bitmap if bitmap is None else bitmap,
+            self.extra_keys if extra_keys is None else extra_keys,
+        )
+
+    def _shares_index(self, other: PartitionsSubset) -> bool:
+        return isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self.partitions_def or other.key_index is self.key_index
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self.bitmap == 0 and not self.extra_keys
+
+    def get_partition_keys(self) -> Iterable[str]:
+        # a set, like the keys of a DefaultPartitionsSubset
+        key_index = self.key_index
+        return {
+            key_index.get_key(ordinal) for ordinal in _ordinals_in_bitmap(self.bitmap)
+        } | self.extra_keys
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        key_index = self.key_index
+        if not key_index.growable and partitions_def == self.partitions_def:
+            all_bits = (1 << len(key_index)) - 1
+            return {
+                key_index.get_key(ordinal)
+                for ordinal in _ordinals_in_bitmap(all_bits & ~self.bitmap)
+            }
+        all_keys = partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        return {key for key in all_keys if key not in self}
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        key_index = self.key_index
+        if not key_index.growable and partitions_def == self.partitions_def:
+            # the ordinals of a static partitions definition are in partition key order
+            return [
+                PartitionKeyRange(key_index.get_key(start), key_index.get_key(end))
+                for start, end in _ranges_in_bitmap(self.bitmap)
+            ]
+        return DefaultPartitionsSubset(set(self.get_partition_keys())).get_partition_key_ranges(
+            partitions_def, current_time, dynamic_partitions_store
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset":
+        ordinals, missing_keys = self.key_index.get_ordinals(partition_keys)
+        if not ordinals and not missing_keys:
+            return self
+        return self._with_bitmap(
+            bitmap=self.bitmap | _bitmap_from_ordinals(ordinals),
+            extra_keys=self.extra_keys | frozenset(missing_keys),
+        )
+
+    def with_partition_key_range(
+        self,
+        partitions_def: PartitionsDefinition,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "BitmapPartitionsSubset":
+        key_index = self.key_index
+        start = key_index.get_ordinal(partition_key_range.start)
+        end = key_index.get_ordinal(partition_key_range.end)
+        if (
+            key_index.growable
+            or partitions_def != self.partitions_def
+            or start is None
+            or end is None
+            or start > end
+        ):
+            return cast(
+                BitmapPartitionsSubset,
+                super().with_partition_key_range(
+                    partitions_def, partition_key_range, dynamic_partitions_store
+                ),
+            )
+        return self._with_bitmap(bitmap=self.bitmap | _bitmap_from_ranges([(start, end)]))
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._shares_index(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return self._with_bitmap(
+                bitmap=self.bitmap | other.bitmap, extra_keys=self.extra_keys | other.extra_keys
+            )
+        return super().__or__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._shares_index(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return self._with_bitmap(
+                bitmap=self.bitmap & ~other.bitmap, extra_keys=self.extra_keys - other.extra_keys
+            )
+        if self is other:
+            return self.empty_subset(self.partitions_def)
+        if other.is_empty:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return self.empty_subset(self.partitions_def)
+        return self.empty_subset(self.partitions_def).with_partition_keys(
+            key for key in self.get_partition_keys() if key not in other
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._shares_index(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return self._with_bitmap(
+                bitmap=self.bitmap & other.bitmap, extra_keys=self.extra_keys & other.extra_keys
+            )
+        if self is other:
+            return self
+        if other.is_empty:
+            return other
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        return self.empty_subset(self.partitions_def).with_partition_keys(
+            key for key in self.get_partition_keys() if key in other
+        )
+
+    def serialize(self) -> str:
+        key_index = self.key_index
+        if key_index.growable:
+            # the ordinals of dynamic partitions are only stable within a process, so the keys
+            # themselves are stored, sorted and compressed
+            compressed_keys = zlib.compress(json.dumps(sorted(self.get_partition_keys())).encode())
+            return json.dumps(
+                {
+                    "version": self.SERIALIZATION_VERSION,
+                    "compressed_subset": base64.b64encode(compressed_keys).decode(),
+                }
+            )
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partitions_def_id": key_index.get_keys_fingerprint(),
+                "ranges": _ranges_in_bitmap(self.bitmap),
+                "extra_keys": sorted(self.extra_keys),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        data = json.loads(serialized)
+        if (
+            isinstance(data, list)
+            or data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION
+        ):
+            return cls.from_partition_keys(
+                partitions_def,
+                cast(
+                    DefaultPartitionsSubset,
+                    DefaultPartitionsSubset.from_serialized(partitions_def, serialized),
+                ).subset,
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        if "compressed_subset" in data:
+            partition_keys = json.loads(
+                zlib.decompress(base64.b64decode(data["compressed_subset"])).decode()
+            )
+            return cls.from_partition_keys(partitions_def, partition_keys)
+
+        subset = cls.empty_subset(partitions_def)
+        if data.get("partitions_def_id") != subset.key_index.get_keys_fingerprint():
+            raise DagsterDefinitionChangedDeserializationError(
+                "Cannot deserialize a partitions subset stored as ranges of partitions after the"
+                " partition keys of its partitions definition changed."
+            )
+        return cls(
+            partitions_def,
+            bitmap=_bitmap_from_ranges([(start, end) for start, end in data["ranges"]]),
+            extra_keys=frozenset(data.get("extra_keys", [])),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if (
+            isinstance(data, list)
+            or data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION
+        ):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            return False
+        if "compressed_subset" in data:
+            return True
+        return isinstance(partitions_def, StaticPartitionsDefinition) and (
+            data.get("partitions_def_id")
+            == partitions_def.get_partition_key_index().get_keys_fingerprint()
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if self._shares_index(cast(PartitionsSubset, other)):
+            other = cast(BitmapPartitionsSubset, other)
+            return self.bitmap == other.bitmap and self.extra_keys == other.extra_keys
+        return isinstance(other, (BitmapPartitionsSubset, DefaultPartitionsSubset)) and set(
+            self.get_partition_keys()
+        ) == set(other.get_partition_keys())
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1") + len(self.extra_keys)
+
+    def __contains__(self, value) -> bool:
+        ordinal = self.key_index.get_ordinal(value)
+        if ordinal is None:
+            return value in self.extra_keys
+        return bool((self.bitmap >> ordinal) & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={set(self.get_partition_keys())})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        if not isinstance(
+            partitions_def, (StaticPartitionsDefinition, DynamicPartitionsDefinition)
+        ):
+            check.failed(
+                "Partitions definition must be a StaticPartitionsDefinition or"
+                " DynamicPartitionsDefinition"
+            )
+        return cls(partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -1,9 +1,10 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from abc import abstractmethod, abstractproperty
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, tzinfo
 from enum import Enum
 from functools import cached_property
 from typing import (
@@ -231,6 +232,134 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+def _is_fixed_offset_timezone(timezone: str) -> bool:
+    """Returns if the given timezone has the same UTC offset at all times, i.e. it has no DST
+    transitions.
+    """
+    return timezone.upper() in (
+        "UTC",
+        "GMT",
+        "UCT",
+        "UNIVERSAL",
+        "ZULU",
+    ) or timezone.upper().startswith("ETC/")
+
+
+def _is_unambiguous_wall_time(dt: datetime, tz: tzinfo) -> bool:
+    """Returns if the wall clock time of the given naive datetime occurs exactly once in the given
+    timezone, i.e. it is neither skipped nor repeated by a DST transition.
+    """
+    return tz.utcoffset(dt.replace(fold=0)) == tz.utcoffset(dt.replace(fold=1))
+
+
+class FixedPeriodSchedule:
+    """Closed-form arithmetic over the ticks of a cron schedule that repeats with a fixed period.
+
+    Ticks are indexed relative to an anchor tick, so that tick 0 is the anchor, tick 1 is the tick
+    after it, and tick -1 is the tick before it.
+
+    Sub-daily schedules (e.g. hourly, or every 15 minutes) are only supported in timezones with a
+    fixed UTC offset, where their ticks are a fixed number of seconds apart. Daily and weekly
+    schedules are supported in any timezone, by doing the arithmetic on wall clock times. Their
+    ticks that fall on a DST transition can't be computed this way, so methods return None for
+    them, and callers should fall back to iterating the cron schedule.
+    """
+
+    def __init__(self, anchor: datetime, period: timedelta, wall_clock: bool):
+        self._tz = check.not_none(anchor.tzinfo)
+        self._anchor_timestamp = anchor.timestamp()
+        self._anchor_wall_time = anchor.replace(tzinfo=None, fold=0)
+        self._period = period
+        self._period_seconds = period.total_seconds()
+        self._wall_clock = wall_clock
+
+    @staticmethod
+    def from_cron_schedule(
+        cron_schedule: str, timezone: str, anchor: datetime
+    ) -> Optional["FixedPeriodSchedule"]:
+        """Returns a FixedPeriodSchedule for the given cron schedule, or None if its ticks don't
+        repeat with a fixed period in the given timezone.
+
+        Args:
+            cron_schedule (str): The cron schedule.
+            timezone (str): The timezone that the cron schedule is evaluated in.
+            anchor (datetime): A tick of the cron schedule.
+        """
+        fixed_minute_interval = get_fixed_minute_interval(cron_schedule)
+        if fixed_minute_interval:
+            period = timedelta(minutes=fixed_minute_interval)
+        elif cron_schedule == "* * * * *":
+            period = timedelta(minutes=1)
+        elif re.fullmatch(r"\d+ \* \* \* \*", cron_schedule):
+            period = timedelta(hours=1)
+        elif re.fullmatch(r"\d+ \d+ \* \* \*", cron_schedule):
+            period = timedelta(days=1)
+        elif re.fullmatch(r"\d+ \d+ \* \* \d+", cron_schedule):
+            period = timedelta(weeks=1)
+        else:
+            return None
+
+        if _is_fixed_offset_timezone(timezone):
+            return FixedPeriodSchedule(anchor, period, wall_clock=False)
+
+        if period < timedelta(days=1) or not _is_unambiguous_wall_time(
+            anchor.replace(tzinfo=None), check.not_none(anchor.tzinfo)
+        ):
+            return None
+
+        return FixedPeriodSchedule(anchor, period, wall_clock=True)
+
+    def tick(self, index: int) -> Optional[datetime]:
+        """The tick with the given index, or None if it falls on a DST transition."""
+        if not self._wall_clock:
+            return datetime.fromtimestamp(
+                self._anchor_timestamp + index * self._period_seconds, tz=self._tz
+            )
+
+        wall_time = self._anchor_wall_time + index * self._period
+        if not _is_unambiguous_wall_time(wall_time, self._tz):
+            return None
+        return wall_time.replace(tzinfo=self._tz)
+
+    def approximate_timestamp(self, index: float) -> float:
+        """A timestamp that is within a few hours of the tick with the given index, even if it falls
+        on a DST transition.
+        """
+        return self._anchor_timestamp + index * self._period_seconds
+
+    def _periods_since_anchor(self, timestamp: float) -> Optional[float]:
+        if not self._wall_clock:
+            return (timestamp - self._anchor_timestamp) / self._period_seconds
+
+        wall_time = datetime.fromtimestamp(timestamp, tz=self._tz).replace(tzinfo=None, fold=0)
+        if not _is_unambiguous_wall_time(wall_time, self._tz):
+            return None
+        return (wall_time - self._anchor_wall_time) / self._period
+
+    def _ticks_exist(self, *indexes: int) -> bool:
+        return not self._wall_clock or all(self.tick(index) is not None for index in indexes)
+
+    def index_at_or_after(self, timestamp: float) -> Optional[int]:
+        """The index of the first tick at or after the given timestamp, or None if it can't be
+        computed because of a nearby DST transition.
+        """
+        periods = self._periods_since_anchor(timestamp)
+        if periods is None:
+            return None
+        index = math.ceil(periods)
+        return index if self._ticks_exist(index - 1, index) else None
+
+    def index_at_or_before(self, timestamp: float) -> Optional[int]:
+        """The index of the last tick at or before the given timestamp, or None if it can't be
+        computed because of a nearby DST transition.
+        """
+        periods = self._periods_since_anchor(timestamp)
+        if periods is None:
+            return None
+        index = math.floor(periods)
+        return index if self._ticks_exist(index, index + 1) else None
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -368,6 +497,57 @@ def end(self) -> Optional[datetime]:
             get_timezone(end_timestamp_with_timezone.timezone),
         )
 
+    @cached_property
+    def _fixed_period_schedule(self) -> Optional[FixedPeriodSchedule]:
+        """If the cron schedule repeats with a fixed period, arithmetic over its ticks anchored at
+        the start of the first partition, so that the index of each tick is the index of the
+        partition that starts at it.
+        """
+        first_window = next(iter(self._iterate_time_windows(self.start.timestamp())))
+        return FixedPeriodSchedule.from_cron_schedule(
+            self.cron_schedule, self.timezone, first_window.start
+        )
+
+    def _time_window_for_partition_index(
+        self, schedule: FixedPeriodSchedule, index: int
+    ) -> TimeWindow:
+        start = schedule.tick(index)
+        end = schedule.tick(index + 1)
+        if start is not None and end is not None:
+            return TimeWindow(start, end)
+
+        # the window starts or ends on a DST transition, so find it by iterating from a time that
+        # is safely between its start and the start of the previous window
+        return next(iter(self._iterate_time_windows(schedule.approximate_timestamp(index - 0.5))))
+
+    def _partition_key_for_partition_index(self, schedule: FixedPeriodSchedule, index: int) -> str:
+        start = schedule.tick(index)
+        if start is None:
+            start = self._time_window_for_partition_index(schedule, index).start
+        # equivalent to dst_safe_strftime, since windows of fixed period schedules never start at
+        # an ambiguous time: sub-daily schedules only have a fixed period in fixed offset timezones
+        return start.strftime(self.fmt)
+
+    def _get_fixed_period_num_partitions(
+        self, schedule: FixedPeriodSchedule, current_timestamp: float
+    ) -> Optional[int]:
+        """The number of partitions that get_partition_keys returns, or None if it can't be
+        computed because the current time or the end is near a DST transition.
+        """
+        # the number of windows that end at or before the current time
+        num_partitions = schedule.index_at_or_before(current_timestamp)
+        if num_partitions is None:
+            return None
+        num_partitions = max(num_partitions, 0) + max(self.end_offset, 0)
+
+        if self.end:
+            num_partitions_before_end = schedule.index_at_or_before(self.end.timestamp())
+            if num_partitions_before_end is None:
+                return None
+            num_partitions = min(num_partitions, max(num_partitions_before_end, 0))
+
+        return max(num_partitions + min(self.end_offset, 0), 0)
+
     def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         if not current_time:
             return get_current_timestamp()
@@ -379,6 +559,13 @@ def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         return current_time.timestamp()
 
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
+        schedule = self._fixed_period_schedule
+        if schedule:
+            start_index = schedule.index_at_or_after(time_window.start.timestamp())
+            end_index = schedule.index_at_or_after(time_window.end.timestamp())
+            if start_index is not None and end_index is not None:
+                return max(end_index - start_index, 0)
+
         if self.is_basic_daily:
             return (
                 date(
@@ -424,6 +611,16 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        schedule = self._fixed_period_schedule
+        num_partitions = (
+            self._get_fixed_period_num_partitions(schedule, current_timestamp) if schedule else None
+        )
+        if schedule and num_partitions is not None:
+            return [
+                self._partition_key_for_partition_index(schedule, idx)
+                for idx in range(max(start_idx, 0), min(end_idx, num_partitions))
+            ]
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -462,6 +659,16 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        schedule = self._fixed_period_schedule
+        num_partitions = (
+            self._get_fixed_period_num_partitions(schedule, current_timestamp) if schedule else None
+        )
+        if schedule and num_partitions is not None:
+            return [
+                self._partition_key_for_partition_index(schedule, idx)
+                for idx in range(num_partitions)
+            ]
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -516,7 +723,15 @@ def __hash__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
+        return self._time_window_at_or_after(partition_key_dt.timestamp())
+
+    def _time_window_at_or_after(self, timestamp: float) -> TimeWindow:
+        schedule = self._fixed_period_schedule
+        index = schedule.index_at_or_after(timestamp) if schedule else None
+        if schedule and index is not None:
+            return self._time_window_for_partition_index(schedule, index)
+
+        return next(iter(self._iterate_time_windows(timestamp)))
 
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
@@ -527,30 +742,43 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
-        sorted_pks = sorted(
-            partition_keys,
-            key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
-        )
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
-            )
-        )
-        partition_key_time_windows: List[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if (
-                dst_safe_strftime(next_window.start, self.timezone, self.fmt, self.cron_schedule)
-                == partition_key
-            ):
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
+        if self._fixed_period_schedule:
+            partition_key_time_windows = sorted(
+                (
+                    self._time_window_at_or_after(
                         dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
                     )
+                    for partition_key in partition_keys
+                ),
+                key=lambda tw: tw.start.timestamp(),
+            )
+        else:
+            sorted_pks = sorted(
+                partition_keys,
+                key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
+            )
+            cur_windows_iterator = iter(
+                self._iterate_time_windows(
+                    dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
                 )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+            )
+            partition_key_time_windows: List[TimeWindow] = []
+            for partition_key in sorted_pks:
+                next_window = next(cur_windows_iterator)
+                if (
+                    dst_safe_strftime(
+                        next_window.start, self.timezone, self.fmt, self.cron_schedule
+                    )
+                    == partition_key
+                ):
+                    partition_key_time_windows.append(next_window)
+                else:
+                    cur_windows_iterator = iter(
+                        self._iterate_time_windows(
+                            dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+                        )
+                    )
+                    partition_key_time_windows.append(next(cur_windows_iterator))
 
         if validate:
             start_time_window = self.get_first_partition_window()
@@ -576,7 +804,7 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
+        return self._time_window_at_or_after(partition_key_dt.timestamp()).start
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
@@ -672,17 +900,25 @@ def _get_last_partition_window(self, *, current_timestamp: float) -> Optional[Ti
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
-        else:
-            # TODO: make this efficient
-            last_partition_key = super().get_last_partition_key(
-                datetime.fromtimestamp(current_timestamp, tz=get_timezone(self.timezone))
-            )
+
+        schedule = self._fixed_period_schedule
+        num_partitions = (
+            self._get_fixed_period_num_partitions(schedule, current_timestamp) if schedule else None
+        )
+        if schedule and num_partitions is not None:
             return (
-                self.time_window_for_partition_key(last_partition_key)
-                if last_partition_key
+                self._time_window_for_partition_index(schedule, num_partitions - 1)
+                if num_partitions
                 else None
             )
 
+        last_partition_key = super().get_last_partition_key(
+            datetime.fromtimestamp(current_timestamp, tz=get_timezone(self.timezone))
+        )
+        return (
+            self.time_window_for_partition_key(last_partition_key) if last_partition_key else None
+        )
+
     def get_last_partition_window(
         self, current_time: Optional[datetime] = None
     ) -> Optional[TimeWindow]:
@@ -716,6 +952,16 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        schedule = self._fixed_period_schedule
+        if schedule:
+            start_index = schedule.index_at_or_after(time_window.start.timestamp())
+            end_index = schedule.index_at_or_after(time_window.end.timestamp())
+            if start_index is not None and end_index is not None:
+                return [
+                    self._partition_key_for_partition_index(schedule, idx)
+                    for idx in range(start_index, end_index)
+                ]
+
         result: List[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
@@ -937,6 +1183,20 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        schedule = self._fixed_period_schedule
+        if schedule:
+            # the last window that starts before the timestamp if end_closed, otherwise the last
+            # window that starts at or before the timestamp
+            index = (
+                schedule.index_at_or_after(timestamp)
+                if end_closed
+                else schedule.index_at_or_before(timestamp)
+            )
+            if index is not None:
+                return self._partition_key_for_partition_index(
+                    schedule, index - 1 if end_closed else index
+                )
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -237,7 +237,8 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
+# These were the only events supported in `EventLogStorage.store_event_batch` before batches of
+# arbitrary events were supported. Retained for backwards compatibility.
 BATCH_WRITABLE_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
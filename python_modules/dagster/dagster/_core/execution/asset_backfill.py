@@ -49,7 +49,8 @@
     DagsterDefinitionChangedDeserializationError,
     DagsterInvariantViolationError,
 )
-from dagster._core.event_api import AssetRecordsFilter
+from dagster._core.event_api import AssetRecordsFilter, RunStatusChangeRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.submit_asset_runs import submit_asset_run
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.dagster_run import (
@@ -81,6 +82,8 @@ def get_asset_backfill_run_chunk_size():
 
 MATERIALIZATION_CHUNK_SIZE = 1000
 
+RUN_STATUS_CHANGE_CHUNK_SIZE = 1000
+
 MAX_RUNS_CANCELED_PER_ITERATION = 50
 
 
@@ -135,7 +138,7 @@ def __new__(cls, asset_key: AssetKey, asset_backfill_status: Optional[AssetBackf
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(skip_when_empty_fields={"frontier_subset"})
 class AssetBackfillData(NamedTuple):
     """Has custom serialization instead of standard Dagster NamedTuple serialization because the
     asset graph is required to build the AssetGraphSubset objects.
@@ -148,6 +151,9 @@ class AssetBackfillData(NamedTuple):
     requested_subset: AssetGraphSubset
     failed_and_downstream_subset: AssetGraphSubset
     backfill_start_time: TimestampWithTimezone
+    # targeted asset partitions whose parents were materialized by the backfill, but that have not
+    # been requested yet. None for backfills that were last updated before the frontier was tracked.
+    frontier_subset: Optional[AssetGraphSubset] = None
 
     @property
     def backfill_start_timestamp(self) -> float:
@@ -459,6 +465,13 @@ def from_serialized(
             ),
             latest_storage_id=storage_dict["latest_storage_id"],
             backfill_start_time=TimestampWithTimezone(backfill_start_timestamp, "UTC"),
+            frontier_subset=(
+                AssetGraphSubset.from_storage_dict(
+                    storage_dict["serialized_frontier_subset"], asset_graph
+                )
+                if storage_dict.get("serialized_frontier_subset") is not None
+                else None
+            ),
         )
 
     @classmethod
@@ -606,6 +619,10 @@ def serialize(
                 dynamic_partitions_store=dynamic_partitions_store, asset_graph=asset_graph
             ),
         }
+        if self.frontier_subset is not None:
+            storage_dict["serialized_frontier_subset"] = self.frontier_subset.to_storage_dict(
+                dynamic_partitions_store=dynamic_partitions_store, asset_graph=asset_graph
+            )
         return json.dumps(storage_dict)
 
 
@@ -1212,6 +1229,7 @@ def get_canceling_asset_backfill_iteration_data(
         | failed_subset,
         requested_subset=asset_backfill_data.requested_subset,
         backfill_start_time=TimestampWithTimezone(backfill_start_timestamp, "UTC"),
+        frontier_subset=asset_backfill_data.frontier_subset,
     )
 
     yield updated_backfill_data
@@ -1273,7 +1291,22 @@ def _get_failed_and_downstream_asset_partitions(
     instance_queryer: CachingInstanceQueryer,
     backfill_start_timestamp: float,
 ) -> AssetGraphSubset:
-    failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
+    """Adds the asset partitions of the runs of the backfill that failed or were canceled since the
+    last iteration, and everything downstream of them that the backfill targets, to the failed
+    subset of the backfill.
+    """
+    failed_asset_partitions = _get_failed_asset_partitions(
+        instance_queryer,
+        backfill_id,
+        asset_graph,
+        run_ids=_get_run_ids_failed_or_canceled_since(
+            instance_queryer.instance, asset_backfill_data.latest_storage_id
+        ),
+    )
+    if not failed_asset_partitions:
+        return asset_backfill_data.failed_and_downstream_subset
+
+    newly_failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
         asset_graph.bfs_filter_asset_partitions(
             instance_queryer,
             lambda asset_partitions, _: (
@@ -1283,12 +1316,87 @@ def _get_failed_and_downstream_asset_partitions(
                 ),
                 "",
             ),
-            _get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph),
+            failed_asset_partitions,
             evaluation_time=datetime_from_timestamp(backfill_start_timestamp),
         )[0],
         asset_graph,
     )
-    return failed_and_downstream_subset
+    return asset_backfill_data.failed_and_downstream_subset | newly_failed_and_downstream_subset
+
+
+def _get_run_ids_failed_or_canceled_since(
+    instance: DagsterInstance, after_storage_id: Optional[int]
+) -> Optional[Sequence[str]]:
+    """Returns the ids of the runs that failed or were canceled after the given storage id, or None
+    if there is no storage id to start from.
+    """
+    if after_storage_id is None:
+        return None
+
+    run_ids: Set[str] = set()
+    for event_type in (DagsterEventType.RUN_FAILURE, DagsterEventType.RUN_CANCELED):
+        cursor = None
+        has_more = True
+        while has_more:
+            result = instance.fetch_run_status_changes(
+                RunStatusChangeRecordsFilter(
+                    event_type=event_type, after_storage_id=after_storage_id
+                ),
+                limit=RUN_STATUS_CHANGE_CHUNK_SIZE,
+                cursor=cursor,
+                ascending=True,
+            )
+            run_ids.update(record.run_id for record in result.records)
+            cursor = result.cursor
+            has_more = result.has_more
+    return list(run_ids)
+
+
+def _get_target_children_subset(
+    parent_subset: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+    asset_graph: RemoteAssetGraph,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    current_time: datetime,
+) -> AssetGraphSubset:
+    """Returns the asset partitions targeted by the backfill that depend on any of the given asset
+    partitions, mapped through the partition mappings between each parent and child.
+    """
+    children_subset = AssetGraphSubset()
+    for parent_asset_subset in parent_subset.iterate_asset_subsets(asset_graph):
+        parent_node = asset_graph.get(parent_asset_subset.key)
+        for child_key in parent_node.child_keys:
+            if child_key not in target_subset:
+                continue
+
+            child_partitions_def = asset_graph.get(child_key).partitions_def
+            if child_partitions_def is None:
+                children_subset |= AssetGraphSubset(non_partitioned_asset_keys={child_key})
+                continue
+
+            target_child_partitions_subset = target_subset.get_partitions_subset(
+                child_key, asset_graph
+            )
+            if parent_node.partitions_def is None:
+                # every partition of the child depends on an unpartitioned parent
+                child_partitions_subset = target_child_partitions_subset
+            else:
+                child_partitions_subset = asset_graph.get_partition_mapping(
+                    child_key, parent_asset_subset.key
+                ).get_downstream_partitions_for_partitions(
+                    parent_asset_subset.subset_value,
+                    parent_node.partitions_def,
+                    downstream_partitions_def=child_partitions_def,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                    current_time=current_time,
+                )
+                child_partitions_subset = target_child_partitions_subset & child_partitions_subset
+
+            children_subset |= AssetGraphSubset(
+                partitions_subsets_by_asset_key={child_key: child_partitions_subset}
+            )
+
+    return children_subset
 
 
 def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int:
@@ -1369,6 +1477,7 @@ def execute_asset_backfill_iteration_inner(
 
         updated_materialized_subset = AssetGraphSubset()
         failed_and_downstream_subset = AssetGraphSubset()
+        frontier_subset = AssetGraphSubset()
         next_latest_storage_id = _get_next_latest_storage_id(instance_queryer)
     else:
         next_latest_storage_id = _get_next_latest_storage_id(instance_queryer)
@@ -1400,16 +1509,18 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
-        parent_materialized_asset_partitions = set().union(
-            *(
-                instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
-                    latest_storage_id=asset_backfill_data.latest_storage_id,
-                    child_asset_key=asset_key,
-                )[0]
-                for asset_key in asset_backfill_data.target_subset.asset_keys
-            )
+        # only the children of the partitions that were materialized since the last tick can have
+        # become ready to request, along with the frontier of partitions that were not ready yet
+        frontier_subset = (
+            asset_backfill_data.frontier_subset or AssetGraphSubset()
+        ) | _get_target_children_subset(
+            materialized_since_last_tick,
+            asset_backfill_data.target_subset,
+            asset_graph,
+            instance_queryer,
+            datetime_from_timestamp(backfill_start_timestamp),
         )
-        initial_candidates.update(parent_materialized_asset_partitions)
+        initial_candidates.update(frontier_subset.iterate_asset_partitions())
 
         yield None
 
@@ -1507,6 +1618,15 @@ def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
             "At least one run should be requested on first backfill iteration",
         )
 
+    # partitions leave the frontier once they are requested, materialized, or failed
+    updated_frontier_subset = (
+        frontier_subset
+        - AssetGraphSubset.from_asset_partition_set(set(asset_partitions_to_request), asset_graph)
+        - asset_backfill_data.requested_subset
+        - updated_materialized_subset
+        - failed_and_downstream_subset
+    )
+
     updated_asset_backfill_data = AssetBackfillData(
         target_subset=asset_backfill_data.target_subset,
         latest_storage_id=next_latest_storage_id or asset_backfill_data.latest_storage_id,
@@ -1516,6 +1636,7 @@ def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
         failed_and_downstream_subset=failed_and_downstream_subset,
         requested_subset=asset_backfill_data.requested_subset,
         backfill_start_time=TimestampWithTimezone(backfill_start_timestamp, "UTC"),
+        frontier_subset=updated_frontier_subset,
     )
     yield AssetBackfillIterationResult(
         run_requests,
@@ -1680,16 +1801,23 @@ def should_backfill_atomic_asset_partitions_unit(
 
 
 def _get_failed_asset_partitions(
-    instance_queryer: CachingInstanceQueryer, backfill_id: str, asset_graph: RemoteAssetGraph
+    instance_queryer: CachingInstanceQueryer,
+    backfill_id: str,
+    asset_graph: RemoteAssetGraph,
+    run_ids: Optional[Sequence[str]] = None,
 ) -> Sequence[AssetKeyPartitionKey]:
     """Returns asset partitions that materializations were requested for as part of the backfill, but
     will not be materialized.
 
     Includes canceled asset partitions. Implementation assumes that successful runs won't have any
-    failed partitions.
+    failed partitions. If run_ids is provided, only those runs of the backfill are considered.
     """
-    runs = instance_queryer.instance.get_runs(
+    if run_ids is not None and not run_ids:
+        return []
+
+    runs = instance_queryer.instance.get_run_summary_records(
         filters=RunsFilter(
+            run_ids=run_ids,
             tags={BACKFILL_ID_TAG: backfill_id},
             statuses=[DagsterRunStatus.CANCELED, DagsterRunStatus.FAILURE],
         )
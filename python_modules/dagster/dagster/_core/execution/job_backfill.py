@@ -96,7 +96,7 @@ def execute_job_backfill_iteration(
             yield None
             time.sleep(CHECKPOINT_INTERVAL)
         else:
-            unfinished_runs = instance.get_runs(
+            unfinished_runs = instance.get_run_summary_records(
                 RunsFilter(
                     tags=DagsterRun.tags_for_backfill_id(backfill.backfill_id),
                     statuses=NOT_FINISHED_STATUSES,
@@ -196,7 +196,7 @@ def _get_partitions_chunk(
         partition_names = partition_names[index + 1 :]
 
     # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
+    backfill_runs = instance.get_run_summary_records(
         RunsFilter(tags=DagsterRun.tags_for_backfill_id(backfill_job.backfill_id))
     )
     # fetching the partitions def of a legacy dynamic partitioned op-job will raise an error
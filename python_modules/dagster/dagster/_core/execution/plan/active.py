@@ -1,3 +1,4 @@
+import heapq
 import time
 from types import TracebackType
 from typing import (
@@ -10,6 +11,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -86,7 +88,22 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # steps that have reached a terminal state, see _mark_resolved
+        self._resolved: Set[str] = set()
+        # for each pending step, the number of its deps that have not been resolved yet
+        self._unresolved_dep_counts: Dict[str, int] = {}
+        # for each step, the pending steps that depend on it
+        self._pending_downstream: Dict[str, Set[str]] = {}
+        # pending steps whose deps have all been resolved, mapped to the order in which they were
+        # added to _pending so that _update processes them in a stable order
+        self._ready_pending: Dict[str, int] = {}
+        self._pending_order: Dict[str, int] = {}
+        self._pending_count: int = 0
+
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -100,8 +117,10 @@ def __init__(
         # track which upstream deps caused a step to skip
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls, with _executable kept as a
+        # heap ordered by sort key, and then by the order in which steps became executable
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_count: int = 0
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -175,7 +194,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [step_key for _, _, step_key in sorted(self._executable)]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -197,16 +219,53 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = self._pending_count
+        self._pending_count += 1
+
+        unresolved_count = 0
+        for dep in deps:
+            if dep not in self._resolved:
+                unresolved_count += 1
+                self._pending_downstream.setdefault(dep, set()).add(step_key)
+
+        self._unresolved_dep_counts[step_key] = unresolved_count
+        if unresolved_count == 0:
+            self._ready_pending[step_key] = self._pending_order[step_key]
+
+    def _mark_resolved(self, step_key: str) -> None:
+        """Record that a step reached a terminal state, only visiting the pending steps that
+        depend on it.
+        """
+        if step_key in self._resolved:
+            return
+
+        self._resolved.add(step_key)
+        for downstream_key in self._pending_downstream.pop(step_key, ()):
+            if downstream_key not in self._pending:
+                continue
+            self._unresolved_dep_counts[downstream_key] -= 1
+            if self._unresolved_dep_counts[downstream_key] == 0:
+                self._ready_pending[downstream_key] = self._pending_order[downstream_key]
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), self._executable_count, step_key),
+        )
+        self._executable_count += 1
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -223,41 +282,30 @@ def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
+        # only the pending steps whose deps have all been resolved need to be considered, which
+        # _mark_resolved keeps track of as steps complete
+        if self._ready_pending:
+            ready_keys = sorted(self._ready_pending, key=self._ready_pending.__getitem__)
+            self._ready_pending = {}
+
+            for step_key in ready_keys:
+                depends_on_steps = self._pending.pop(step_key)
+                del self._unresolved_dep_counts[step_key]
+                del self._pending_order[step_key]
+
+                if self._should_skip_step(step_key):
+                    self._pending_skip.append(step_key)
+                elif any(dep in self._failed or dep in self._abandoned for dep in depends_on_steps):
+                    self._pending_abandon.append(step_key)
                 else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+                    self._push_executable(step_key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -266,7 +314,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_interval(self):
@@ -318,11 +366,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -332,8 +375,11 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        # steps that could not be executed yet, to be put back in _executable
+        blocked: List[Tuple[float, int, str]] = []
+        claimed_in_batch = self._claim_global_concurrency_slots_in_batch(limit)
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -343,8 +389,12 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
             if run_scoped_concurrency_limits_counter:
@@ -352,35 +402,71 @@ def get_steps_to_execute(
 
             step_concurrency_key = step.tags.get(GLOBAL_CONCURRENCY_TAG)
             if step_concurrency_key and self._instance_concurrency_context:
-                try:
-                    step_priority = int(step.tags.get(PRIORITY_TAG, 0))
-                except ValueError:
-                    step_priority = 0
-
                 if not self._instance_concurrency_context.claim(
-                    step_concurrency_key, step.key, step_priority
+                    step_concurrency_key, step.key, _get_step_priority(step)
                 ):
+                    blocked.append(entry)
                     continue
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
+        if claimed_in_batch and self._instance_concurrency_context:
+            # give back the slots of any steps that were claimed for but not launched after all
+            launched = {step.key for step in batch}
+            for step_key in claimed_in_batch - launched:
+                self._instance_concurrency_context.free_step(step_key)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
 
+    def _claim_global_concurrency_slots_in_batch(self, limit: Optional[int]) -> Set[str]:
+        """Claim global concurrency slots for the executable steps that are next in line with a
+        single storage call per concurrency key, instead of one call per step. Returns the keys of
+        the steps that claimed a slot.
+        """
+        if not self._instance_concurrency_context or self._tag_concurrency_limits:
+            return set()
+
+        budget = limit
+        if self._max_concurrent is not None:
+            available = self._max_concurrent - len(self._in_flight)
+            budget = available if budget is None else min(budget, available)
+
+        if budget is None:
+            entries = sorted(self._executable)
+        elif budget > 0:
+            entries = heapq.nsmallest(budget, self._executable)
+        else:
+            return set()
+
+        claims = []
+        for _, _, step_key in entries:
+            step = self.get_step_by_key(step_key)
+            step_concurrency_key = step.tags.get(GLOBAL_CONCURRENCY_TAG)
+            if step_concurrency_key:
+                claims.append((step_concurrency_key, step_key, _get_step_priority(step)))
+
+        if len(claims) < 2:
+            return set()
+
+        return self._instance_concurrency_context.claim_batch(claims)
+
     def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
             self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
 
@@ -390,11 +476,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -446,20 +532,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -479,7 +569,7 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
@@ -488,6 +578,8 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
         self._retry_state.mark_attempt(step_key)
 
         self._mark_complete(step_key)
+        if self._retry_mode.deferred:
+            self._mark_resolved(step_key)
 
     def _mark_complete(self, step_key: str) -> None:
         check.invariant(
@@ -662,3 +754,10 @@ def concurrency_event_iterator(
                 yield DagsterEvent.step_concurrency_blocked(
                     step_context, step_concurrency_key, initial=is_initial_message
                 )
+
+
+def _get_step_priority(step: ExecutionStep) -> int:
+    try:
+        return int(step.tags.get(PRIORITY_TAG, 0))
+    except ValueError:
+        return 0
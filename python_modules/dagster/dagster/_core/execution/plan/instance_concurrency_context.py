@@ -1,17 +1,20 @@
 import time
 from collections import defaultdict
 from types import TracebackType
-from typing import List, Optional, Set, Type
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Type
 
 from typing_extensions import Self
 
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._utils.concurrency import ConcurrencyClaimStatus
 
 INITIAL_INTERVAL_VALUE = 1
 STEP_UP_BASE = 1.1
 MAX_CONCURRENCY_CLAIM_BLOCKED_INTERVAL = 15
+# the maximum number of steps to claim slots for in a single storage call
+CONCURRENCY_CLAIM_BATCH_SIZE = 500
 
 
 class InstanceConcurrencyContext:
@@ -36,6 +39,9 @@ def __init__(self, instance: DagsterInstance, dagster_run: DagsterRun):
         self._pending_claim_counts = defaultdict(int)
         self._pending_claims = set()
         self._claims = set()
+        # the concurrency key of each pending or claimed step, so that pending steps can be woken up
+        # when a step of the same key frees its slot
+        self._concurrency_keys_by_step: Dict[str, str] = {}
         try:
             self._run_priority = int(dagster_run.tags.get(PRIORITY_TAG, "0"))
         except ValueError:
@@ -60,6 +66,7 @@ def __exit__(
             del self._pending_timeouts[step_key]
             del self._pending_claim_counts[step_key]
             self._pending_claims.remove(step_key)
+            self._concurrency_keys_by_step.pop(step_key, None)
 
         self._context_guard = False
 
@@ -80,9 +87,9 @@ def global_concurrency_keys(self) -> Set[str]:
     def _sync_global_concurrency_keys(self) -> None:
         self._global_concurrency_keys = self._instance.event_log_storage.get_concurrency_keys()
 
-    def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0):
+    def _is_concurrency_limited(self, concurrency_key: str) -> bool:
         if not self._instance.event_log_storage.supports_global_concurrency_limits:
-            return True
+            return False
 
         if concurrency_key not in self.global_concurrency_keys:
             # The initialization call will be a no-op if the limit is set by another process,
@@ -91,11 +98,14 @@ def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0):
                 concurrency_key
             ):
                 # still default open if the limit table has not been initialized
-                return True
+                return False
             else:
                 # sync the global concurrency keys to ensure we have the latest
                 self._sync_global_concurrency_keys()
 
+        return True
+
+    def _should_check_claim(self, concurrency_key: str, step_key: str) -> bool:
         if step_key in self._pending_claims:
             if time.time() > self._pending_timeouts[step_key]:
                 del self._pending_timeouts[step_key]
@@ -103,12 +113,59 @@ def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0):
                 return False
         else:
             self._pending_claims.add(step_key)
+            self._concurrency_keys_by_step[step_key] = concurrency_key
+        return True
+
+    def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0):
+        if step_key in self._claims:
+            # already claimed, e.g. by `claim_batch`
+            return True
+
+        if not self._is_concurrency_limited(concurrency_key):
+            return True
+
+        if not self._should_check_claim(concurrency_key, step_key):
+            return False
 
         priority = self._run_priority + step_priority
         claim_status = self._instance.event_log_storage.claim_concurrency_slot(
             concurrency_key, self._run_id, step_key, priority
         )
+        return self._handle_claim_status(step_key, claim_status)
+
+    def claim_batch(self, claims: Sequence[Tuple[str, str, int]]) -> Set[str]:
+        """Claim slots for many steps at once, given as (concurrency key, step key, step priority)
+        tuples, with a single storage call per concurrency key. Returns the keys of the steps that
+        claimed a slot, which are then also reported as claimed by `claim`.
+        """
+        step_priorities_by_key: Dict[str, Dict[str, int]] = {}
+        for concurrency_key, step_key, step_priority in claims:
+            if step_key in self._claims or not self._is_concurrency_limited(concurrency_key):
+                continue
+            if not self._should_check_claim(concurrency_key, step_key):
+                continue
+            step_priorities_by_key.setdefault(concurrency_key, {})[step_key] = (
+                self._run_priority + step_priority
+            )
+
+        claimed = set()
+        for concurrency_key, step_priorities in step_priorities_by_key.items():
+            step_keys = list(step_priorities.keys())
+            for i in range(0, len(step_keys), CONCURRENCY_CLAIM_BATCH_SIZE):
+                claim_statuses = self._instance.event_log_storage.claim_concurrency_slots(
+                    concurrency_key,
+                    self._run_id,
+                    {
+                        step_key: step_priorities[step_key]
+                        for step_key in step_keys[i : i + CONCURRENCY_CLAIM_BATCH_SIZE]
+                    },
+                )
+                for step_key, claim_status in claim_statuses.items():
+                    if self._handle_claim_status(step_key, claim_status):
+                        claimed.add(step_key)
+        return claimed
 
+    def _handle_claim_status(self, step_key: str, claim_status: ConcurrencyClaimStatus) -> bool:
         if not claim_status.is_claimed:
             interval = _calculate_timeout_interval(
                 claim_status.sleep_interval, self._pending_claim_counts[step_key]
@@ -143,6 +200,13 @@ def free_step(self, step_key) -> None:
         self._instance.event_log_storage.free_concurrency_slot_for_step(self._run_id, step_key)
         self._claims.remove(step_key)
 
+        # the freed slot may now be assigned to one of our pending steps, so check their claims
+        # right away instead of waiting out their backoff intervals
+        concurrency_key = self._concurrency_keys_by_step.pop(step_key, None)
+        for pending_step_key in self._pending_claims:
+            if self._concurrency_keys_by_step.get(pending_step_key) == concurrency_key:
+                self._pending_timeouts[pending_step_key] = 0.0
+
 
 def _calculate_timeout_interval(sleep_interval: Optional[float], pending_claim_count: int) -> float:
     if sleep_interval is not None:
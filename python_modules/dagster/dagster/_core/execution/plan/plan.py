@@ -1277,7 +1277,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1347,7 +1347,7 @@ def _compute_step_maps(
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
     past_mappings = known_state.dynamic_mappings if known_state else {}
 
     executable_map: Dict[str, Union[StepHandle, ResolvedFromDynamicStepHandle]] = {}
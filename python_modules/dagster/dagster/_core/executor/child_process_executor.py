@@ -7,7 +7,7 @@
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
@@ -43,6 +43,14 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerRetiringEvent(
+    NamedTuple("ChildProcessWorkerRetiringEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Emitted by a worker process before the done event of its final command, signaling that
+    the worker will exit instead of accepting another command.
+    """
+
+
 class ChildProcessCommand(ABC):
     """Inherit from this class in order to use this library.
 
@@ -93,6 +101,79 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
             )
 
 
+class ChildProcessWorker(ABC):
+    """Inherit from this class in order to execute a series of commands in a single long-lived
+    child process.
+
+    The object must be picklable; instantiate it and pass it to a ChildProcessWorkerPool. Any state
+    that is expensive to build (loaded code, instances, etc.) should be lazily initialized inside
+    execute so that it is created once in the child process and reused across commands.
+    """
+
+    @abstractmethod
+    def execute(self, command: Any) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the child process once for each dispatched command.
+
+        Yields a sequence of events to be handled by execute_child_process_worker_command.
+        """
+
+    def should_exit(self) -> bool:
+        """Invoked in the child process after each command. Return True to have the worker exit
+        rather than accept another command.
+        """
+        return False
+
+    def dispose(self) -> None:
+        """Invoked in the child process before the worker exits."""
+
+
+def _execute_commands_in_worker_process(
+    command_queue: Queue, event_queue: Queue, worker: ChildProcessWorker
+):
+    """Wraps the execution of a sequence of commands by a ChildProcessWorker.
+
+    Each command is reported to the parent process with the same start / done / error events
+    used by _execute_command_in_child_process. A None command instructs the worker to exit.
+    """
+    check.inst_param(worker, "worker", ChildProcessWorker)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        try:
+            while True:
+                command = command_queue.get()
+                if command is None:
+                    break
+
+                event_queue.put(ChildProcessStartEvent(pid=pid))
+                try:
+                    for step_event in worker.execute(command):
+                        event_queue.put(step_event)
+                    should_exit = worker.should_exit()
+                    if should_exit:
+                        event_queue.put(ChildProcessWorkerRetiringEvent(pid=pid))
+                    event_queue.put(ChildProcessDoneEvent(pid=pid))
+                except (
+                    Exception,
+                    KeyboardInterrupt,
+                    DagsterExecutionInterruptedError,
+                ):
+                    # the worker may be in an unknown state after an error, so do not reuse it
+                    should_exit = True
+                    event_queue.put(ChildProcessWorkerRetiringEvent(pid=pid))
+                    event_queue.put(
+                        ChildProcessSystemErrorEvent(
+                            pid=pid,
+                            error_info=serializable_error_info_from_exc_info(sys.exc_info()),
+                        )
+                    )
+
+                if should_exit:
+                    break
+        finally:
+            worker.dispose()
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -175,3 +256,149 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+class ChildProcessWorkerHandle:
+    """Parent process handle to a long-lived worker process started by a ChildProcessWorkerPool."""
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        worker: ChildProcessWorker,
+        term_event: Any,
+    ):
+        self.term_event = term_event
+        self.command_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(self.command_queue, self.event_queue, worker),
+        )
+        self.retiring = False
+        self.commands_dispatched = 0
+
+    def start(self) -> None:
+        self.process.start()
+
+    @property
+    def is_reusable(self) -> bool:
+        return not self.retiring and not self.term_event.is_set() and self.process.is_alive()
+
+    def stop(self, timeout: float) -> None:
+        if self.process.is_alive():
+            self.command_queue.put(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.command_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A bounded pool of long-lived worker processes that commands can be dispatched to.
+
+    Workers are started lazily as commands are dispatched, are returned to the pool once their
+    command completes, and are discarded when they retire, crash, or are asked to terminate.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
+        create_worker (Callable[[Any], ChildProcessWorker]): Builds the worker for a new process,
+            given the multiprocessing event the parent will set to interrupt that worker.
+        max_workers (int): The maximum number of worker processes alive at once.
+    """
+
+    SHUTDOWN_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        create_worker: Callable[[Any], ChildProcessWorker],
+        max_workers: int,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._create_worker = check.callable_param(create_worker, "create_worker")
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._idle: List[ChildProcessWorkerHandle] = []
+        self._busy: List[ChildProcessWorkerHandle] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._idle) + len(self._busy)
+
+    def acquire(self) -> ChildProcessWorkerHandle:
+        while self._idle:
+            handle = self._idle.pop()
+            if handle.is_reusable:
+                self._busy.append(handle)
+                return handle
+            handle.stop(self.SHUTDOWN_TIMEOUT)
+
+        check.invariant(
+            len(self._busy) < self._max_workers,
+            f"Can not start more than {self._max_workers} worker processes",
+        )
+        term_event = self._multiprocessing_ctx.Event()
+        handle = ChildProcessWorkerHandle(
+            self._multiprocessing_ctx, self._create_worker(term_event), term_event
+        )
+        handle.start()
+        self._busy.append(handle)
+        return handle
+
+    def release(self, handle: ChildProcessWorkerHandle) -> None:
+        if handle not in self._busy:
+            return
+        self._busy.remove(handle)
+        if handle.is_reusable:
+            self._idle.append(handle)
+        else:
+            handle.stop(self.SHUTDOWN_TIMEOUT)
+
+    def shutdown(self) -> None:
+        for handle in self._idle + self._busy:
+            handle.stop(self.SHUTDOWN_TIMEOUT)
+        self._idle = []
+        self._busy = []
+
+
+def execute_child_process_worker_command(
+    handle: ChildProcessWorkerHandle, command: Any
+) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+    """Dispatch a command to a long-lived worker process.
+
+    Yields the same sequence of objects as execute_child_process_command, but rather than starting
+    a new process for the command, the command is sent to an already running worker process.
+    Polls the worker's event queue until the command completes or the worker dies.
+    """
+    check.inst_param(handle, "handle", ChildProcessWorkerHandle)
+
+    handle.commands_dispatched += 1
+    handle.command_queue.put(command)
+    yield handle.process
+
+    completed_properly = False
+
+    while not completed_properly:
+        event = _poll_for_event(handle.process, handle.event_queue)
+
+        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+            break
+
+        if isinstance(event, ChildProcessWorkerRetiringEvent):
+            handle.retiring = True
+
+        yield event
+
+        if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+            completed_properly = True
+
+    if not completed_properly:
+        handle.retiring = True
+        raise ChildProcessCrashException(pid=handle.process.pid, exit_code=handle.process.exitcode)
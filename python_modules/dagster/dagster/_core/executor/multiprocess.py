@@ -5,7 +5,7 @@
 from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
 
 from dagster import _check as check
 from dagster._core.definitions.metadata import MetadataValue
@@ -32,9 +32,14 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerHandle,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    execute_child_process_worker_command,
 )
 from dagster._core.instance import DagsterInstance
+from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -107,6 +112,160 @@ def execute(self) -> Iterator[DagsterEvent]:
                 self.term_event.set()
 
 
+class MultiprocessWorkerPoolConfig(
+    NamedTuple(
+        "_MultiprocessWorkerPoolConfig",
+        [("max_steps_per_worker", Optional[int]), ("max_memory_mb", Optional[int])],
+    )
+):
+    """Configures the multiprocess executor to reuse a bounded pool of long-lived worker processes
+    instead of starting a new process for each step.
+
+    Args:
+        max_steps_per_worker (Optional[int]): Recycle a worker process after it has executed this
+            many steps. By default, workers are reused for the duration of the run.
+        max_memory_mb (Optional[int]): Recycle a worker process once its peak resident memory
+            exceeds this many megabytes.
+    """
+
+    def __new__(
+        cls, max_steps_per_worker: Optional[int] = None, max_memory_mb: Optional[int] = None
+    ):
+        return super().__new__(
+            cls,
+            max_steps_per_worker=check.opt_int_param(max_steps_per_worker, "max_steps_per_worker"),
+            max_memory_mb=check.opt_int_param(max_memory_mb, "max_memory_mb"),
+        )
+
+
+class MultiprocessWorkerStepCommand(NamedTuple):
+    step_key: str
+    known_state: Optional[KnownExecutionState]
+
+
+def _get_peak_memory_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+class MultiprocessExecutorWorker(ChildProcessWorker):
+    """Executes steps of a single run in a long-lived worker process.
+
+    The instance, the job definition and the resolved run config are loaded once, the first time
+    the worker executes a step, and are reused for every subsequent step dispatched to the worker.
+    """
+
+    def __init__(
+        self,
+        run_config: Mapping[str, object],
+        dagster_run: "DagsterRun",
+        instance_ref: "InstanceRef",
+        term_event: Any,
+        recon_pipeline: ReconstructableJob,
+        retry_mode: RetryMode,
+        repository_load_data: Optional[RepositoryLoadData],
+        pool_config: MultiprocessWorkerPoolConfig,
+    ):
+        self.run_config = run_config
+        self.dagster_run = dagster_run
+        self.instance_ref = instance_ref
+        self.term_event = term_event
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+        self.repository_load_data = repository_load_data
+        self.pool_config = pool_config
+
+        # initialized in the worker process
+        self._steps_executed = 0
+        self._exit_stack: Optional[ExitStack] = None
+        self._instance: Optional[DagsterInstance] = None
+        self._resolved_run_config: Optional[ResolvedRunConfig] = None
+        self._idle_event: Optional[threading.Event] = None
+
+    def _initialize(self) -> DagsterInstance:
+        if self._instance is None:
+            self._exit_stack = ExitStack()
+            self._instance = self._exit_stack.enter_context(
+                DagsterInstance.from_ref(self.instance_ref)
+            )
+            self._idle_event = threading.Event()
+            self._idle_event.set()
+            start_termination_thread(self.term_event, self._idle_event)
+        return self._instance
+
+    def execute(self, command: MultiprocessWorkerStepCommand) -> Iterator[DagsterEvent]:
+        instance = self._initialize()
+        idle_event = check.not_none(self._idle_event)
+        recon_job = self.recon_pipeline.with_repository_load_data(self.repository_load_data)
+
+        idle_event.clear()
+        try:
+            log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+            yield DagsterEvent.step_worker_started(
+                log_manager,
+                self.dagster_run.job_name,
+                message=f'Executing step "{command.step_key}" in worker process.',
+                metadata={
+                    "pid": MetadataValue.text(str(os.getpid())),
+                    "steps_executed_by_worker": MetadataValue.int(self._steps_executed),
+                },
+                step_key=command.step_key,
+            )
+            job_def = recon_job.get_definition()
+            if self._resolved_run_config is None:
+                self._resolved_run_config = ResolvedRunConfig.build(job_def, self.run_config)
+
+            execution_plan = ExecutionPlan.build(
+                job_def,
+                self._resolved_run_config,
+                step_keys_to_execute=[command.step_key],
+                known_state=command.known_state,
+                repository_load_data=self.repository_load_data,
+            )
+            yield from execute_plan_iterator(
+                execution_plan,
+                recon_job,
+                self.dagster_run,
+                run_config=self.run_config,
+                retry_mode=self.retry_mode.for_inner_plan(),
+                instance=instance,
+            )
+        finally:
+            self._steps_executed += 1
+            idle_event.set()
+
+    def should_exit(self) -> bool:
+        if self.term_event.is_set():
+            return True
+
+        max_steps = self.pool_config.max_steps_per_worker
+        if max_steps is not None and self._steps_executed >= max_steps:
+            return True
+
+        max_memory_mb = self.pool_config.max_memory_mb
+        if max_memory_mb is not None:
+            peak_memory_mb = _get_peak_memory_mb()
+            if peak_memory_mb is not None and peak_memory_mb >= max_memory_mb:
+                return True
+
+        return False
+
+    def dispose(self) -> None:
+        if self._idle_event:
+            # set events to stop the termination thread on exit
+            self._idle_event.set()  # waiting on term_event so set idle first
+            self.term_event.set()
+        if self._exit_stack:
+            self._exit_stack.close()
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -115,6 +274,7 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        worker_pool_config: Optional[MultiprocessWorkerPoolConfig] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +300,9 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._worker_pool_config = check.opt_inst_param(
+            worker_pool_config, "worker_pool_config", MultiprocessWorkerPoolConfig
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -202,6 +365,26 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        create_worker=lambda term_event: MultiprocessExecutorWorker(
+                            run_config=plan_context.run_config,
+                            dagster_run=plan_context.dagster_run,
+                            instance_ref=plan_context.instance.get_ref(),
+                            term_event=term_event,
+                            recon_pipeline=job,
+                            retry_mode=self.retries,
+                            repository_load_data=execution_plan.repository_load_data,
+                            pool_config=check.not_none(self._worker_pool_config),
+                        ),
+                        max_workers=limit,
+                    )
+                )
+                if self._worker_pool_config
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             processes: Dict[str, BaseProcess] = {}
@@ -235,6 +418,20 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker_process(
+                                    worker_pool,
+                                    worker,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    active_execution.get_known_state(),
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -395,3 +592,35 @@ def execute_step_out_of_process(
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker_process(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorkerHandle,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    processes: Dict[str, BaseProcess],
+    known_state: KnownExecutionState,
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessWorkerStepCommand(step_key=step.key, known_state=known_state)
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Dispatching "{step.key}" to worker process.',
+        metadata={},
+    )
+
+    try:
+        for ret in execute_child_process_worker_command(worker, command):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            elif isinstance(ret, BaseProcess):
+                processes[step.key] = ret
+            else:
+                check.failed(f"Unexpected return value from worker process {type(ret)}")
+    finally:
+        worker_pool.release(worker)
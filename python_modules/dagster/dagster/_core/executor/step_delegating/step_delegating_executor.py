@@ -1,7 +1,19 @@
 import os
 import sys
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, cast
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    cast,
+)
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
@@ -14,9 +26,13 @@
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
+from dagster._core.executor.step_delegating.step_event_channel import (
+    StepEventChannel,
+    open_step_event_channel,
+)
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
 from dagster._core.instance import DagsterInstance
-from dagster._grpc.types import ExecuteStepArgs
+from dagster._grpc.types import ExecuteStepArgs, StepEventChannelAddress
 from dagster._time import get_current_datetime
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -27,6 +43,50 @@
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
 
+# one of STEP_EVENT_CHANNEL_TRANSPORTS, to have step workers notify the executor when they store
+# new events instead of only polling the event log for them
+DEFAULT_EVENT_CHANNEL = os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_EVENT_CHANNEL")
+
+# how often the event log is polled when step workers notify the executor of new events, to pick
+# up any notifications that were lost
+DEFAULT_EVENT_CHANNEL_FALLBACK_POLL_SECONDS = float(
+    os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_EVENT_CHANNEL_FALLBACK_POLL_SECONDS", "10.0")
+)
+
+
+class _SeenStorageIds:
+    """The storage ids of the events that the executor has already read from the event log.
+
+    Since the event log is read in order of storage id, only the highest storage id seen needs to
+    be kept, along with the storage ids seen within `window` of it, which can be read again when
+    the cursor is offset to pick up events that were committed out of order.
+    """
+
+    def __init__(self, window: int):
+        self._window = window
+        self._high_watermark: Optional[int] = None
+        self._recent: Set[int] = set()
+
+    def __contains__(self, storage_id: int) -> bool:
+        if self._high_watermark is None:
+            return False
+        if storage_id <= self._high_watermark - self._window:
+            return True
+        return storage_id in self._recent
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def update(self, storage_ids: Iterable[int]) -> None:
+        for storage_id in storage_ids:
+            self._recent.add(storage_id)
+            if self._high_watermark is None or storage_id > self._high_watermark:
+                self._high_watermark = storage_id
+
+        if self._high_watermark is not None:
+            floor = self._high_watermark - self._window
+            self._recent = {storage_id for storage_id in self._recent if storage_id > floor}
+
 
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
@@ -44,6 +104,8 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        event_channel: Optional[str] = None,
+        event_channel_fallback_poll_seconds: Optional[float] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -68,7 +130,22 @@ def __init__(
         )
         self._should_verify_step = should_verify_step
 
+        self._event_channel = check.opt_str_param(
+            event_channel, "event_channel", default=DEFAULT_EVENT_CHANNEL
+        )
+        self._event_channel_fallback_poll_seconds = cast(
+            float,
+            check.opt_float_param(
+                event_channel_fallback_poll_seconds,
+                "event_channel_fallback_poll_seconds",
+                default=DEFAULT_EVENT_CHANNEL_FALLBACK_POLL_SECONDS,
+            ),
+        )
+        # set while executing, so that step workers know where to notify the executor of new events
+        self._step_event_channel_address: Optional[StepEventChannelAddress] = None
+
         self._event_cursor: Optional[str] = None
+        self._has_more_events = False
         self._pop_events_offset = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_OFFSET", "0"))
 
         if self._pop_events_offset:
@@ -83,7 +160,7 @@ def retries(self):
         return self._retries
 
     def _pop_events(
-        self, instance: DagsterInstance, run_id: str, seen_storage_ids: Set[int]
+        self, instance: DagsterInstance, run_id: str, seen_storage_ids: _SeenStorageIds
     ) -> Sequence[DagsterEvent]:
         adjusted_cursor = self._event_cursor
 
@@ -104,6 +181,7 @@ def _pop_events(
             limit=self._pop_events_limit,
         )
         self._event_cursor = conn.cursor
+        self._has_more_events = conn.has_more
 
         dagster_events = [
             record.event_log_entry.dagster_event
@@ -131,14 +209,20 @@ def _get_step_handler_context(
                 known_state=active_execution.get_known_state(),
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
+                step_event_channel=self._step_event_channel_address,
             ),
             dagster_run=plan_context.dagster_run,
         )
 
+    def _open_step_event_channel(self) -> ContextManager[Optional[StepEventChannel]]:
+        if not self._event_channel:
+            return nullcontext()
+        return open_step_event_channel(self._event_channel)
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
-        seen_storage_ids = set()
+        seen_storage_ids = _SeenStorageIds(window=self._pop_events_offset)
 
         DagsterEvent.engine_event(
             plan_context,
@@ -147,7 +231,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         )
         with InstanceConcurrencyContext(
             plan_context.instance, plan_context.dagster_run
-        ) as instance_concurrency_context:
+        ) as instance_concurrency_context, self._open_step_event_channel() as step_event_channel:
+            self._step_event_channel_address = (
+                step_event_channel.address if step_event_channel else None
+            )
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -227,6 +314,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                 last_check_step_health_time = get_current_datetime()
 
+                # without an event channel, the event log is polled on every iteration
+                should_pop_events = True
+                last_pop_events_time = time.monotonic()
+
                 try:
                     # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
                     # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
@@ -264,7 +355,16 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                             return
 
-                        if active_execution.has_in_flight_steps:
+                        if step_event_channel and not should_pop_events:
+                            should_pop_events = (
+                                self._has_more_events
+                                or time.monotonic() - last_pop_events_time
+                                >= self._event_channel_fallback_poll_seconds
+                            )
+
+                        if active_execution.has_in_flight_steps and should_pop_events:
+                            last_pop_events_time = time.monotonic()
+                            should_pop_events = not step_event_channel
                             for dagster_event in self._pop_events(
                                 plan_context.instance,
                                 plan_context.run_id,
@@ -324,6 +424,8 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                             health_check_error,
                                             active_execution.get_known_state(),
                                         )
+                                        # read the event that was just stored for the step
+                                        should_pop_events = True
 
                                 except Exception:
                                     serializable_error = serializable_error_info_from_exc_info(
@@ -338,6 +440,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                             user_failure_data=None,
                                         ),
                                     )
+                                    should_pop_events = True
 
                         if self._max_concurrent is not None:
                             max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -360,7 +463,12 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                 )
                             )
 
-                        time.sleep(self._sleep_seconds)
+                        if step_event_channel:
+                            # wake up as soon as a step worker stores new events
+                            if step_event_channel.wait(self._sleep_seconds):
+                                should_pop_events = True
+                        else:
+                            time.sleep(self._sleep_seconds)
                 except Exception:
                     if not active_execution.is_complete and running_steps:
                         serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
@@ -0,0 +1,187 @@
+import os
+import select
+import shutil
+import socket
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Type
+
+from typing_extensions import Self
+
+import dagster._check as check
+from dagster._grpc.types import StepEventChannelAddress
+
+SOCKET_STEP_EVENT_CHANNEL = "socket"
+FILE_STEP_EVENT_CHANNEL = "file"
+STEP_EVENT_CHANNEL_TRANSPORTS = (SOCKET_STEP_EVENT_CHANNEL, FILE_STEP_EVENT_CHANNEL)
+
+# the host that step workers use to reach the orchestrator over a socket channel, if the hostname of
+# the orchestrator does not resolve to an address they can reach
+STEP_EVENT_CHANNEL_HOST_ENV_VAR = "DAGSTER_STEP_EVENT_CHANNEL_HOST"
+
+# how often the file channel checks its directory for notifications while waiting
+FILE_STEP_EVENT_CHANNEL_CHECK_INTERVAL_SECONDS = 0.05
+
+# notifications only wake up the orchestrator, so they only need to carry enough to be logged
+MAX_NOTIFICATION_BYTES = 1024
+
+
+class StepEventChannel(ABC):
+    """The orchestrator side of a channel that step workers use to notify the
+    `StepDelegatingExecutor` that they stored new events for their steps.
+
+    Notifications are best-effort and carry no events. The event log remains the durable record of
+    what happened in each step, and the executor still reads the events from there after being
+    notified, falling back to polling the event log for notifications that are lost.
+    """
+
+    @property
+    @abstractmethod
+    def address(self) -> StepEventChannelAddress:
+        """The address that step workers send their notifications to."""
+
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for a notification, returning whether any notifications
+        were received since the last call. All pending notifications are consumed.
+        """
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class SocketStepEventChannel(StepEventChannel):
+    """Receives notifications as UDP datagrams, for step workers that can reach the orchestrator
+    over the network (e.g. Kubernetes pods or Docker containers on the same network).
+    """
+
+    def __init__(self, host: Optional[str] = None):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("0.0.0.0", 0))
+        self._socket.setblocking(False)
+        self._host = check.opt_str_param(host, "host") or _get_default_host()
+
+    @property
+    def address(self) -> StepEventChannelAddress:
+        return StepEventChannelAddress(
+            transport=SOCKET_STEP_EVENT_CHANNEL,
+            location=f"{self._host}:{self._socket.getsockname()[1]}",
+        )
+
+    def wait(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self._socket], [], [], max(timeout, 0))
+        if not readable:
+            return False
+
+        # drain everything that arrived, so that a burst of notifications only wakes us up once
+        while True:
+            try:
+                self._socket.recv(MAX_NOTIFICATION_BYTES)
+            except BlockingIOError:
+                return True
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+class FileStepEventChannel(StepEventChannel):
+    """Receives notifications as files written to a directory, for step workers that share a
+    filesystem with the orchestrator but can not reach it over the network.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        check.opt_str_param(base_dir, "base_dir")
+        self._owns_dir = base_dir is None
+        self._base_dir = base_dir or tempfile.mkdtemp(prefix="dagster-step-events-")
+        os.makedirs(self._base_dir, exist_ok=True)
+
+    @property
+    def address(self) -> StepEventChannelAddress:
+        return StepEventChannelAddress(transport=FILE_STEP_EVENT_CHANNEL, location=self._base_dir)
+
+    def _consume_notifications(self) -> bool:
+        notified = False
+        for filename in os.listdir(self._base_dir):
+            if filename.startswith("."):
+                # still being written
+                continue
+            notified = True
+            try:
+                os.remove(os.path.join(self._base_dir, filename))
+            except FileNotFoundError:
+                pass
+        return notified
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._consume_notifications():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, FILE_STEP_EVENT_CHANNEL_CHECK_INTERVAL_SECONDS))
+
+    def close(self) -> None:
+        if self._owns_dir:
+            shutil.rmtree(self._base_dir, ignore_errors=True)
+
+
+def open_step_event_channel(transport: str) -> StepEventChannel:
+    check.invariant(
+        transport in STEP_EVENT_CHANNEL_TRANSPORTS,
+        f"Unknown step event channel {transport}, expected one of {STEP_EVENT_CHANNEL_TRANSPORTS}",
+    )
+    if transport == SOCKET_STEP_EVENT_CHANNEL:
+        return SocketStepEventChannel()
+    return FileStepEventChannel()
+
+
+def notify_step_event_channel(address: StepEventChannelAddress, message: str) -> bool:
+    """Notify the orchestrator listening on the given channel that new events were stored, from a
+    step worker. Returns whether the notification was sent, without raising, since the orchestrator
+    falls back to polling the event log for notifications that are lost.
+    """
+    payload = message.encode()[:MAX_NOTIFICATION_BYTES]
+    try:
+        if address.transport == SOCKET_STEP_EVENT_CHANNEL:
+            host, port = address.location.rsplit(":", 1)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.sendto(payload, (host, int(port)))
+        elif address.transport == FILE_STEP_EVENT_CHANNEL:
+            name = uuid.uuid4().hex
+            # write to a hidden file first, so that the orchestrator never sees a partial write
+            tmp_path = os.path.join(address.location, f".{name}")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, os.path.join(address.location, name))
+        else:
+            return False
+    except OSError:
+        return False
+
+    return True
+
+
+def _get_default_host() -> str:
+    host = os.getenv(STEP_EVENT_CHANNEL_HOST_ENV_VAR)
+    if host:
+        return host
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
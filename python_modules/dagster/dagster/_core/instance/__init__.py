@@ -1,7 +1,9 @@
+import functools
 import logging
 import logging.config
 import os
 import sys
+import threading
 import warnings
 import weakref
 from abc import abstractmethod
@@ -53,6 +55,7 @@
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
+from dagster._core.instance.event_buffer import EventWriteBuffer, PartialEventWriteError
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.log_manager import get_log_record_metadata
 from dagster._core.origin import JobPythonOrigin
@@ -65,6 +68,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from dagster._core.storage.tags import (
@@ -176,6 +180,7 @@
     )
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
+    from dagster._core.storage.runs.snapshot_cache import SnapshotCacheMetrics
     from dagster._core.storage.schedules import ScheduleStorage
     from dagster._core.storage.sql import AlembicVersion
     from dagster._core.workspace.workspace import IWorkspace
@@ -200,6 +205,20 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum time, in milliseconds, that events may be held in the per-process write-behind
+# buffer before being written to the event log in a single batch. Defaults to 0, which disables the
+# write-behind buffer so that each event is written synchronously. Events that change run or step
+# state always flush the buffer. Read when the instance handles its first event.
+def _get_event_buffer_max_delay_ms() -> int:
+    return int(os.getenv("DAGSTER_EVENT_BUFFER_MAX_DELAY_MS", "0"))
+
+
+# Sets the number of events that the write-behind buffer holds before it is flushed by the writing
+# thread.
+def _get_event_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_BUFFER_SIZE", "100"))
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -495,6 +514,9 @@ def __init__(
 
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._event_write_buffer: Optional[EventWriteBuffer] = None
+        self._event_write_buffer_initialized = False
+        self._event_write_buffer_lock = threading.Lock()
 
     # ctors
 
@@ -1015,6 +1037,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_write_buffer:
+            self._event_write_buffer.close()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1097,6 +1121,13 @@ def has_historical_job(self, snapshot_id: str) -> bool:
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    @traced
+    def get_snapshot_cache_metrics(self) -> Optional["SnapshotCacheMetrics"]:
+        """The hit rate and size of the process-wide cache of job and execution plan snapshots, or
+        None if the cache is disabled.
+        """
+        return self._run_storage.get_snapshot_cache_metrics()
+
     @traced
     def get_run_stats(self, run_id: str) -> DagsterRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
@@ -1844,6 +1875,34 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunSummaryRecord]:
+        """Return a list of run summary records stored in the run storage, sorted by the given
+        column in given order. Prefer this over `get_run_records` when only the status,
+        timestamps, job name, partition or tags of the runs are needed, since the runs themselves
+        are not loaded.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            List[RunSummaryRecord]: List of run summary records stored in the run storage.
+        """
+        return self._run_storage.get_run_summary_records(
+            filters, limit, order_by, ascending, cursor
+        )
+
     @traced
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
@@ -1917,6 +1976,12 @@ def update_asset_cached_status_data(
     ) -> None:
         self._event_storage.update_asset_cached_status_data(asset_key, cache_values)
 
+    @traced
+    def update_asset_cached_status_data_for_assets(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        self._event_storage.update_asset_cached_status_data_for_assets(cache_values_by_asset_key)
+
     @traced
     def wipe_asset_cached_status(self, asset_keys: Sequence[AssetKey]) -> None:
         check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
@@ -2398,6 +2463,15 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If the write-behind buffer is enabled (by setting `DAGSTER_EVENT_BUFFER_MAX_DELAY_MS`), then
+        log messages and other informational events are held in a per-process buffer and written in
+        a single batch when the buffer fills, when the maximum delay elapses, or when an event that
+        changes run or step state is handled. Subscribers are notified once events are written,
+        from the thread that writes them: buffered events that are written after the maximum delay
+        are written and notified from the buffer's background thread, while events that change run
+        or step state, and the buffered events written with them, are written and notified from the
+        calling thread.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
@@ -2413,6 +2487,42 @@ def handle_new_event(
             else:
                 return
 
+        event_write_buffer = self._get_event_write_buffer()
+        if event_write_buffer:
+            event_write_buffer.add(events)
+        else:
+            self._store_and_notify_events(events)
+
+    def _get_event_write_buffer(self) -> Optional["EventWriteBuffer"]:
+        if not self._event_write_buffer_initialized:
+            # built under a lock, so that no thread writes events directly to storage ahead of
+            # events that another thread has already buffered
+            with self._event_write_buffer_lock:
+                if not self._event_write_buffer_initialized:
+                    max_delay_ms = _get_event_buffer_max_delay_ms()
+                    if max_delay_ms > 0:
+                        self._event_write_buffer = EventWriteBuffer(
+                            functools.partial(self._store_events, report_partial_writes=True),
+                            self._notify_events,
+                            max_size=_get_event_buffer_size(),
+                            max_delay_seconds=max_delay_ms / 1000.0,
+                            logger=logging.getLogger("dagster.instance"),
+                        )
+                    self._event_write_buffer_initialized = True
+        return self._event_write_buffer
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
+        self._store_events(events)
+        self._notify_events(events)
+
+    def _store_events(
+        self, events: Sequence["EventLogEntry"], report_partial_writes: bool = False
+    ) -> None:
+        """Stores the events, falling back to storing them one at a time if the batch write fails.
+
+        If `report_partial_writes` is set and the fallback fails after storing some of the events,
+        raises a PartialEventWriteError with the number of events that were stored.
+        """
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
@@ -2428,9 +2538,15 @@ def handle_new_event(
                 sys.stderr.write(
                     "Falling back to storing multiple single-event storage requests...\n"
                 )
-                for event in events:
-                    self._event_storage.store_event(event)
-
+                for num_stored, event in enumerate(events):
+                    try:
+                        self._event_storage.store_event(event)
+                    except Exception as event_error:
+                        if report_partial_writes and num_stored > 0:
+                            raise PartialEventWriteError(num_stored) from event_error
+                        raise
+
+    def _notify_events(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             run_id = event.run_id
             if (
@@ -2593,6 +2709,9 @@ def storage_directory(self) -> str:
     def schedules_directory(self) -> str:
         return self._local_artifact_storage.schedules_dir
 
+    def repository_snapshots_directory(self) -> str:
+        return self._local_artifact_storage.repository_snapshots_dir
+
     # Runs coordinator
 
     def submit_run(self, run_id: str, workspace: "IWorkspace") -> DagsterRun:
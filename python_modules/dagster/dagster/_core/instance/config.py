@@ -405,6 +405,22 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                     ),
                 ),
                 "use_sensors": Field(BoolSource, is_required=False),
+                "use_query_cache": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Whether to cache the results of instance queries across ticks, so that"
+                        " each tick only queries the assets that have new events"
+                    ),
+                ),
+                "query_cache_max_entries": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "The maximum number of assets and runs whose query results are cached"
+                        " across ticks, for each sensor"
+                    ),
+                ),
                 "use_threads": Field(Bool, is_required=False, default_value=False),
                 "num_workers": Field(
                     int,
@@ -413,6 +429,14 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the automation conditions of assets"
+                        " that don't depend on each other in parallel, within each tick"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
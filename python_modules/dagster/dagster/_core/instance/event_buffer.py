@@ -0,0 +1,209 @@
+import atexit
+import logging
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+import dagster._check as check
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+
+# Dagster event types that are safe to hold in the write-behind buffer. Any other dagster event
+# (run and step starts and ends, asset events, etc.) forces a flush of the buffer, together with the
+# event itself, so that state transitions are never delayed and are always written after every
+# event that preceded them.
+def _get_bufferable_event_type_values() -> frozenset:
+    from dagster._core.events import DagsterEventType
+
+    return frozenset(
+        event_type.value
+        for event_type in [
+            DagsterEventType.STEP_INPUT,
+            DagsterEventType.STEP_OUTPUT,
+            DagsterEventType.LOADED_INPUT,
+            DagsterEventType.HANDLED_OUTPUT,
+            DagsterEventType.LOGS_CAPTURED,
+            DagsterEventType.STEP_WORKER_STARTING,
+            DagsterEventType.STEP_WORKER_STARTED,
+            DagsterEventType.RESOURCE_INIT_STARTED,
+            DagsterEventType.RESOURCE_INIT_SUCCESS,
+            DagsterEventType.ENGINE_EVENT,
+        ]
+    )
+
+
+_BUFFERABLE_EVENT_TYPE_VALUES: Optional[frozenset] = None
+
+
+def is_bufferable_event(event: "EventLogEntry") -> bool:
+    global _BUFFERABLE_EVENT_TYPE_VALUES  # noqa: PLW0603
+    if _BUFFERABLE_EVENT_TYPE_VALUES is None:
+        _BUFFERABLE_EVENT_TYPE_VALUES = _get_bufferable_event_type_values()
+
+    if not event.is_dagster_event:
+        # plain log messages
+        return True
+    return event.get_dagster_event().event_type_value in _BUFFERABLE_EVENT_TYPE_VALUES
+
+
+class PartialEventWriteError(Exception):
+    """Raised by the `store_events` callback of an EventWriteBuffer when it fails after storing
+    the first `num_stored` events, so that the buffer does not write those events again.
+    """
+
+    def __init__(self, num_stored: int):
+        super().__init__(f"Failed to store buffered events after storing {num_stored} of them")
+        self.num_stored = num_stored
+
+
+_LIVE_BUFFERS: "weakref.WeakSet[EventWriteBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_buffers() -> None:
+    for write_buffer in list(_LIVE_BUFFERS):
+        write_buffer.close()
+
+
+class EventWriteBuffer:
+    """A per-process, write-behind buffer for event log writes.
+
+    Buffered events are handed to `store_events` as a single batch once the buffer holds
+    `max_size` events, once the oldest buffered event has waited `max_delay_seconds`, or as soon as
+    a non-bufferable event (a run or step boundary) is added. Batches are written in the order in
+    which events were added, so per-run ordering is preserved. A caller that fills the buffer writes
+    the batch synchronously, which bounds the buffer size and applies backpressure to producers.
+
+    Events are only removed from the buffer once `store_events` has stored them, after which they
+    are passed to `notify_events`. If `store_events` fails after storing some of the events, it
+    should raise a `PartialEventWriteError` so that only the remaining events are kept. Both are called from the thread that flushes the buffer: batches
+    that contain a non-bufferable event are always flushed by the thread that added it, but batches
+    of bufferable events that are flushed after `max_delay_seconds` are written and notified from
+    the buffer's background thread.
+    """
+
+    def __init__(
+        self,
+        store_events: Callable[[Sequence["EventLogEntry"]], None],
+        notify_events: Callable[[Sequence["EventLogEntry"]], None],
+        max_size: int,
+        max_delay_seconds: float,
+        logger: logging.Logger,
+    ):
+        self._store_events = check.callable_param(store_events, "store_events")
+        self._notify_events = check.callable_param(notify_events, "notify_events")
+        self._max_size = check.int_param(max_size, "max_size")
+        self._max_delay_seconds = check.numeric_param(max_delay_seconds, "max_delay_seconds")
+        self._logger = check.inst_param(logger, "logger", logging.Logger)
+        check.invariant(self._max_size > 0, "max_size must be positive")
+
+        self._condition = threading.Condition()
+        # held while writing the buffered events and removing them from the buffer, so that
+        # batches are written in order
+        self._flush_lock = threading.RLock()
+        self._buffer: List["EventLogEntry"] = []
+        self._oldest_buffered_at: Optional[float] = None
+        self._flush_thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        _LIVE_BUFFERS.add(self)
+
+    @property
+    def num_buffered(self) -> int:
+        with self._condition:
+            return len(self._buffer)
+
+    def add(self, events: Sequence["EventLogEntry"]) -> None:
+        if all(is_bufferable_event(event) for event in events):
+            with self._condition:
+                if not self._closed and len(self._buffer) + len(events) < self._max_size:
+                    self._buffer.extend(events)
+                    if self._oldest_buffered_at is None:
+                        self._oldest_buffered_at = time.monotonic()
+                    self._ensure_flush_thread()
+                    self._condition.notify()
+                    return
+
+        # taking the flush lock before adding the events keeps the background thread from flushing
+        # them, so that they are written and notified on the caller's thread
+        with self._flush_lock:
+            with self._condition:
+                self._buffer.extend(events)
+                if self._oldest_buffered_at is None:
+                    self._oldest_buffered_at = time.monotonic()
+            self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._condition:
+                events = list(self._buffer)
+
+            if not events:
+                return
+
+            error: Optional[Exception] = None
+            try:
+                self._store_events(events)
+                num_stored = len(events)
+            except PartialEventWriteError as e:
+                num_stored, error = e.num_stored, e
+            except Exception as e:
+                num_stored, error = 0, e
+
+            with self._condition:
+                # events are only ever removed from the buffer while the flush lock is held, so the
+                # stored events are still at the front of the buffer. Events that were not stored
+                # are kept so that they are written by the next flush.
+                del self._buffer[:num_stored]
+                self._oldest_buffered_at = time.monotonic() if self._buffer else None
+
+            if num_stored:
+                self._notify_events(events[:num_stored])
+            if error:
+                raise error
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            flush_thread = self._flush_thread
+            self._flush_thread = None
+
+        if flush_thread and flush_thread is not threading.current_thread():
+            flush_thread.join()
+
+        self.flush()
+        _LIVE_BUFFERS.discard(self)
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically, name="event-write-buffer", daemon=True
+            )
+            self._flush_thread.start()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and self._oldest_buffered_at is None:
+                    self._condition.wait()
+                if self._closed:
+                    return
+
+                remaining = (
+                    self._oldest_buffered_at + self._max_delay_seconds - time.monotonic()  # type: ignore  # (possible none)
+                )
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+            try:
+                self.flush()
+            except Exception:
+                self._logger.exception(
+                    "Exception while flushing buffered events, retrying after"
+                    f" {self._max_delay_seconds} seconds."
+                )
@@ -76,12 +76,18 @@ def _fetch_concurrency_info(self, instance: DagsterInstance, queued_runs: Sequen
                 all_concurrency_keys.update(run.run_op_concurrency.root_key_counts.keys())
 
         for key in all_concurrency_keys:
-            if key is None:
+            if key is None or key in self._concurrency_info_by_key:
                 continue
             self._concurrency_info_by_key[key] = instance.event_log_storage.get_concurrency_info(
                 key
             )
 
+    def add_queued_runs(self, instance: DagsterInstance, runs: Sequence[DagsterRun]):
+        """Fetch the concurrency info for queued runs that were not passed to the constructor,
+        e.g. because they were loaded from a later page of the run queue.
+        """
+        self._fetch_concurrency_info(instance, runs)
+
     def _should_allocate_slots_for_root_concurrency_keys(self, record: RunRecord):
         status = record.dagster_run.status
         if status == DagsterRunStatus.STARTING:
@@ -1,3 +1,4 @@
+import os
 import sys
 import threading
 from abc import abstractmethod
@@ -7,6 +8,7 @@
     AbstractSet,
     Any,
     Dict,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -27,8 +29,15 @@
     sync_get_external_partition_set_execution_param_data_grpc,
     sync_get_external_partition_tags_grpc,
 )
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
-from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
+from dagster._api.snapshot_repository import (
+    sync_get_external_repositories_data_from_snapshot_pieces_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
+from dagster._api.snapshot_schedule import (
+    ScheduleExecutionRequest,
+    sync_get_external_schedule_execution_data_batch_grpc,
+    sync_get_external_schedule_execution_data_grpc,
+)
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.asset_job import IMPLICIT_ASSET_JOB_NAME
 from dagster._core.definitions.asset_key import AssetKey
@@ -66,6 +75,7 @@
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
 )
+from dagster._core.remote_representation.snapshot_cache import get_repository_snapshot_cache
 from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster._grpc.impl import (
     get_external_schedule_execution,
@@ -92,6 +102,13 @@
     )
 
 
+def _should_use_repository_snapshot_cache() -> bool:
+    # Opt in to only fetching the pieces of repository snapshots (jobs, asset nodes, schedules,
+    # sensors, partition sets) that changed since they were last loaded, and caching the pieces in
+    # the instance's local artifact storage.
+    return os.getenv("DAGSTER_REPOSITORY_SNAPSHOT_CACHE") == "1"
+
+
 class CodeLocation(AbstractContextManager):
     """A CodeLocation represents a target containing user code which has a set of Dagster
     definition objects. A given location will contain some number of uniquely named
@@ -295,6 +312,18 @@ def get_external_schedule_execution_data(
     ) -> "ScheduleExecutionData":
         pass
 
+    @abstractmethod
+    def get_external_schedule_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        schedule_execution_requests: Sequence[ScheduleExecutionRequest],
+    ) -> Iterator[Tuple[int, Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]]]:
+        """Evaluate many schedule ticks at once, yielding the index of each tick along with its
+        result as soon as it is available. Ticks that are not yielded, e.g. because the code
+        location is too old to evaluate them in batches, should be evaluated one at a time with
+        `get_external_schedule_execution_data`.
+        """
+
     @abstractmethod
     def get_external_sensor_execution_data(
         self,
@@ -585,6 +614,40 @@ def get_external_schedule_execution_data(
 
         return result
 
+    def get_external_schedule_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        schedule_execution_requests: Sequence[ScheduleExecutionRequest],
+    ) -> Iterator[Tuple[int, Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.sequence_param(
+            schedule_execution_requests,
+            "schedule_execution_requests",
+            of_type=ScheduleExecutionRequest,
+        )
+
+        instance_ref = instance.get_ref()
+        for index, request in enumerate(schedule_execution_requests):
+            yield (
+                index,
+                get_external_schedule_execution(
+                    self._get_repo_def(request.repository_handle.repository_name),
+                    instance_ref=instance_ref,
+                    schedule_name=request.schedule_name,
+                    scheduled_execution_timestamp=(
+                        request.scheduled_execution_time.timestamp
+                        if request.scheduled_execution_time
+                        else None
+                    ),
+                    scheduled_execution_timezone=(
+                        request.scheduled_execution_time.timezone
+                        if request.scheduled_execution_time
+                        else None
+                    ),
+                    log_key=request.log_key,
+                ),
+            )
+
     def get_external_sensor_execution_data(
         self,
         instance: DagsterInstance,
@@ -729,10 +792,21 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
-            )
+            if _should_use_repository_snapshot_cache():
+                self._external_repositories_data = (
+                    sync_get_external_repositories_data_from_snapshot_pieces_grpc(
+                        self.client,
+                        self,
+                        get_repository_snapshot_cache(instance.repository_snapshots_directory()),
+                    )
+                )
+            else:
+                self._external_repositories_data = (
+                    sync_get_streaming_external_repositories_data_grpc(
+                        self.client,
+                        self,
+                    )
+                )
 
             self.external_repositories = {
                 repo_name: ExternalRepository(
@@ -960,6 +1034,19 @@ def get_external_schedule_execution_data(
             log_key,
         )
 
+    def get_external_schedule_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        schedule_execution_requests: Sequence[ScheduleExecutionRequest],
+    ) -> Iterator[Tuple[int, Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+
+        return sync_get_external_schedule_execution_data_batch_grpc(
+            self.client,
+            instance,
+            schedule_execution_requests,
+        )
+
     def get_external_sensor_execution_data(
         self,
         instance: DagsterInstance,
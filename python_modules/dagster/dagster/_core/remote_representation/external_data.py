@@ -10,6 +10,7 @@
 from collections import defaultdict
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Iterable,
@@ -101,9 +102,10 @@
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.storage.tags import COMPUTE_KIND_TAG
 from dagster._core.utils import is_valid_email
-from dagster._record import IHaveNew, record, record_custom
+from dagster._record import IHaveNew, copy, record, record_custom
 from dagster._serdes import whitelist_for_serdes
 from dagster._serdes.serdes import FieldSerializer, is_whitelisted_for_serdes_object
+from dagster._serdes.utils import create_snapshot_id
 from dagster._time import datetime_from_timestamp
 from dagster._utils.error import SerializableErrorInfo
 from dagster._utils.warnings import suppress_dagster_warnings
@@ -578,6 +580,51 @@ class ExternalRepositoryErrorData:
     error: Optional[SerializableErrorInfo]
 
 
+ExternalRepositorySnapshotPiece = Union[
+    "ExternalJobData",
+    "ExternalAssetNode",
+    "ScheduleSnap",
+    "SensorSnap",
+    "PartitionSetSnap",
+]
+
+# The fields of ExternalRepositoryData that are split into individually addressed pieces
+EXTERNAL_REPOSITORY_SNAPSHOT_PIECE_FIELDS: Final = (
+    "external_job_datas",
+    "external_asset_graph_data",
+    "external_schedule_datas",
+    "external_sensor_datas",
+    "external_partition_set_datas",
+)
+
+
+@whitelist_for_serdes
+@record
+class ExternalRepositorySnapshotPieces:
+    """An ExternalRepositoryData split into content-addressed pieces, so that a client only needs
+    to receive the jobs, asset nodes, schedules, sensors and partition sets that it does not
+    already have.
+
+    Args:
+        repository_data (ExternalRepositoryData): The repository data, with the piece fields
+            emptied.
+        piece_ids_by_field (Mapping[str, Sequence[str]]): For each piece field, the ids of the
+            pieces in that field, in order.
+        pieces (Mapping[str, ExternalRepositorySnapshotPiece]): The pieces that the client did not
+            already have, by id.
+    """
+
+    repository_data: ExternalRepositoryData
+    piece_ids_by_field: Mapping[str, Sequence[str]]
+    pieces: Mapping[str, ExternalRepositorySnapshotPiece]
+
+    @property
+    def piece_ids(self) -> Sequence[str]:
+        return [
+            piece_id for piece_ids in self.piece_ids_by_field.values() for piece_id in piece_ids
+        ]
+
+
 @whitelist_for_serdes
 @record
 class ExternalSensorExecutionErrorData:
@@ -1820,3 +1867,53 @@ def active_presets_from_job_def(job_def: JobDefinition) -> Sequence[ExternalPres
                 tags={},
             )
         ]
+
+
+def external_repository_snapshot_pieces_from_data(
+    repository_data: ExternalRepositoryData,
+    known_piece_ids: AbstractSet[str],
+) -> ExternalRepositorySnapshotPieces:
+    """Split the given repository data into pieces identified by the hash of their serialized
+    contents, omitting the pieces whose ids are in known_piece_ids.
+    """
+    check.inst_param(repository_data, "repository_data", ExternalRepositoryData)
+    check.invariant(
+        repository_data.has_job_data(),
+        "Repository data with deferred job snapshots cannot be split into pieces",
+    )
+
+    piece_ids_by_field: Dict[str, List[str]] = {}
+    pieces: Dict[str, ExternalRepositorySnapshotPiece] = {}
+    for field in EXTERNAL_REPOSITORY_SNAPSHOT_PIECE_FIELDS:
+        piece_ids_by_field[field] = []
+        for piece in getattr(repository_data, field):
+            piece_id = create_snapshot_id(piece)
+            piece_ids_by_field[field].append(piece_id)
+            if piece_id not in known_piece_ids:
+                pieces[piece_id] = piece
+
+    return ExternalRepositorySnapshotPieces(
+        repository_data=copy(
+            repository_data, **{field: [] for field in EXTERNAL_REPOSITORY_SNAPSHOT_PIECE_FIELDS}
+        ),
+        piece_ids_by_field=piece_ids_by_field,
+        pieces=pieces,
+    )
+
+
+def external_repository_data_from_snapshot_pieces(
+    snapshot_pieces: ExternalRepositorySnapshotPieces,
+    pieces: Mapping[str, ExternalRepositorySnapshotPiece],
+) -> ExternalRepositoryData:
+    """Reassemble repository data that was split by `external_repository_snapshot_pieces_from_data`,
+    given every piece that it references by id.
+    """
+    check.inst_param(snapshot_pieces, "snapshot_pieces", ExternalRepositorySnapshotPieces)
+
+    return copy(
+        snapshot_pieces.repository_data,
+        **{
+            field: [pieces[piece_id] for piece_id in piece_ids]
+            for field, piece_ids in snapshot_pieces.piece_ids_by_field.items()
+        },
+    )
@@ -0,0 +1,170 @@
+import logging
+import os
+import threading
+from typing import Dict, Optional, Sequence, Set, Tuple, cast
+
+import dagster._check as check
+from dagster._core.remote_representation.external_data import (
+    ExternalRepositoryData,
+    ExternalRepositorySnapshotPiece,
+    ExternalRepositorySnapshotPieces,
+    external_repository_data_from_snapshot_pieces,
+)
+from dagster._serdes import (
+    deserialize_value,
+    deserialize_value_from_binary,
+    serialize_value,
+    serialize_value_to_binary,
+)
+from dagster._serdes.errors import DeserializationError
+from dagster._serdes.utils import hash_str
+from dagster._utils import write_file_atomically
+
+# (code location name, repository name)
+RepositoryKey = Tuple[str, str]
+
+
+class RepositorySnapshotCache:
+    """Caches the pieces of the repository snapshots loaded from gRPC servers, so that reloading a
+    code location only transfers and deserializes the pieces that changed.
+
+    Pieces are stored on disk in `base_dir`, in files named by their content-hashed ids, so that
+    the cache survives process restarts and can be shared by the processes that use the same
+    instance. Alongside the pieces, the ids of the pieces in the last snapshot of each repository
+    are stored, to be sent to the server as the pieces the client already has. Pieces that are
+    referenced by the repositories loaded in this process are also kept in memory.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _pieces and _piece_ids_by_repository
+    """
+
+    def __init__(self, base_dir: str):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._lock = threading.Lock()
+        self._pieces: Dict[str, ExternalRepositorySnapshotPiece] = {}
+        self._piece_ids_by_repository: Dict[RepositoryKey, Sequence[str]] = {}
+
+    @property
+    def base_dir(self) -> str:
+        return self._base_dir
+
+    def _piece_path(self, piece_id: str) -> str:
+        return os.path.join(self._base_dir, "pieces", piece_id[:2], piece_id)
+
+    def _repository_index_path(self, key: RepositoryKey) -> str:
+        return os.path.join(self._base_dir, "repositories", hash_str(serialize_value(key)))
+
+    def get_known_piece_ids(self, location_name: str, repository_name: str) -> Sequence[str]:
+        """The ids of the cached pieces of the last snapshot of the given repository."""
+        key = (location_name, repository_name)
+        with self._lock:
+            piece_ids = self._piece_ids_by_repository.get(key)
+            if piece_ids is not None:
+                return [piece_id for piece_id in piece_ids if piece_id in self._pieces]
+
+        piece_ids = self._read_repository_index(key)
+        return [piece_id for piece_id in piece_ids if os.path.exists(self._piece_path(piece_id))]
+
+    def get_repository_data(
+        self,
+        location_name: str,
+        repository_name: str,
+        snapshot_pieces: ExternalRepositorySnapshotPieces,
+    ) -> Optional[ExternalRepositoryData]:
+        """Assemble the repository data from the pieces returned by the server and the cached
+        pieces, and store the new pieces in the cache.
+
+        Returns None if a piece that the server did not return is missing from the cache, e.g.
+        because it was removed by another process after its id was sent to the server.
+        """
+        check.inst_param(snapshot_pieces, "snapshot_pieces", ExternalRepositorySnapshotPieces)
+        key = (location_name, repository_name)
+        piece_ids = snapshot_pieces.piece_ids
+
+        with self._lock:
+            pieces = {
+                piece_id: (
+                    snapshot_pieces.pieces[piece_id]
+                    if piece_id in snapshot_pieces.pieces
+                    else self._pieces.get(piece_id)
+                )
+                for piece_id in piece_ids
+            }
+
+        for piece_id in [piece_id for piece_id, piece in pieces.items() if piece is None]:
+            pieces[piece_id] = self._read_piece(piece_id)
+            if pieces[piece_id] is None:
+                return None
+        resolved_pieces = cast(Dict[str, ExternalRepositorySnapshotPiece], pieces)
+
+        for piece_id, piece in snapshot_pieces.pieces.items():
+            self._write_piece(piece_id, piece)
+
+        previous_piece_ids = self._read_repository_index(key)
+        self._write_repository_index(key, piece_ids)
+
+        with self._lock:
+            self._piece_ids_by_repository[key] = piece_ids
+            referenced_piece_ids: Set[str] = set()
+            for repository_piece_ids in self._piece_ids_by_repository.values():
+                referenced_piece_ids.update(repository_piece_ids)
+            self._pieces = {
+                piece_id: piece
+                for piece_id, piece in {**self._pieces, **resolved_pieces}.items()
+                if piece_id in referenced_piece_ids
+            }
+
+        # Remove the pieces that this repository no longer uses. Another repository that shares
+        # one of these pieces will re-fetch it from its server on its next load.
+        for piece_id in set(previous_piece_ids) - referenced_piece_ids:
+            try:
+                os.remove(self._piece_path(piece_id))
+            except FileNotFoundError:
+                pass
+
+        return external_repository_data_from_snapshot_pieces(snapshot_pieces, resolved_pieces)
+
+    def _read_piece(self, piece_id: str) -> Optional[ExternalRepositorySnapshotPiece]:
+        try:
+            with open(self._piece_path(piece_id), "rb") as f:
+                return cast(
+                    ExternalRepositorySnapshotPiece, deserialize_value_from_binary(f.read())
+                )
+        except FileNotFoundError:
+            return None
+        except DeserializationError:
+            logging.getLogger("dagster").warning(
+                f"Could not read cached repository snapshot piece {piece_id}, it will be reloaded."
+            )
+            return None
+
+    def _write_piece(self, piece_id: str, piece: ExternalRepositorySnapshotPiece) -> None:
+        path = self._piece_path(piece_id)
+        if not os.path.exists(path):
+            write_file_atomically(path, serialize_value_to_binary(piece))
+
+    def _read_repository_index(self, key: RepositoryKey) -> Sequence[str]:
+        try:
+            with open(self._repository_index_path(key), "r", encoding="utf8") as f:
+                return deserialize_value(f.read(), list)
+        except (FileNotFoundError, DeserializationError):
+            return []
+
+    def _write_repository_index(self, key: RepositoryKey, piece_ids: Sequence[str]) -> None:
+        write_file_atomically(
+            self._repository_index_path(key), serialize_value(list(piece_ids)).encode("utf8")
+        )
+
+
+_caches_lock = threading.Lock()
+_caches: Dict[str, RepositorySnapshotCache] = {}
+
+
+def get_repository_snapshot_cache(base_dir: str) -> RepositorySnapshotCache:
+    """The process-wide repository snapshot cache for the given directory, so that pieces kept in
+    memory are reused across code location reloads.
+    """
+    with _caches_lock:
+        if base_dir not in _caches:
+            _caches[base_dir] = RepositorySnapshotCache(base_dir)
+        return _caches[base_dir]
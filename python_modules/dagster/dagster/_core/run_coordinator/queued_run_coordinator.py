@@ -69,6 +69,7 @@ def __init__(
         max_user_code_failure_retries: Optional[int] = None,
         user_code_failure_retry_delay: Optional[int] = None,
         block_op_concurrency_limited_runs: Optional[Mapping[str, Any]] = None,
+        in_progress_runs_reconcile_interval_seconds: Optional[int] = None,
         inst_data: Optional[ConfigurableClassData] = None,
     ):
         self._inst_data: Optional[ConfigurableClassData] = check.opt_inst_param(
@@ -115,6 +116,10 @@ def __init__(
                 "op_concurrency_slot_buffer can only be set if block_op_concurrency_limited_runs "
                 "is enabled",
             )
+        self._in_progress_runs_reconcile_interval_seconds: Optional[int] = check.opt_int_param(
+            in_progress_runs_reconcile_interval_seconds,
+            "in_progress_runs_reconcile_interval_seconds",
+        )
 
         self._logger = logging.getLogger("dagster.run_coordinator.queued_run_coordinator")
         super().__init__()
@@ -145,6 +150,10 @@ def dequeue_use_threads(self) -> bool:
     def dequeue_num_workers(self) -> Optional[int]:
         return self._dequeue_num_workers
 
+    @property
+    def in_progress_runs_reconcile_interval_seconds(self) -> Optional[int]:
+        return self._in_progress_runs_reconcile_interval_seconds
+
     @property
     def should_block_op_concurrency_limited_runs(self) -> bool:
         return self._should_block_op_concurrency_limited_runs
@@ -237,6 +246,16 @@ def config_type(cls) -> UserConfigSchema:
                     " launcher is being used."
                 ),
             ),
+            "in_progress_runs_reconcile_interval_seconds": Field(
+                config=IntSource,
+                is_required=False,
+                description=(
+                    "If set, the Dagster Daemon keeps track of the in-progress runs in memory,"
+                    " updating them from the run status change events stored since its last"
+                    " iteration, and only reloads every in-progress run at this interval in"
+                    " seconds. If not set, every in-progress run is reloaded on each iteration."
+                ),
+            ),
             "block_op_concurrency_limited_runs": Field(
                 {
                     "enabled": Field(Bool, is_required=False),
@@ -267,6 +286,9 @@ def from_config_value(
             max_user_code_failure_retries=config_value.get("max_user_code_failure_retries"),
             user_code_failure_retry_delay=config_value.get("user_code_failure_retry_delay"),
             block_op_concurrency_limited_runs=config_value.get("block_op_concurrency_limited_runs"),
+            in_progress_runs_reconcile_interval_seconds=config_value.get(
+                "in_progress_runs_reconcile_interval_seconds"
+            ),
         )
 
     def submit_run(self, context: SubmitRunContext) -> DagsterRun:
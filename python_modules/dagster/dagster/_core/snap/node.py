@@ -334,7 +334,7 @@ def build_node_defs_snapshot(job_def: JobDefinition) -> NodeDefsSnapshot:
     graph_def_snaps = []
     for node_def in job_def.all_node_defs:
         if isinstance(node_def, OpDefinition):
-            op_def_snaps.append(build_op_def_snap(node_def))
+            op_def_snaps.append(node_def.get_op_def_snap())
         elif isinstance(node_def, GraphDefinition):
             graph_def_snaps.append(build_graph_def_snap(node_def))
         else:
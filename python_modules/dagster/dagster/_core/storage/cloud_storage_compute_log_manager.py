@@ -7,7 +7,14 @@
 from contextlib import contextmanager
 from typing import IO, Iterator, Optional, Sequence
 
+import dagster._check as check
 from dagster._core.instance import T_DagsterInstance
+from dagster._core.storage.compute_log_chunks import (
+    COMPUTE_LOG_CHUNK_INDEX_NAME,
+    ComputeLogChunkIndex,
+    read_chunked_log,
+    write_chunked_log,
+)
 from dagster._core.storage.compute_log_manager import (
     CapturedLogContext,
     CapturedLogData,
@@ -23,6 +30,18 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# Serializes chunked uploads of the same log, so that the periodic partial upload can't overwrite the
+# index written by the final upload when the capture completes. Logs share a fixed set of locks so
+# that long-lived processes don't accumulate a lock per log key.
+_CHUNK_UPLOAD_LOCKS = [threading.Lock() for _ in range(64)]
+
+
+@contextmanager
+def _chunk_upload_lock(log_key: Sequence[str], io_type: ComputeIOType) -> Iterator[None]:
+    lock = _CHUNK_UPLOAD_LOCKS[hash((json.dumps(log_key), io_type)) % len(_CHUNK_UPLOAD_LOCKS)]
+    with lock:
+        yield
+
 
 class CloudStorageComputeLogManager(ComputeLogManager[T_DagsterInstance]):
     """Abstract class that uses the local compute log manager to capture logs and stores them in
@@ -70,6 +89,60 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    @property
+    def upload_chunk_size(self) -> Optional[int]:
+        """Returns the number of uncompressed bytes in each segment of a log that is uploaded in
+        the chunked format, or None if logs are uploaded as whole files. Implementations that
+        return a value must implement `upload_chunk_to_cloud_storage` and
+        `download_chunk_from_cloud_storage`.
+        """
+        return None
+
+    def upload_chunk_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ) -> None:
+        """Uploads a single segment or index of a chunked log to cloud storage."""
+        raise NotImplementedError()
+
+    def download_chunk_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> Optional[bytes]:
+        """Downloads a single segment or index of a chunked log from cloud storage, returning None
+        if it does not exist.
+        """
+        raise NotImplementedError()
+
+    def get_cloud_storage_chunk_index(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Optional[ComputeLogChunkIndex]:
+        data = self.download_chunk_from_cloud_storage(
+            log_key, io_type, COMPUTE_LOG_CHUNK_INDEX_NAME
+        )
+        return ComputeLogChunkIndex.from_json(data.decode("utf-8")) if data else None
+
+    def upload_chunks_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, complete: bool = False
+    ) -> None:
+        """Uploads the segments of the local log file for a given log key that have changed since
+        the last upload, so that each upload only sends the new bytes of the log.
+        """
+        chunk_size = check.not_none(self.upload_chunk_size)
+        with _chunk_upload_lock(log_key, io_type):
+            index = self.get_cloud_storage_chunk_index(log_key, io_type)
+            if index and index.complete:
+                return
+
+            path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+            write_chunked_log(
+                path,
+                index,
+                lambda chunk_name, data: self.upload_chunk_to_cloud_storage(
+                    log_key, io_type, chunk_name, data
+                ),
+                chunk_size=chunk_size,
+                complete=complete,
+            )
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
@@ -86,6 +159,11 @@ def open_log_stream(
         self._on_capture_complete(log_key)
 
     def _on_capture_complete(self, log_key: Sequence[str]):
+        if self.upload_chunk_size:
+            self.upload_chunks_to_cloud_storage(log_key, ComputeIOType.STDOUT, complete=True)
+            self.upload_chunks_to_cloud_storage(log_key, ComputeIOType.STDERR, complete=True)
+            return
+
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR)
 
@@ -93,6 +171,10 @@ def is_capture_complete(self, log_key: Sequence[str]) -> bool:
         if self.local_manager.is_capture_complete(log_key):
             return True
         # check remote storage
+        if self.upload_chunk_size:
+            index = self.get_cloud_storage_chunk_index(log_key, ComputeIOType.STDERR)
+            if index:
+                return index.complete
         return self.cloud_storage_has_logs(log_key, ComputeIOType.STDERR)
 
     def log_data_for_type(
@@ -103,6 +185,18 @@ def log_data_for_type(
                 log_key, IO_TYPE_EXTENSION[io_type]
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+        if self.upload_chunk_size:
+            # only fetch the segments that overlap the requested range
+            index = self.get_cloud_storage_chunk_index(log_key, io_type)
+            if index:
+                return read_chunked_log(
+                    index,
+                    lambda chunk_name: self.download_chunk_from_cloud_storage(
+                        log_key, io_type, chunk_name
+                    ),
+                    offset=offset,
+                    max_bytes=max_bytes,
+                )
         if self.cloud_storage_has_logs(log_key, io_type):
             self.download_from_cloud_storage(log_key, io_type)
             local_path = self.local_manager.get_captured_local_path(
@@ -151,6 +245,11 @@ def on_progress(self, log_key):
         if self.is_capture_complete(log_key):
             return
 
+        if self.upload_chunk_size:
+            self.upload_chunks_to_cloud_storage(log_key, ComputeIOType.STDOUT)
+            self.upload_chunks_to_cloud_storage(log_key, ComputeIOType.STDERR)
+            return
+
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
 
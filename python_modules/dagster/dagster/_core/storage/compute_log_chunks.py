@@ -0,0 +1,186 @@
+"""Append-only chunked format for captured compute logs.
+
+A captured log file is stored as a sequence of gzip-compressed segments, each holding a fixed number
+of uncompressed bytes of the log, along with a small JSON index describing the segments. Only the
+last segment can be partially filled, so a log that keeps growing can be stored by writing the new
+segments and rewriting the last one, rather than rewriting the whole log. Reads at a byte offset
+only need the segments that overlap the requested range.
+"""
+
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from typing_extensions import Final
+
+import dagster._check as check
+from dagster._seven import json
+
+DEFAULT_COMPUTE_LOG_CHUNK_SIZE: Final = 4 * 1024 * 1024
+DEFAULT_COMPUTE_LOG_CHUNK_MAX_WORKERS: Final = 4
+COMPUTE_LOG_CHUNK_INDEX_NAME: Final = "index.json"
+
+
+def compute_log_chunk_name(chunk_index: int) -> str:
+    return f"{chunk_index:08d}.gz"
+
+
+class ComputeLogChunk(NamedTuple):
+    """A segment of a chunked log, covering `length` uncompressed bytes starting at `offset`."""
+
+    index: int
+    offset: int
+    length: int
+
+    @property
+    def name(self) -> str:
+        return compute_log_chunk_name(self.index)
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+
+class ComputeLogChunkIndex(NamedTuple):
+    """Describes the segments of a chunked log. `complete` is set once the capture has finished and
+    the log will not grow any further.
+    """
+
+    chunk_size: int
+    chunks: Sequence[ComputeLogChunk]
+    complete: bool = False
+
+    @property
+    def total_length(self) -> int:
+        return self.chunks[-1].end if self.chunks else 0
+
+    def chunks_for_range(self, offset: int, max_bytes: Optional[int]) -> Sequence[ComputeLogChunk]:
+        end = None if max_bytes is None else offset + max_bytes
+        return [
+            chunk
+            for chunk in self.chunks
+            if chunk.end > offset and (end is None or chunk.offset < end)
+        ]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "chunk_size": self.chunk_size,
+                "chunks": [[chunk.offset, chunk.length] for chunk in self.chunks],
+                "complete": self.complete,
+            }
+        )
+
+    @staticmethod
+    def from_json(value: str) -> "ComputeLogChunkIndex":
+        data = json.loads(value)
+        return ComputeLogChunkIndex(
+            chunk_size=data["chunk_size"],
+            chunks=[
+                ComputeLogChunk(index=i, offset=offset, length=length)
+                for i, (offset, length) in enumerate(data["chunks"])
+            ],
+            complete=data.get("complete", False),
+        )
+
+
+def _compress(data: bytes) -> bytes:
+    # fix mtime so that the same bytes always compress to the same segment
+    return gzip.compress(data, mtime=0)
+
+
+def write_chunked_log(
+    path: str,
+    index: Optional[ComputeLogChunkIndex],
+    write_chunk: Callable[[str, bytes], None],
+    chunk_size: int = DEFAULT_COMPUTE_LOG_CHUNK_SIZE,
+    complete: bool = False,
+    max_workers: int = DEFAULT_COMPUTE_LOG_CHUNK_MAX_WORKERS,
+) -> ComputeLogChunkIndex:
+    """Writes the segments of the local log file at `path` that have changed since `index` was
+    written, then writes the new index, and returns it.
+
+    Segments that were already full are never written again, so each call writes the new bytes of
+    the log plus at most one previously written segment. Segments are compressed and written in
+    parallel, and the index is written last so that readers never see an index that refers to a
+    segment that has not been written yet.
+    """
+    check.str_param(path, "path")
+    check.opt_inst_param(index, "index", ComputeLogChunkIndex)
+
+    if index and index.chunk_size != chunk_size:
+        # segments written with a different size can't be appended to, start over
+        index = None
+
+    existing_chunks: List[ComputeLogChunk] = list(index.chunks) if index else []
+    # the last segment is rewritten if it was only partially filled
+    if existing_chunks and existing_chunks[-1].length < chunk_size:
+        existing_chunks.pop()
+
+    start_offset = existing_chunks[-1].end if existing_chunks else 0
+    new_chunks: List[Tuple[ComputeLogChunk, bytes]] = []
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            f.seek(start_offset, os.SEEK_SET)
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                chunk = ComputeLogChunk(
+                    index=len(existing_chunks) + len(new_chunks),
+                    offset=start_offset,
+                    length=len(data),
+                )
+                new_chunks.append((chunk, data))
+                start_offset += len(data)
+
+    def _write(chunk_and_data: Tuple[ComputeLogChunk, bytes]) -> None:
+        chunk, data = chunk_and_data
+        write_chunk(chunk.name, _compress(data))
+
+    if len(new_chunks) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(new_chunks)),
+            thread_name_prefix="compute_log_chunk_writer",
+        ) as executor:
+            list(executor.map(_write, new_chunks))
+    else:
+        for chunk_and_data in new_chunks:
+            _write(chunk_and_data)
+
+    new_index = ComputeLogChunkIndex(
+        chunk_size=chunk_size,
+        chunks=existing_chunks + [chunk for chunk, _ in new_chunks],
+        complete=complete,
+    )
+    write_chunk(COMPUTE_LOG_CHUNK_INDEX_NAME, new_index.to_json().encode("utf-8"))
+    return new_index
+
+
+def read_chunked_log(
+    index: ComputeLogChunkIndex,
+    read_chunk: Callable[[str], Optional[bytes]],
+    offset: int = 0,
+    max_bytes: Optional[int] = None,
+) -> Tuple[bytes, int]:
+    """Reads up to `max_bytes` bytes of a chunked log starting at `offset`, fetching only the
+    segments that overlap the requested range. Returns the bytes along with the offset to read from
+    next.
+    """
+    check.inst_param(index, "index", ComputeLogChunkIndex)
+
+    parts = []
+    for chunk in index.chunks_for_range(offset, max_bytes):
+        compressed = read_chunk(chunk.name)
+        if compressed is None:
+            # the segment was removed from underneath the index, stop at the data we have
+            break
+        data = gzip.decompress(compressed)
+        start = max(offset - chunk.offset, 0)
+        parts.append(data[start:])
+
+    data = b"".join(parts)
+    if max_bytes is not None:
+        data = data[:max_bytes]
+    return data, offset + len(data)
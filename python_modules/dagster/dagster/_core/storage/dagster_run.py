@@ -27,6 +27,7 @@
     AUTOMATION_CONDITION_TAG,
     BACKFILL_ID_TAG,
     PARENT_RUN_ID_TAG,
+    PARTITION_NAME_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
     ROOT_RUN_ID_TAG,
@@ -652,6 +653,78 @@ def _blocking_batch_load(
         return result_map.values()
 
 
+class RunSummaryRecord(
+    NamedTuple(
+        "_RunSummaryRecord",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("job_name", str),
+            ("status", DagsterRunStatus),
+            ("partition", Optional[str]),
+            ("job_snapshot_id", Optional[str]),
+            ("tags", Mapping[str, str]),
+            ("create_timestamp", datetime),
+            ("update_timestamp", datetime),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+        ],
+    )
+):
+    """Internal projection of a run record, built from the indexed columns of a
+    :py:class:`~dagster._core.storage.runs.RunStorage` and the tags of the run, without loading
+    the run itself.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        job_name: str,
+        status: DagsterRunStatus,
+        partition: Optional[str],
+        job_snapshot_id: Optional[str],
+        tags: Mapping[str, str],
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ):
+        return super(RunSummaryRecord, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            job_name=check.str_param(job_name, "job_name"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            partition=check.opt_str_param(partition, "partition"),
+            job_snapshot_id=check.opt_str_param(job_snapshot_id, "job_snapshot_id"),
+            tags=check.mapping_param(tags, "tags", key_type=str, value_type=str),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+        )
+
+    @classmethod
+    def from_run_record(cls, record: RunRecord) -> "RunSummaryRecord":
+        run = record.dagster_run
+        return cls(
+            storage_id=record.storage_id,
+            run_id=run.run_id,
+            job_name=run.job_name,
+            status=run.status,
+            partition=run.tags.get(PARTITION_NAME_TAG),
+            job_snapshot_id=run.job_snapshot_id,
+            tags=run.tags,
+            create_timestamp=record.create_timestamp,
+            update_timestamp=record.update_timestamp,
+            start_time=record.start_time,
+            end_time=record.end_time,
+        )
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
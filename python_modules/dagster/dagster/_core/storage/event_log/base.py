@@ -359,6 +359,15 @@ def update_asset_cached_status_data(
     ) -> None:
         pass
 
+    def update_asset_cached_status_data_for_assets(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        """Update the cached status of many assets at once. Storages that can should write all of
+        the values in a single transaction.
+        """
+        for asset_key, cache_values in cache_values_by_asset_key.items():
+            self.update_asset_cached_status_data(asset_key, cache_values)
+
     def get_asset_keys(
         self,
         prefix: Optional[Sequence[str]] = None,
@@ -468,6 +477,21 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
     ) -> Mapping[str, Tuple[str, int]]:
         pass
 
+    def get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+        self, after_storage_id_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Mapping[str, Tuple[str, int]]]:
+        """Equivalent to calling
+        `get_latest_asset_partition_materialization_attempts_without_materializations` for each of
+        the given assets, with its own `after_storage_id`. Storages that can should fetch the
+        attempts for all of the assets in a single query.
+        """
+        return {
+            asset_key: self.get_latest_asset_partition_materialization_attempts_without_materializations(
+                asset_key, after_storage_id
+            )
+            for asset_key, after_storage_id in after_storage_id_by_asset_key.items()
+        }
+
     @abstractmethod
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Get the list of partition keys for a dynamic partitions definition."""
@@ -541,6 +565,17 @@ def claim_concurrency_slot(
         """Claim concurrency slots for step."""
         raise NotImplementedError()
 
+    def claim_concurrency_slots(
+        self, concurrency_key: str, run_id: str, step_priorities: Mapping[str, Optional[int]]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        """Claim concurrency slots for a batch of steps of a run, keyed by step key. Storages that
+        can claim slots for many steps at once should override this.
+        """
+        return {
+            step_key: self.claim_concurrency_slot(concurrency_key, run_id, step_key, priority)
+            for step_key, priority in step_priorities.items()
+        }
+
     @abstractmethod
     def check_concurrency_claim(
         self, concurrency_key: str, run_id: str, step_key: str
@@ -2,11 +2,12 @@
 import uuid
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.schema import SqlEventLogStorageMetadata
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
@@ -81,6 +82,14 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_watchers(event)
+
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        super(InMemoryEventLogStorage, self).store_event_batch(events)
+        for event in events:
+            self._notify_watchers(event)
+
+    def _notify_watchers(self, event: EventLogEntry) -> None:
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
@@ -1,35 +1,57 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
+from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
 
-class CallbackAfterCursor(NamedTuple):
+def _get_polling_batch_size() -> int:
+    return int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
+
+class CallbackAfterCursor:
     """Callback passed from Observer class in event polling.
 
-    cursor (str): Only process EventLogEntrys after the given cursor
-    callback (Callable[[EventLogEntry], None]): callback passed from Observer
+    The storage id of the last event passed to the callback is tracked so that each callback is
+    only executed on EventLogEntrys after the cursor it was registered with, and never twice on the
+    same EventLogEntry.
+
+    cursor (Optional[str]): Only process EventLogEntrys after the given cursor
+    callback (Callable[[EventLogEntry, str], None]): callback passed from Observer
         to call on new EventLogEntrys, with a string cursor
     """
 
-    cursor: Optional[str]
-    callback: Callable[[EventLogEntry, str], None]
+    __slots__ = ["callback", "last_storage_id"]
+
+    def __init__(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+        self.callback = callback
+        # rely on the fact that all storage ids will be positive integers
+        self.last_storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else -1
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+
+    A single thread (SqlPollingEventWatcherThread) polls the event log on behalf of every watched
+    run_id. Each poll fetches the new events for all of the watched runs in one query, and then
+    dispatches them to the callbacks registered for each run. If that query fails, the poll falls
+    back to one query per run, so that a run with an invalid event log does not stop the delivery
+    of events for the other runs. Runs with an invalid event log are no longer watched. The poll
+    period backs off while no new events are found and resets as soon as there is activity.
+    Storages that can be notified of new events (e.g. through Postgres LISTEN/NOTIFY) can call
+    `notify` to trigger an immediate poll.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _callbacks_by_run_id
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -37,15 +59,16 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _callbacks_by_run_id
+        self._lock: threading.RLock = threading.RLock()
+        self._callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = {}
+        self._thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._lock:
+            _has_run_id = run_id in self._callbacks_by_run_id
         return _has_run_id
 
     def watch_run(
@@ -59,14 +82,17 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+        with self._lock:
+            self._callbacks_by_run_id.setdefault(run_id, []).append(
+                CallbackAfterCursor(cursor, callback)
+            )
+            if self._thread is None:
+                self._thread = SqlPollingEventWatcherThread(self)
+                self._thread.start()
+            thread = self._thread
+
+        # poll right away so that the new observer receives the events it has not yet seen
+        thread.wake()
 
     def unwatch_run(
         self,
@@ -75,113 +101,199 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            if run_id in self._callbacks_by_run_id:
+                callbacks = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                    if callback_with_cursor.callback != handler
+                ]
+                if callbacks:
+                    self._callbacks_by_run_id[run_id] = callbacks
+                else:
+                    del self._callbacks_by_run_id[run_id]
+
+    def notify(self, run_id: Optional[str] = None) -> None:
+        """Signal that new events may have been written, so that the watcher polls immediately
+        instead of waiting for the end of its current poll period.
+
+        Args:
+            run_id (Optional[str]): The run that new events were written for. Notifications for
+                runs that are not being watched are ignored.
+        """
+        thread = self._thread
+        if thread is None or (run_id is not None and not self.has_run_id(run_id)):
+            return
+        thread.wake()
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._lock:
+                thread = self._thread
+                self._thread = None
+                self._callbacks_by_run_id = {}
+            if thread:
+                thread.should_thread_exit.set()
+                thread.wake()
+                thread.join()
+
+    def poll(self) -> Tuple[int, bool]:
+        """Fetch the new events for all of the watched runs and fire the callbacks registered for
+        each run on them.
 
+        Returns:
+            Tuple[int, bool]: The number of records fetched, and whether more records may be
+                available without waiting for new events to be written.
+        """
+        with self._lock:
+            after_storage_id_by_run_id = {
+                run_id: min(callback.last_storage_id for callback in callbacks)
+                for run_id, callbacks in self._callbacks_by_run_id.items()
+            }
+        if not after_storage_id_by_run_id:
+            return 0, False
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+        limit = _get_polling_batch_size()
+        records, has_more = self._fetch_records(after_storage_id_by_run_id, limit)
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+        records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+        for record in records:
+            records_by_run_id[record.event_log_entry.run_id].append(record)
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+        for run_id, run_records in records_by_run_id.items():
+            with self._lock:
+                callbacks = list(self._callbacks_by_run_id.get(run_id, []))
+                for record in run_records:
+                    for callback_with_cursor in callbacks:
+                        if callback_with_cursor.last_storage_id >= record.storage_id:
+                            continue
+                        callback_with_cursor.last_storage_id = record.storage_id
+                        try:
+                            callback_with_cursor.callback(
+                                record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(record.storage_id)),
+                            )
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
+                            )
 
-    """
+        return len(records), has_more
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
+    def _fetch_records(
+        self, after_storage_id_by_run_id: Mapping[str, int], limit: int
+    ) -> Tuple[Sequence[EventLogRecord], bool]:
+        if isinstance(self._event_log_storage, SqlEventLogStorage):
+            try:
+                return self._fetch_records_for_runs(after_storage_id_by_run_id, limit)
+            except Exception:
+                logging.exception(
+                    "Exception while polling for new events for %d runs, polling each run"
+                    " separately.",
+                    len(after_storage_id_by_run_id),
+                )
+
+        records = []
+        has_more = False
+        for run_id, storage_id in after_storage_id_by_run_id.items():
+            try:
+                run_records, run_has_more = self._fetch_records_for_run(run_id, storage_id, limit)
+            except DagsterEventLogInvalidForRun:
+                logging.exception(
+                    "Invalid event log for run %s, no longer watching it for new events.", run_id
+                )
+                self._unwatch_all(run_id)
+                continue
+            except Exception:
+                logging.exception("Exception while polling for new events for run %s.", run_id)
+                continue
+            records.extend(run_records)
+            has_more = has_more or run_has_more
+        return records, has_more
+
+    def _fetch_records_for_runs(
+        self, after_storage_id_by_run_id: Mapping[str, int], limit: int
+    ) -> Tuple[Sequence[EventLogRecord], bool]:
+        event_log_storage = cast(SqlEventLogStorage, self._event_log_storage)
+        records = event_log_storage.get_records_for_runs(after_storage_id_by_run_id, limit=limit)
+        if event_log_storage.is_run_sharded:
+            # the limit is applied to each run shard separately
+            records_per_run = defaultdict(int)
+            for record in records:
+                records_per_run[record.event_log_entry.run_id] += 1
+            return records, any(count == limit for count in records_per_run.values())
+        return records, len(records) == limit
+
+    def _fetch_records_for_run(
+        self, run_id: str, after_storage_id: int, limit: int
+    ) -> Tuple[Sequence[EventLogRecord], bool]:
+        if isinstance(self._event_log_storage, SqlEventLogStorage):
+            return self._fetch_records_for_runs({run_id: after_storage_id}, limit)
+
+        conn = self._event_log_storage.get_records_for_run(
+            run_id,
+            cursor=EventLogCursor.from_storage_id(after_storage_id).to_string(),
+            limit=limit,
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        return conn.records, conn.has_more
 
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+    def _unwatch_all(self, run_id: str) -> None:
+        with self._lock:
+            self._callbacks_by_run_id.pop(run_id, None)
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
 
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls the event log for new Events on behalf of a
+    SqlPollingEventWatcher, for all of its watched run_ids at once.
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
+    Polls every INIT_POLL_PERIOD while new events are being found, backing off up to
+    MAX_POLL_PERIOD while the watched runs are idle. A call to `wake` triggers an immediate poll and
+    resets the poll period.
+    Exits when `self.should_thread_exit` is set.
+    """
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+    def __init__(self, watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__(daemon=True)
+        self._watcher = check.inst_param(watcher, "watcher", SqlPollingEventWatcher)
+        self._should_thread_exit = threading.Event()
+        self._wakeup = threading.Event()
+        self.name = "sql-event-watch"
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
+
+    def wake(self) -> None:
+        self._wakeup.set()
 
     def run(self) -> None:
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+
+        Wakes every poll period (or when woken) &
+            1. executes a single SELECT query to get new EventLogEntrys for all watched runs
+            2. fires each run's callbacks (taking into account the callback cursors) on the new
+               EventLogEntrys
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
+        while not self._should_thread_exit.is_set():
+            woken = self._wakeup.wait(wait_time)
+            self._wakeup.clear()
+            if self._should_thread_exit.is_set():
+                break
 
-        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+            try:
+                num_records, has_more = self._watcher.poll()
+            except Exception:
+                logging.exception("Exception while polling for new events.")
+                num_records, has_more = 0, False
 
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
-            )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+            if has_more:
+                wait_time = 0
+            elif num_records or woken:
+                wait_time = INIT_POLL_PERIOD
+            else:
+                wait_time = min(wait_time * 2, MAX_POLL_PERIOD)
+
+        # release the reference to the watcher, so that it can be garbage collected once closed
+        del self._watcher
@@ -1,9 +1,9 @@
 import logging
 import os
 from abc import abstractmethod
-from collections import OrderedDict, defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from functools import cached_property
 from typing import (
     TYPE_CHECKING,
@@ -100,7 +100,12 @@
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.errors import DeserializationError
 from dagster._serdes.serdes import deserialize_values
-from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
+from dagster._time import (
+    datetime_from_timestamp,
+    get_current_datetime,
+    get_current_timestamp,
+    utc_datetime_from_naive,
+)
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
     ClaimedSlotInfo,
@@ -108,6 +113,7 @@
     ConcurrencyKeyInfo,
     ConcurrencySlotStatus,
     PendingStepInfo,
+    get_concurrency_assignment_lease_seconds,
     get_max_concurrency_limit_value,
 )
 from dagster._utils.warnings import deprecation_warning
@@ -143,6 +149,12 @@ def enforce_max_records_limit(limit: int):
 SqlDbConnection: TypeAlias = Any
 
 
+class EventBatchIndexSettings(NamedTuple):
+    has_asset_key_index_cols: bool
+    has_asset_event_tags_table: bool
+    supports_asset_checks: bool
+
+
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
 
@@ -401,7 +413,19 @@ def store_asset_event_tags(
         check.sequence_param(events, "events", EventLogEntry)
         check.sequence_param(event_ids, "event_ids", int)
 
-        all_values = [
+        all_values = self._get_asset_event_tag_rows(events, event_ids)
+
+        # Only execute if tags table exists. This is to support OSS users who have not yet run the
+        # migration to create the table. On read, we will throw an error if the table does not
+        # exist.
+        if len(all_values) > 0 and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), all_values)
+
+    def _get_asset_event_tag_rows(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> Sequence[Mapping[str, Any]]:
+        return [
             dict(
                 event_id=event_id,
                 asset_key=check.not_none(event.get_dagster_event().asset_key).to_string(),
@@ -413,13 +437,6 @@ def store_asset_event_tags(
             for key, value in self._tags_for_asset_event(event).items()
         ]
 
-        # Only execute if tags table exists. This is to support OSS users who have not yet run the
-        # migration to create the table. On read, we will throw an error if the table does not
-        # exist.
-        if len(all_values) > 0 and self.has_table(AssetEventTagsTable.name):
-            with self.index_connection() as conn:
-                conn.execute(AssetEventTagsTable.insert(), all_values)
-
     def _tags_for_asset_event(self, event: EventLogEntry) -> Mapping[str, str]:
         tags = {}
         if event.dagster_event and event.dagster_event.asset_key:
@@ -465,6 +482,126 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events in a single transaction.
+
+        The event rows, the merged `asset_keys` upserts and the `asset_event_tags` rows for every
+        asset event in the batch, and the asset check execution rows for every asset check event in
+        the batch are all written using one connection, and committed together.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        index_settings = self._get_event_batch_index_settings(events)
+        with self.index_transaction() as conn:
+            event_ids = self._insert_event_batch(conn, events)
+            self._store_event_batch_indexes(conn, events, event_ids, index_settings)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[int]:
+        """Inserts the event rows for a batch of events using the given connection, returning the
+        storage ids of the inserted rows in order.
+        """
+        return [
+            conn.execute(self.prepare_insert_event(event)).inserted_primary_key[0]
+            for event in events
+        ]
+
+    def _get_event_batch_index_settings(
+        self, events: Sequence[EventLogEntry]
+    ) -> "EventBatchIndexSettings":
+        """Resolves the schema-dependent settings used to index a batch of events, so that the
+        schema is inspected at most once per batch and never while the batch transaction is open.
+        """
+        event_types = {event.dagster_event_type for event in events if event.is_dagster_event}
+        has_asset_events = bool(event_types & ASSET_EVENTS)
+        has_asset_check_events = bool(event_types & ASSET_CHECK_EVENTS)
+        return EventBatchIndexSettings(
+            has_asset_key_index_cols=has_asset_events
+            and self.has_secondary_index(ASSET_KEY_INDEX_COLS),
+            has_asset_event_tags_table=has_asset_events
+            and self.has_table(AssetEventTagsTable.name),
+            supports_asset_checks=has_asset_check_events and self.supports_asset_checks,
+        )
+
+    def _store_event_batch_indexes(
+        self,
+        conn: Connection,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[Optional[int]],
+        index_settings: "EventBatchIndexSettings",
+    ) -> None:
+        """Writes the cross-run asset and asset check index rows for a batch of stored events using
+        the given connection.
+        """
+        asset_events: List[EventLogEntry] = []
+        asset_event_ids: List[int] = []
+        asset_key_values: Dict[str, Dict[str, Any]] = {}
+
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+
+            dagster_event = event.get_dagster_event()
+            if dagster_event.event_type in ASSET_EVENTS and dagster_event.asset_key:
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                # merge the values for each asset key, so that later events in the batch win
+                asset_key_values.setdefault(dagster_event.asset_key.to_string(), {}).update(
+                    self._get_asset_entry_values(
+                        event, event_id, index_settings.has_asset_key_index_cols
+                    )
+                )
+                asset_events.append(event)
+                asset_event_ids.append(event_id)
+
+            if dagster_event.event_type in ASSET_CHECK_EVENTS:
+                check.invariant(
+                    index_settings.supports_asset_checks,
+                    "Asset checks require a database schema migration. Run `dagster instance"
+                    " migrate`.",
+                )
+                self._store_asset_check_event_with_connection(conn, event, event_id)
+
+        if asset_key_values:
+            self._upsert_asset_key_rows(conn, asset_key_values)
+
+        if index_settings.has_asset_event_tags_table:
+            tag_rows = self._get_asset_event_tag_rows(asset_events, asset_event_ids)
+            if tag_rows:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+    def _upsert_asset_key_rows(
+        self, conn: Connection, values_by_asset_key: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Inserts or updates the `asset_keys` rows for a set of asset keys using the given
+        connection. Storages with native upsert support should override this method.
+        """
+        existing_asset_keys = {
+            row[0]
+            for row in conn.execute(
+                db_select([AssetKeyTable.c.asset_key]).where(
+                    AssetKeyTable.c.asset_key.in_(list(values_by_asset_key.keys()))
+                )
+            ).fetchall()
+        }
+        for asset_key_str, values in values_by_asset_key.items():
+            if asset_key_str not in existing_asset_keys:
+                conn.execute(AssetKeyTable.insert().values(asset_key=asset_key_str, **values))
+            elif values:
+                conn.execute(
+                    AssetKeyTable.update()
+                    .values(**values)
+                    .where(AssetKeyTable.c.asset_key == asset_key_str)
+                )
+
     def get_records_for_run(
         self,
         run_id,
@@ -558,6 +695,65 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self,
+        after_storage_id_by_run_id: Mapping[str, int],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records for several runs in a single query, in ascending storage id
+        order. Used by the polling event watcher to fetch new events for every watched run at once.
+
+        Args:
+            after_storage_id_by_run_id (Mapping[str, int]): For each run, only records with a
+                storage id greater than the given storage id are returned.
+            limit (Optional[int]): the maximum number of records to fetch across all runs
+        """
+        check.mapping_param(
+            after_storage_id_by_run_id, "after_storage_id_by_run_id", key_type=str, value_type=int
+        )
+        if not after_storage_id_by_run_id:
+            return []
+
+        # the IN clause and the lower bound on the id narrow the scan; the per-run conditions
+        # keep runs that are further ahead from re-reading events they have already seen
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id.in_(list(after_storage_id_by_run_id.keys())))
+            .where(SqlEventLogStorageTable.c.id > min(after_storage_id_by_run_id.values()))
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > storage_id,
+                        )
+                        for run_id, storage_id in after_storage_id_by_run_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -1524,6 +1720,26 @@ def update_asset_cached_status_data(
                     .values(cached_status_data=serialize_value(cache_values))
                 )
 
+    def update_asset_cached_status_data_for_assets(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        if not self.can_read_asset_status_cache() or not cache_values_by_asset_key:
+            return
+
+        with self.index_transaction() as conn:
+            conn.execute(
+                AssetKeyTable.update()
+                .where(AssetKeyTable.c.asset_key == db.bindparam("asset_key_string"))
+                .values(cached_status_data=db.bindparam("cached_status_data_string")),
+                [
+                    {
+                        "asset_key_string": asset_key.to_string(),
+                        "cached_status_data_string": serialize_value(cache_values),
+                    }
+                    for asset_key, cache_values in cache_values_by_asset_key.items()
+                ],
+            )
+
     def _fetch_backcompat_materialization_times(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, datetime]:
@@ -2040,6 +2256,113 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
 
         return materialization_planned_rows_by_partition
 
+    def get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+        self, after_storage_id_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Mapping[str, Tuple[str, int]]]:
+        check.mapping_param(
+            after_storage_id_by_asset_key, "after_storage_id_by_asset_key", key_type=AssetKey
+        )
+        if not after_storage_id_by_asset_key:
+            return {}
+
+        asset_keys = list(after_storage_id_by_asset_key.keys())
+        asset_keys_by_string = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+
+        # The latest event of a partition after a storage id is the latest event of the partition,
+        # if that is after the storage id. So all of the assets can be queried after the earliest of
+        # their storage ids, dropping the partitions whose latest events come before the storage id
+        # of their own asset.
+        after_storage_ids = list(after_storage_id_by_asset_key.values())
+        min_after_storage_id = (
+            None
+            if any(not storage_id for storage_id in after_storage_ids)
+            else min(after_storage_ids)
+        )
+
+        latest_event_ids_query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(list(asset_keys_by_string.keys())),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [
+                            DagsterEventType.ASSET_MATERIALIZATION.value,
+                            DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                        ]
+                    ),
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.partition,
+            )
+        )
+        if min_after_storage_id is not None:
+            latest_event_ids_query = latest_event_ids_query.where(
+                SqlEventLogStorageTable.c.id > min_after_storage_id
+            )
+        latest_event_ids_subquery = db_subquery(
+            self._add_assets_wipe_filter_to_query(
+                latest_event_ids_query, self._get_assets_details(asset_keys), asset_keys
+            ),
+            "latest_event_ids_by_partition_subquery",
+        )
+
+        latest_events_query = db_select(
+            [
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.partition,
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.id,
+            ]
+        ).select_from(
+            latest_event_ids_subquery.join(
+                SqlEventLogStorageTable,
+                SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+            ),
+        )
+
+        with self.index_connection() as conn:
+            rows = db_fetch_mappings(conn, latest_events_query)
+
+        planned_by_partition_by_asset_key: Dict[AssetKey, Dict[str, Tuple[str, int]]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        materialization_rows = []
+        for row in rows:
+            asset_key = asset_keys_by_string[row["asset_key"]]
+            after_storage_id = after_storage_id_by_asset_key[asset_key]
+            if after_storage_id and row["id"] <= after_storage_id:
+                continue
+            if row["dagster_event_type"] == DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value:
+                planned_by_partition_by_asset_key[asset_key][row["partition"]] = (
+                    row["run_id"],
+                    row["id"],
+                )
+            else:
+                materialization_rows.append((asset_key, row["partition"], row["id"]))
+
+        for asset_key, partition, mat_event_id in materialization_rows:
+            planned_by_partition = planned_by_partition_by_asset_key[asset_key]
+            if partition not in planned_by_partition:
+                continue
+            _, planned_event_id = planned_by_partition[partition]
+            if planned_event_id < mat_event_id:
+                # this planned materialization event was followed by a materialization event
+                planned_by_partition.pop(partition)
+
+        return planned_by_partition_by_asset_key
+
     def _check_partitions_table(self) -> None:
         # Guards against cases where the user is not running the latest migration for
         # partitions storage. Should be updated when the partitions storage schema changes.
@@ -2344,29 +2667,32 @@ def _allocate_concurrency_slots(self, conn, concurrency_key: str, num: int) -> L
 
     def has_unassigned_slots(self, concurrency_key: str) -> bool:
         with self.index_connection() as conn:
-            pending_row = conn.execute(
-                db_select([db.func.count()])
-                .select_from(PendingStepsTable)
-                .where(
-                    db.and_(
-                        PendingStepsTable.c.concurrency_key == concurrency_key,
-                        PendingStepsTable.c.assigned_timestamp != None,  # noqa: E711
-                    )
+            return self._get_unassigned_slot_count(conn, concurrency_key) > 0
+
+    def _get_unassigned_slot_count(self, conn, concurrency_key: str) -> int:
+        pending_row = conn.execute(
+            db_select([db.func.count()])
+            .select_from(PendingStepsTable)
+            .where(
+                db.and_(
+                    PendingStepsTable.c.concurrency_key == concurrency_key,
+                    PendingStepsTable.c.assigned_timestamp != None,  # noqa: E711
                 )
-            ).fetchone()
-            slots = conn.execute(
-                db_select([db.func.count()])
-                .select_from(ConcurrencySlotsTable)
-                .where(
-                    db.and_(
-                        ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
-                        ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
-                    )
+            )
+        ).fetchone()
+        slots = conn.execute(
+            db_select([db.func.count()])
+            .select_from(ConcurrencySlotsTable)
+            .where(
+                db.and_(
+                    ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                    ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
                 )
-            ).fetchone()
+            )
+        ).fetchone()
         pending_count = cast(int, pending_row[0]) if pending_row else 0
         slots_count = cast(int, slots[0]) if slots else 0
-        return slots_count > pending_count
+        return slots_count - pending_count
 
     def check_concurrency_claim(
         self, concurrency_key: str, run_id: str, step_key: str
@@ -2465,28 +2791,96 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
         if not concurrency_keys:
             return
 
+        # assign all of the freed slots for each key at once, instead of one slot at a time
         with self.index_connection() as conn:
-            for key in concurrency_keys:
-                row = conn.execute(
-                    db_select([PendingStepsTable.c.id])
-                    .where(
-                        db.and_(
-                            PendingStepsTable.c.concurrency_key == key,
-                            PendingStepsTable.c.assigned_timestamp == None,  # noqa: E711
-                        )
-                    )
-                    .order_by(
-                        PendingStepsTable.c.priority.desc(),
-                        PendingStepsTable.c.create_timestamp.asc(),
-                    )
-                    .limit(1)
-                ).fetchone()
-                if row:
-                    conn.execute(
-                        PendingStepsTable.update()
-                        .where(PendingStepsTable.c.id == row[0])
-                        .values(assigned_timestamp=db.func.now())
+            for key, count in Counter(concurrency_keys).items():
+                self._assign_pending_steps(conn, key, count)
+
+    def _assign_pending_steps(
+        self,
+        conn,
+        concurrency_key: str,
+        count: int,
+        exclude_ids: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Assign up to `count` unassigned pending steps for the key, in priority order."""
+        query = (
+            db_select([PendingStepsTable.c.id])
+            .where(
+                db.and_(
+                    PendingStepsTable.c.concurrency_key == concurrency_key,
+                    PendingStepsTable.c.assigned_timestamp == None,  # noqa: E711
+                )
+            )
+            .order_by(
+                PendingStepsTable.c.priority.desc(),
+                PendingStepsTable.c.create_timestamp.asc(),
+            )
+            .limit(count)
+        )
+        if exclude_ids:
+            query = query.where(PendingStepsTable.c.id.notin_(exclude_ids))
+        rows = conn.execute(query).fetchall()
+        if rows:
+            conn.execute(
+                PendingStepsTable.update()
+                .where(PendingStepsTable.c.id.in_([row[0] for row in rows]))
+                .values(assigned_timestamp=db.func.now())
+            )
+
+    def _expire_concurrency_assignments(self, conn, concurrency_key: str) -> None:
+        """Unassign the pending steps that were assigned a slot longer than the assignment lease ago
+        but never claimed it, e.g. because the process waiting on the claim went away, and assign
+        their slots to the next pending steps.
+        """
+        lease_seconds = get_concurrency_assignment_lease_seconds()
+        if lease_seconds <= 0:
+            return
+
+        assigned_rows = conn.execute(
+            db_select(
+                [
+                    PendingStepsTable.c.id,
+                    PendingStepsTable.c.run_id,
+                    PendingStepsTable.c.step_key,
+                    PendingStepsTable.c.assigned_timestamp,
+                ]
+            ).where(
+                db.and_(
+                    PendingStepsTable.c.concurrency_key == concurrency_key,
+                    PendingStepsTable.c.assigned_timestamp != None,  # noqa: E711
+                )
+            )
+        ).fetchall()
+        if not assigned_rows:
+            return
+
+        claimed = {
+            (row[0], row[1])
+            for row in conn.execute(
+                db_select([ConcurrencySlotsTable.c.run_id, ConcurrencySlotsTable.c.step_key]).where(
+                    db.and_(
+                        ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                        ConcurrencySlotsTable.c.run_id != None,  # noqa: E711
                     )
+                )
+            ).fetchall()
+        }
+        lease_expiry = get_current_datetime() - timedelta(seconds=lease_seconds)
+        expired_ids = [
+            row[0]
+            for row in assigned_rows
+            if (row[1], row[2]) not in claimed and utc_datetime_from_naive(row[3]) < lease_expiry
+        ]
+        if not expired_ids:
+            return
+
+        conn.execute(
+            PendingStepsTable.update()
+            .where(PendingStepsTable.c.id.in_(expired_ids))
+            .values(assigned_timestamp=None)
+        )
+        self._assign_pending_steps(conn, concurrency_key, len(expired_ids), exclude_ids=expired_ids)
 
     def add_pending_step(
         self,
@@ -2572,6 +2966,10 @@ def claim_concurrency_slot(
                 should_assign=has_unassigned_slots,
             )
 
+        if get_concurrency_assignment_lease_seconds() > 0:
+            with self.index_transaction() as conn:
+                self._expire_concurrency_assignments(conn, concurrency_key)
+
         # if the step is not assigned (i.e. has not been popped from queue), block the claim
         claim_status = self.check_concurrency_claim(
             concurrency_key=concurrency_key, run_id=run_id, step_key=step_key
@@ -2587,6 +2985,150 @@ def claim_concurrency_slot(
         )
         return claim_status.with_slot_status(slot_status)
 
+    def claim_concurrency_slots(
+        self, concurrency_key: str, run_id: str, step_priorities: Mapping[str, Optional[int]]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        """Claim concurrency slots for a batch of steps of a run, in a single transaction.
+
+        Steps that are not pending yet are added to the pending queue, and as many of them are
+        assigned as there are unassigned slots, in priority order. Every assigned step that has not
+        claimed a slot yet then claims one.
+
+        Args:
+            concurrency_key (str): The concurrency key to claim.
+            run_id (str): The run id to claim for.
+            step_priorities (Mapping[str, Optional[int]]): The priority of each step to claim for.
+        """
+        step_keys = list(step_priorities.keys())
+        if not step_keys:
+            return {}
+
+        def _priority(step_key: str) -> int:
+            return step_priorities[step_key] or 0
+
+        with self.index_transaction() as conn:
+            self._expire_concurrency_assignments(conn, concurrency_key)
+
+            pending_step_keys = {
+                row[0]
+                for row in conn.execute(
+                    db_select([PendingStepsTable.c.step_key]).where(
+                        db.and_(
+                            PendingStepsTable.c.concurrency_key == concurrency_key,
+                            PendingStepsTable.c.run_id == run_id,
+                            PendingStepsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+            }
+            new_step_keys = sorted(
+                [step_key for step_key in step_keys if step_key not in pending_step_keys],
+                key=_priority,
+                reverse=True,
+            )
+            if new_step_keys:
+                unassigned_slot_count = self._get_unassigned_slot_count(conn, concurrency_key)
+                conn.execute(
+                    PendingStepsTable.insert().values(
+                        [
+                            dict(
+                                run_id=run_id,
+                                step_key=step_key,
+                                concurrency_key=concurrency_key,
+                                priority=_priority(step_key),
+                                assigned_timestamp=(
+                                    db.func.now() if i < unassigned_slot_count else None
+                                ),
+                            )
+                            for i, step_key in enumerate(new_step_keys)
+                        ]
+                    )
+                )
+
+            pending_rows = {
+                row[0]: row
+                for row in conn.execute(
+                    db_select(
+                        [
+                            PendingStepsTable.c.step_key,
+                            PendingStepsTable.c.assigned_timestamp,
+                            PendingStepsTable.c.priority,
+                            PendingStepsTable.c.create_timestamp,
+                        ]
+                    ).where(
+                        db.and_(
+                            PendingStepsTable.c.concurrency_key == concurrency_key,
+                            PendingStepsTable.c.run_id == run_id,
+                            PendingStepsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+            }
+            claimed_step_keys = {
+                row[0]
+                for row in conn.execute(
+                    db_select([ConcurrencySlotsTable.c.step_key]).where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                            ConcurrencySlotsTable.c.run_id == run_id,
+                            ConcurrencySlotsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+            }
+
+            step_keys_to_claim = sorted(
+                [
+                    step_key
+                    for step_key, row in pending_rows.items()
+                    if row[1] is not None and step_key not in claimed_step_keys
+                ],
+                key=_priority,
+                reverse=True,
+            )
+            if step_keys_to_claim:
+                slot_rows = conn.execute(
+                    db_select([ConcurrencySlotsTable.c.id])
+                    .select_from(ConcurrencySlotsTable)
+                    .where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                            ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                            ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                        )
+                    )
+                    .with_for_update(skip_locked=True)
+                    .limit(len(step_keys_to_claim))
+                ).fetchall()
+                claims = [
+                    {"slot_id": slot_row[0], "claim_step_key": step_key}
+                    for slot_row, step_key in zip(slot_rows, step_keys_to_claim)
+                ]
+                if claims:
+                    conn.execute(
+                        ConcurrencySlotsTable.update()
+                        .where(ConcurrencySlotsTable.c.id == db.bindparam("slot_id"))
+                        .values(run_id=run_id, step_key=db.bindparam("claim_step_key")),
+                        claims,
+                    )
+                    claimed_step_keys.update(claim["claim_step_key"] for claim in claims)
+
+        claim_statuses = {}
+        for step_key in step_keys:
+            row = pending_rows.get(step_key)
+            claim_statuses[step_key] = ConcurrencyClaimStatus(
+                concurrency_key=concurrency_key,
+                slot_status=(
+                    ConcurrencySlotStatus.CLAIMED
+                    if row is not None and step_key in claimed_step_keys
+                    else ConcurrencySlotStatus.BLOCKED
+                ),
+                priority=cast(int, row[2]) if row is not None and row[2] else None,
+                assigned_timestamp=cast(datetime, row[1]) if row is not None and row[1] else None,
+                enqueued_timestamp=cast(datetime, row[3]) if row is not None and row[3] else None,
+            )
+        return claim_statuses
+
     def _claim_concurrency_slot(
         self, concurrency_key: str, run_id: str, step_key: str
     ) -> ConcurrencySlotStatus:
@@ -2782,95 +3324,100 @@ def store_asset_check_event(self, event: EventLogEntry, event_id: Optional[int])
             "Asset checks require a database schema migration. Run `dagster instance migrate`.",
         )
 
+        with self.index_connection() as conn:
+            self._store_asset_check_event_with_connection(conn, event, event_id)
+
+    def _store_asset_check_event_with_connection(
+        self, conn: Connection, event: EventLogEntry, event_id: Optional[int]
+    ) -> None:
         if event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED:
-            self._store_asset_check_evaluation_planned(event, event_id)
+            self._store_asset_check_evaluation_planned(conn, event, event_id)
         if event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION:
             if event.run_id == "" or event.run_id is None:
-                self._store_runless_asset_check_evaluation(event, event_id)
+                self._store_runless_asset_check_evaluation(conn, event, event_id)
             else:
-                self._update_asset_check_evaluation(event, event_id)
+                self._update_asset_check_evaluation(conn, event, event_id)
 
     def _store_asset_check_evaluation_planned(
-        self, event: EventLogEntry, event_id: Optional[int]
+        self, conn: Connection, event: EventLogEntry, event_id: Optional[int]
     ) -> None:
         planned = cast(
             AssetCheckEvaluationPlanned, check.not_none(event.dagster_event).event_specific_data
         )
-        with self.index_connection() as conn:
-            conn.execute(
-                AssetCheckExecutionsTable.insert().values(
-                    asset_key=planned.asset_key.to_string(),
-                    check_name=planned.check_name,
-                    run_id=event.run_id,
-                    execution_status=AssetCheckExecutionRecordStatus.PLANNED.value,
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
-                )
+        conn.execute(
+            AssetCheckExecutionsTable.insert().values(
+                asset_key=planned.asset_key.to_string(),
+                check_name=planned.check_name,
+                run_id=event.run_id,
+                execution_status=AssetCheckExecutionRecordStatus.PLANNED.value,
+                evaluation_event=serialize_value(event),
+                evaluation_event_timestamp=self._event_insert_timestamp(event),
             )
+        )
 
     def _event_insert_timestamp(self, event):
         # Postgres requires a datetime that is in UTC but has no timezone info
         return datetime.fromtimestamp(event.timestamp, timezone.utc).replace(tzinfo=None)
 
     def _store_runless_asset_check_evaluation(
-        self, event: EventLogEntry, event_id: Optional[int]
+        self, conn: Connection, event: EventLogEntry, event_id: Optional[int]
     ) -> None:
         evaluation = cast(
             AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
         )
-        with self.index_connection() as conn:
-            conn.execute(
-                AssetCheckExecutionsTable.insert().values(
-                    asset_key=evaluation.asset_key.to_string(),
-                    check_name=evaluation.check_name,
-                    run_id=event.run_id,
-                    execution_status=(
-                        AssetCheckExecutionRecordStatus.SUCCEEDED.value
-                        if evaluation.passed
-                        else AssetCheckExecutionRecordStatus.FAILED.value
-                    ),
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
-                    evaluation_event_storage_id=event_id,
-                    materialization_event_storage_id=(
-                        evaluation.target_materialization_data.storage_id
-                        if evaluation.target_materialization_data
-                        else None
-                    ),
-                )
+        conn.execute(
+            AssetCheckExecutionsTable.insert().values(
+                asset_key=evaluation.asset_key.to_string(),
+                check_name=evaluation.check_name,
+                run_id=event.run_id,
+                execution_status=(
+                    AssetCheckExecutionRecordStatus.SUCCEEDED.value
+                    if evaluation.passed
+                    else AssetCheckExecutionRecordStatus.FAILED.value
+                ),
+                evaluation_event=serialize_value(event),
+                evaluation_event_timestamp=self._event_insert_timestamp(event),
+                evaluation_event_storage_id=event_id,
+                materialization_event_storage_id=(
+                    evaluation.target_materialization_data.storage_id
+                    if evaluation.target_materialization_data
+                    else None
+                ),
             )
+        )
 
-    def _update_asset_check_evaluation(self, event: EventLogEntry, event_id: Optional[int]) -> None:
+    def _update_asset_check_evaluation(
+        self, conn: Connection, event: EventLogEntry, event_id: Optional[int]
+    ) -> None:
         evaluation = cast(
             AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
         )
-        with self.index_connection() as conn:
-            rows_updated = conn.execute(
-                AssetCheckExecutionsTable.update()
-                .where(
-                    # (asset_key, check_name, run_id) uniquely identifies the row created for the planned event
-                    db.and_(
-                        AssetCheckExecutionsTable.c.asset_key == evaluation.asset_key.to_string(),
-                        AssetCheckExecutionsTable.c.check_name == evaluation.check_name,
-                        AssetCheckExecutionsTable.c.run_id == event.run_id,
-                    )
-                )
-                .values(
-                    execution_status=(
-                        AssetCheckExecutionRecordStatus.SUCCEEDED.value
-                        if evaluation.passed
-                        else AssetCheckExecutionRecordStatus.FAILED.value
-                    ),
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
-                    evaluation_event_storage_id=event_id,
-                    materialization_event_storage_id=(
-                        evaluation.target_materialization_data.storage_id
-                        if evaluation.target_materialization_data
-                        else None
-                    ),
+        rows_updated = conn.execute(
+            AssetCheckExecutionsTable.update()
+            .where(
+                # (asset_key, check_name, run_id) uniquely identifies the row created for the planned event
+                db.and_(
+                    AssetCheckExecutionsTable.c.asset_key == evaluation.asset_key.to_string(),
+                    AssetCheckExecutionsTable.c.check_name == evaluation.check_name,
+                    AssetCheckExecutionsTable.c.run_id == event.run_id,
                 )
-            ).rowcount
+            )
+            .values(
+                execution_status=(
+                    AssetCheckExecutionRecordStatus.SUCCEEDED.value
+                    if evaluation.passed
+                    else AssetCheckExecutionRecordStatus.FAILED.value
+                ),
+                evaluation_event=serialize_value(event),
+                evaluation_event_timestamp=self._event_insert_timestamp(event),
+                evaluation_event_storage_id=event_id,
+                materialization_event_storage_id=(
+                    evaluation.target_materialization_data.storage_id
+                    if evaluation.target_materialization_data
+                    else None
+                ),
+            )
+        ).rowcount
 
         # 0 isn't normally expected, but occurs with the external instance of step launchers where
         # they don't have planned events.
@@ -0,0 +1,373 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
+
+import sqlalchemy as db
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
+
+import dagster._check as check
+from dagster._core.storage.event_log.base import EventRecordsFilter
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.sql import create_engine
+from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._core.storage.sqlite import create_db_conn_string
+from dagster._utils import mkdir_p
+
+SHARD_INDEX_DIR_NAME = "shard_index"
+SHARD_INDEX_DB_NAME = "shard_index"
+
+# the state key of the time at which the index was last caught up with the run shards
+CAUGHT_UP_AT_KEY = "caught_up_at"
+# run shards modified this many seconds before the index was last caught up are checked again, to
+# allow for filesystems with coarse modification times
+SHARD_MODIFIED_AT_SLACK_SECONDS = 2.0
+
+ShardIndexMetadata = db.MetaData()
+
+ShardEventIndexTable = db.Table(
+    "shard_event_index",
+    ShardIndexMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    # the id of the event in its run shard
+    db.Column("storage_id", db.Integer, nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    db.Column("asset_key", db.Text),
+    db.Column("partition", db.Text),
+    db.Column("timestamp", db.types.TIMESTAMP),
+)
+
+db.Index(
+    "idx_shard_event_index_run_storage_id",
+    ShardEventIndexTable.c.run_id,
+    ShardEventIndexTable.c.storage_id,
+    unique=True,
+)
+db.Index(
+    "idx_shard_event_index_event_type",
+    ShardEventIndexTable.c.dagster_event_type,
+    ShardEventIndexTable.c.timestamp,
+)
+db.Index(
+    "idx_shard_event_index_asset_key",
+    ShardEventIndexTable.c.asset_key,
+    ShardEventIndexTable.c.dagster_event_type,
+    ShardEventIndexTable.c.timestamp,
+)
+
+ShardIndexStateTable = db.Table(
+    "shard_index_state",
+    ShardIndexMetadata,
+    db.Column("key", db.String(255), primary_key=True),
+    db.Column("value", db.Text),
+)
+
+
+class ShardEventIndexEntry(NamedTuple):
+    run_id: str
+    # the id of the event in its run shard
+    storage_id: int
+
+
+class ShardEventIndex:
+    """A SQLite database, kept alongside the run shards of a `SqliteEventLogStorage`, that mirrors
+    the columns of the dagster events in every run shard that cross-run event queries filter on.
+
+    Cross-run queries first find the matching events in this database, and then only open the run
+    shards that contain them, instead of opening the shard of every run.
+
+    The highest indexed storage id of each run acts as the high-water mark of its shard. Events
+    stored while the index is not being maintained (e.g. by a process that has the shard index
+    disabled) are indexed by `catch_up`, which only reads the events past the high-water mark of
+    the shards that were modified since the index was last caught up.
+    """
+
+    def __init__(self, base_dir: str):
+        self._base_dir = os.path.join(check.str_param(base_dir, "base_dir"), SHARD_INDEX_DIR_NAME)
+        self._lock = threading.Lock()
+        mkdir_p(self._base_dir)
+        self._is_new = not os.path.exists(self.path)
+        engine = create_engine(self._conn_string, poolclass=NullPool)
+        with engine.connect() as conn:
+            ShardIndexMetadata.create_all(conn)
+            conn.execute(db.text("PRAGMA journal_mode=WAL;"))
+        engine.dispose()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self._base_dir, f"{SHARD_INDEX_DB_NAME}.db")
+
+    @property
+    def is_new(self) -> bool:
+        """Whether the database was created by this instance, and so may need to be built from the
+        existing run shards.
+        """
+        return self._is_new
+
+    @property
+    def _conn_string(self) -> str:
+        return create_db_conn_string(self._base_dir, SHARD_INDEX_DB_NAME)
+
+    @contextmanager
+    def connect(self) -> Iterator[Connection]:
+        with self._lock:
+            engine = create_engine(self._conn_string, poolclass=NullPool)
+            with engine.connect() as conn:
+                with conn.begin():
+                    yield conn
+            engine.dispose()
+
+    def index_events(self, rows: Sequence[Mapping[str, object]]) -> None:
+        """Index events that were just stored in their run shards. Each row contains the run id,
+        the id of the event in its run shard, and the filtered columns of the event.
+        """
+        rows = [row for row in rows if row.get("dagster_event_type")]
+        if not rows:
+            return
+        with self.connect() as conn:
+            # events can be indexed both by the process that stores them and by a concurrent
+            # catch up, so events that are already indexed are skipped
+            conn.execute(
+                ShardEventIndexTable.insert().prefix_with("OR IGNORE"),
+                [_index_row(row) for row in rows],
+            )
+
+    def rebuild(
+        self,
+        run_ids: Sequence[str],
+        run_connection: Callable[[str], ContextManager[Connection]],
+    ) -> None:
+        """Replace the contents of the index with the dagster events in the given run shards."""
+        started_at = time.time()
+        with self.connect() as conn:
+            conn.execute(ShardEventIndexTable.delete())
+
+        for run_id in run_ids:
+            self._index_shard(run_id, run_connection, after_storage_id=None)
+
+        self._set_caught_up_at(started_at)
+
+    def catch_up(
+        self,
+        run_ids: Sequence[str],
+        run_connection: Callable[[str], ContextManager[Connection]],
+        get_shard_modified_at: Callable[[str], Optional[float]],
+    ) -> None:
+        """Index the events that were stored in the given run shards without being indexed, and
+        remove the events of runs whose shards no longer exist.
+
+        Args:
+            run_ids (Sequence[str]): The ids of every run that has a shard.
+            run_connection (Callable[[str], ContextManager[Connection]]): Opens a run shard.
+            get_shard_modified_at (Callable[[str], Optional[float]]): Returns the time at which a
+                run shard was last modified, or None if it is unknown.
+        """
+        started_at = time.time()
+        caught_up_at = self._get_caught_up_at()
+        run_id_set = set(run_ids)
+
+        with self.connect() as conn:
+            watermarks: Dict[str, int] = {
+                run_id: max_storage_id
+                for run_id, max_storage_id in conn.execute(
+                    db_select(
+                        [
+                            ShardEventIndexTable.c.run_id,
+                            db.func.max(ShardEventIndexTable.c.storage_id),
+                        ]
+                    ).group_by(ShardEventIndexTable.c.run_id)
+                )
+            }
+
+        deleted_run_ids: Set[str] = set(watermarks) - run_id_set
+        for run_id in deleted_run_ids:
+            self.delete_events_for_run(run_id)
+
+        for run_id in run_ids:
+            if caught_up_at is not None:
+                modified_at = get_shard_modified_at(run_id)
+                if (
+                    modified_at is not None
+                    and modified_at < caught_up_at - SHARD_MODIFIED_AT_SLACK_SECONDS
+                ):
+                    continue
+            self._index_shard(run_id, run_connection, after_storage_id=watermarks.get(run_id))
+
+        self._set_caught_up_at(started_at)
+
+    def _index_shard(
+        self,
+        run_id: str,
+        run_connection: Callable[[str], ContextManager[Connection]],
+        after_storage_id: Optional[int],
+    ) -> None:
+        query = db_select(
+            [
+                SqlEventLogStorageTable.c.id,
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.partition,
+                SqlEventLogStorageTable.c.timestamp,
+            ]
+        ).where(SqlEventLogStorageTable.c.dagster_event_type.isnot(None))
+        if after_storage_id is not None:
+            query = query.where(SqlEventLogStorageTable.c.id > after_storage_id)
+
+        with run_connection(run_id) as run_conn:
+            rows = run_conn.execute(query).fetchall()
+
+        self.index_events(
+            [
+                {
+                    "run_id": row_run_id or run_id,
+                    "storage_id": storage_id,
+                    "dagster_event_type": event_type,
+                    "asset_key": asset_key,
+                    "partition": partition,
+                    "timestamp": timestamp,
+                }
+                for storage_id, row_run_id, event_type, asset_key, partition, timestamp in rows
+            ]
+        )
+
+    def _get_caught_up_at(self) -> Optional[float]:
+        with self.connect() as conn:
+            value = conn.execute(
+                db_select([ShardIndexStateTable.c.value]).where(
+                    ShardIndexStateTable.c.key == CAUGHT_UP_AT_KEY
+                )
+            ).scalar()
+        return float(value) if value is not None else None
+
+    def _set_caught_up_at(self, timestamp: float) -> None:
+        with self.connect() as conn:
+            conn.execute(
+                ShardIndexStateTable.insert().prefix_with("OR REPLACE"),
+                {"key": CAUGHT_UP_AT_KEY, "value": str(timestamp)},
+            )
+
+    def delete_events_for_run(self, run_id: str) -> None:
+        with self.connect() as conn:
+            conn.execute(
+                ShardEventIndexTable.delete().where(ShardEventIndexTable.c.run_id == run_id)
+            )
+
+    def wipe(self) -> None:
+        with self.connect() as conn:
+            conn.execute(ShardEventIndexTable.delete())
+            conn.execute(ShardIndexStateTable.delete())
+
+    def get_matching_events(
+        self,
+        event_records_filter: EventRecordsFilter,
+        after_timestamp: Optional[float] = None,
+        run_ids: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[ShardEventIndexEntry]:
+        """Find the events that match the filter, ordered by their timestamp.
+
+        The index applies the same filters as the query against the run shards, with storage ids
+        referring to the ids of events within their run shard, so that the shards do not need to
+        filter out any of the returned events.
+        """
+        query = db_select([ShardEventIndexTable.c.run_id, ShardEventIndexTable.c.storage_id]).where(
+            ShardEventIndexTable.c.dagster_event_type == event_records_filter.event_type.value
+        )
+        if event_records_filter.asset_key:
+            query = query.where(
+                ShardEventIndexTable.c.asset_key == event_records_filter.asset_key.to_string()
+            )
+        if event_records_filter.asset_partitions:
+            query = query.where(
+                ShardEventIndexTable.c.partition.in_(event_records_filter.asset_partitions)
+            )
+        if after_timestamp:
+            query = query.where(ShardEventIndexTable.c.timestamp > _to_naive_utc(after_timestamp))
+        if event_records_filter.after_timestamp:
+            query = query.where(
+                ShardEventIndexTable.c.timestamp
+                > _to_naive_utc(event_records_filter.after_timestamp)
+            )
+        if event_records_filter.before_timestamp:
+            query = query.where(
+                ShardEventIndexTable.c.timestamp
+                < _to_naive_utc(event_records_filter.before_timestamp)
+            )
+        if event_records_filter.storage_ids:
+            query = query.where(
+                ShardEventIndexTable.c.storage_id.in_(event_records_filter.storage_ids)
+            )
+
+        if ascending:
+            query = query.order_by(
+                ShardEventIndexTable.c.timestamp.asc(), ShardEventIndexTable.c.id.asc()
+            )
+        else:
+            query = query.order_by(
+                ShardEventIndexTable.c.timestamp.desc(), ShardEventIndexTable.c.id.desc()
+            )
+
+        # the runs are filtered after the query, since there may be too many of them to bind as
+        # query parameters
+        run_id_set = set(run_ids) if run_ids is not None else None
+        if limit and run_id_set is None:
+            query = query.limit(limit)
+
+        entries: List[ShardEventIndexEntry] = []
+        with self.connect() as conn:
+            for run_id, storage_id in conn.execute(query):
+                if run_id_set is not None and run_id not in run_id_set:
+                    continue
+                entries.append(ShardEventIndexEntry(run_id, storage_id))
+                if limit and len(entries) >= limit:
+                    break
+
+        return entries
+
+
+def group_storage_ids_by_run_id(
+    entries: Sequence[ShardEventIndexEntry],
+) -> Mapping[str, Sequence[int]]:
+    storage_ids_by_run_id: Dict[str, List[int]] = defaultdict(list)
+    for entry in entries:
+        storage_ids_by_run_id[entry.run_id].append(entry.storage_id)
+    return storage_ids_by_run_id
+
+
+def _index_row(row: Mapping[str, object]) -> Mapping[str, object]:
+    return {
+        "run_id": row["run_id"],
+        "storage_id": row["storage_id"],
+        "dagster_event_type": row["dagster_event_type"],
+        "asset_key": row.get("asset_key"),
+        "partition": row.get("partition"),
+        "timestamp": row.get("timestamp"),
+    }
+
+
+def _to_naive_utc(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
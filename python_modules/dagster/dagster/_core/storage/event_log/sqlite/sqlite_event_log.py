@@ -8,7 +8,20 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -20,7 +33,7 @@
 
 import dagster._check as check
 import dagster._seven as seven
-from dagster._config import StringSource
+from dagster._config import BoolSource, Field, StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvariantViolationError
@@ -39,6 +52,10 @@
     SqlEventLogStorageTable,
 )
 from dagster._core.storage.event_log.sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from dagster._core.storage.event_log.sqlite.shard_index import (
+    ShardEventIndex,
+    group_storage_ids_by_run_id,
+)
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -82,9 +99,18 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    Setting ``use_shard_index: true`` keeps an additional SQLite database that indexes the events
+    in every run database, so that cross-run event queries only open the run databases that
+    contain matching events.
     """
 
-    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        use_shard_index: bool = False,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database.
         """
@@ -110,6 +136,17 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
             self.reindex_events()
             self.reindex_assets()
 
+        self._shard_index: Optional[ShardEventIndex] = None
+        if check.bool_param(use_shard_index, "use_shard_index"):
+            self._shard_index = ShardEventIndex(self._base_dir)
+            if self._shard_index.is_new:
+                self._shard_index.rebuild(self.get_all_run_ids(), self.run_connection)
+            else:
+                # index the events that were stored while the shard index was disabled
+                self._shard_index.catch_up(
+                    self.get_all_run_ids(), self.run_connection, self._get_shard_modified_at
+                )
+
         super().__init__()
 
     def upgrade(self) -> None:
@@ -125,6 +162,10 @@ def upgrade(self) -> None:
         with self.index_connection() as conn:
             run_alembic_upgrade(alembic_config, conn, "index")
 
+        if self._shard_index:
+            print("Rebuilding the event log shard index...")  # noqa: T201
+            self._shard_index.rebuild(all_run_ids, self.run_connection)
+
         self._initialized_dbs = set()
 
     @property
@@ -133,7 +174,10 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "use_shard_index": Field(BoolSource, is_required=False, default_value=False),
+        }
 
     @classmethod
     def from_config_value(
@@ -155,9 +199,25 @@ def has_table(self, table_name: str) -> bool:
         with engine.connect() as conn:
             return bool(engine.dialect.has_table(conn, table_name))
 
+    @property
+    def has_shard_index(self) -> bool:
+        return self._shard_index is not None
+
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, f"{run_id}.db")
 
+    def _get_shard_modified_at(self, run_id: str) -> Optional[float]:
+        # the shards are in WAL mode, so recent writes may only have modified the write-ahead log
+        shard_path = self.path_for_shard(run_id)
+        modified_at = None
+        for path in [shard_path, f"{shard_path}-wal"]:
+            try:
+                path_modified_at = os.path.getmtime(path)
+            except OSError:
+                continue
+            modified_at = max(modified_at or path_modified_at, path_modified_at)
+        return modified_at
+
     def conn_string_for_shard(self, shard_name: str) -> str:
         check.str_param(shard_name, "shard_name")
         return create_db_conn_string(self._base_dir, shard_name)
@@ -239,7 +299,12 @@ def store_event(self, event: EventLogEntry) -> None:
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            result = conn.execute(insert_event_statement)
+
+        if self._shard_index and event.is_dagster_event:
+            self._shard_index.index_events(
+                [self._shard_index_row(event, result.inserted_primary_key[0])]
+            )
 
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
@@ -272,6 +337,75 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to store a batch of events with one transaction per run shard, and a
+        single transaction against the central index shard for the mirrored asset events, asset
+        check events and run status change events.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        events_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+
+        shard_index_rows = []
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                for event in run_events:
+                    result = conn.execute(self.prepare_insert_event(event))
+                    if self._shard_index and event.is_dagster_event:
+                        shard_index_rows.append(
+                            self._shard_index_row(event, result.inserted_primary_key[0])
+                        )
+
+        if self._shard_index:
+            self._shard_index.index_events(shard_index_rows)
+
+        index_settings = self._get_event_batch_index_settings(events)
+        index_events: List[EventLogEntry] = []
+        index_event_ids: List[Optional[int]] = []
+        with self.index_connection() as conn:
+            for event in events:
+                if not event.is_dagster_event:
+                    continue
+
+                dagster_event = event.get_dagster_event()
+                if dagster_event.asset_key:
+                    check.invariant(
+                        dagster_event.event_type in ASSET_EVENTS,
+                        "Can only store asset materializations, materialization_planned, and"
+                        " observations in index database",
+                    )
+                    # mirror the event in the cross-run index database
+                    result = conn.execute(self.prepare_insert_event(event))
+                    index_events.append(event)
+                    index_event_ids.append(result.inserted_primary_key[0])
+                elif dagster_event.event_type in ASSET_CHECK_EVENTS:
+                    index_events.append(event)
+                    index_event_ids.append(None)
+
+                if dagster_event.event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                    # should mirror run status change events in the index shard
+                    conn.execute(self.prepare_insert_event(event))
+
+            self._store_event_batch_indexes(conn, index_events, index_event_ids, index_settings)
+
+    def _shard_index_row(self, event: EventLogEntry, storage_id: int) -> Mapping[str, Any]:
+        dagster_event = event.get_dagster_event()
+        return {
+            "run_id": event.run_id,
+            "storage_id": storage_id,
+            "dagster_event_type": dagster_event.event_type_value,
+            "asset_key": dagster_event.asset_key.to_string() if dagster_event.asset_key else None,
+            "partition": dagster_event.partition,
+            "timestamp": self._event_insert_timestamp(event),
+        }
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -329,6 +463,22 @@ def _get_run_sharded_event_records(
             asset_details=asset_details,
             apply_cursor_filters=False,  # run-sharded cursor filters don't really make sense
         )
+        run_updated_after = (
+            event_records_filter.after_cursor.run_updated_after
+            if isinstance(event_records_filter.after_cursor, RunShardedEventsCursor)
+            else None
+        )
+
+        if self._shard_index:
+            return self._get_shard_indexed_event_records(
+                query,
+                event_records_filter,
+                asset_details.last_wipe_timestamp if asset_details else None,
+                run_updated_after,
+                limit,
+                ascending,
+            )
+
         if limit:
             query = query.limit(limit)
         if ascending:
@@ -338,11 +488,6 @@ def _get_run_sharded_event_records(
 
         # workaround for the run-shard sqlite to enable cross-run queries: get a list of run_ids
         # whose events may qualify the query, and then open run_connection per run_id at a time.
-        run_updated_after = (
-            event_records_filter.after_cursor.run_updated_after
-            if isinstance(event_records_filter.after_cursor, RunShardedEventsCursor)
-            else None
-        )
         run_records = self._instance.get_run_records(
             filters=RunsFilter(updated_after=run_updated_after),
             order_by="update_timestamp",
@@ -375,6 +520,61 @@ def _get_run_sharded_event_records(
 
         return event_records[:limit]
 
+    def _get_shard_indexed_event_records(
+        self,
+        query: Any,
+        event_records_filter: EventRecordsFilter,
+        last_wipe_timestamp: Optional[float],
+        run_updated_after: Optional[datetime],
+        limit: Optional[int],
+        ascending: bool,
+    ) -> Sequence[EventLogRecord]:
+        # find the matching events in the shard index, and then only read them from the run shards
+        # that contain them
+        run_ids = (
+            [
+                record.dagster_run.run_id
+                for record in self._instance.get_run_records(
+                    filters=RunsFilter(updated_after=run_updated_after)
+                )
+            ]
+            if run_updated_after
+            else None
+        )
+        entries = check.not_none(self._shard_index).get_matching_events(
+            event_records_filter,
+            after_timestamp=last_wipe_timestamp,
+            run_ids=run_ids,
+            limit=limit,
+            ascending=ascending,
+        )
+
+        records_by_entry: Dict[Tuple[str, int], EventLogRecord] = {}
+        for run_id, storage_ids in group_storage_ids_by_run_id(entries).items():
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(
+                    query.where(SqlEventLogStorageTable.c.id.in_(storage_ids))
+                ).fetchall()
+
+            for row_id, json_str in results:
+                try:
+                    event_record = deserialize_value(json_str, EventLogEntry)
+                    records_by_entry[(run_id, row_id)] = EventLogRecord(
+                        storage_id=row_id, event_log_entry=event_record
+                    )
+                except DeserializationError:
+                    logging.warning(
+                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
+                    )
+                except seven.JSONDecodeError:
+                    logging.warning("Could not parse event record id `%s`.", row_id)
+
+        return [
+            records_by_entry[(entry.run_id, entry.storage_id)]
+            for entry in entries
+            if (entry.run_id, entry.storage_id) in records_by_entry
+        ]
+
     def fetch_run_status_changes(
         self,
         records_filter: Union[DagsterEventType, RunStatusChangeRecordsFilter],
@@ -422,6 +622,24 @@ def fetch_run_status_changes(
     def supports_event_consumer_queries(self) -> bool:
         return False
 
+    def get_records_for_runs(
+        self,
+        after_storage_id_by_run_id: Mapping[str, int],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        # events for each run live in their own shard, so there is no single table to query across
+        # runs; storage ids are only ordered within a run and the limit applies to each run
+        records = []
+        for run_id, storage_id in after_storage_id_by_run_id.items():
+            records.extend(
+                self.get_records_for_run(
+                    run_id,
+                    cursor=EventLogCursor.from_storage_id(storage_id).to_string(),
+                    limit=limit,
+                ).records
+            )
+        return records
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -430,6 +648,9 @@ def delete_events(self, run_id: str) -> None:
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        if self._shard_index:
+            self._shard_index.delete_events_for_run(run_id)
+
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
         for filename in (
@@ -447,6 +668,8 @@ def wipe(self) -> None:
 
         self._initialized_dbs = set()
         self._wipe_index()
+        if self._shard_index:
+            self._shard_index.wipe()
 
     def _delete_mirrored_events_for_asset_key(self, asset_key: AssetKey) -> None:
         with self.index_connection() as conn:
@@ -58,9 +58,11 @@
         RunPartitionData,
         RunRecord,
         RunsFilter,
+        RunSummaryRecord,
         TagBucket,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+    from dagster._core.storage.runs.snapshot_cache import SnapshotCacheMetrics
     from dagster._daemon.types import DaemonHeartbeat
 
 
@@ -231,6 +233,18 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_summary_records(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence["RunSummaryRecord"]:
+        return self._storage.run_storage.get_run_summary_records(
+            filters, limit, order_by, ascending, cursor
+        )
+
     def get_run_tags(
         self,
         tag_keys: Sequence[str],
@@ -284,6 +298,9 @@ def get_execution_plan_snapshot(
     ) -> "ExecutionPlanSnapshot":
         return self._storage.run_storage.get_execution_plan_snapshot(execution_plan_snapshot_id)
 
+    def get_snapshot_cache_metrics(self) -> Optional["SnapshotCacheMetrics"]:
+        return self._storage.run_storage.get_snapshot_cache_metrics()
+
     def wipe(self) -> None:
         return self._storage.run_storage.wipe()
 
@@ -578,6 +595,13 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
             asset_key, after_storage_id
         )
 
+    def get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+        self, after_storage_id_by_asset_key: Mapping["AssetKey", Optional[int]]
+    ) -> Mapping["AssetKey", Mapping[str, Tuple[str, int]]]:
+        return self._storage.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+            after_storage_id_by_asset_key
+        )
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._storage.event_log_storage.get_dynamic_partitions(partitions_def_name)
 
@@ -624,6 +648,13 @@ def update_asset_cached_status_data(
             asset_key=asset_key, cache_values=cache_values
         )
 
+    def update_asset_cached_status_data_for_assets(
+        self, cache_values_by_asset_key: Mapping["AssetKey", "AssetStatusCacheValue"]
+    ) -> None:
+        self._storage.event_log_storage.update_asset_cached_status_data_for_assets(
+            cache_values_by_asset_key
+        )
+
     def get_records_for_run(
         self,
         run_id: str,
@@ -660,6 +691,13 @@ def claim_concurrency_slot(
             concurrency_key, run_id, step_key, priority
         )
 
+    def claim_concurrency_slots(
+        self, concurrency_key: str, run_id: str, step_priorities: Mapping[str, Optional[int]]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        return self._storage.event_log_storage.claim_concurrency_slots(
+            concurrency_key, run_id, step_priorities
+        )
+
     def check_concurrency_claim(self, concurrency_key: str, run_id: str, step_key: str):
         return self._storage.event_log_storage.check_concurrency_claim(
             concurrency_key, run_id, step_key
@@ -18,6 +18,11 @@
 )
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.execution.compute_logs import mirror_stream_to_file
+from dagster._core.storage.compute_log_chunks import (
+    COMPUTE_LOG_CHUNK_INDEX_NAME,
+    ComputeLogChunkIndex,
+    read_chunked_log,
+)
 from dagster._core.storage.compute_log_manager import (
     CapturedLogContext,
     CapturedLogData,
@@ -147,6 +152,10 @@ def delete_logs(
             for path in paths:
                 if os.path.exists(path) and os.path.isfile(path):
                     os.remove(path)
+            for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+                chunk_dir = self.get_captured_local_chunk_dir(log_key, io_type)
+                if os.path.exists(chunk_dir) and os.path.isdir(chunk_dir):
+                    shutil.rmtree(chunk_dir)
         elif prefix:
             dir_to_delete = os.path.join(self._base_dir, *prefix)
             if os.path.exists(dir_to_delete) and os.path.isdir(dir_to_delete):
@@ -163,6 +172,15 @@ def _read_bytes(
         max_bytes: Optional[int] = None,
     ):
         path = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        if not os.path.exists(path):
+            index = self.get_log_chunk_index(log_key, io_type)
+            if index:
+                return read_chunked_log(
+                    index,
+                    lambda chunk_name: self.read_log_chunk(log_key, io_type, chunk_name),
+                    offset=offset or 0,
+                    max_bytes=max_bytes,
+                )
         return self.read_path(path, offset or 0, max_bytes)
 
     def parse_cursor(self, cursor: Optional[str] = None) -> Tuple[int, int]:
@@ -222,6 +240,39 @@ def get_captured_local_path(self, log_key: Sequence[str], extension: str, partia
             raise ValueError("Invalid path")
         return str(log_path)
 
+    def get_captured_local_chunk_dir(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        """Returns the directory holding the logs for a given log key and io type in the chunked
+        format (see `dagster._core.storage.compute_log_chunks`).
+        """
+        return self.get_captured_local_path(log_key, f"{IO_TYPE_EXTENSION[io_type]}.chunks")
+
+    def write_log_chunk(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ) -> None:
+        chunk_dir = self.get_captured_local_chunk_dir(log_key, io_type)
+        ensure_dir(chunk_dir)
+        path = os.path.join(chunk_dir, chunk_name)
+        # write to a temporary file first so that readers never see a partially written chunk
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def read_log_chunk(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> Optional[bytes]:
+        path = os.path.join(self.get_captured_local_chunk_dir(log_key, io_type), chunk_name)
+        if not os.path.isfile(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def get_log_chunk_index(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Optional[ComputeLogChunkIndex]:
+        data = self.read_log_chunk(log_key, io_type, COMPUTE_LOG_CHUNK_INDEX_NAME)
+        return ComputeLogChunkIndex.from_json(data.decode("utf-8")) if data else None
+
     def subscribe(
         self, log_key: Sequence[str], cursor: Optional[str] = None
     ) -> CapturedLogSubscription:
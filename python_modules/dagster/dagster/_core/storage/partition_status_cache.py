@@ -1,5 +1,16 @@
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from dagster import (
     AssetKey,
@@ -247,6 +258,8 @@ def _build_status_cache(
     dynamic_partitions_store: DynamicPartitionsStore,
     stored_cache_value: Optional[AssetStatusCacheValue],
     asset_record: Optional["AssetRecord"],
+    last_planned_materialization_storage_id: Optional[int] = None,
+    prefetched_attempts: Optional["_PartitionMaterializationAttempts"] = None,
 ) -> Optional[AssetStatusCacheValue]:
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
@@ -255,9 +268,10 @@ def _build_status_cache(
         asset_record.asset_entry.last_materialization_storage_id if asset_record else None
     )
 
-    last_planned_materialization_storage_id = get_last_planned_storage_id(
-        instance, asset_key, asset_record
-    )
+    if last_planned_materialization_storage_id is None:
+        last_planned_materialization_storage_id = get_last_planned_storage_id(
+            instance, asset_key, asset_record
+        )
 
     latest_storage_id = max(
         last_materialization_storage_id or 0,
@@ -275,15 +289,7 @@ def _build_status_cache(
         else None
     )
 
-    cached_in_progress_cursor = (
-        (
-            stored_cache_value.earliest_in_progress_materialization_event_id - 1
-            if stored_cache_value.earliest_in_progress_materialization_event_id
-            else stored_cache_value.latest_storage_id
-        )
-        if stored_cache_value
-        else None
-    )
+    cached_in_progress_cursor = _get_in_progress_cursor(stored_cache_value)
 
     if stored_cache_value:
         # fetch the incremental new materialized partitions, and update the cached materialized
@@ -338,6 +344,7 @@ def _build_status_cache(
         last_planned_materialization_storage_id=last_planned_materialization_storage_id,
         failed_subset=failed_subset,
         after_storage_id=cached_in_progress_cursor,
+        prefetched_attempts=prefetched_attempts,
     )
 
     return AssetStatusCacheValue(
@@ -352,6 +359,48 @@ def _build_status_cache(
     )
 
 
+class _PartitionMaterializationAttempts(NamedTuple):
+    """The planned materializations of an asset's partitions that were not followed by a
+    materialization, with the statuses of their runs, when these are fetched for many assets at
+    once.
+    """
+
+    incomplete_materializations: Mapping[str, Tuple[str, int]]
+    run_statuses: Mapping[str, DagsterRunStatus]
+
+
+def _get_in_progress_cursor(stored_cache_value: Optional[AssetStatusCacheValue]) -> Optional[int]:
+    if not stored_cache_value:
+        return None
+    return (
+        stored_cache_value.earliest_in_progress_materialization_event_id - 1
+        if stored_cache_value.earliest_in_progress_materialization_event_id
+        else stored_cache_value.latest_storage_id
+    )
+
+
+def _has_planned_materializations_after(
+    last_planned_materialization_storage_id: Optional[int], after_storage_id: Optional[int]
+) -> bool:
+    return bool(last_planned_materialization_storage_id) and (
+        not after_storage_id
+        or check.not_none(last_planned_materialization_storage_id) > after_storage_id
+    )
+
+
+def _get_run_statuses(
+    instance: DagsterInstance, run_ids: AbstractSet[str]
+) -> Mapping[str, DagsterRunStatus]:
+    to_fetch = list(run_ids)
+    run_statuses = {}
+    while to_fetch:
+        chunk = to_fetch[:RUN_FETCH_BATCH_SIZE]
+        to_fetch = to_fetch[RUN_FETCH_BATCH_SIZE:]
+        for r in instance.get_runs(filters=RunsFilter(run_ids=chunk)):
+            run_statuses[r.run_id] = r.status
+    return run_statuses
+
+
 def build_failed_and_in_progress_partition_subset(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -360,17 +409,20 @@ def build_failed_and_in_progress_partition_subset(
     last_planned_materialization_storage_id: int,
     failed_subset: Optional[PartitionsSubset[str]] = None,
     after_storage_id: Optional[int] = None,
+    prefetched_attempts: Optional[_PartitionMaterializationAttempts] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
     in_progress_partitions: Set[str] = set()
 
-    incomplete_materializations = {}
+    incomplete_materializations: Mapping[str, Tuple[str, int]] = {}
 
     failed_subset = failed_subset or partitions_def.empty_subset()
 
+    if prefetched_attempts is not None:
+        incomplete_materializations = prefetched_attempts.incomplete_materializations
     # Fetch incomplete materializations if there have been any planned materializations since the
     # cursor
-    if last_planned_materialization_storage_id and (
-        not after_storage_id or last_planned_materialization_storage_id > after_storage_id
+    elif _has_planned_materializations_after(
+        last_planned_materialization_storage_id, after_storage_id
     ):
         incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
             asset_key, after_storage_id=after_storage_id
@@ -380,25 +432,20 @@ def build_failed_and_in_progress_partition_subset(
 
     cursor = None
     if incomplete_materializations:
-        to_fetch = list(set([run_id for run_id, _event_id in incomplete_materializations.values()]))
-        finished_runs = {}
-        unfinished_runs = {}
-
-        while to_fetch:
-            chunk = to_fetch[:RUN_FETCH_BATCH_SIZE]
-            to_fetch = to_fetch[RUN_FETCH_BATCH_SIZE:]
-            for r in instance.get_runs(filters=RunsFilter(run_ids=chunk)):
-                if r.status in FINISHED_STATUSES:
-                    finished_runs[r.run_id] = r.status
-                else:
-                    unfinished_runs[r.run_id] = r.status
+        if prefetched_attempts is not None:
+            run_statuses = prefetched_attempts.run_statuses
+        else:
+            run_statuses = _get_run_statuses(
+                instance,
+                {run_id for run_id, _event_id in incomplete_materializations.values()},
+            )
 
         for partition, (run_id, event_id) in incomplete_materializations.items():
-            if run_id in finished_runs:
-                status = finished_runs.get(run_id)
+            status = run_statuses.get(run_id)
+            if status in FINISHED_STATUSES:
                 if status == DagsterRunStatus.FAILURE:
                     failed_partitions.add(partition)
-            elif run_id in unfinished_runs:
+            elif status is not None:
                 in_progress_partitions.add(partition)
                 # If the run is not finished, keep track of the event id so we can check on it next time
                 if cursor is None or event_id < cursor:
@@ -472,3 +519,106 @@ def get_and_update_asset_status_cache_value(
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
+
+
+def get_and_update_asset_status_cache_values(
+    instance: DagsterInstance,
+    partitions_defs_by_asset_key: Mapping[AssetKey, Optional[PartitionsDefinition]],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+    loading_context: Optional[LoadingContext] = None,
+) -> Mapping[AssetKey, Optional[AssetStatusCacheValue]]:
+    """Equivalent to calling `get_and_update_asset_status_cache_value` for each of the given
+    assets, but batches the work across all of them: the planned materializations without
+    materializations of every asset are fetched in a single query, the statuses of their runs are
+    fetched once, and all of the updated cache values are written in a single transaction.
+    """
+    from dagster._core.storage.event_log.base import AssetRecord
+
+    check.mapping_param(partitions_defs_by_asset_key, "partitions_defs_by_asset_key", AssetKey)
+    asset_keys = list(partitions_defs_by_asset_key.keys())
+    if not asset_keys:
+        return {}
+
+    if loading_context:
+        asset_records = AssetRecord.blocking_get_many(loading_context, asset_keys)
+    else:
+        asset_records = instance.get_asset_records(asset_keys=asset_keys)
+    asset_record_by_key = {
+        asset_record.asset_entry.asset_key: asset_record
+        for asset_record in asset_records
+        if asset_record
+    }
+
+    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+
+    stored_cache_value_by_key: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    usable_cache_value_by_key: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    last_planned_storage_id_by_key: Dict[AssetKey, int] = {}
+    after_storage_id_by_key: Dict[AssetKey, Optional[int]] = {}
+    for asset_key, partitions_def in partitions_defs_by_asset_key.items():
+        asset_record = asset_record_by_key.get(asset_key)
+        stored_cache_value = asset_record.asset_entry.cached_status if asset_record else None
+        stored_cache_value_by_key[asset_key] = stored_cache_value
+        use_cached_value = (
+            stored_cache_value
+            and partitions_def
+            and stored_cache_value.partitions_def_id
+            == partitions_def.get_serializable_unique_identifier(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+        )
+        usable_cache_value = stored_cache_value if use_cached_value else None
+        usable_cache_value_by_key[asset_key] = usable_cache_value
+
+        last_planned_storage_id = get_last_planned_storage_id(instance, asset_key, asset_record)
+        last_planned_storage_id_by_key[asset_key] = last_planned_storage_id
+
+        if not partitions_def or not is_cacheable_partition_type(partitions_def):
+            continue
+        after_storage_id = _get_in_progress_cursor(usable_cache_value)
+        if _has_planned_materializations_after(last_planned_storage_id, after_storage_id):
+            after_storage_id_by_key[asset_key] = after_storage_id
+
+    incomplete_materializations_by_key = (
+        instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+            after_storage_id_by_key
+        )
+        if after_storage_id_by_key
+        else {}
+    )
+    run_statuses = _get_run_statuses(
+        instance,
+        {
+            run_id
+            for incomplete_materializations in incomplete_materializations_by_key.values()
+            for run_id, _event_id in incomplete_materializations.values()
+        },
+    )
+
+    updated_cache_value_by_key: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    to_write: Dict[AssetKey, AssetStatusCacheValue] = {}
+    for asset_key, partitions_def in partitions_defs_by_asset_key.items():
+        updated_cache_value = _build_status_cache(
+            instance=instance,
+            asset_key=asset_key,
+            partitions_def=partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+            stored_cache_value=usable_cache_value_by_key[asset_key],
+            asset_record=asset_record_by_key.get(asset_key),
+            last_planned_materialization_storage_id=last_planned_storage_id_by_key[asset_key],
+            prefetched_attempts=_PartitionMaterializationAttempts(
+                incomplete_materializations=incomplete_materializations_by_key.get(asset_key, {}),
+                run_statuses=run_statuses,
+            ),
+        )
+        updated_cache_value_by_key[asset_key] = updated_cache_value
+        if (
+            updated_cache_value is not None
+            and updated_cache_value != stored_cache_value_by_key[asset_key]
+        ):
+            to_write[asset_key] = updated_cache_value
+
+    if to_write and instance.event_log_storage.can_write_asset_status_cache():
+        instance.update_asset_cached_status_data_for_assets(to_write)
+
+    return updated_cache_value_by_key
@@ -41,6 +41,10 @@ def storage_dir(self) -> str:
     def schedules_dir(self) -> str:
         return os.path.join(self.base_dir, "schedules")
 
+    @property
+    def repository_snapshots_dir(self) -> str:
+        return os.path.join(self.base_dir, "repository_snapshots")
+
     @classmethod
     def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: LocalArtifactStorageConfig
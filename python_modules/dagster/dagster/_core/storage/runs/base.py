@@ -15,6 +15,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
@@ -23,6 +24,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation.origin import RemoteJobOrigin
+    from dagster._core.storage.runs.snapshot_cache import SnapshotCacheMetrics
 
 
 class RunGroupInfo(TypedDict):
@@ -158,6 +160,35 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunSummaryRecord]:
+        """Return a list of run summary records stored in the run storage, sorted by the given
+        column in given order. Summary records only contain the status, timestamps, job name,
+        partition and tags of each run, so run storages may build them without loading the runs.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            List[RunSummaryRecord]: List of run summary records stored in the run storage.
+        """
+        return [
+            RunSummaryRecord.from_run_record(record)
+            for record in self.get_run_records(
+                filters=filters, limit=limit, order_by=order_by, ascending=ascending, cursor=cursor
+            )
+        ]
+
     @abstractmethod
     def get_run_tags(
         self,
@@ -310,6 +341,12 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_snapshot_cache_metrics(self) -> Optional["SnapshotCacheMetrics"]:
+        """The metrics of the process-wide cache of job and execution plan snapshots, or None if
+        this run storage does not use the cache.
+        """
+        return None
+
     @abstractmethod
     def wipe(self) -> None:
         """Clears the run storage."""
@@ -0,0 +1,258 @@
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Set, Union
+
+import dagster._check as check
+from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
+
+Snapshot = Union[JobSnapshot, ExecutionPlanSnapshot]
+
+# the maximum total size of the serialized bodies of the cached snapshots, 0 disables the cache
+SNAPSHOT_CACHE_MAX_BYTES_ENV_VAR = "DAGSTER_SNAPSHOT_CACHE_MAX_BYTES"
+# a directory to keep the stored bodies of snapshots in, so that snapshots that were evicted from
+# memory can be loaded without fetching them from run storage again
+SNAPSHOT_CACHE_SPILL_DIR_ENV_VAR = "DAGSTER_SNAPSHOT_CACHE_SPILL_DIR"
+# how long a run storage remembers that a snapshot does not exist
+SNAPSHOT_CACHE_NEGATIVE_TTL_SECONDS_ENV_VAR = "DAGSTER_SNAPSHOT_CACHE_NEGATIVE_TTL_SECONDS"
+
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_SNAPSHOT_CACHE_NEGATIVE_TTL_SECONDS = 5.0
+
+MAX_KNOWN_SNAPSHOT_IDS = 100_000
+MAX_MISSING_SNAPSHOT_IDS = 10_000
+
+_SPILLABLE_SNAPSHOT_ID_RE = re.compile(r"^[0-9a-zA-Z_-]+$")
+
+
+class SnapshotCacheMetrics(NamedTuple):
+    hits: int
+    misses: int
+    spill_hits: int
+    negative_hits: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SnapshotCache:
+    """A size-bounded LRU cache of deserialized job and execution plan snapshots, keyed by snapshot
+    id and shared by every run storage in the process.
+
+    Snapshot ids are hashes of the contents of their snapshots, so a cached snapshot is the same
+    snapshot no matter which run storage it was loaded from. Whether a run storage contains a
+    snapshot is tracked separately by each run storage, see `SnapshotIdPresence`.
+    """
+
+    def __init__(self, max_bytes: int, spill_dir: Optional[str] = None):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._spill_dir = check.opt_str_param(spill_dir, "spill_dir")
+        if self._spill_dir:
+            os.makedirs(self._spill_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Snapshot] = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._spill_hits = 0
+        self._negative_hits = 0
+        self._evictions = 0
+
+    @property
+    def metrics(self) -> SnapshotCacheMetrics:
+        with self._lock:
+            return SnapshotCacheMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                spill_hits=self._spill_hits,
+                negative_hits=self._negative_hits,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def __contains__(self, snapshot_id: str) -> bool:
+        return snapshot_id in self._entries
+
+    def get(self, snapshot_id: str) -> Optional[Snapshot]:
+        with self._lock:
+            snapshot = self._entries.get(snapshot_id)
+            if snapshot is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(snapshot_id)
+            self._hits += 1
+            return snapshot
+
+    def put(self, snapshot_id: str, snapshot: Snapshot, size_bytes: int) -> None:
+        """Cache a snapshot, where `size_bytes` is the size of its serialized body."""
+        if size_bytes > self._max_bytes:
+            return
+
+        with self._lock:
+            if snapshot_id in self._entries:
+                self._entries.move_to_end(snapshot_id)
+                return
+
+            self._entries[snapshot_id] = snapshot
+            self._sizes[snapshot_id] = size_bytes
+            self._size_bytes += size_bytes
+            while self._size_bytes > self._max_bytes:
+                evicted_id, _ = self._entries.popitem(last=False)
+                self._size_bytes -= self._sizes.pop(evicted_id)
+                self._evictions += 1
+
+    def record_negative_hit(self) -> None:
+        with self._lock:
+            self._negative_hits += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._size_bytes = 0
+
+    @property
+    def has_spill(self) -> bool:
+        return self._spill_dir is not None
+
+    def _spill_path(self, snapshot_id: str) -> Optional[str]:
+        if not self._spill_dir or not _SPILLABLE_SNAPSHOT_ID_RE.match(snapshot_id):
+            return None
+        return os.path.join(self._spill_dir, snapshot_id)
+
+    def spill(self, snapshot_id: str, stored_body: bytes) -> None:
+        """Keep the body of a snapshot, as stored in run storage, on disk."""
+        path = self._spill_path(snapshot_id)
+        if not path or os.path.exists(path):
+            return
+
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(stored_body)
+            os.replace(tmp_path, path)
+        except OSError:
+            # the spill is only an optimization
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_spilled_body(self, snapshot_id: str) -> Optional[bytes]:
+        path = self._spill_path(snapshot_id)
+        if not path:
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        with self._lock:
+            self._spill_hits += 1
+        return body
+
+
+class SnapshotIdPresence:
+    """Tracks which snapshots a single run storage contains.
+
+    Snapshots are never removed from a run storage, apart from when it is wiped, so snapshots that
+    are known to exist are remembered for the lifetime of the run storage. Snapshots that do not
+    exist may be added at any time by another process, so they are only remembered for
+    `negative_ttl_seconds`.
+    """
+
+    def __init__(self, negative_ttl_seconds: float):
+        self._negative_ttl_seconds = check.numeric_param(
+            negative_ttl_seconds, "negative_ttl_seconds"
+        )
+        self._lock = threading.Lock()
+        self._present: Set[str] = set()
+        self._missing: OrderedDict[str, float] = OrderedDict()
+
+    def is_present(self, snapshot_id: str) -> Optional[bool]:
+        """Whether the run storage contains the snapshot, or None if that is not known."""
+        if snapshot_id in self._present:
+            return True
+
+        with self._lock:
+            expiry = self._missing.get(snapshot_id)
+            if expiry is None:
+                return None
+            if expiry < time.monotonic():
+                del self._missing[snapshot_id]
+                return None
+            return False
+
+    def mark_present(self, snapshot_id: str) -> None:
+        with self._lock:
+            self._missing.pop(snapshot_id, None)
+            if len(self._present) >= MAX_KNOWN_SNAPSHOT_IDS:
+                self._present.clear()
+            self._present.add(snapshot_id)
+
+    def mark_missing(self, snapshot_id: str) -> None:
+        if self._negative_ttl_seconds <= 0:
+            return
+
+        with self._lock:
+            self._missing[snapshot_id] = time.monotonic() + self._negative_ttl_seconds
+            self._missing.move_to_end(snapshot_id)
+            while len(self._missing) > MAX_MISSING_SNAPSHOT_IDS:
+                self._missing.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._present.clear()
+            self._missing.clear()
+
+
+_snapshot_cache: Optional[SnapshotCache] = None
+_snapshot_cache_lock = threading.Lock()
+
+
+def get_snapshot_cache() -> Optional[SnapshotCache]:
+    """The snapshot cache shared by the run storages of this process, or None if it is disabled."""
+    global _snapshot_cache  # noqa: PLW0603
+
+    max_bytes = int(
+        os.getenv(SNAPSHOT_CACHE_MAX_BYTES_ENV_VAR, str(DEFAULT_SNAPSHOT_CACHE_MAX_BYTES))
+    )
+    if max_bytes <= 0:
+        return None
+
+    if _snapshot_cache is None:
+        with _snapshot_cache_lock:
+            if _snapshot_cache is None:
+                _snapshot_cache = SnapshotCache(
+                    max_bytes=max_bytes,
+                    spill_dir=os.getenv(SNAPSHOT_CACHE_SPILL_DIR_ENV_VAR) or None,
+                )
+    return _snapshot_cache
+
+
+def reset_snapshot_cache() -> None:
+    """Discard the shared snapshot cache, so that it is recreated from the environment."""
+    global _snapshot_cache  # noqa: PLW0603
+
+    with _snapshot_cache_lock:
+        _snapshot_cache = None
+
+
+def get_snapshot_negative_ttl_seconds() -> float:
+    return float(
+        os.getenv(
+            SNAPSHOT_CACHE_NEGATIVE_TTL_SECONDS_ENV_VAR,
+            str(DEFAULT_SNAPSHOT_CACHE_NEGATIVE_TTL_SECONDS),
+        )
+    )
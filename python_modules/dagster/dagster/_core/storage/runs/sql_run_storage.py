@@ -1,4 +1,5 @@
 import logging
+import os
 import uuid
 import zlib
 from abc import abstractmethod
@@ -53,6 +54,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from dagster._core.storage.runs.base import RunStorage
@@ -72,6 +74,13 @@
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from dagster._core.storage.runs.snapshot_cache import (
+    Snapshot,
+    SnapshotCacheMetrics,
+    SnapshotIdPresence,
+    get_snapshot_cache,
+    get_snapshot_negative_ttl_seconds,
+)
 from dagster._core.storage.sql import SqlAlchemyQuery
 from dagster._core.storage.sqlalchemy_compat import (
     db_fetch_mappings,
@@ -88,19 +97,34 @@
     RUN_FAILURE_REASON_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
-from dagster._serdes.serdes import deserialize_values
+from dagster._serdes import (
+    deserialize_value,
+    deserialize_value_from_binary,
+    serialize_value,
+    serialize_value_to_binary,
+)
+from dagster._serdes.serdes import deserialize_values, is_binary_serialized_value
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
+from dagster._utils.cached_method import cached_method
 from dagster._utils.merger import merge_dicts
 
+# the number of runs whose tags are fetched in a single query when building run summary records
+RUN_TAGS_BATCH_SIZE = 1000
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
+def _should_store_binary_snapshots() -> bool:
+    # Snapshots stored in the binary serdes format are smaller and faster to read, but cannot be
+    # read by processes running versions of dagster that predate the format.
+    return os.getenv("DAGSTER_SNAPSHOT_SERDES_FORMAT", "json") == "binary"
+
+
 class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages."""
 
@@ -430,6 +454,74 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunSummaryRecord]:
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        check.opt_int_param(limit, "limit")
+
+        # only fetch indexed columns, so that the run bodies never need to be deserialized
+        columns = [
+            "id",
+            "run_id",
+            "pipeline_name",
+            "status",
+            "partition",
+            "snapshot_id",
+            "create_timestamp",
+            "update_timestamp",
+        ]
+        if self.has_run_stats_index_cols():
+            columns += ["start_time", "end_time"]
+        query = self._runs_query(
+            filters=filters,
+            limit=limit,
+            columns=columns,
+            order_by=order_by,
+            ascending=ascending,
+            cursor=cursor,
+        )
+
+        rows = self.fetchall(query)
+        tags_by_run_id = self._get_tags_by_run_id([row["run_id"] for row in rows])
+        return [
+            RunSummaryRecord(
+                storage_id=check.int_param(row["id"], "id"),
+                run_id=row["run_id"],
+                job_name=row["pipeline_name"],
+                status=DagsterRunStatus(row["status"]),
+                partition=row["partition"],
+                job_snapshot_id=row["snapshot_id"],
+                tags=tags_by_run_id.get(row["run_id"], {}),
+                create_timestamp=utc_datetime_from_naive(
+                    check.inst(row["create_timestamp"], datetime)
+                ),
+                update_timestamp=utc_datetime_from_naive(
+                    check.inst(row["update_timestamp"], datetime)
+                ),
+                start_time=(
+                    check.opt_inst(row["start_time"], float) if "start_time" in row else None
+                ),
+                end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
+            )
+            for row in rows
+        ]
+
+    def _get_tags_by_run_id(self, run_ids: Sequence[str]) -> Mapping[str, Mapping[str, str]]:
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for i in range(0, len(run_ids), RUN_TAGS_BATCH_SIZE):
+            query = db_select(
+                [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+            ).where(RunTagsTable.c.run_id.in_(run_ids[i : i + RUN_TAGS_BATCH_SIZE]))
+            for row in self.fetchall(query):
+                tags_by_run_id[row["run_id"]][row["key"]] = row["value"]
+        return tags_by_run_id
+
     def get_run_tags(
         self,
         tag_keys: Sequence[str],
@@ -605,10 +697,16 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        serialized_snapshot = (
+            serialize_value_to_binary(snapshot_obj)
+            if _should_store_binary_snapshots()
+            else serialize_value(snapshot_obj).encode("utf-8")
+        )
+        snapshot_body = zlib.compress(serialized_snapshot)
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=snapshot_body,
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -617,7 +715,30 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 # on_conflict_do_nothing equivalent
                 pass
 
-            return snapshot_id
+        self._cache_added_snapshot(
+            snapshot_id, snapshot_obj, snapshot_body, len(serialized_snapshot)
+        )
+        return snapshot_id
+
+    @cached_method
+    def _snapshot_id_presence(self) -> SnapshotIdPresence:
+        return SnapshotIdPresence(negative_ttl_seconds=get_snapshot_negative_ttl_seconds())
+
+    def _cache_added_snapshot(
+        self, snapshot_id: str, snapshot_obj: Snapshot, snapshot_body: bytes, size_bytes: int
+    ) -> None:
+        """Cache a snapshot that was just stored, given its stored body and the size of its
+        serialized (uncompressed) body.
+        """
+        self._snapshot_id_presence().mark_present(snapshot_id)
+        snapshot_cache = get_snapshot_cache()
+        if snapshot_cache:
+            snapshot_cache.put(snapshot_id, snapshot_obj, size_bytes)
+            snapshot_cache.spill(snapshot_id, snapshot_body)
+
+    def get_snapshot_cache_metrics(self) -> Optional[SnapshotCacheMetrics]:
+        snapshot_cache = get_snapshot_cache()
+        return snapshot_cache.metrics if snapshot_cache else None
 
     def get_run_storage_id(self) -> str:
         query = db_select([InstanceInfo.c.run_storage_id])
@@ -631,26 +752,72 @@ def get_run_storage_id(self) -> str:
             return row["run_storage_id"]
 
     def _has_snapshot_id(self, snapshot_id: str) -> bool:
+        presence = self._snapshot_id_presence()
+        is_present = presence.is_present(snapshot_id)
+        if is_present is not None:
+            if not is_present:
+                _record_negative_snapshot_hit()
+            return is_present
+
         query = db_select([SnapshotsTable.c.snapshot_id]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
 
+        if row:
+            presence.mark_present(snapshot_id)
+        else:
+            presence.mark_missing(snapshot_id)
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnapshot]:
+        snapshot_cache = get_snapshot_cache()
+        if snapshot_cache:
+            # snapshots are content-addressed, so a snapshot cached from any run storage can be
+            # returned, as long as this run storage contains it too
+            snapshot = snapshot_cache.get(snapshot_id)
+            if snapshot is not None:
+                return snapshot if self._has_snapshot_id(snapshot_id) else None  # type: ignore
+
+            if snapshot_cache.has_spill and self._has_snapshot_id(snapshot_id):
+                spilled_body = snapshot_cache.get_spilled_body(snapshot_id)
+                if spilled_body is not None:
+                    snapshot = self._unpack_and_cache_snapshot(snapshot_id, spilled_body)
+                    if snapshot is not None:
+                        return snapshot  # type: ignore
+
+        presence = self._snapshot_id_presence()
+        if presence.is_present(snapshot_id) is False:
+            _record_negative_snapshot_hit()
+            return None
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
-            if row
-            else None
-        )
+        if not row:
+            presence.mark_missing(snapshot_id)
+            return None
+
+        presence.mark_present(snapshot_id)
+        return self._unpack_and_cache_snapshot(snapshot_id, row["snapshot_body"])  # type: ignore
+
+    def _unpack_and_cache_snapshot(
+        self, snapshot_id: str, snapshot_body: Any
+    ) -> Optional[Snapshot]:
+        uncompressed_bytes = _decompress_snapshot_body(logging, snapshot_body)  # type: ignore
+        if uncompressed_bytes is None:
+            return None
+
+        snapshot = _deserialize_snapshot_bytes(logging, uncompressed_bytes)  # type: ignore
+        snapshot_cache = get_snapshot_cache()
+        if snapshot is not None and snapshot_cache:
+            snapshot_cache.put(snapshot_id, snapshot, len(uncompressed_bytes))
+            snapshot_cache.spill(snapshot_id, snapshot_body)
+        return snapshot
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -826,6 +993,7 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+        self._snapshot_id_presence().clear()
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -1021,30 +1189,54 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
 def defensively_unpack_execution_plan_snapshot_query(
     logger: logging.Logger, row: Sequence[Any]
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnapshot]]:
-    # minimal checking here because sqlalchemy returns a different type based on what version of
-    # SqlAlchemy you are using
+    uncompressed_bytes = _decompress_snapshot_body(logger, row[0])
+    if uncompressed_bytes is None:
+        return None
+    return _deserialize_snapshot_bytes(logger, uncompressed_bytes)
+
 
-    def _warn(msg: str) -> None:
-        logger.warning(f"get-pipeline-snapshot: {msg}")
+def _warn_snapshot_query(logger: logging.Logger, msg: str) -> None:
+    logger.warning(f"get-pipeline-snapshot: {msg}")
 
-    if not isinstance(row[0], bytes):
-        _warn("First entry in row is not a binary type.")
+
+def _decompress_snapshot_body(logger: logging.Logger, snapshot_body: Any) -> Optional[bytes]:
+    # minimal checking here because sqlalchemy returns a different type based on what version of
+    # SqlAlchemy you are using
+    if not isinstance(snapshot_body, bytes):
+        _warn_snapshot_query(logger, "First entry in row is not a binary type.")
         return None
 
     try:
-        uncompressed_bytes = zlib.decompress(row[0])
+        return zlib.decompress(snapshot_body)
     except zlib.error:
-        _warn("Could not decompress bytes stored in snapshot table.")
+        _warn_snapshot_query(logger, "Could not decompress bytes stored in snapshot table.")
         return None
 
+
+def _deserialize_snapshot_bytes(
+    logger: logging.Logger, uncompressed_bytes: bytes
+) -> Optional[Union[ExecutionPlanSnapshot, JobSnapshot]]:
+    if is_binary_serialized_value(uncompressed_bytes):
+        return deserialize_value_from_binary(
+            uncompressed_bytes, (ExecutionPlanSnapshot, JobSnapshot)
+        )
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
-        _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
+        _warn_snapshot_query(
+            logger, "Could not unicode decode decompressed bytes stored in snapshot table."
+        )
         return None
 
     try:
         return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnapshot))
     except JSONDecodeError:
-        _warn("Could not parse json in snapshot table.")
+        _warn_snapshot_query(logger, "Could not parse json in snapshot table.")
         return None
+
+
+def _record_negative_snapshot_hit() -> None:
+    snapshot_cache = get_snapshot_cache()
+    if snapshot_cache:
+        snapshot_cache.record_negative_hit()
@@ -66,6 +66,10 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import SingleInstigatorDebugCrashFlags, check_for_debug_crash
+from dagster._utils.caching_instance_queryer import (
+    DEFAULT_QUERYER_CACHE_MAX_ENTRIES,
+    InstanceQueryerCache,
+)
 
 _LEGACY_PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 _PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR_NEW"
@@ -338,6 +342,11 @@ def __init__(self, settings: Mapping[str, Any], pre_sensor_interval_seconds: int
 
         self._settings = settings
 
+        # queryer caches shared by the ticks of each automation condition sensor, keyed by sensor
+        # selector id (or None for ticks that are not run by a sensor)
+        self._queryer_caches: Dict[Optional[str], InstanceQueryerCache] = {}
+        self._queryer_caches_lock = threading.Lock()
+
         super().__init__()
 
     @classmethod
@@ -357,6 +366,22 @@ def _get_print_sensor_name(self, sensor: Optional[ExternalSensor]) -> str:
         )
         return f" for {sensor.name} in {repo_name}"
 
+    def _get_queryer_cache(
+        self, sensor: Optional[ExternalSensor]
+    ) -> Optional[InstanceQueryerCache]:
+        if not self._settings.get("use_query_cache"):
+            return None
+
+        selector_id = sensor.selector_id if sensor else None
+        with self._queryer_caches_lock:
+            if selector_id not in self._queryer_caches:
+                self._queryer_caches[selector_id] = InstanceQueryerCache(
+                    max_entries=self._settings.get(
+                        "query_cache_max_entries", DEFAULT_QUERYER_CACHE_MAX_ENTRIES
+                    )
+                )
+            return self._queryer_caches[selector_id]
+
     def _initialize_evaluation_id(
         self,
         instance: DagsterInstance,
@@ -960,6 +985,8 @@ def _evaluate_auto_materialize_tick(
                 observe_run_tags={AUTO_OBSERVE_TAG: "true", **sensor_tags},
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 logger=self._logger,
+                queryer_cache=self._get_queryer_cache(sensor),
+                evaluation_max_workers=self._settings.get("num_evaluation_workers"),
             ).evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
@@ -357,7 +357,8 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
         return SensorDaemon(settings=instance.get_sensor_settings())
     elif daemon_type == QueuedRunCoordinatorDaemon.daemon_type():
         return QueuedRunCoordinatorDaemon(
-            interval_seconds=instance.run_coordinator.dequeue_interval_seconds  # type: ignore  # (??)
+            interval_seconds=instance.run_coordinator.dequeue_interval_seconds,  # type: ignore  # (??)
+            in_progress_runs_reconcile_interval_seconds=instance.run_coordinator.in_progress_runs_reconcile_interval_seconds,  # type: ignore
         )
     elif daemon_type == BackfillDaemon.daemon_type():
         return BackfillDaemon(interval_seconds=DEFAULT_DAEMON_INTERVAL_SECONDS)
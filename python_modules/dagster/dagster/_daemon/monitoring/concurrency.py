@@ -32,7 +32,7 @@ def execute_concurrency_slots_iteration(
         return
 
     now = get_current_datetime()
-    run_records = instance.get_run_records(
+    run_records = instance.get_run_summary_records(
         filters=RunsFilter(
             run_ids=list(run_ids),
             statuses=FINISHED_STATUSES,
@@ -43,11 +43,11 @@ def execute_concurrency_slots_iteration(
     for run_record in run_records:
         if run_record.end_time + timeout_seconds < now.timestamp():
             freed_slots = instance.event_log_storage.free_concurrency_slots_for_run(
-                run_record.dagster_run.run_id
+                run_record.run_id
             )
             if freed_slots:
                 logger.info(
-                    f"Freed {freed_slots} slots for run {run_record.dagster_run.run_id} with status"
-                    f" {run_record.dagster_run.status}"
+                    f"Freed {freed_slots} slots for run {run_record.run_id} with status"
+                    f" {run_record.status}"
                 )
         yield
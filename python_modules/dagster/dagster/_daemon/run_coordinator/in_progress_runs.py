@@ -0,0 +1,102 @@
+import logging
+from typing import Dict, Optional, Sequence, Set
+
+from dagster._core.event_api import RunStatusChangeRecordsFilter
+from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, RunRecord, RunsFilter
+from dagster._time import get_current_timestamp
+
+RUN_STATUS_CHANGE_BATCH_SIZE = 1000
+
+
+class InProgressRunsTracker:
+    """Keeps the records of the in-progress runs of an instance in memory, so that the queued run
+    coordinator daemon does not need to reload every in-progress run on each iteration.
+
+    The tracker is updated from the run status change events stored since the last update, which
+    only requires reloading the records of the runs whose status changed. Since runs can also
+    change status without a status change event (e.g. runs created directly with an in-progress
+    status, or deleted runs), every `reconcile_interval_seconds` the tracker reloads all of the
+    in-progress runs instead.
+    """
+
+    def __init__(
+        self,
+        reconcile_interval_seconds: float,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self._reconcile_interval_seconds = reconcile_interval_seconds
+        self._logger = logger or logging.getLogger("dagster")
+        self._records_by_run_id: Dict[str, RunRecord] = {}
+        self._cursor: Optional[int] = None
+        self._last_reconcile_time: Optional[float] = None
+
+    @property
+    def in_progress_run_records(self) -> Sequence[RunRecord]:
+        return list(self._records_by_run_id.values())
+
+    def update(self, instance: DagsterInstance) -> Sequence[RunRecord]:
+        """Bring the tracked in-progress runs up to date and return their records."""
+        now = get_current_timestamp()
+        if (
+            self._cursor is None
+            or self._last_reconcile_time is None
+            or now - self._last_reconcile_time >= self._reconcile_interval_seconds
+        ):
+            self._reconcile(instance, now)
+        else:
+            self._apply_run_status_changes(instance)
+
+        return self.in_progress_run_records
+
+    def _reconcile(self, instance: DagsterInstance, now: float) -> None:
+        # fetch the cursor before the runs, so that status changes that happen while the runs are
+        # loading are applied on the next update
+        cursor = instance.event_log_storage.get_maximum_record_id() or 0
+        records = instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        self._records_by_run_id = {record.dagster_run.run_id: record for record in records}
+        self._cursor = cursor
+        self._last_reconcile_time = now
+
+    def _apply_run_status_changes(self, instance: DagsterInstance) -> None:
+        cursor = self._cursor or 0
+        # bound every query by the same storage id, so that the cursor never skips past events of
+        # one type that were stored after the events of another type were fetched
+        max_storage_id = instance.event_log_storage.get_maximum_record_id() or 0
+        if max_storage_id <= cursor:
+            return
+
+        changed_run_ids: Set[str] = set()
+        for event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+            records_cursor = None
+            has_more = True
+            while has_more:
+                result = instance.fetch_run_status_changes(
+                    RunStatusChangeRecordsFilter(
+                        event_type=event_type,
+                        after_storage_id=cursor,
+                        before_storage_id=max_storage_id + 1,
+                    ),
+                    limit=RUN_STATUS_CHANGE_BATCH_SIZE,
+                    cursor=records_cursor,
+                    ascending=True,
+                )
+                changed_run_ids.update(record.run_id for record in result.records)
+                records_cursor = result.cursor
+                has_more = result.has_more
+
+        if changed_run_ids:
+            records = instance.get_run_records(filters=RunsFilter(run_ids=list(changed_run_ids)))
+            for run_id in changed_run_ids:
+                self._records_by_run_id.pop(run_id, None)
+            for record in records:
+                if record.dagster_run.status in IN_PROGRESS_RUN_STATUSES:
+                    self._records_by_run_id[record.dagster_run.run_id] = record
+
+            self._logger.debug(
+                f"Applied status changes for {len(changed_run_ids)} runs,"
+                f" {len(self._records_by_run_id)} runs are in progress."
+            )
+
+        self._cursor = max_storage_id
@@ -2,9 +2,10 @@
 import sys
 import threading
 import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -32,6 +33,7 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.run_coordinator.in_progress_runs import InProgressRunsTracker
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
@@ -44,12 +46,25 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     store and launches them.
     """
 
-    def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
+    def __init__(
+        self,
+        interval_seconds,
+        page_size=PAGE_SIZE,
+        in_progress_runs_reconcile_interval_seconds: Optional[int] = None,
+    ) -> None:
         self._exit_stack = ExitStack()
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
         self._page_size = page_size
+        # without a reconcile interval, every in-progress run is reloaded on each iteration
+        self._in_progress_runs_tracker = (
+            InProgressRunsTracker(
+                reconcile_interval_seconds=in_progress_runs_reconcile_interval_seconds
+            )
+            if in_progress_runs_reconcile_interval_seconds
+            else None
+        )
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -210,8 +225,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
         batch: List[DagsterRun] = []
 
         now = fixed_iteration_time or time.time()
@@ -230,23 +243,17 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
-        logged_this_iteration = False
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
-            )
-            has_more = len(queued_runs) >= self._page_size
-
-            if not queued_runs:
-                has_more = False
-                return batch
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits, in_progress_runs
+        )
+        global_concurrency_limits_counter: Optional[GlobalOpConcurrencyLimitsCounter] = None
+        initialized_global_concurrency_limits_counter = False
 
+        logged_this_iteration = False
+        # Queued runs are loaded a page at a time in the order that they should be dequeued, so
+        # that we can stop loading them as soon as there are no run slots left. The maximum number
+        # of runs we'll hold in memory is max_runs_to_launch + page_size.
+        for queued_runs in self._iter_queued_runs_in_priority_order(instance):
             if not logged_this_iteration:
                 logged_this_iteration = True
                 self._logger.info(
@@ -254,34 +261,26 @@ def _get_runs_to_dequeue(
                     + locations_clause
                 )
 
-            cursor = queued_runs[-1].run_id
-
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
-            batch += queued_runs
-            batch = self._priority_sort(batch)
-
             if run_queue_config.should_block_op_concurrency_limited_runs:
                 try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
+                    if not initialized_global_concurrency_limits_counter:
+                        global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
+                            instance,
+                            queued_runs,
+                            in_progress_run_records,
+                            run_queue_config.op_concurrency_slot_buffer,
+                        )
+                    elif global_concurrency_limits_counter:
+                        global_concurrency_limits_counter.add_queued_runs(instance, queued_runs)
                 except:
                     self._logger.exception("Failed to initialize op concurrency counter")
                     # when we cannot initialize the global concurrency counter, we should fall back
                     # to not blocking any runs based on op concurrency limits
                     global_concurrency_limits_counter = None
-            else:
-                global_concurrency_limits_counter = None
+                initialized_global_concurrency_limits_counter = True
 
-            to_remove = []
-            for run in batch:
+            for run in queued_runs:
                 if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
                     continue
                 else:
                     tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -296,7 +295,6 @@ def _get_runs_to_dequeue(
                     self._logger.info(
                         f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
                     )
-                    to_remove.append(run)
                     continue
                 elif global_concurrency_limits_counter:
                     global_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -305,30 +303,70 @@ def _get_runs_to_dequeue(
                     run.external_job_origin.location_name if run.external_job_origin else None
                 )
                 if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
                     continue
 
-            for run in to_remove:
-                batch.remove(run)
-
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+                batch.append(run)
+                if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                    return batch
 
         return batch
 
-    def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
-        return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+    def _iter_queued_runs_in_priority_order(
+        self, instance: DagsterInstance
+    ) -> Iterator[Sequence[DagsterRun]]:
+        """Yields pages of queued runs, ordered by descending priority and then by the order in
+        which they were queued.
+
+        Runs with a nonzero priority are loaded by filtering on the values of their priority tag,
+        so that the runs with the default priority (which are most queued runs) are only loaded
+        once the runs with a higher priority have been considered.
+        """
+        values_by_priority: Dict[int, List[str]] = defaultdict(list)
+        for key, values in instance.get_run_tags(tag_keys=[PRIORITY_TAG]):
+            if key != PRIORITY_TAG:
+                continue
+            for value in values:
+                priority = _parse_priority(value)
+                if priority != 0:
+                    values_by_priority[priority].append(value)
+
+        priorities = sorted({0, *values_by_priority.keys()}, reverse=True)
+        for priority in priorities:
+            if priority == 0:
+                filters = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+            else:
+                filters = RunsFilter(
+                    statuses=[DagsterRunStatus.QUEUED],
+                    tags={PRIORITY_TAG: values_by_priority[priority]},
+                )
+
+            cursor = None
+            has_more = True
+            while has_more:
+                queued_runs = instance.get_runs(
+                    filters, cursor=cursor, limit=self._page_size, ascending=True
+                )
+                has_more = len(queued_runs) >= self._page_size
+                if not queued_runs:
+                    break
+                cursor = queued_runs[-1].run_id
+
+                if priority == 0:
+                    # the runs with the default priority can only be filtered out by their tags
+                    # after they are loaded, since they include the runs without a priority tag
+                    queued_runs = [run for run in queued_runs if self._get_priority(run) == 0]
+                    if not queued_runs:
+                        continue
+
+                yield queued_runs
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+    def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
+        if self._in_progress_runs_tracker is None:
+            return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        return self._in_progress_runs_tracker.update(instance)
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+    def _get_priority(self, run: DagsterRun) -> int:
+        return _parse_priority(run.tags.get(PRIORITY_TAG, "0"))
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -465,3 +503,10 @@ def _dequeue_run(
                 instance.report_run_failed(run)
                 return False
         return True
+
+
+def _parse_priority(priority_tag_value: str) -> int:
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
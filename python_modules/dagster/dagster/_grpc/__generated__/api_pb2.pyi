@@ -488,6 +488,27 @@ class StreamingExternalRepositoryEvent(google.protobuf.message.Message):
 
 global___StreamingExternalRepositoryEvent = StreamingExternalRepositoryEvent
 
+@typing_extensions.final
+class ExternalRepositorySnapshotPiecesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SERIALIZED_REPOSITORY_SNAPSHOT_PIECES_ARGS_FIELD_NUMBER: builtins.int
+    serialized_repository_snapshot_pieces_args: builtins.str
+    def __init__(
+        self,
+        *,
+        serialized_repository_snapshot_pieces_args: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "serialized_repository_snapshot_pieces_args",
+            b"serialized_repository_snapshot_pieces_args",
+        ],
+    ) -> None: ...
+
+global___ExternalRepositorySnapshotPiecesRequest = ExternalRepositorySnapshotPiecesRequest
+
 @typing_extensions.final
 class ExternalScheduleExecutionRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -509,6 +530,50 @@ class ExternalScheduleExecutionRequest(google.protobuf.message.Message):
 
 global___ExternalScheduleExecutionRequest = ExternalScheduleExecutionRequest
 
+@typing_extensions.final
+class ExternalScheduleExecutionBatchRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SERIALIZED_EXTERNAL_SCHEDULE_EXECUTION_BATCH_ARGS_FIELD_NUMBER: builtins.int
+    serialized_external_schedule_execution_batch_args: builtins.str
+    def __init__(
+        self,
+        *,
+        serialized_external_schedule_execution_batch_args: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "serialized_external_schedule_execution_batch_args",
+            b"serialized_external_schedule_execution_batch_args",
+        ],
+    ) -> None: ...
+
+global___ExternalScheduleExecutionBatchRequest = ExternalScheduleExecutionBatchRequest
+
+@typing_extensions.final
+class ExternalScheduleExecutionBatchEvent(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INDEX_FIELD_NUMBER: builtins.int
+    SERIALIZED_SCHEDULE_RESULT_FIELD_NUMBER: builtins.int
+    index: builtins.int
+    serialized_schedule_result: builtins.str
+    def __init__(
+        self,
+        *,
+        index: builtins.int = ...,
+        serialized_schedule_result: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "index", b"index", "serialized_schedule_result", b"serialized_schedule_result"
+        ],
+    ) -> None: ...
+
+global___ExternalScheduleExecutionBatchEvent = ExternalScheduleExecutionBatchEvent
+
 @typing_extensions.final
 class ExternalSensorExecutionRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -95,6 +95,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.StreamingExternalRepositorySnapshotPieces = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositorySnapshotPieces",
+            request_serializer=api__pb2.ExternalRepositorySnapshotPiecesRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -105,6 +110,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
             response_deserializer=api__pb2.ExternalScheduleExecutionReply.FromString,
         )
+        self.ExternalScheduleExecutionBatch = channel.unary_stream(
+            "/api.DagsterApi/ExternalScheduleExecutionBatch",
+            request_serializer=api__pb2.ExternalScheduleExecutionBatchRequest.SerializeToString,
+            response_deserializer=api__pb2.ExternalScheduleExecutionBatchEvent.FromString,
+        )
         self.ExternalSensorExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalSensorExecution",
             request_serializer=api__pb2.ExternalSensorExecutionRequest.SerializeToString,
@@ -245,6 +255,12 @@ def StreamingExternalRepository(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepositorySnapshotPieces(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -257,6 +273,12 @@ def SyncExternalScheduleExecution(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExternalScheduleExecutionBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalSensorExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -389,6 +411,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "StreamingExternalRepositorySnapshotPieces": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositorySnapshotPieces,
+            request_deserializer=api__pb2.ExternalRepositorySnapshotPiecesRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -399,6 +426,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
             response_serializer=api__pb2.ExternalScheduleExecutionReply.SerializeToString,
         ),
+        "ExternalScheduleExecutionBatch": grpc.unary_stream_rpc_method_handler(
+            servicer.ExternalScheduleExecutionBatch,
+            request_deserializer=api__pb2.ExternalScheduleExecutionBatchRequest.FromString,
+            response_serializer=api__pb2.ExternalScheduleExecutionBatchEvent.SerializeToString,
+        ),
         "ExternalSensorExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalSensorExecution,
             request_deserializer=api__pb2.ExternalSensorExecutionRequest.FromString,
@@ -888,6 +920,35 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepositorySnapshotPieces(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositorySnapshotPieces",
+            api__pb2.ExternalRepositorySnapshotPiecesRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
@@ -946,6 +1007,35 @@ def SyncExternalScheduleExecution(
             metadata,
         )
 
+    @staticmethod
+    def ExternalScheduleExecutionBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/ExternalScheduleExecutionBatch",
+            api__pb2.ExternalScheduleExecutionBatchRequest.SerializeToString,
+            api__pb2.ExternalScheduleExecutionBatchEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalSensorExecution(
         request,
@@ -1,4 +1,4 @@
-from dagster._cli.api import grpc_command
+from dagster._cli.code_server import grpc_command
 
 if __name__ == "__main__":
     grpc_command()
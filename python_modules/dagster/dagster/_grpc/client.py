@@ -1,3 +1,4 @@
+import math
 import os
 import sys
 from contextlib import asynccontextmanager, contextmanager
@@ -36,10 +37,12 @@
     ExecuteExternalJobArgs,
     ExecutionPlanSnapshotArgs,
     ExternalScheduleExecutionArgs,
+    ExternalScheduleExecutionBatchArgs,
     JobSubsetSnapshotArgs,
     PartitionArgs,
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
+    RepositorySnapshotPiecesArgs,
     SensorExecutionArgs,
 )
 from dagster._grpc.utils import (
@@ -49,6 +52,7 @@
     default_sensor_grpc_timeout,
     max_rx_bytes,
     max_send_bytes,
+    serdes_format_metadata,
 )
 from dagster._serdes import serialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -91,6 +95,9 @@ def __init__(
         self._ssl_creds = grpc.ssl_channel_credentials() if use_ssl else None
 
         self._metadata = check.opt_sequence_param(metadata, "metadata")
+        # metadata sent with every call, including the serdes format that the server should use for
+        # large responses
+        self._call_metadata = [*self._metadata, *serdes_format_metadata()]
 
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
@@ -171,7 +178,7 @@ def _get_response(
     ):
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return getattr(stub, method)(request, metadata=self._call_metadata, timeout=timeout)
 
     async def _gen_response(
         self,
@@ -181,7 +188,9 @@ async def _gen_response(
     ):
         async with self._async_channel() as channel:
             stub = DagsterApiStub(channel)
-            return await getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return await getattr(stub, method)(
+                request, metadata=self._call_metadata, timeout=timeout
+            )
 
     def _raise_grpc_exception(
         self,
@@ -240,7 +249,7 @@ def _get_streaming_response(
     ) -> Iterator[Any]:
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            yield from getattr(stub, method)(request, metadata=self._call_metadata, timeout=timeout)
 
     async def _gen_streaming_response(
         self,
@@ -251,7 +260,7 @@ async def _gen_streaming_response(
         async with self._async_channel() as channel:
             stub = DagsterApiStub(channel)
             async for response in getattr(stub, method)(
-                request, metadata=self._metadata, timeout=timeout
+                request, metadata=self._call_metadata, timeout=timeout
             ):
                 yield response
 
@@ -492,6 +501,38 @@ async def gen_streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_snapshot_pieces(
+        self,
+        repository_snapshot_pieces_args: RepositorySnapshotPiecesArgs,
+        timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+    ) -> Optional[str]:
+        """Returns the serialized pieces of the repository snapshot that are not in
+        `known_piece_ids`, or None if the server is too old to split snapshots into pieces.
+        """
+        check.inst_param(
+            repository_snapshot_pieces_args,
+            "repository_snapshot_pieces_args",
+            RepositorySnapshotPiecesArgs,
+        )
+
+        try:
+            chunks = list(
+                self._streaming_query(
+                    "StreamingExternalRepositorySnapshotPieces",
+                    api_pb2.ExternalRepositorySnapshotPiecesRequest,
+                    serialized_repository_snapshot_pieces_args=serialize_value(
+                        repository_snapshot_pieces_args
+                    ),
+                    timeout=timeout,
+                )
+            )
+        except Exception as e:
+            if self._is_unimplemented_error(e):
+                return None
+            raise
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def _is_unimplemented_error(self, e: Exception) -> bool:
         return (
             isinstance(e.__cause__, grpc.RpcError)
@@ -547,6 +588,49 @@ def external_schedule_execution(
             else:
                 raise
 
+    def external_schedule_execution_batch(
+        self, external_schedule_execution_batch_args: ExternalScheduleExecutionBatchArgs
+    ) -> Iterator[Tuple[int, str]]:
+        """Yields the index of each schedule tick in the batch along with its serialized result, in
+        the order in which their evaluations finish. Yields nothing if the server is too old to
+        evaluate schedule ticks in batches.
+        """
+        check.inst_param(
+            external_schedule_execution_batch_args,
+            "external_schedule_execution_batch_args",
+            ExternalScheduleExecutionBatchArgs,
+        )
+
+        schedule_execution_args = external_schedule_execution_batch_args.schedule_execution_args
+        if not schedule_execution_args:
+            return
+
+        # Give each tick as long to evaluate as it would have on its own, for each round of
+        # evaluations that the server needs to get through the batch
+        timeout = max(
+            args.timeout if args.timeout is not None else DEFAULT_SCHEDULE_GRPC_TIMEOUT
+            for args in schedule_execution_args
+        )
+        num_rounds = math.ceil(
+            len(schedule_execution_args)
+            / max(external_schedule_execution_batch_args.max_workers, 1)
+        )
+
+        try:
+            for event in self._streaming_query(
+                "ExternalScheduleExecutionBatch",
+                api_pb2.ExternalScheduleExecutionBatchRequest,
+                serialized_external_schedule_execution_batch_args=serialize_value(
+                    external_schedule_execution_batch_args
+                ),
+                timeout=timeout * num_rounds,
+            ):
+                yield event.index, event.serialized_schedule_result
+        except Exception as e:
+            if self._is_unimplemented_error(e):
+                return
+            raise
+
     def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs) -> str:
         check.inst_param(
             sensor_execution_args,
@@ -9,6 +9,7 @@
 import time
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
 from functools import update_wrapper
 from threading import Event as ThreadingEventType
@@ -48,11 +49,14 @@
 from dagster._core.remote_representation.external_data import (
     ExternalJobSubsetResult,
     ExternalPartitionExecutionErrorData,
+    ExternalRepositoryData,
     ExternalRepositoryErrorData,
+    ExternalRepositorySnapshotPieces,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
     external_job_data_from_def,
     external_repository_data_from_def,
+    external_repository_snapshot_pieces_from_data,
 )
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshotErrorData
@@ -81,6 +85,7 @@
     get_partition_tags,
     start_run_in_subprocess,
 )
+from dagster._grpc.snapshot_cache import CodeServerSnapshotCache, get_loaded_code_fingerprint
 from dagster._grpc.types import (
     CanCancelExecutionRequest,
     CanCancelExecutionResult,
@@ -89,6 +94,7 @@
     ExecuteExternalJobArgs,
     ExecutionPlanSnapshotArgs,
     ExternalScheduleExecutionArgs,
+    ExternalScheduleExecutionBatchArgs,
     GetCurrentImageResult,
     GetCurrentRunsResult,
     JobSubsetSnapshotArgs,
@@ -97,6 +103,7 @@
     PartitionArgs,
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
+    RepositorySnapshotPiecesArgs,
     SensorExecutionArgs,
     ShutdownServerResult,
     StartRunResult,
@@ -105,9 +112,12 @@
     default_grpc_server_shutdown_grace_period,
     get_loadable_targets,
     max_rx_bytes,
+    max_schedule_batch_workers,
     max_send_bytes,
+    requested_binary_serdes_format,
 )
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._record import copy
+from dagster._serdes import deserialize_value, serialize_value, serialize_value_to_binary_string
 from dagster._serdes.ipc import IPCErrorMessage, open_ipc_subprocess
 from dagster._utils import find_free_port, get_run_crash_explanation, safe_tempfile_path_unmanaged
 from dagster._utils.container import (
@@ -352,6 +362,7 @@ def __init__(
         instance_ref: Optional[InstanceRef] = None,
         location_name: Optional[str] = None,
         enable_metrics: bool = False,
+        snapshot_cache_dir: Optional[str] = None,
     ):
         super(DagsterApiServer, self).__init__()
 
@@ -430,6 +441,22 @@ def __init__(
             self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
             self._logger.exception("Error while importing code")
 
+        # Definitions are never reloaded by this server, so the snapshots of its repositories are
+        # built and serialized at most once, rather than on every request for them. They can also be
+        # persisted across restarts of the server with unchanged code in a snapshot cache directory.
+        self._repository_snapshot_lock = threading.Lock()
+        self._repository_datas: Dict[Tuple[str, bool], ExternalRepositoryData] = {}
+        self._serialized_repository_datas: Dict[str, str] = {}
+        self._repository_snapshot_pieces: Dict[str, ExternalRepositorySnapshotPieces] = {}
+        self._snapshot_cache = (
+            CodeServerSnapshotCache(
+                check.str_param(snapshot_cache_dir, "snapshot_cache_dir"),
+                get_loaded_code_fingerprint(loadable_target_origin),
+            )
+            if snapshot_cache_dir and self._loaded_repositories
+            else None
+        )
+
         self.__last_heartbeat_time = time.time()
         if heartbeat:
             self.__heartbeat_thread: Optional[threading.Thread] = threading.Thread(
@@ -780,7 +807,9 @@ def ExternalPipelineSubsetSnapshot(
         )
 
     def _get_serialized_external_repository_data(
-        self, request: api_pb2.ExternalRepositoryRequest
+        self,
+        request: api_pb2.ExternalRepositoryRequest,
+        context: Optional[grpc.ServicerContext] = None,
     ) -> str:
         try:
             repository_origin = deserialize_value(
@@ -788,11 +817,10 @@ def _get_serialized_external_repository_data(
                 RemoteRepositoryOrigin,
             )
 
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            return self._get_serialized_repository_snapshot(
+                repository_origin,
+                defer_snapshots=request.defer_snapshots,
+                binary=requested_binary_serdes_format(context),
             )
         except Exception:
             _maybe_log_exception(self._logger, "Repository")
@@ -802,10 +830,80 @@ def _get_serialized_external_repository_data(
                 )
             )
 
+    def _get_repository_data(
+        self, repository_origin: RemoteRepositoryOrigin, defer_snapshots: bool
+    ) -> ExternalRepositoryData:
+        # must be called with _repository_snapshot_lock held
+        key = (repository_origin.repository_name, defer_snapshots)
+        if key not in self._repository_datas:
+            self._repository_datas[key] = external_repository_data_from_def(
+                self._get_repo_for_origin(repository_origin),
+                defer_snapshots=defer_snapshots,
+            )
+        return self._repository_datas[key]
+
+    def _get_serialized_repository_snapshot(
+        self, repository_origin: RemoteRepositoryOrigin, defer_snapshots: bool, binary: bool
+    ) -> str:
+        repository_name = repository_origin.repository_name
+        variant = f"{'deferred' if defer_snapshots else 'full'}:{'binary' if binary else 'json'}"
+        with self._repository_snapshot_lock:
+            key = f"{repository_name}:{variant}"
+            if key not in self._serialized_repository_datas:
+                serialized = (
+                    self._snapshot_cache.get(repository_name, variant)
+                    if self._snapshot_cache
+                    else None
+                )
+                if serialized is None:
+                    serialize = serialize_value_to_binary_string if binary else serialize_value
+                    serialized = serialize(
+                        self._get_repository_data(repository_origin, defer_snapshots)
+                    )
+                    if self._snapshot_cache:
+                        self._snapshot_cache.set(repository_name, variant, serialized)
+                self._serialized_repository_datas[key] = serialized
+            return self._serialized_repository_datas[key]
+
+    def _get_repository_snapshot_pieces(
+        self, repository_origin: RemoteRepositoryOrigin
+    ) -> ExternalRepositorySnapshotPieces:
+        """All the pieces of the snapshot of the given repository, including the ones that the
+        client already has. Splitting a snapshot into pieces hashes each of them, so it is only done
+        once.
+        """
+        repository_name = repository_origin.repository_name
+        with self._repository_snapshot_lock:
+            if repository_name not in self._repository_snapshot_pieces:
+                serialized = (
+                    self._snapshot_cache.get(repository_name, "pieces")
+                    if self._snapshot_cache
+                    else None
+                )
+                if serialized is not None:
+                    snapshot_pieces = deserialize_value(
+                        serialized, ExternalRepositorySnapshotPieces
+                    )
+                else:
+                    snapshot_pieces = external_repository_snapshot_pieces_from_data(
+                        self._get_repository_data(repository_origin, defer_snapshots=False),
+                        known_piece_ids=set(),
+                    )
+                    if self._snapshot_cache:
+                        self._snapshot_cache.set(
+                            repository_name,
+                            "pieces",
+                            serialize_value_to_binary_string(snapshot_pieces),
+                        )
+                self._repository_snapshot_pieces[repository_name] = snapshot_pieces
+            return self._repository_snapshot_pieces[repository_name]
+
     def ExternalRepository(
-        self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.ExternalRepositoryRequest, context: grpc.ServicerContext
     ) -> api_pb2.ExternalRepositoryReply:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, context
+        )
 
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
@@ -834,9 +932,11 @@ def ExternalJob(
             )
 
     def StreamingExternalRepository(
-        self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.ExternalRepositoryRequest, context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, context
+        )
 
         num_chunks = int(
             math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
@@ -856,6 +956,44 @@ def StreamingExternalRepository(
                 ],
             )
 
+    def StreamingExternalRepositorySnapshotPieces(
+        self,
+        request: api_pb2.ExternalRepositorySnapshotPiecesRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterable[api_pb2.StreamingChunkEvent]:
+        try:
+            args = deserialize_value(
+                request.serialized_repository_snapshot_pieces_args,
+                RepositorySnapshotPiecesArgs,
+            )
+
+            serialize = (
+                serialize_value_to_binary_string
+                if requested_binary_serdes_format(context)
+                else serialize_value
+            )
+            all_snapshot_pieces = self._get_repository_snapshot_pieces(args.repository_origin)
+            known_piece_ids = set(args.known_piece_ids)
+            serialized_data = serialize(
+                copy(
+                    all_snapshot_pieces,
+                    pieces={
+                        piece_id: piece
+                        for piece_id, piece in all_snapshot_pieces.pieces.items()
+                        if piece_id not in known_piece_ids
+                    },
+                )
+            )
+        except Exception:
+            _maybe_log_exception(self._logger, "RepositorySnapshotPieces")
+            serialized_data = serialize_value(
+                ExternalRepositoryErrorData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
+        yield from self._split_serialized_data_into_chunk_events(serialized_data)
+
     def _split_serialized_data_into_chunk_events(
         self, serialized_data: str
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
@@ -884,6 +1022,38 @@ def SyncExternalScheduleExecution(self, request, _context: grpc.ServicerContext)
             serialized_schedule_result=self._external_schedule_execution(request)
         )
 
+    def ExternalScheduleExecutionBatch(
+        self,
+        request: api_pb2.ExternalScheduleExecutionBatchRequest,
+        _context: grpc.ServicerContext,
+    ) -> Iterable[api_pb2.ExternalScheduleExecutionBatchEvent]:
+        batch_args = deserialize_value(
+            request.serialized_external_schedule_execution_batch_args,
+            ExternalScheduleExecutionBatchArgs,
+        )
+
+        # Evaluate the ticks in parallel and stream back each result as soon as it is ready, so
+        # that the caller can make progress on the ticks that finished first. The number of
+        # threads is bounded by the server, whatever the caller asks for.
+        max_workers = min(
+            batch_args.max_workers,
+            max_schedule_batch_workers(),
+            len(batch_args.schedule_execution_args),
+        )
+        with ThreadPoolExecutor(
+            max_workers=max(max_workers, 1),
+            thread_name_prefix="schedule_batch_worker",
+        ) as executor:
+            futures = {
+                executor.submit(self._get_serialized_schedule_execution, args): index
+                for index, args in enumerate(batch_args.schedule_execution_args)
+            }
+            for future in as_completed(futures):
+                yield api_pb2.ExternalScheduleExecutionBatchEvent(
+                    index=futures[future],
+                    serialized_schedule_result=future.result(),
+                )
+
     def _external_schedule_execution(
         self, request: api_pb2.ExternalScheduleExecutionRequest
     ) -> str:
@@ -892,6 +1062,18 @@ def _external_schedule_execution(
                 request.serialized_external_schedule_execution_args,
                 ExternalScheduleExecutionArgs,
             )
+        except Exception:
+            _maybe_log_exception(self._logger, "ScheduleExecution")
+            return serialize_value(
+                ExternalScheduleExecutionErrorData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
+        return self._get_serialized_schedule_execution(args)
+
+    def _get_serialized_schedule_execution(self, args: ExternalScheduleExecutionArgs) -> str:
+        try:
             return serialize_value(
                 get_external_schedule_execution(
                     self._get_repo_for_origin(args.repository_origin),
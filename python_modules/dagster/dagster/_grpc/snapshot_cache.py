@@ -0,0 +1,73 @@
+import hashlib
+import logging
+import os
+import sys
+from typing import Optional
+
+import dagster._check as check
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._serdes import serialize_value
+from dagster._serdes.utils import hash_str
+from dagster._utils import write_file_atomically
+from dagster.version import __version__
+
+
+def get_loaded_code_fingerprint(loadable_target_origin: Optional[LoadableTargetOrigin]) -> str:
+    """A fingerprint of the code that has been imported by this process: the dagster and python
+    versions, the target that was loaded, and the path, size and modification time of every
+    imported module. Should be called once the definitions have been loaded.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"{__version__}\n{sys.version}\n".encode("utf8"))
+    hasher.update(serialize_value(loadable_target_origin).encode("utf8"))
+    for name, module in sorted(list(sys.modules.items()), key=lambda item: item[0]):
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        hasher.update(f"\n{name}:{path}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf8"))
+    return hasher.hexdigest()
+
+
+class CodeServerSnapshotCache:
+    """Stores the serialized repository snapshots that a code server sends to its clients in
+    `base_dir`, keyed by a fingerprint of the loaded code, so that a server that is restarted with
+    unchanged code (e.g. a rescheduled container) can skip building and serializing them.
+
+    Definitions that depend on anything other than the code that defines them, such as environment
+    variables read while loading them, can change without changing the fingerprint. Only enable
+    the cache for code servers whose definitions are fully determined by their code.
+    """
+
+    def __init__(self, base_dir: str, code_fingerprint: str):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._code_fingerprint = check.str_param(code_fingerprint, "code_fingerprint")
+
+    def _path(self, repository_name: str, variant: str) -> str:
+        return os.path.join(
+            self._base_dir,
+            hash_str(f"{self._code_fingerprint}:{repository_name}:{variant}"),
+        )
+
+    def get(self, repository_name: str, variant: str) -> Optional[str]:
+        try:
+            with open(self._path(repository_name, variant), "r", encoding="utf8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, repository_name: str, variant: str, serialized_data: str) -> None:
+        try:
+            write_file_atomically(
+                self._path(repository_name, variant), serialized_data.encode("utf8")
+            )
+        except OSError:
+            # the cache is only an optimization, keep serving if it can't be written to
+            logging.getLogger("dagster.code_server").warning(
+                f"Could not write the snapshot of repository {repository_name} to the snapshot"
+                f" cache in {self._base_dir}.",
+                exc_info=True,
+            )
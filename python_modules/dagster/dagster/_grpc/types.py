@@ -227,6 +227,28 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class StepEventChannelAddress(
+    NamedTuple(
+        "_StepEventChannelAddress",
+        [
+            ("transport", str),
+            ("location", str),
+        ],
+    )
+):
+    """Where step workers notify the orchestrator that they stored new events, see
+    `StepEventChannel`.
+    """
+
+    def __new__(cls, transport: str, location: str):
+        return super(StepEventChannelAddress, cls).__new__(
+            cls,
+            transport=check.str_param(transport, "transport"),
+            location=check.str_param(location, "location"),
+        )
+
+
 @whitelist_for_serdes(
     storage_field_names={
         "job_origin": "pipeline_origin",
@@ -246,6 +268,7 @@ class ExecuteStepArgs(
             ("known_state", Optional[KnownExecutionState]),
             ("should_verify_step", Optional[bool]),
             ("print_serialized_events", bool),
+            ("step_event_channel", Optional[StepEventChannelAddress]),
         ],
     )
 ):
@@ -259,6 +282,7 @@ def __new__(
         known_state: Optional[KnownExecutionState] = None,
         should_verify_step: Optional[bool] = None,
         print_serialized_events: Optional[bool] = None,
+        step_event_channel: Optional[StepEventChannelAddress] = None,
     ):
         return super(ExecuteStepArgs, cls).__new__(
             cls,
@@ -276,6 +300,9 @@ def __new__(
             print_serialized_events=check.opt_bool_param(
                 print_serialized_events, "print_serialized_events", False
             ),
+            step_event_channel=check.opt_inst_param(
+                step_event_channel, "step_event_channel", StepEventChannelAddress
+            ),
         )
 
     def _get_compressed_args(self) -> str:
@@ -619,6 +646,32 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalScheduleExecutionBatchArgs(
+    NamedTuple(
+        "_ExternalScheduleExecutionBatchArgs",
+        [
+            ("schedule_execution_args", Sequence[ExternalScheduleExecutionArgs]),
+            ("max_workers", int),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        schedule_execution_args: Sequence[ExternalScheduleExecutionArgs],
+        max_workers: int,
+    ):
+        return super(ExternalScheduleExecutionBatchArgs, cls).__new__(
+            cls,
+            schedule_execution_args=check.sequence_param(
+                schedule_execution_args,
+                "schedule_execution_args",
+                of_type=ExternalScheduleExecutionArgs,
+            ),
+            max_workers=check.int_param(max_workers, "max_workers"),
+        )
+
+
 @whitelist_for_serdes
 class SensorExecutionArgs(
     NamedTuple(
@@ -702,6 +755,26 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class RepositorySnapshotPiecesArgs(
+    NamedTuple(
+        "_RepositorySnapshotPiecesArgs",
+        [
+            ("repository_origin", RemoteRepositoryOrigin),
+            ("known_piece_ids", Sequence[str]),
+        ],
+    )
+):
+    def __new__(cls, repository_origin: RemoteRepositoryOrigin, known_piece_ids: Sequence[str]):
+        return super(RepositorySnapshotPiecesArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", RemoteRepositoryOrigin
+            ),
+            known_piece_ids=check.sequence_param(known_piece_ids, "known_piece_ids", of_type=str),
+        )
+
+
 @whitelist_for_serdes
 class ShutdownServerResult(
     NamedTuple(
@@ -1,5 +1,5 @@
 import os
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
 import dagster._check as check
 from dagster._core.definitions.reconstruct import (
@@ -9,11 +9,16 @@
 )
 
 if TYPE_CHECKING:
+    import grpc
+
     from dagster._core.workspace.autodiscovery import LoadableTarget
 
 _DEFAULT_GRPC_TIMEOUT_IF_NO_ENV_VAR_SET = 60
 _DEFAULT_REPOSITORY_TIMEOUT_IF_NO_ENV_VAR_SET = 180
 
+SERDES_FORMAT_METADATA_KEY = "dagster-serdes-format"
+BINARY_SERDES_FORMAT = "binary"
+
 
 def get_loadable_targets(
     python_file: Optional[str],
@@ -105,6 +110,26 @@ def default_schedule_grpc_timeout() -> int:
     return default_grpc_timeout()
 
 
+def default_schedule_batch_max_workers() -> int:
+    # The number of schedule ticks that a code server evaluates at the same time when it is asked
+    # to evaluate many of them in a single call
+    env_set = os.getenv("DAGSTER_SCHEDULE_BATCH_MAX_WORKERS")
+    if env_set:
+        return int(env_set)
+
+    return 8
+
+
+def max_schedule_batch_workers() -> int:
+    # The most schedule ticks that a code server evaluates at the same time for a single call,
+    # regardless of the number of workers that the caller asks for
+    env_set = os.getenv("DAGSTER_CODE_SERVER_MAX_SCHEDULE_BATCH_WORKERS")
+    if env_set:
+        return int(env_set)
+
+    return 16
+
+
 def default_sensor_grpc_timeout() -> int:
     env_set = os.getenv("DAGSTER_SENSOR_GRPC_TIMEOUT_SECONDS")
     if env_set:
@@ -128,3 +153,21 @@ def default_grpc_server_shutdown_grace_period():
     return max(
         default_grpc_timeout(), default_schedule_grpc_timeout(), default_sensor_grpc_timeout()
     )
+
+
+def serdes_format_metadata() -> Sequence[Tuple[str, str]]:
+    # Clients can opt into receiving large payloads (e.g. repository snapshots) in the compact
+    # binary serdes format by setting DAGSTER_GRPC_SERDES_FORMAT=binary. The format is requested
+    # through call metadata so that servers that do not know about it keep sending JSON.
+    if os.getenv("DAGSTER_GRPC_SERDES_FORMAT") == BINARY_SERDES_FORMAT:
+        return [(SERDES_FORMAT_METADATA_KEY, BINARY_SERDES_FORMAT)]
+    return []
+
+
+def requested_binary_serdes_format(context: Optional["grpc.ServicerContext"]) -> bool:
+    if context is None:
+        return False
+    return any(
+        key == SERDES_FORMAT_METADATA_KEY and value == BINARY_SERDES_FORMAT
+        for key, value in (context.invocation_metadata() or [])
+    )
@@ -16,6 +16,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Union,
     cast,
 )
@@ -24,15 +25,23 @@
 
 import dagster._check as check
 from dagster._core.definitions.run_request import RunRequest
-from dagster._core.definitions.schedule_definition import DefaultScheduleStatus
+from dagster._core.definitions.schedule_definition import (
+    DefaultScheduleStatus,
+    ScheduleExecutionData,
+)
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.definitions.utils import normalize_tags
-from dagster._core.errors import DagsterCodeLocationLoadError, DagsterUserCodeUnreachableError
+from dagster._core.errors import (
+    DagsterCodeLocationLoadError,
+    DagsterUserCodeProcessError,
+    DagsterUserCodeUnreachableError,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._core.remote_representation import ExternalSchedule
-from dagster._core.remote_representation.code_location import CodeLocation
+from dagster._core.remote_representation.code_location import CodeLocation, ScheduleExecutionRequest
 from dagster._core.remote_representation.external import ExternalJob
+from dagster._core.remote_representation.external_data import ExternalScheduleExecutionErrorData
 from dagster._core.scheduler.instigation import (
     InstigatorState,
     InstigatorStatus,
@@ -75,6 +84,12 @@
 ERROR_INTERVAL_TIME = 5
 
 
+def _get_schedule_batch_evaluation_min_size() -> int:
+    # The minimum number of schedules in a code location that must be due at the same time for them
+    # to be evaluated with a single call to the code location. Setting this to 0 disables batching.
+    return int(os.getenv("DAGSTER_SCHEDULE_BATCH_EVALUATION_MIN_SIZE", "2"))
+
+
 class _ScheduleLaunchContext(AbstractContextManager):
     def __init__(
         self,
@@ -102,11 +117,7 @@ def tick_id(self) -> str:
 
     @property
     def log_key(self) -> Sequence[str]:
-        return [
-            self._external_schedule.handle.repository_name,
-            self._external_schedule.name,
-            self.tick_id,
-        ]
+        return _get_tick_log_key(self._external_schedule, self._tick.tick_id)
 
     def update_state(self, status, error=None, **kwargs):
         skip_reason = kwargs.get("skip_reason")
@@ -321,8 +332,8 @@ def launch_scheduled_runs(
         yield
         return
 
+    schedules_to_launch: List[_ScheduleToLaunch] = []
     for external_schedule in schedules.values():
-        error_info = None
         try:
             schedule_state = all_schedule_states.get(external_schedule.selector_id)
             if not schedule_state:
@@ -363,16 +374,44 @@ def launch_scheduled_runs(
                         # only allow one tick per schedule to be in flight
                         continue
 
-                previous_iteration_times = iteration_times.get(external_schedule.selector_id)
-                if (
-                    previous_iteration_times
-                    and not previous_iteration_times.should_run_next_iteration(
-                        external_schedule, end_datetime_utc.timestamp()
-                    )
-                ):
-                    # Not enough time has passed for this schedule, don't bother creating a thread
-                    continue
+            previous_iteration_times = iteration_times.get(external_schedule.selector_id)
+            if previous_iteration_times and not previous_iteration_times.should_run_next_iteration(
+                external_schedule, end_datetime_utc.timestamp()
+            ):
+                # Not enough time has passed for this schedule, don't bother executing
+                continue
+
+            schedules_to_launch.append(
+                _ScheduleToLaunch(
+                    external_schedule=external_schedule,
+                    schedule_state=schedule_state,
+                    schedule_debug_crash_flags=schedule_debug_crash_flags,
+                    previous_iteration_times=previous_iteration_times,
+                )
+            )
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.exception(f"Scheduler caught an error for schedule {external_schedule.name}")
+            yield error_info
 
+    prefetched_executions = yield from _prefetch_schedule_executions(
+        workspace_process_context,
+        logger,
+        schedules_to_launch,
+        end_datetime_utc,
+        max_catchup_runs,
+        max_tick_retries,
+    )
+
+    for (
+        external_schedule,
+        schedule_state,
+        schedule_debug_crash_flags,
+        previous_iteration_times,
+    ) in schedules_to_launch:
+        error_info = None
+        try:
+            if threadpool_executor:
                 future = threadpool_executor.submit(
                     launch_scheduled_runs_for_schedule,
                     workspace_process_context,
@@ -390,21 +429,12 @@ def launch_scheduled_runs(
                         if previous_iteration_times
                         else None
                     ),
+                    prefetched_execution=prefetched_executions.get(external_schedule.selector_id),
                 )
-                scheduler_run_futures[external_schedule.selector_id] = future
+                check.not_none(scheduler_run_futures)[external_schedule.selector_id] = future
                 yield
 
             else:
-                previous_iteration_times = iteration_times.get(external_schedule.selector_id)
-                if (
-                    previous_iteration_times
-                    and not previous_iteration_times.should_run_next_iteration(
-                        external_schedule, end_datetime_utc.timestamp()
-                    )
-                ):
-                    # Not enough time has passed for this schedule, don't bother executing
-                    continue
-
                 # evaluate the schedules in a loop, synchronously, yielding to allow the schedule daemon to
                 # heartbeat
                 found_iteration_times = False
@@ -424,6 +454,7 @@ def launch_scheduled_runs(
                         if previous_iteration_times
                         else None
                     ),
+                    prefetched_execution=prefetched_executions.get(external_schedule.selector_id),
                 ):
                     if isinstance(yielded_value, ScheduleIterationTimes):
                         check.invariant(
@@ -456,6 +487,7 @@ def launch_scheduled_runs_for_schedule(
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     in_memory_last_iteration_timestamp: Optional[float],
+    prefetched_execution: Optional["_PrefetchedScheduleExecution"] = None,
 ) -> ScheduleIterationTimes:
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -472,6 +504,7 @@ def launch_scheduled_runs_for_schedule(
         schedule_debug_crash_flags,
         submit_threadpool_executor=submit_threadpool_executor,
         in_memory_last_iteration_timestamp=in_memory_last_iteration_timestamp,
+        prefetched_execution=prefetched_execution,
     ):
         if isinstance(yielded_value, ScheduleIterationTimes):
             iteration_times = yielded_value
@@ -491,43 +524,27 @@ def launch_scheduled_runs_for_schedule_iterator(
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     in_memory_last_iteration_timestamp: Optional[float],
+    prefetched_execution: Optional["_PrefetchedScheduleExecution"] = None,
 ) -> Generator[Union[None, SerializableErrorInfo, ScheduleIterationTimes], None, None]:
     schedule_state = check.inst_param(schedule_state, "schedule_state", InstigatorState)
     end_datetime_utc = check.inst_param(end_datetime_utc, "end_datetime_utc", datetime.datetime)
     instance = workspace_process_context.instance
 
-    instigator_origin_id = external_schedule.get_external_origin_id()
-    ticks = instance.get_ticks(instigator_origin_id, external_schedule.selector_id, limit=1)
-    latest_tick: Optional[InstigatorTick] = ticks[0] if ticks else None
-
-    instigator_data = cast(ScheduleInstigatorData, schedule_state.instigator_data)
-    start_timestamp_utc: float = instigator_data.start_timestamp or 0
-
-    if latest_tick:
-        if latest_tick.status == TickStatus.STARTED or (
-            latest_tick.status == TickStatus.FAILURE
-            and latest_tick.failure_count <= max_tick_retries
-        ):
-            # Scheduler was interrupted while performing this tick, re-do it
-            start_timestamp_utc = max(
-                start_timestamp_utc,
-                latest_tick.timestamp,
-                instigator_data.last_iteration_timestamp or 0.0,
-                in_memory_last_iteration_timestamp or 0.0,
-            )
-        else:
-            start_timestamp_utc = max(
-                start_timestamp_utc,
-                latest_tick.timestamp + 1,
-                instigator_data.last_iteration_timestamp or 0.0,
-                in_memory_last_iteration_timestamp or 0.0,
-            )
+    if prefetched_execution:
+        # the tick times were already computed, and the first tick created, by the prefetch
+        latest_tick = prefetched_execution.latest_tick
+        tick_times = prefetched_execution.tick_times
+        next_iteration_timestamp = prefetched_execution.next_iteration_timestamp
     else:
-        start_timestamp_utc = max(
-            start_timestamp_utc,
-            instigator_data.last_iteration_timestamp or 0.0,
-            in_memory_last_iteration_timestamp or 0.0,
+        latest_tick, tick_times, next_iteration_timestamp = _get_schedule_tick_times(
+            instance,
+            external_schedule,
+            schedule_state,
+            end_datetime_utc,
+            max_tick_retries,
+            in_memory_last_iteration_timestamp,
         )
+    instigator_data = cast(ScheduleInstigatorData, schedule_state.instigator_data)
 
     schedule_name = external_schedule.name
 
@@ -535,20 +552,8 @@ def launch_scheduled_runs_for_schedule_iterator(
     if not timezone_str:
         timezone_str = "UTC"
 
-    tick_times: List[datetime.datetime] = []
-
     now_timestamp = end_datetime_utc.timestamp()
 
-    next_iteration_timestamp = None
-
-    for next_time in external_schedule.execution_time_iterator(start_timestamp_utc):
-        next_tick_timestamp = next_time.timestamp()
-        if next_tick_timestamp > now_timestamp:
-            next_iteration_timestamp = next_tick_timestamp
-            break
-
-        tick_times.append(next_time)
-
     if not tick_times:
         next_checkpoint_timestamp = _write_and_get_next_checkpoint_timestamp(
             instance,
@@ -568,12 +573,15 @@ def launch_scheduled_runs_for_schedule_iterator(
         )
         return
 
-    if not external_schedule.partition_set_name and len(tick_times) > 1:
-        logger.warning(f"{schedule_name} has no partition set, so not trying to catch up")
-        tick_times = tick_times[-1:]
-    elif len(tick_times) > max_catchup_runs:
-        logger.warning(f"{schedule_name} has fallen behind, only launching {max_catchup_runs} runs")
-        tick_times = tick_times[-max_catchup_runs:]
+    all_tick_times = tick_times
+    tick_times = _limit_tick_times(external_schedule, all_tick_times, max_catchup_runs)
+    if len(tick_times) < len(all_tick_times):
+        if not external_schedule.partition_set_name:
+            logger.warning(f"{schedule_name} has no partition set, so not trying to catch up")
+        else:
+            logger.warning(
+                f"{schedule_name} has fallen behind, only launching {max_catchup_runs} runs"
+            )
 
     if len(tick_times) == 1:
         tick_time = tick_times[0].strftime(default_date_format_string())
@@ -589,21 +597,12 @@ def launch_scheduled_runs_for_schedule_iterator(
             tick = latest_tick
             if latest_tick.status == TickStatus.FAILURE:
                 logger.info(f"Retrying previously failed schedule execution at {schedule_time_str}")
-            else:
+            elif not (prefetched_execution and prefetched_execution.tick_id == tick.tick_id):
                 logger.info(
                     f"Resuming previously interrupted schedule execution at {schedule_time_str}"
                 )
         else:
-            tick = instance.create_tick(
-                TickData(
-                    instigator_origin_id=instigator_origin_id,
-                    instigator_name=schedule_name,
-                    instigator_type=InstigatorType.SCHEDULE,
-                    status=TickStatus.STARTED,
-                    timestamp=schedule_timestamp,
-                    selector_id=external_schedule.selector_id,
-                )
-            )
+            tick = _create_schedule_tick(instance, external_schedule, schedule_timestamp)
 
             check_for_debug_crash(schedule_debug_crash_flags, "TICK_CREATED")
 
@@ -623,6 +622,11 @@ def launch_scheduled_runs_for_schedule_iterator(
                     tick_context,
                     submit_threadpool_executor,
                     schedule_debug_crash_flags,
+                    prefetched_execution_data=(
+                        prefetched_execution.execution_data
+                        if prefetched_execution and prefetched_execution.tick_id == tick.tick_id
+                        else None
+                    ),
                 )
             except Exception as e:
                 if isinstance(e, (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError)):
@@ -684,6 +688,230 @@ def launch_scheduled_runs_for_schedule_iterator(
     return
 
 
+def _get_schedule_tick_times(
+    instance: DagsterInstance,
+    external_schedule: ExternalSchedule,
+    schedule_state: InstigatorState,
+    end_datetime_utc: datetime.datetime,
+    max_tick_retries: int,
+    in_memory_last_iteration_timestamp: Optional[float],
+) -> Tuple[Optional[InstigatorTick], List[datetime.datetime], Optional[float]]:
+    """Returns the latest tick for the schedule, the tick times that are due as of
+    end_datetime_utc, and the timestamp of the first tick time after that.
+    """
+    ticks = instance.get_ticks(
+        external_schedule.get_external_origin_id(), external_schedule.selector_id, limit=1
+    )
+    latest_tick: Optional[InstigatorTick] = ticks[0] if ticks else None
+
+    instigator_data = cast(ScheduleInstigatorData, schedule_state.instigator_data)
+    start_timestamp_utc: float = instigator_data.start_timestamp or 0
+
+    if latest_tick:
+        if latest_tick.status == TickStatus.STARTED or (
+            latest_tick.status == TickStatus.FAILURE
+            and latest_tick.failure_count <= max_tick_retries
+        ):
+            # Scheduler was interrupted while performing this tick, re-do it
+            start_timestamp_utc = max(
+                start_timestamp_utc,
+                latest_tick.timestamp,
+                instigator_data.last_iteration_timestamp or 0.0,
+                in_memory_last_iteration_timestamp or 0.0,
+            )
+        else:
+            start_timestamp_utc = max(
+                start_timestamp_utc,
+                latest_tick.timestamp + 1,
+                instigator_data.last_iteration_timestamp or 0.0,
+                in_memory_last_iteration_timestamp or 0.0,
+            )
+    else:
+        start_timestamp_utc = max(
+            start_timestamp_utc,
+            instigator_data.last_iteration_timestamp or 0.0,
+            in_memory_last_iteration_timestamp or 0.0,
+        )
+
+    tick_times: List[datetime.datetime] = []
+
+    now_timestamp = end_datetime_utc.timestamp()
+
+    next_iteration_timestamp = None
+
+    for next_time in external_schedule.execution_time_iterator(start_timestamp_utc):
+        next_tick_timestamp = next_time.timestamp()
+        if next_tick_timestamp > now_timestamp:
+            next_iteration_timestamp = next_tick_timestamp
+            break
+
+        tick_times.append(next_time)
+
+    return latest_tick, tick_times, next_iteration_timestamp
+
+
+def _limit_tick_times(
+    external_schedule: ExternalSchedule,
+    tick_times: List[datetime.datetime],
+    max_catchup_runs: int,
+) -> List[datetime.datetime]:
+    if not external_schedule.partition_set_name and len(tick_times) > 1:
+        return tick_times[-1:]
+    elif len(tick_times) > max_catchup_runs:
+        return tick_times[-max_catchup_runs:]
+    return tick_times
+
+
+def _create_schedule_tick(
+    instance: DagsterInstance, external_schedule: ExternalSchedule, schedule_timestamp: float
+) -> InstigatorTick:
+    return instance.create_tick(
+        TickData(
+            instigator_origin_id=external_schedule.get_external_origin_id(),
+            instigator_name=external_schedule.name,
+            instigator_type=InstigatorType.SCHEDULE,
+            status=TickStatus.STARTED,
+            timestamp=schedule_timestamp,
+            selector_id=external_schedule.selector_id,
+        )
+    )
+
+
+def _get_tick_log_key(external_schedule: ExternalSchedule, tick_id: int) -> Sequence[str]:
+    return [
+        external_schedule.handle.repository_name,
+        external_schedule.name,
+        str(tick_id),
+    ]
+
+
+class _PrefetchedScheduleExecution(NamedTuple):
+    """The result of evaluating the first due tick of a schedule as part of a batch, before the
+    schedule is launched, along with the tick times that were computed to find it. execution_data
+    is None if the batch did not return a result for the tick, in which case the tick is evaluated
+    on its own.
+    """
+
+    tick_id: int
+    latest_tick: InstigatorTick
+    tick_times: List[datetime.datetime]
+    next_iteration_timestamp: Optional[float]
+    execution_data: Optional[Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]]
+
+
+class _ScheduleToLaunch(NamedTuple):
+    external_schedule: ExternalSchedule
+    schedule_state: InstigatorState
+    schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags]
+    previous_iteration_times: Optional[ScheduleIterationTimes]
+
+
+def _prefetch_schedule_executions(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    schedules_to_launch: Sequence[_ScheduleToLaunch],
+    end_datetime_utc: datetime.datetime,
+    max_catchup_runs: int,
+    max_tick_retries: int,
+) -> Generator[None, None, Mapping[str, _PrefetchedScheduleExecution]]:
+    # Evaluates the first due tick of each schedule with a single call per code location, so that
+    # a code location with many schedules due at the same time is not sent one request per schedule.
+    # Later ticks of schedules that are catching up are still evaluated one at a time when the
+    # schedule is launched.
+    prefetched: Dict[str, _PrefetchedScheduleExecution] = {}
+    batch_min_size = _get_schedule_batch_evaluation_min_size()
+    if batch_min_size <= 0:
+        return prefetched
+
+    instance = workspace_process_context.instance
+
+    schedules_by_location: Dict[str, List[_ScheduleToLaunch]] = defaultdict(list)
+    for schedule_to_launch in schedules_to_launch:
+        # don't move ticks around underneath tests that simulate crashes at particular points
+        if schedule_to_launch.schedule_debug_crash_flags:
+            continue
+        schedules_by_location[schedule_to_launch.external_schedule.handle.location_name].append(
+            schedule_to_launch
+        )
+
+    for location_name, location_schedules in schedules_by_location.items():
+        if len(location_schedules) < batch_min_size:
+            continue
+
+        try:
+            selector_ids: List[str] = []
+            requests: List[ScheduleExecutionRequest] = []
+            for schedule_to_launch in location_schedules:
+                external_schedule = schedule_to_launch.external_schedule
+                previous_iteration_times = schedule_to_launch.previous_iteration_times
+                latest_tick, tick_times, next_iteration_timestamp = _get_schedule_tick_times(
+                    instance,
+                    external_schedule,
+                    schedule_to_launch.schedule_state,
+                    end_datetime_utc,
+                    max_tick_retries,
+                    (
+                        previous_iteration_times.last_iteration_timestamp
+                        if previous_iteration_times
+                        else None
+                    ),
+                )
+                if not tick_times:
+                    continue
+
+                schedule_time = _limit_tick_times(external_schedule, tick_times, max_catchup_runs)[
+                    0
+                ]
+                schedule_timestamp = schedule_time.timestamp()
+                if latest_tick and latest_tick.timestamp == schedule_timestamp:
+                    tick = latest_tick
+                else:
+                    tick = _create_schedule_tick(instance, external_schedule, schedule_timestamp)
+
+                prefetched[external_schedule.selector_id] = _PrefetchedScheduleExecution(
+                    tick_id=tick.tick_id,
+                    latest_tick=tick,
+                    tick_times=tick_times,
+                    next_iteration_timestamp=next_iteration_timestamp,
+                    execution_data=None,
+                )
+                selector_ids.append(external_schedule.selector_id)
+                requests.append(
+                    ScheduleExecutionRequest(
+                        repository_handle=external_schedule.handle.repository_handle,
+                        schedule_name=external_schedule.name,
+                        scheduled_execution_time=TimestampWithTimezone(
+                            schedule_timestamp, external_schedule.execution_timezone or "UTC"
+                        ),
+                        log_key=_get_tick_log_key(external_schedule, tick.tick_id),
+                    )
+                )
+
+            if len(requests) < batch_min_size:
+                continue
+
+            code_location = _get_code_location_for_schedule(
+                workspace_process_context, location_schedules[0].external_schedule
+            )
+            for index, execution_data in code_location.get_external_schedule_execution_data_batch(
+                instance, requests
+            ):
+                selector_id = selector_ids[index]
+                prefetched[selector_id] = prefetched[selector_id]._replace(
+                    execution_data=execution_data
+                )
+                # yield to allow the schedule daemon to heartbeat
+                yield
+        except Exception:
+            # Any schedules that were not evaluated are evaluated one at a time when they are launched
+            logger.exception(
+                f"Scheduler could not evaluate schedules in code location {location_name} in a"
+                " batch, evaluating them one at a time instead"
+            )
+
+    return prefetched
+
+
 class SubmitRunRequestResult(NamedTuple):
     run_key: Optional[str]
     error_info: Optional[SerializableErrorInfo]
@@ -786,22 +1014,32 @@ def _schedule_runs_at_time(
     tick_context: _ScheduleLaunchContext,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    prefetched_execution_data: Optional[
+        Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]
+    ] = None,
 ) -> Generator[Union[None, SerializableErrorInfo, ScheduleIterationTimes], None, None]:
     instance = workspace_process_context.instance
     repository_handle = external_schedule.handle.repository_handle
 
-    code_location = _get_code_location_for_schedule(workspace_process_context, external_schedule)
+    if isinstance(prefetched_execution_data, ExternalScheduleExecutionErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(prefetched_execution_data.error)
+    elif prefetched_execution_data:
+        schedule_execution_data = prefetched_execution_data
+    else:
+        code_location = _get_code_location_for_schedule(
+            workspace_process_context, external_schedule
+        )
 
-    schedule_execution_data = code_location.get_external_schedule_execution_data(
-        instance=instance,
-        repository_handle=repository_handle,
-        schedule_name=external_schedule.name,
-        scheduled_execution_time=TimestampWithTimezone(
-            schedule_time.timestamp(),
-            timezone_str,
-        ),
-        log_key=tick_context.log_key,
-    )
+        schedule_execution_data = code_location.get_external_schedule_execution_data(
+            instance=instance,
+            repository_handle=repository_handle,
+            schedule_name=external_schedule.name,
+            scheduled_execution_time=TimestampWithTimezone(
+                schedule_time.timestamp(),
+                timezone_str,
+            ),
+            log_key=tick_context.log_key,
+        )
     yield None
 
     # Kept for backwards compatibility with schedule log keys that were previously created in the
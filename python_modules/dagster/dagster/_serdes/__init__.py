@@ -9,9 +9,12 @@
     SerializableNonScalarKeyMapping as SerializableNonScalarKeyMapping,
     WhitelistMap as WhitelistMap,
     deserialize_value as deserialize_value,
+    deserialize_value_from_binary as deserialize_value_from_binary,
     deserialize_values as deserialize_values,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_to_binary as serialize_value_to_binary,
+    serialize_value_to_binary_string as serialize_value_to_binary_string,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
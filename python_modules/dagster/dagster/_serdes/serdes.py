@@ -13,8 +13,11 @@
   (in memory, not human readable, etc) just handle the json case effectively.
 """
 
+import base64
+import binascii
 import collections.abc
 import dataclasses
+import struct
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
 from enum import Enum
@@ -1087,6 +1090,8 @@ def deserialize_value(
 ) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
     """Deserialize a json encoded string to a Python object.
 
+    Strings produced by `serialize_value_to_binary_string` are also accepted.
+
     Two steps:
 
     - Parse the input string as JSON with an object_hook for custom types.
@@ -1137,10 +1142,17 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            if val.startswith(BINARY_SERDES_STRING_PREFIX):
+                unpacked_value = _read_binary_value(
+                    _decode_binary_string(val), whitelist_map, context
+                )
+            else:
+                unpacked_value = seven.json.loads(
+                    val,
+                    object_hook=partial(
+                        _unpack_object, whitelist_map=whitelist_map, context=context
+                    ),
+                )
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -1282,6 +1294,596 @@ def _unpack_value(
     return val
 
 
+###################################################################################################
+# Binary Serialize / Deserialize
+###################################################################################################
+
+# Values serialized with `serialize_value_to_binary` start with this header. No JSON document can
+# start with it, so readers can tell the two formats apart.
+BINARY_SERDES_HEADER: Final[bytes] = b"\xd5SB\x01"
+
+# Strings produced by `serialize_value_to_binary_string` start with this prefix, which no JSON
+# document can start with either.
+BINARY_SERDES_STRING_PREFIX: Final[str] = "~dsb1:"
+
+# Type tags. Small non-negative ints are stored in the tag byte itself (any tag >= _TAG_FIXINT).
+_TAG_NONE: Final = 0
+_TAG_FALSE: Final = 1
+_TAG_TRUE: Final = 2
+_TAG_INT: Final = 3  # zigzag varint
+_TAG_FLOAT: Final = 4  # 8 byte double
+_TAG_STR: Final = 5  # varint byte length + utf-8, appended to the string table
+_TAG_STR_REF: Final = 6  # varint index into the string table
+_TAG_LONG_STR: Final = 7  # varint byte length + utf-8, not appended to the string table
+_TAG_LIST: Final = 8  # varint length + items
+_TAG_DICT: Final = 9  # varint length + key/value pairs
+_TAG_SET: Final = 10  # varint length + items
+_TAG_FROZENSET: Final = 11  # varint length + items
+_TAG_ENUM: Final = 12  # enum string, as stored in JSON
+_TAG_OBJECT_SHAPE: Final = 13  # storage name + varint field count + field names, then values
+_TAG_OBJECT: Final = 14  # varint index of a previously written shape, then values
+_TAG_MAPPING_ITEMS: Final = 15  # varint length + key/value pairs
+_TAG_FIXINT: Final = 0x80
+
+# longer strings are rarely repeated, so they are not worth keeping in the string table
+_MAX_INTERNED_STR_LENGTH: Final = 128
+
+_FLOAT_STRUCT: Final = struct.Struct("<d")
+
+
+class _BinaryFieldPackPlan(NamedTuple):
+    storage_name: str
+    field_serializer: Optional[FieldSerializer]
+    skip_when_empty: bool
+
+
+# field name -> plan, per serializer
+_BINARY_PACK_PLANS: Dict[ObjectSerializer, Dict[str, _BinaryFieldPackPlan]] = {}
+
+
+class _BinaryUnpackPlan(NamedTuple):
+    # (loaded field name, field serializer) for each stored field name of an object shape, with a
+    # None name for stored fields that are not constructor params
+    fields: Sequence[Tuple[Optional[str], Optional[FieldSerializer]]]
+    # the loaded field names, if each stored field is passed to the constructor as is
+    direct_field_names: Optional[Tuple[str, ...]]
+
+
+# per serializer and stored field names, or None for serializers that customize unpacking and must
+# be passed the stored fields as a dict
+_BINARY_UNPACK_PLANS: Dict[
+    Tuple[ObjectSerializer, Tuple[str, ...]], Optional[_BinaryUnpackPlan]
+] = {}
+
+
+def _get_binary_field_pack_plan(serializer: ObjectSerializer, key: str) -> _BinaryFieldPackPlan:
+    plans = _BINARY_PACK_PLANS.setdefault(serializer, {})
+    plan = plans.get(key)
+    if plan is None:
+        plan = _BinaryFieldPackPlan(
+            storage_name=serializer.storage_field_names.get(key, key),
+            field_serializer=serializer.field_serializers.get(key),
+            skip_when_empty=key in serializer.skip_when_empty_fields,
+        )
+        plans[key] = plan
+    return plan
+
+
+def _get_binary_unpack_plan(
+    serializer: ObjectSerializer, storage_keys: Tuple[str, ...]
+) -> Optional[_BinaryUnpackPlan]:
+    plan_key = (serializer, storage_keys)
+    if plan_key not in _BINARY_UNPACK_PLANS:
+        serializer_class = type(serializer)
+        if (
+            serializer_class.unpack is not ObjectSerializer.unpack
+            or serializer_class.before_unpack is not ObjectSerializer.before_unpack
+        ):
+            _BINARY_UNPACK_PLANS[plan_key] = None
+        else:
+            constructor_param_names = set(serializer.constructor_param_names)
+            fields = []
+            for key in storage_keys:
+                loaded_name = serializer.loaded_field_names.get(key, key)
+                if loaded_name in constructor_param_names:
+                    fields.append((loaded_name, serializer.field_serializers.get(loaded_name)))
+                else:
+                    fields.append((None, None))
+            is_direct = all(name and not field_serializer for name, field_serializer in fields)
+            _BINARY_UNPACK_PLANS[plan_key] = _BinaryUnpackPlan(
+                fields=fields,
+                direct_field_names=(
+                    tuple(cast(str, name) for name, _ in fields) if is_direct else None
+                ),
+            )
+    return _BINARY_UNPACK_PLANS[plan_key]
+
+
+def _json_key(key: Any, descent_path: str) -> str:
+    # mirror the coercion of non-string keys applied by json.dumps
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return int.__repr__(key) if isinstance(key, int) else float.__repr__(key)
+    raise SerializationError(
+        f"Can only serialize mappings with scalar keys, received {type(key)}.\nDescent path:"
+        f" {descent_path}"
+    )
+
+
+class _BinaryEncoder:
+    """Writes a value in the binary serdes format.
+
+    Strings (including object storage and field names) are interned, so that each is only written
+    once per value. Objects are written as a shape (the storage name and stored field names of the
+    class) followed by the field values, and each distinct shape is only written once per value.
+    """
+
+    def __init__(self, whitelist_map: WhitelistMap):
+        self._whitelist_map = whitelist_map
+        self.out = bytearray(BINARY_SERDES_HEADER)
+        self._strings: Dict[str, int] = {}
+        self._shapes: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+
+    def _write_uint(self, n: int) -> None:
+        out = self.out
+        while n >= 0x80:
+            out.append((n & 0x7F) | 0x80)
+            n >>= 7
+        out.append(n)
+
+    def _write_str(self, val: str) -> None:
+        index = self._strings.get(val)
+        if index is not None:
+            self.out.append(_TAG_STR_REF)
+            self._write_uint(index)
+            return
+
+        if len(val) <= _MAX_INTERNED_STR_LENGTH:
+            self.out.append(_TAG_STR)
+            self._strings[val] = len(self._strings)
+        else:
+            self.out.append(_TAG_LONG_STR)
+        encoded = val.encode("utf-8")
+        self._write_uint(len(encoded))
+        self.out += encoded
+
+    def _write_items(self, tag: int, items: Sequence[Any], descent_path: str) -> None:
+        self.out.append(tag)
+        self._write_uint(len(items))
+        for item in items:
+            self.write(item, descent_path)
+
+    def write(self, val: Any, descent_path: str) -> None:
+        # this is a hot code path so we handle the common base cases without isinstance
+        tval = type(val)
+        if tval is str:
+            self._write_str(val)
+        elif val is None:
+            self.out.append(_TAG_NONE)
+        elif tval is bool:
+            self.out.append(_TAG_TRUE if val else _TAG_FALSE)
+        elif tval is int:
+            if 0 <= val < _TAG_FIXINT:
+                self.out.append(_TAG_FIXINT | val)
+            else:
+                self.out.append(_TAG_INT)
+                self._write_uint(val * 2 if val >= 0 else -val * 2 - 1)
+        elif tval is float:
+            self.out.append(_TAG_FLOAT)
+            self.out += _FLOAT_STRUCT.pack(val)
+        elif tval is list:
+            self._write_items(_TAG_LIST, val, descent_path)
+        elif tval is dict:
+            self._write_dict(val, descent_path)
+        elif tval is SerializableNonScalarKeyMapping:
+            self.out.append(_TAG_MAPPING_ITEMS)
+            self._write_uint(len(val))
+            for key, value in val.items():
+                self.write(key, f"{descent_path}.{key}")
+                self.write(value, f"{descent_path}.{key}")
+        elif isinstance(val, Enum):
+            klass_name = val.__class__.__name__
+            if klass_name not in self._whitelist_map.enum_serializers:
+                raise SerializationError(
+                    "Can only serialize whitelisted Enums, received"
+                    f" {klass_name}.\nDescent path: {descent_path}",
+                )
+            enum_serializer = self._whitelist_map.enum_serializers[klass_name]
+            self.out.append(_TAG_ENUM)
+            self._write_str(enum_serializer.pack(val, self._whitelist_map, descent_path))
+        elif (
+            (isinstance(val, tuple) and hasattr(val, "_fields"))
+            or isinstance(val, BaseModel)
+            or (is_dataclass(val) and not isinstance(val, type))
+        ):
+            self._write_object(val, descent_path)
+        elif isinstance(val, (set, frozenset)):
+            self._write_items(
+                _TAG_SET if isinstance(val, set) else _TAG_FROZENSET,
+                sorted(list(val), key=str),
+                descent_path + "{}",
+            )
+        # custom string subclasses
+        elif isinstance(val, str):
+            self._write_str(str(val))
+        # handle more expensive and uncommon abc instance checks last
+        elif isinstance(val, collections.abc.Mapping):
+            self._write_dict(val, descent_path)
+        elif isinstance(val, collections.abc.Sequence):
+            self._write_items(_TAG_LIST, list(val), descent_path)
+        else:
+            raise SerializationError(f"Unhandled value type {tval}")
+
+    def _write_dict(self, val: Mapping[Any, Any], descent_path: str) -> None:
+        if "__class__" in val:
+            # the JSON form of an object, as produced by field serializers
+            storage_keys = [key for key in val.keys() if key != "__class__"]
+            self._write_shape(
+                val["__class__"],
+                storage_keys,
+                [(val[key], f"{descent_path}.{key}") for key in storage_keys],
+            )
+            return
+
+        self.out.append(_TAG_DICT)
+        self._write_uint(len(val))
+        for key, value in val.items():
+            self._write_str(_json_key(key, descent_path))
+            self.write(value, f"{descent_path}.{key}")
+
+    def _write_object(self, val: SerializableObject, descent_path: str) -> None:
+        klass_name = val.__class__.__name__
+        serializer = self._whitelist_map.object_serializers.get(klass_name)
+        if serializer is None:
+            raise SerializationError(
+                "Can only serialize whitelisted namedtuples, received"
+                f" {val}.\nDescent path: {descent_path}",
+            )
+
+        # (value, whether the value has already been packed by a field serializer)
+        storage_keys: List[str] = []
+        field_values: List[Tuple[Any, str]] = []
+        if type(serializer).pack_items is ObjectSerializer.pack_items:
+            for key, inner_value in serializer.object_as_mapping(
+                serializer.before_pack(val)
+            ).items():
+                plan = _get_binary_field_pack_plan(serializer, key)
+                if plan.skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                storage_keys.append(plan.storage_name)
+                field_path = f"{descent_path}.{key}"
+                field_values.append(
+                    (
+                        plan.field_serializer.pack(
+                            inner_value, whitelist_map=self._whitelist_map, descent_path=field_path
+                        )
+                        if plan.field_serializer
+                        else inner_value,
+                        field_path,
+                    )
+                )
+            for key, default in serializer.old_fields.items():
+                storage_keys.append(key)
+                field_values.append((default, f"{descent_path}.{key}"))
+        else:
+            # custom pack_items implementations produce the JSON form of each field
+            for key, packed_value in serializer.pack_items(
+                val, self._whitelist_map, _pack_object, descent_path
+            ):
+                if key == "__class__":
+                    continue
+                storage_keys.append(key)
+                field_values.append((packed_value, f"{descent_path}.{key}"))
+
+        self._write_shape(serializer.get_storage_name(), storage_keys, field_values)
+
+    def _write_shape(
+        self, storage_name: str, storage_keys: List[str], field_values: List[Tuple[Any, str]]
+    ) -> None:
+        shape_key = (storage_name, tuple(storage_keys))
+        shape_index = self._shapes.get(shape_key)
+        if shape_index is None:
+            self._shapes[shape_key] = len(self._shapes)
+            self.out.append(_TAG_OBJECT_SHAPE)
+            self._write_str(storage_name)
+            self._write_uint(len(storage_keys))
+            for storage_key in storage_keys:
+                self._write_str(storage_key)
+        else:
+            self.out.append(_TAG_OBJECT)
+            self._write_uint(shape_index)
+
+        for inner_value, field_path in field_values:
+            self.write(inner_value, field_path)
+
+
+def serialize_value_to_binary(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object to the compact binary serdes format.
+
+    Supports the same values and `whitelist_for_serdes` options as `serialize_value`, and is read
+    with `deserialize_value_from_binary`. Every string is written once and referred to by index
+    afterwards, and the storage name and field names of each class are written once, followed by
+    only the field values for each instance of the class.
+    """
+    encoder = _BinaryEncoder(whitelist_map)
+    encoder.write(val, _root(val))
+    return bytes(encoder.out)
+
+
+def serialize_value_to_binary_string(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> str:
+    """Serialize an object to the binary serdes format, as a string that can be sent over
+    transports or stored in columns that only accept text. Read with `deserialize_value`.
+    """
+    return BINARY_SERDES_STRING_PREFIX + base64.b64encode(
+        serialize_value_to_binary(val, whitelist_map)[len(BINARY_SERDES_HEADER) :]
+    ).decode("ascii")
+
+
+def _decode_binary_string(val: str) -> bytes:
+    try:
+        return BINARY_SERDES_HEADER + base64.b64decode(val[len(BINARY_SERDES_STRING_PREFIX) :])
+    except binascii.Error as err:
+        raise DeserializationError("Could not decode binary serdes string.") from err
+
+
+def is_binary_serialized_value(val: bytes) -> bool:
+    """Whether the given bytes were produced by `serialize_value_to_binary`, rather than being a
+    utf-8 encoded JSON string.
+    """
+    return val[: len(BINARY_SERDES_HEADER)] == BINARY_SERDES_HEADER
+
+
+_BinaryShape: TypeAlias = Tuple[
+    str, Tuple[str, ...], Optional[ObjectSerializer], Optional[_BinaryUnpackPlan]
+]
+
+
+def _read_binary_value(
+    data: bytes, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    # The reader is a set of closures over the read position rather than a class, since this is a
+    # hot code path and reading closure variables is cheaper than reading attributes.
+    pos = len(BINARY_SERDES_HEADER)
+    size = len(data)
+    strings: List[str] = []
+    shapes: List[_BinaryShape] = []
+
+    def read_uint() -> int:
+        nonlocal pos
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_utf8() -> str:
+        nonlocal pos
+        length = read_uint()
+        start = pos
+        pos += length
+        if pos > size:
+            raise IndexError(pos)
+        return data[start:pos].decode("utf-8")
+
+    def read() -> UnpackedValue:
+        nonlocal pos
+        tag = data[pos]
+        pos += 1
+        if tag >= _TAG_FIXINT:
+            return tag - _TAG_FIXINT
+        elif tag == _TAG_STR_REF:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+                return strings[index]
+            return strings[read_uint()]
+        elif tag == _TAG_STR:
+            val = read_utf8()
+            strings.append(val)
+            return val
+        elif tag == _TAG_OBJECT:
+            return read_object(shapes[read_uint()])
+        elif tag == _TAG_OBJECT_SHAPE:
+            storage_name = cast(str, read())
+            storage_keys = tuple(cast(str, read()) for _ in range(read_uint()))
+            serializer = whitelist_map.object_deserializers.get(storage_name)
+            shape = (
+                storage_name,
+                storage_keys,
+                serializer,
+                _get_binary_unpack_plan(serializer, storage_keys) if serializer else None,
+            )
+            shapes.append(shape)
+            return read_object(shape)
+        elif tag == _TAG_NONE:
+            return None
+        elif tag == _TAG_LIST:
+            return read_values(read_uint())
+        elif tag == _TAG_DICT:
+            unpacked_dict = {}
+            for _ in range(read_uint()):
+                key = cast(str, read())
+                unpacked_dict[key] = read()
+            # dicts may hold the JSON form of values packed by field serializers
+            return _unpack_object(unpacked_dict, whitelist_map, context)
+        elif tag == _TAG_TRUE:
+            return True
+        elif tag == _TAG_FALSE:
+            return False
+        elif tag == _TAG_INT:
+            n = read_uint()
+            return n >> 1 if not n & 1 else -((n + 1) >> 1)
+        elif tag == _TAG_FLOAT:
+            start = pos
+            pos += _FLOAT_STRUCT.size
+            return _FLOAT_STRUCT.unpack_from(data, start)[0]
+        elif tag == _TAG_LONG_STR:
+            return read_utf8()
+        elif tag == _TAG_ENUM:
+            return _unpack_object({"__enum__": read()}, whitelist_map, context)
+        elif tag == _TAG_SET:
+            return set(read_values(read_uint()))
+        elif tag == _TAG_FROZENSET:
+            return frozenset(read_values(read_uint()))
+        elif tag == _TAG_MAPPING_ITEMS:
+            unpacked_mapping = {}
+            for _ in range(read_uint()):
+                key = read()
+                unpacked_mapping[key] = read()
+            return unpacked_mapping
+        raise DeserializationError(f"Invalid binary serdes tag {tag} at position {pos - 1}")
+
+    def read_values(count: int) -> List[UnpackedValue]:
+        nonlocal pos
+        values = []
+        for _ in range(count):
+            # handle the most common values inline, to avoid the overhead of calling read()
+            tag = data[pos]
+            pos += 1
+            if tag == _TAG_STR_REF:
+                index = data[pos]
+                if index < 0x80:
+                    pos += 1
+                    values.append(strings[index])
+                else:
+                    values.append(strings[read_uint()])
+            elif tag == _TAG_OBJECT:
+                index = data[pos]
+                if index < 0x80:
+                    pos += 1
+                    values.append(read_object(shapes[index]))
+                else:
+                    values.append(read_object(shapes[read_uint()]))
+            elif tag == _TAG_LIST:
+                values.append(read_values(read_uint()))
+            elif tag >= _TAG_FIXINT:
+                values.append(tag - _TAG_FIXINT)
+            elif tag == _TAG_NONE:
+                values.append(None)
+            elif tag == _TAG_FALSE:
+                values.append(False)
+            elif tag == _TAG_TRUE:
+                values.append(True)
+            else:
+                pos -= 1
+                values.append(read())
+        return values
+
+    def read_object(shape: _BinaryShape) -> UnpackedValue:
+        storage_name, storage_keys, serializer, plan = shape
+        values = read_values(len(storage_keys))
+
+        if serializer and plan and not context.observed_unknown_serdes_values:
+            if plan.direct_field_names:
+                kwargs = dict(zip(plan.direct_field_names, values))
+            else:
+                kwargs = {}
+                for (loaded_name, field_serializer), value in zip(plan.fields, values):
+                    if loaded_name is None:
+                        continue
+                    kwargs[loaded_name] = (
+                        field_serializer.unpack(value, whitelist_map=whitelist_map, context=context)
+                        if field_serializer
+                        else value
+                    )
+            try:
+                return serializer.klass(**kwargs)
+            except Exception:
+                # fall back to the general path, which applies the serializer's error handling
+                pass
+
+        unpacked_dict: Dict[str, UnpackedValue] = {"__class__": storage_name}
+        unpacked_dict.update(zip(storage_keys, values))
+        return _unpack_object(unpacked_dict, whitelist_map, context)
+
+    try:
+        val = read()
+    except (IndexError, struct.error) as err:
+        raise DeserializationError("Truncated binary serdes value.") from err
+    if pos != size:
+        raise DeserializationError(f"Unexpected data after binary serdes value at position {pos}.")
+    return val
+
+
+@overload
+def deserialize_value_from_binary(
+    val: bytes,
+    as_type: Tuple[Type[T_PackableValue], Type[U_PackableValue]],
+    whitelist_map: WhitelistMap = ...,
+) -> Union[T_PackableValue, U_PackableValue]: ...
+
+
+@overload
+def deserialize_value_from_binary(
+    val: bytes,
+    as_type: Type[T_PackableValue],
+    whitelist_map: WhitelistMap = ...,
+) -> T_PackableValue: ...
+
+
+@overload
+def deserialize_value_from_binary(
+    val: bytes,
+    as_type: None = ...,
+    whitelist_map: WhitelistMap = ...,
+) -> PackableValue: ...
+
+
+def deserialize_value_from_binary(
+    val: bytes,
+    as_type: Optional[
+        Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
+    ] = None,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
+    """Deserialize a value written by `serialize_value_to_binary` to a Python object.
+
+    Objects are unpacked by the same serializers as `deserialize_value`, so every
+    `whitelist_for_serdes` option and hook applies to both formats.
+    """
+    check.inst_param(val, "val", bytes)
+    if not is_binary_serialized_value(val):
+        raise DeserializationError("Value is not in the binary serdes format.")
+
+    with disable_dagster_warnings(), check.EvalContext.contextual_namespace(
+        whitelist_map.object_type_map
+    ):
+        context = UnpackContext()
+        unpacked_value = _read_binary_value(val, whitelist_map, context)
+        unpacked_value = context.finalize_unpack(unpacked_value)
+
+    if as_type and not (
+        is_named_tuple_instance(unpacked_value)
+        if as_type is NamedTuple
+        else isinstance(unpacked_value, as_type)
+    ):
+        raise DeserializationError(
+            f"Deserialized object was not expected type {as_type}, got {type(unpacked_value)}"
+        )
+    return unpacked_value
+
+
 ###################################################################################################
 # Validation
 ###################################################################################################
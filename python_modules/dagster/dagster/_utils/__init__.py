@@ -425,6 +425,17 @@ def touch_file(path):
         os.utime(path, None)
 
 
+def write_file_atomically(path: str, contents: bytes) -> None:
+    """Writes the contents to a temporary file and moves it into place, so that other processes
+    reading the path never see a partially written file.
+    """
+    mkdir_p(os.path.dirname(path))
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(contents)
+    os.replace(temp_path, path)
+
+
 def _termination_handler(
     should_stop_event,  # multiprocessing.Event
     is_done_event: threading.Event,
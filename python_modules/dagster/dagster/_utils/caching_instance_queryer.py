@@ -1,16 +1,22 @@
 import logging
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
+    Callable,
     Dict,
+    Hashable,
     Iterable,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -34,7 +40,7 @@
     DagsterDefinitionChangedDeserializationError,
     DagsterInvalidDefinitionError,
 )
-from dagster._core.event_api import AssetRecordsFilter
+from dagster._core.event_api import AssetRecordsFilter, EventRecordsFilter
 from dagster._core.events import DagsterEventType
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.loader import LoadingContext
@@ -55,6 +61,166 @@
 
 RECORD_BATCH_SIZE = 1000
 
+DEFAULT_QUERYER_CACHE_MAX_ENTRIES = 50000
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class InstanceQueryerCacheMetrics(NamedTuple):
+    """Counters for the lookups into an InstanceQueryerCache, since it was created."""
+
+    hits: int
+    misses: int
+    # entries evicted to stay within the memory bound
+    evictions: int
+    # entries evicted because new events were found for their asset
+    invalidations: int
+
+
+class InstanceQueryerCache:
+    """A cache of instance queries that outlives a single CachingInstanceQueryer, so that a
+    long-running process such as the asset daemon can share query results between its ticks.
+
+    Values are cached per asset key, for the queries whose results only change when a new
+    materialization or observation of the asset is stored, and per run id, for the queries whose
+    results no longer change once the run has finished. Before each tick, `refresh` reads the
+    materialization and observation events stored since the previous refresh, and evicts the values
+    cached for their assets, so that only the assets that changed are queried again.
+
+    Asset wipes do not store events, so values cached for wiped assets are only evicted when the
+    cache is cleared or when they fall out of the cache.
+
+    The cache holds values for at most `max_entries` asset keys and run ids, evicting the least
+    recently used ones first.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _entries, _last_event_id and the metrics counters
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_QUERYER_CACHE_MAX_ENTRIES):
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Union[AssetKey, str], Dict[Hashable, Any]] = OrderedDict()
+        self._last_event_id: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def last_event_id(self) -> Optional[int]:
+        """The storage id of the last event that was read by `refresh`."""
+        return self._last_event_id
+
+    @property
+    def metrics(self) -> InstanceQueryerCacheMetrics:
+        with self._lock:
+            return InstanceQueryerCacheMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._last_event_id = None
+
+    def refresh(self, instance: DagsterInstance, last_event_id: Optional[int]) -> Set[AssetKey]:
+        """Evict the values cached for the assets that have new materializations or observations
+        since the last refresh, up to and including the given storage id.
+
+        Args:
+            instance (DagsterInstance): The instance whose event log to read.
+            last_event_id (Optional[int]): The storage id of the latest event in the event log.
+
+        Returns:
+            Set[AssetKey]: The asset keys that have new events.
+        """
+        with self._lock:
+            previous_last_event_id = self._last_event_id
+
+        if (
+            previous_last_event_id is None
+            or last_event_id is None
+            or last_event_id < previous_last_event_id
+        ):
+            # nothing is known about the events the cached values were computed from, or the event
+            # log was wiped
+            self.clear()
+            with self._lock:
+                self._last_event_id = last_event_id
+            return set()
+
+        updated_asset_keys: Set[AssetKey] = set()
+        for event_type in (
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_OBSERVATION,
+        ):
+            after_cursor = previous_last_event_id
+            while True:
+                records = instance.get_event_records(
+                    EventRecordsFilter(
+                        event_type=event_type,
+                        after_cursor=after_cursor,
+                        before_cursor=last_event_id + 1,
+                    ),
+                    limit=RECORD_BATCH_SIZE,
+                    ascending=True,
+                )
+                updated_asset_keys.update(
+                    record.asset_key for record in records if record.asset_key is not None
+                )
+                if len(records) < RECORD_BATCH_SIZE:
+                    break
+                after_cursor = records[-1].storage_id
+
+        with self._lock:
+            for asset_key in updated_asset_keys:
+                if self._entries.pop(asset_key, None) is not None:
+                    self._invalidations += 1
+            self._last_event_id = last_event_id
+
+        return updated_asset_keys
+
+    def get(self, scope: Union[AssetKey, str], key: Hashable) -> Any:
+        """Returns the value cached for the key in the given scope (an asset key or a run id), or
+        _MISSING if there is none.
+        """
+        with self._lock:
+            values = self._entries.get(scope)
+            if values is None or key not in values:
+                self._misses += 1
+                return _MISSING
+
+            self._hits += 1
+            self._entries.move_to_end(scope)
+            return values[key]
+
+    def set(self, scope: Union[AssetKey, str], key: Hashable, value: Any) -> None:
+        with self._lock:
+            if scope in self._entries:
+                self._entries.move_to_end(scope)
+            self._entries.setdefault(scope, {})[key] = value
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(
+        self, scope: Union[AssetKey, str], key: Hashable, compute_fn: Callable[[], T]
+    ) -> T:
+        value = self.get(scope, key)
+        if value is _MISSING:
+            value = compute_fn()
+            self.set(scope, key, value)
+        return value
+
 
 class CachingInstanceQueryer(DynamicPartitionsStore):
     """Provides utility functions for querying for asset-materialization related data from the
@@ -63,6 +229,8 @@ class CachingInstanceQueryer(DynamicPartitionsStore):
 
     Args:
         instance (DagsterInstance): The instance to query.
+        cache (Optional[InstanceQueryerCache]): A cache shared with the queryers of previous
+            requests, e.g. previous ticks of the same daemon, that has been refreshed for this one.
     """
 
     def __init__(
@@ -72,8 +240,10 @@ def __init__(
         loading_context: LoadingContext,
         evaluation_time: Optional[datetime] = None,
         logger: Optional[logging.Logger] = None,
+        cache: Optional[InstanceQueryerCache] = None,
     ):
         self._instance = instance
+        self._cache = cache
         self._loading_context = loading_context
 
         self._asset_graph = asset_graph
@@ -88,6 +258,8 @@ def __init__(
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
+        self._asset_status_cache_values: Dict[AssetKey, Optional["AssetStatusCacheValue"]] = {}
+
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
         self._respect_materialization_data_versions = (
@@ -116,6 +288,32 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
 
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
 
+    def prefetch_asset_status_cache_values(self, asset_keys: Iterable[AssetKey]) -> None:
+        """For performance, updates the status caches of the selected partitioned assets in a
+        single batch, instead of one asset at a time as they are needed.
+        """
+        from dagster._core.storage.partition_status_cache import (
+            get_and_update_asset_status_cache_values,
+        )
+
+        partitions_defs_by_asset_key = {
+            asset_key: self.asset_graph.get(asset_key).partitions_def
+            for asset_key in asset_keys
+            if asset_key not in self._asset_status_cache_values
+            and self.asset_graph.get(asset_key).partitions_def is not None
+        }
+        if not partitions_defs_by_asset_key:
+            return
+
+        self._asset_status_cache_values.update(
+            get_and_update_asset_status_cache_values(
+                instance=self.instance,
+                partitions_defs_by_asset_key=partitions_defs_by_asset_key,
+                dynamic_partitions_loader=self,
+                loading_context=self._loading_context,
+            )
+        )
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -126,6 +324,9 @@ def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetSta
             get_and_update_asset_status_cache_value,
         )
 
+        if asset_key in self._asset_status_cache_values:
+            return self._asset_status_cache_values[asset_key]
+
         partitions_def = check.not_none(self.asset_graph.get(asset_key).partitions_def)
         return get_and_update_asset_status_cache_value(
             instance=self.instance,
@@ -155,18 +356,33 @@ def get_materialized_asset_subset(
     ) -> SerializableEntitySubset[AssetKey]:
         """Returns an AssetSubset representing the subset of the asset that has been materialized."""
         partitions_def = self.asset_graph.get(asset_key).partitions_def
-        if partitions_def:
-            cache_value = self._get_updated_cache_value(asset_key=asset_key)
-            if cache_value is None:
-                value = partitions_def.empty_subset()
-            else:
-                value = cache_value.deserialize_materialized_partition_subsets(partitions_def)
+        if partitions_def and self._cache is not None:
+            value = self._cache.get_or_compute(
+                asset_key,
+                (
+                    "materialized_subset",
+                    partitions_def.get_serializable_unique_identifier(
+                        dynamic_partitions_store=self
+                    ),
+                ),
+                lambda: self._get_materialized_partitions_subset(asset_key, partitions_def),
+            )
+        elif partitions_def:
+            value = self._get_materialized_partitions_subset(asset_key, partitions_def)
         else:
             value = self.asset_partition_has_materialization_or_observation(
                 AssetKeyPartitionKey(asset_key)
             )
         return SerializableEntitySubset(key=asset_key, value=value)
 
+    def _get_materialized_partitions_subset(
+        self, asset_key: AssetKey, partitions_def: PartitionsDefinition
+    ) -> PartitionsSubset:
+        cache_value = self._get_updated_cache_value(asset_key=asset_key)
+        if cache_value is None:
+            return partitions_def.empty_subset()
+        return cache_value.deserialize_materialized_partition_subsets(partitions_def)
+
     @cached_method
     def get_in_progress_asset_subset(
         self, *, asset_key: AssetKey
@@ -237,6 +453,9 @@ def _event_type_for_key(self, asset_key: AssetKey) -> DagsterEventType:
         else:
             return DagsterEventType.ASSET_MATERIALIZATION
 
+    def _is_observable(self, asset_key: AssetKey) -> bool:
+        return self.asset_graph.has(asset_key) and self.asset_graph.get(asset_key).is_observable
+
     @cached_method
     def _get_latest_materialization_or_observation_record(
         self, *, asset_partition: AssetKeyPartitionKey, before_cursor: Optional[int] = None
@@ -245,14 +464,30 @@ def _get_latest_materialization_or_observation_record(
         observable source assets, this will be an AssetObservation, otherwise it will be an
         AssetMaterialization.
         """
+        if self._cache is not None and before_cursor is None:
+            return self._cache.get_or_compute(
+                asset_partition.asset_key,
+                (
+                    "latest_record",
+                    asset_partition.partition_key,
+                    self._is_observable(asset_partition.asset_key),
+                ),
+                lambda: self._fetch_latest_materialization_or_observation_record(
+                    asset_partition=asset_partition, before_cursor=None
+                ),
+            )
+        return self._fetch_latest_materialization_or_observation_record(
+            asset_partition=asset_partition, before_cursor=before_cursor
+        )
+
+    def _fetch_latest_materialization_or_observation_record(
+        self, *, asset_partition: AssetKeyPartitionKey, before_cursor: Optional[int]
+    ) -> Optional["EventLogRecord"]:
         # in the simple case, just use the asset record
         if (
             before_cursor is None
             and asset_partition.partition_key is None
-            and not (
-                self.asset_graph.has(asset_partition.asset_key)
-                and self.asset_graph.get(asset_partition.asset_key).is_observable
-            )
+            and not self._is_observable(asset_partition.asset_key)
         ):
             asset_record = self.get_asset_record(asset_partition.asset_key)
             if asset_record is None:
@@ -307,13 +542,27 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
+                    for partition_key, storage_id in self._get_latest_storage_id_by_partition(
+                        asset_key
                     ).items()
                 }
             )
         return latest_storage_ids
 
+    def _get_latest_storage_id_by_partition(self, asset_key: AssetKey) -> Mapping[str, int]:
+        event_type = self._event_type_for_key(asset_key)
+        if self._cache is None:
+            return self.instance.get_latest_storage_id_by_partition(
+                asset_key, event_type=event_type
+            )
+        return self._cache.get_or_compute(
+            asset_key,
+            ("latest_storage_id_by_partition", event_type),
+            lambda: self.instance.get_latest_storage_id_by_partition(
+                asset_key, event_type=event_type
+            ),
+        )
+
     def get_latest_materialization_or_observation_storage_id(
         self, asset_partition: AssetKeyPartitionKey
     ) -> Optional[int]:
@@ -438,7 +687,24 @@ def next_version_record(
 
     @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        if self._cache is None:
+            return self.instance.get_run_record_by_id(run_id)
+
+        run_record = self._cache.get(run_id, "run_record")
+        if run_record is _MISSING:
+            run_record = self.instance.get_run_record_by_id(run_id)
+            # the record of a finished run no longer changes
+            if run_record is not None and run_record.dagster_run.is_finished:
+                self._cache.set(run_id, "run_record", run_record)
+        return run_record
+
+    def _get_or_compute_for_finished_run(
+        self, run_id: str, key: str, compute_fn: Callable[[], T]
+    ) -> T:
+        run = self._get_run_by_id(run_id)
+        if self._cache is None or run is None or not run.is_finished:
+            return compute_fn()
+        return self._cache.get_or_compute(run_id, key, compute_fn)
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -462,6 +728,15 @@ def run_has_tag(self, run_id: str, tag_key: str, tag_value: Optional[str]) -> bo
     def _get_planned_materializations_for_run_from_snapshot(
         self, *, snapshot_id: str
     ) -> AbstractSet[AssetKey]:
+        if self._cache is not None:
+            # execution plan snapshots are immutable
+            return self._cache.get_or_compute(
+                snapshot_id,
+                "asset_selection",
+                lambda: check.not_none(
+                    self._instance.get_execution_plan_snapshot(snapshot_id)
+                ).asset_selection,
+            )
         execution_plan_snapshot = check.not_none(
             self._instance.get_execution_plan_snapshot(snapshot_id)
         )
@@ -478,10 +753,16 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
-        materializations_planned = self.instance.get_records_for_run(
-            run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
-        ).records
-        return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
+        return self._get_or_compute_for_finished_run(
+            run_id,
+            "planned_materializations",
+            lambda: {
+                cast(AssetKey, record.asset_key)
+                for record in self.instance.get_records_for_run(
+                    run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+                ).records
+            },
+        )
 
     def get_planned_materializations_for_run(self, run_id: str) -> AbstractSet[AssetKey]:
         """Returns the set of asset keys that are planned to be materialized by the run.
@@ -526,11 +807,16 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
-        materializations = self.instance.get_records_for_run(
-            run_id=run_id,
-            of_type=DagsterEventType.ASSET_MATERIALIZATION,
-        ).records
-        return set(cast(AssetKey, record.asset_key) for record in materializations)
+        return self._get_or_compute_for_finished_run(
+            run_id,
+            "current_materializations",
+            lambda: {
+                cast(AssetKey, record.asset_key)
+                for record in self.instance.get_records_for_run(
+                    run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+                ).records
+            },
+        )
 
     ####################
     # BACKFILLS
@@ -585,11 +871,17 @@ def get_materialized_partitions(
             before_cursor not in self._asset_partitions_cache
             or asset_key not in self._asset_partitions_cache[before_cursor]
         ):
-            self._asset_partitions_cache[before_cursor][asset_key] = (
-                self.instance.get_materialized_partitions(
+            if self._cache is not None and before_cursor is None:
+                materialized_partitions = self._cache.get_or_compute(
+                    asset_key,
+                    "materialized_partitions",
+                    lambda: self.instance.get_materialized_partitions(asset_key=asset_key),
+                )
+            else:
+                materialized_partitions = self.instance.get_materialized_partitions(
                     asset_key=asset_key, before_cursor=before_cursor
                 )
-            )
+            self._asset_partitions_cache[before_cursor][asset_key] = materialized_partitions
 
         return self._asset_partitions_cache[before_cursor][asset_key]
 
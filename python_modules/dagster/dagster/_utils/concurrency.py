@@ -10,6 +10,14 @@ def get_max_concurrency_limit_value() -> int:
     return int(os.getenv("DAGSTER_MAX_GLOBAL_OP_CONCURRENCY_LIMIT", "1000"))
 
 
+def get_concurrency_assignment_lease_seconds() -> float:
+    """How long a pending step may hold an assigned slot without claiming it, before the slot is
+    reassigned to the next pending step. Disabled by default; a value of 0 or less disables the
+    lease.
+    """
+    return float(os.getenv("DAGSTER_CONCURRENCY_ASSIGNMENT_LEASE_SECONDS", "0"))
+
+
 class ConcurrencySlotStatus(Enum):
     BLOCKED = "BLOCKED"
     CLAIMED = "CLAIMED"
@@ -6,6 +6,7 @@
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
 from dagster._api.snapshot_repository import (
     gen_streaming_external_repositories_data_grpc,
+    sync_get_external_repositories_data_from_snapshot_pieces_grpc,
     sync_get_streaming_external_repositories_data_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -15,12 +16,20 @@
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.remote_representation.external import ExternalRepository
-from dagster._core.remote_representation.external_data import ExternalJobData
+from dagster._core.remote_representation.external_data import (
+    ExternalJobData,
+    ExternalRepositorySnapshotPieces,
+)
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
-from dagster._core.test_utils import instance_for_test
+from dagster._core.remote_representation.snapshot_cache import RepositorySnapshotCache
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._grpc.client import DagsterGrpcClient
+from dagster._grpc.types import RepositorySnapshotPiecesArgs
+from dagster._record import copy
+from dagster._serdes import serialize_value
+from dagster._serdes.serdes import BINARY_SERDES_STRING_PREFIX, deserialize_value
 
 from dagster_tests.api_tests.utils import get_bar_repo_code_location
 
@@ -49,6 +58,127 @@ def test_streaming_external_repositories_api_grpc(instance):
         assert async_external_repo_datas == external_repo_datas
 
 
+def test_streaming_external_repositories_api_grpc_binary_serdes(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        json_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+
+        # the serdes format is requested through call metadata when the client is created
+        with environ({"DAGSTER_GRPC_SERDES_FORMAT": "binary"}):
+            client = DagsterGrpcClient(
+                port=code_location.client.port,
+                socket=code_location.client.socket,
+                host=code_location.client.host,
+            )
+
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+        serialized_repo_data = client.external_repository(repo_origin)
+        assert serialized_repo_data.startswith(BINARY_SERDES_STRING_PREFIX)
+        assert deserialize_value(serialized_repo_data) == json_repo_datas["bar_repo"]
+
+        binary_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            client, code_location
+        )
+        assert binary_repo_datas == json_repo_datas
+
+
+def test_external_repositories_from_snapshot_pieces_grpc(instance, tmpdir):
+    with get_bar_repo_code_location(instance) as code_location:
+        full_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+
+        snapshot_cache = RepositorySnapshotCache(str(tmpdir))
+        assert snapshot_cache.get_known_piece_ids(code_location.name, "bar_repo") == []
+
+        repo_datas = sync_get_external_repositories_data_from_snapshot_pieces_grpc(
+            code_location.client, code_location, snapshot_cache
+        )
+        assert repo_datas == full_repo_datas
+
+        known_piece_ids = snapshot_cache.get_known_piece_ids(code_location.name, "bar_repo")
+        assert known_piece_ids
+
+        # only the pieces that the client does not already have are returned
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+        snapshot_pieces = deserialize_value(
+            code_location.client.streaming_external_repository_snapshot_pieces(
+                RepositorySnapshotPiecesArgs(repo_origin, known_piece_ids[1:])
+            ),
+            ExternalRepositorySnapshotPieces,
+        )
+        assert set(snapshot_pieces.piece_ids) == set(known_piece_ids)
+        assert list(snapshot_pieces.pieces.keys()) == [known_piece_ids[0]]
+
+        # a new cache over the same directory reads the pieces from disk
+        assert (
+            sync_get_external_repositories_data_from_snapshot_pieces_grpc(
+                code_location.client, code_location, RepositorySnapshotCache(str(tmpdir))
+            )
+            == full_repo_datas
+        )
+
+
+def test_external_repositories_from_snapshot_pieces_missing_piece(instance, tmpdir):
+    with get_bar_repo_code_location(instance) as code_location:
+        sync_get_external_repositories_data_from_snapshot_pieces_grpc(
+            code_location.client, code_location, RepositorySnapshotCache(str(tmpdir))
+        )
+
+        snapshot_cache = RepositorySnapshotCache(str(tmpdir))
+        known_piece_ids = snapshot_cache.get_known_piece_ids(code_location.name, "bar_repo")
+
+        # remove a piece after its id has been read, so that the server omits it from its reply
+        get_known_piece_ids = snapshot_cache.get_known_piece_ids
+        removed_piece_id = known_piece_ids[0]
+
+        def _get_known_piece_ids_then_remove_piece(location_name, repository_name):
+            piece_ids = get_known_piece_ids(location_name, repository_name)
+            tmpdir.join("pieces", removed_piece_id[:2], removed_piece_id).remove()
+            return piece_ids
+
+        snapshot_cache.get_known_piece_ids = _get_known_piece_ids_then_remove_piece
+
+        assert sync_get_external_repositories_data_from_snapshot_pieces_grpc(
+            code_location.client, code_location, snapshot_cache
+        ) == sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
+        assert tmpdir.join("pieces", removed_piece_id[:2], removed_piece_id).exists()
+
+
+def test_grpc_code_location_with_repository_snapshot_cache(instance):
+    with environ({"DAGSTER_REPOSITORY_SNAPSHOT_CACHE": "1"}):
+        with get_bar_repo_code_location(instance) as code_location:
+            assert code_location.get_repository("bar_repo").name == "bar_repo"
+            assert RepositorySnapshotCache(
+                instance.repository_snapshots_directory()
+            ).get_known_piece_ids(code_location.name, "bar_repo")
+
+
+def test_code_server_snapshot_cache(instance, tmpdir):
+    with environ({"DAGSTER_GRPC_SNAPSHOT_CACHE_DIR": str(tmpdir)}):
+        with get_bar_repo_code_location(instance) as code_location:
+            repo_datas = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location
+            )
+
+        (cache_file,) = tmpdir.listdir()
+        cached_repo_data = deserialize_value(cache_file.read(), ExternalRepositoryData)
+        assert cached_repo_data == repo_datas["bar_repo"]
+
+        # a server restarted with unchanged code serves the snapshot from the cache
+        cache_file.write(
+            serialize_value(
+                copy(cached_repo_data, metadata={"string": TextMetadataValue("cached")})
+            )
+        )
+        with get_bar_repo_code_location(instance) as code_location:
+            repo_datas = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location
+            )
+            assert repo_datas["bar_repo"].metadata == {"string": TextMetadataValue("cached")}
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
@@ -5,6 +5,8 @@
 
 import pytest
 from dagster._api.snapshot_schedule import (
+    ScheduleExecutionRequest,
+    sync_get_external_schedule_execution_data_batch_grpc,
     sync_get_external_schedule_execution_data_ephemeral_grpc,
     sync_get_external_schedule_execution_data_grpc,
 )
@@ -12,7 +14,7 @@
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.remote_representation.external_data import ExternalScheduleExecutionErrorData
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._grpc.client import ephemeral_grpc_api_client
 from dagster._grpc.types import ExternalScheduleExecutionArgs
 from dagster._serdes import deserialize_value
@@ -152,3 +154,121 @@ def test_run_request_partition_key_schedule_grpc():
             to_launch = execution_data.run_requests[0]
             assert to_launch.tags["dagster/schedule_name"] == "partitioned_run_request_schedule"
             assert to_launch.tags["dagster/partition"] == "a"
+
+
+def test_external_schedule_execution_data_batch_grpc():
+    with instance_for_test() as instance:
+        with get_bar_repo_handle(instance) as repository_handle:
+            origin = repository_handle.get_external_origin()
+            execution_time = get_current_datetime()
+            schedule_names = [
+                "foo_schedule",
+                "schedule_error",
+                "foo_schedule_never_execute",
+                "foo_schedule_echo_time",
+            ]
+            with ephemeral_grpc_api_client(
+                origin.code_location_origin.loadable_target_origin
+            ) as api_client:
+                results = dict(
+                    sync_get_external_schedule_execution_data_batch_grpc(
+                        api_client,
+                        instance,
+                        [
+                            ScheduleExecutionRequest(
+                                repository_handle=repository_handle,
+                                schedule_name=schedule_name,
+                                scheduled_execution_time=TimestampWithTimezone(
+                                    execution_time.timestamp(), "UTC"
+                                ),
+                                log_key=None,
+                            )
+                            for schedule_name in schedule_names
+                        ],
+                        max_workers=2,
+                    )
+                )
+
+            assert set(results.keys()) == {0, 1, 2, 3}
+
+            assert isinstance(results[0], ScheduleExecutionData)
+            assert results[0].run_requests[0].run_config == {"fizz": "buzz"}
+
+            assert isinstance(results[1], ExternalScheduleExecutionErrorData)
+            assert "womp womp" in results[1].error.to_string()
+
+            assert isinstance(results[2], ScheduleExecutionData)
+            assert len(results[2].run_requests) == 0
+
+            assert isinstance(results[3], ScheduleExecutionData)
+            assert results[3].run_requests[0].run_config == {
+                "passed_in_time": execution_time.isoformat()
+            }
+
+
+def test_external_schedule_execution_data_batch_grpc_max_workers():
+    # the code server bounds the number of threads that evaluate the batch, whatever the caller
+    # asks for
+    with environ({"DAGSTER_CODE_SERVER_MAX_SCHEDULE_BATCH_WORKERS": "1"}):
+        with instance_for_test() as instance:
+            with get_bar_repo_handle(instance) as repository_handle:
+                origin = repository_handle.get_external_origin()
+                with ephemeral_grpc_api_client(
+                    origin.code_location_origin.loadable_target_origin
+                ) as api_client:
+                    results = dict(
+                        sync_get_external_schedule_execution_data_batch_grpc(
+                            api_client,
+                            instance,
+                            [
+                                ScheduleExecutionRequest(
+                                    repository_handle=repository_handle,
+                                    schedule_name="foo_schedule",
+                                    scheduled_execution_time=None,
+                                    log_key=None,
+                                )
+                                for _ in range(3)
+                            ],
+                            max_workers=1_000_000,
+                        )
+                    )
+
+    assert set(results.keys()) == {0, 1, 2}
+    assert all(isinstance(result, ScheduleExecutionData) for result in results.values())
+
+
+def test_external_schedule_execution_data_batch_grpc_unimplemented():
+    with instance_for_test() as instance:
+        with get_bar_repo_handle(instance) as repository_handle:
+            origin = repository_handle.get_external_origin()
+            with ephemeral_grpc_api_client(
+                origin.code_location_origin.loadable_target_origin
+            ) as api_client:
+                with mock.patch(
+                    "dagster._grpc.client.DagsterGrpcClient._streaming_query"
+                ) as mock_method:
+                    with mock.patch(
+                        "dagster._grpc.client.DagsterGrpcClient._is_unimplemented_error",
+                        return_value=True,
+                    ):
+                        mock_method.side_effect = Exception("Unimplemented")
+
+                        # older servers evaluate nothing, leaving the caller to evaluate each
+                        # schedule on its own
+                        assert (
+                            list(
+                                sync_get_external_schedule_execution_data_batch_grpc(
+                                    api_client,
+                                    instance,
+                                    [
+                                        ScheduleExecutionRequest(
+                                            repository_handle=repository_handle,
+                                            schedule_name="foo_schedule",
+                                            scheduled_execution_time=None,
+                                            log_key=None,
+                                        )
+                                    ],
+                                )
+                            )
+                            == []
+                        )
@@ -810,3 +810,75 @@ def my_asset(): ...
     # But not resolved.
     with pytest.raises(NotImplementedError):
         selection.resolve([my_asset])
+
+
+def test_resolve_cached_per_asset_graph() -> None:
+    @asset(group_name="g")
+    def a(): ...
+
+    @asset(deps=[a])
+    def b(): ...
+
+    asset_graph = AssetGraph.from_assets([a, b])
+    selection = AssetSelection.assets("a").downstream() | AssetSelection.groups("g")
+
+    resolved = selection.resolve(asset_graph)
+    assert resolved == {AssetKey("a"), AssetKey("b")}
+    assert len(asset_graph.resolved_asset_selections) == 1
+
+    # an equal selection built separately hits the cache, and modifying a result doesn't affect it
+    resolved.add(AssetKey("c"))
+    assert (AssetSelection.assets("a").downstream() | AssetSelection.groups("g")).resolve(
+        asset_graph
+    ) == {AssetKey("a"), AssetKey("b")}
+    assert len(asset_graph.resolved_asset_selections) == 1
+
+    # a different graph does not share results
+    assert selection.resolve(AssetGraph.from_assets([a])) == {AssetKey("a")}
+
+    class MySelection(AssetSelection):
+        def resolve_inner(self, asset_graph, allow_missing):
+            return {AssetKey("a")}
+
+    # selections defined outside of dagster are not cached, as they may depend on other state
+    assert (MySelection() | AssetSelection.assets("b")).resolve(asset_graph) == {
+        AssetKey("a"),
+        AssetKey("b"),
+    }
+    assert len(asset_graph.resolved_asset_selections) == 1
+
+
+def test_asset_graph_index_traversals() -> None:
+    import random
+
+    from dagster._core.selector.subset_selector import fetch_connected, fetch_sinks, fetch_sources
+
+    rand = random.Random(42)
+    assets = []
+    for i in range(60):
+        deps = rand.sample([f"asset_{j}" for j in range(i)], min(i, rand.randint(0, 3)))
+
+        @asset(name=f"asset_{i}", deps=deps)
+        def _asset(): ...
+
+        assets.append(_asset)
+
+    asset_graph = AssetGraph.from_assets(assets)
+    index = asset_graph.index
+    dep_graph = asset_graph.asset_dep_graph
+
+    for _ in range(20):
+        selection = set(rand.sample(sorted(asset_graph.all_asset_keys), rand.randint(1, 10)))
+        for depth in [None, 0, 1, 3]:
+            for direction, fetch in [
+                ("upstream", index.upstream_keys),
+                ("downstream", index.downstream_keys),
+            ]:
+                expected = set()
+                for key in selection:
+                    expected |= fetch_connected(
+                        item=key, graph=dep_graph, direction=direction, depth=depth
+                    )
+                assert fetch(selection, depth) == expected
+        assert index.source_keys(selection) == fetch_sources(dep_graph, selection)
+        assert index.sink_keys(selection) == fetch_sinks(dep_graph, selection)
@@ -2,15 +2,29 @@
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+    PartitionKeyIndex,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
 )
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+)
 from dagster._core.test_utils import freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
@@ -54,6 +68,128 @@ def test_static_partitions_subset_current_version_serialization():
     assert deserialized.get_partition_keys() == {"baz", "foo"}
 
 
+def test_bitmap_partitions_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(100)])
+    evens = partitions_def.empty_subset().with_partition_keys(str(i) for i in range(0, 100, 2))
+    low = partitions_def.empty_subset().with_partition_keys(str(i) for i in range(10))
+
+    assert len(evens) == 50
+    assert "4" in evens and "5" not in evens and "foo" not in evens
+    assert (evens & low).get_partition_keys() == {"0", "2", "4", "6", "8"}
+    assert (low - evens).get_partition_keys() == {"1", "3", "5", "7", "9"}
+    assert len(evens | low) == 55
+    assert evens | low == DefaultPartitionsSubset(
+        {str(i) for i in range(100) if i % 2 == 0 or i < 10}
+    )
+    assert low & DefaultPartitionsSubset({"1", "50"}) == DefaultPartitionsSubset({"1"})
+    assert low - DefaultPartitionsSubset({"1", "50"}) == DefaultPartitionsSubset(
+        {str(i) for i in range(10) if i != 1}
+    )
+
+    assert low.get_partition_key_ranges(partitions_def) == [PartitionKeyRange("0", "9")]
+    assert (evens & low).get_partition_key_ranges(partitions_def) == [
+        PartitionKeyRange(key, key) for key in ["0", "2", "4", "6", "8"]
+    ]
+    assert set(low.get_partition_keys_not_in_subset(partitions_def)) == {
+        str(i) for i in range(10, 100)
+    }
+    assert low.with_partition_key_range(
+        partitions_def, PartitionKeyRange("20", "29")
+    ).get_partition_key_ranges(partitions_def) == [
+        PartitionKeyRange("0", "9"),
+        PartitionKeyRange("20", "29"),
+    ]
+
+    # keys that are not partitions of the definition are still tracked
+    with_extra = low.with_partition_keys(["foo"])
+    assert "foo" in with_extra
+    assert len(with_extra) == 11
+    assert partitions_def.deserialize_subset(with_extra.serialize()) == with_extra
+
+
+def test_bitmap_partitions_subset_serialization():
+    partitions_def = StaticPartitionsDefinition(["foo", "bar", "baz", "qux"])
+    subset = partitions_def.empty_subset().with_partition_keys(["foo", "bar", "qux"])
+    serialized = subset.serialize()
+
+    assert partitions_def.can_deserialize_subset(
+        serialized, None, StaticPartitionsDefinition.__name__
+    )
+    assert partitions_def.deserialize_subset(serialized) == subset
+
+    # ranges of ordinals can't be read once the partition keys change
+    changed_partitions_def = StaticPartitionsDefinition(["bar", "foo", "baz", "qux"])
+    assert not changed_partitions_def.can_deserialize_subset(
+        serialized, None, StaticPartitionsDefinition.__name__
+    )
+    with pytest.raises(DagsterDefinitionChangedDeserializationError):
+        changed_partitions_def.deserialize_subset(serialized)
+
+    # but sets of keys can
+    old_serialized = DefaultPartitionsSubset({"foo", "bar"}).serialize()
+    assert changed_partitions_def.can_deserialize_subset(
+        old_serialized, None, StaticPartitionsDefinition.__name__
+    )
+    assert changed_partitions_def.deserialize_subset(old_serialized).get_partition_keys() == {
+        "foo",
+        "bar",
+    }
+
+    # serdes still uses the set of keys
+    round_trip_subset = deserialize_value(serialize_value(subset.to_serializable_subset()))  # type: ignore
+    assert isinstance(round_trip_subset, DefaultPartitionsSubset)
+    assert round_trip_subset == subset
+
+
+def test_dynamic_bitmap_partitions_subset():
+    partitions_def = DynamicPartitionsDefinition(name="bitmap_subset_test")
+    subset = partitions_def.empty_subset().with_partition_keys(["b", "a"])
+    other = (
+        DynamicPartitionsDefinition(name="bitmap_subset_test")
+        .empty_subset()
+        .with_partition_keys(["c", "a"])
+    )
+
+    assert (subset | other).get_partition_keys() == {"a", "b", "c"}
+    assert (subset & other).get_partition_keys() == {"a"}
+    assert (subset - other).get_partition_keys() == {"b"}
+
+    serialized = subset.serialize()
+    assert partitions_def.can_deserialize_subset(
+        serialized, None, DynamicPartitionsDefinition.__name__
+    )
+    assert partitions_def.deserialize_subset(serialized) == subset
+    assert partitions_def.deserialize_subset('["a", "b"]') == subset
+
+
+def test_dynamic_partition_key_index_is_bounded(monkeypatch):
+    # each definition has its own index, which is released with the definition
+    assert (
+        DynamicPartitionsDefinition(name="bounded_index_test").get_partition_key_index()
+        is not DynamicPartitionsDefinition(name="bounded_index_test").get_partition_key_index()
+    )
+
+    key_index = PartitionKeyIndex(growable=True, max_size=2)
+    assert key_index.get_ordinals(["a", "b", "c"]) == ([0, 1], ["c"])
+    assert key_index.get_ordinals(["d", "a"]) == ([0], ["d"])
+    assert len(key_index) == 2
+
+    # keys past the bound of the index are stored as the extra keys of subsets
+    monkeypatch.setattr(
+        "dagster._core.definitions.partition.MAX_DYNAMIC_PARTITION_KEY_INDEX_SIZE", 2
+    )
+    partitions_def = DynamicPartitionsDefinition(name="bounded_index_test")
+    subset = partitions_def.empty_subset().with_partition_keys(["a", "b", "c"])
+    other = partitions_def.empty_subset().with_partition_keys(["c", "d"])
+    assert subset.extra_keys == {"c"}
+    assert "c" in subset and "d" not in subset
+    assert len(subset) == 3
+    assert (subset | other).get_partition_keys() == {"a", "b", "c", "d"}
+    assert (subset & other).get_partition_keys() == {"c"}
+    assert (subset - other).get_partition_keys() == {"a", "b"}
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+
+
 def test_time_window_subset_cannot_deserialize_invalid_version():
     daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
     serialized_subset = (
@@ -83,7 +219,8 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
+    assert type(DynamicPartitionsDefinition(name="foo").empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is PartitionKeysTimeWindowPartitionsSubset
 
 
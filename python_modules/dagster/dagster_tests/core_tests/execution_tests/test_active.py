@@ -12,7 +12,7 @@
 from dagster._core.execution.plan.objects import StepRetryData, StepSuccessData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.retries import RetryMode
-from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
+from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG, PRIORITY_TAG
 from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster._utils.error import SerializableErrorInfo
@@ -352,3 +352,66 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def define_priority_fan_in_job():
+    @op(tags={PRIORITY_TAG: "-1"})
+    def low():
+        return 1
+
+    @op(tags={PRIORITY_TAG: "5"})
+    def high():
+        return 1
+
+    @op
+    def middle():
+        return 1
+
+    @op
+    def fan_in(a, b, c):
+        return a + b + c
+
+    @job
+    def priority_fan_in_job():
+        fan_in(low(), high(), middle())
+
+    return priority_fan_in_job
+
+
+def test_steps_ready_when_all_deps_resolved():
+    priority_job = define_priority_fan_in_job()
+
+    with create_execution_plan(priority_job).start(
+        RetryMode.DISABLED, max_concurrent=1
+    ) as active_execution:
+        executed = []
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute()
+            if not steps:
+                break
+            assert len(steps) == 1
+            step = steps[0]
+            executed.append(step.key)
+
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    job_name=priority_job.name,
+                    step_key=step.key,
+                    event_specific_data=StepOutputData(
+                        step_output_handle=StepOutputHandle(step.key, "result")
+                    ),
+                )
+            )
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_SUCCESS.value,
+                    job_name=priority_job.name,
+                    event_specific_data=StepSuccessData(duration_ms=10.0),
+                    step_key=step.key,
+                )
+            )
+
+    # ready steps are launched in priority order, and the downstream step only once all of its
+    # deps have resolved
+    assert executed == ["high", "middle", "low", "fan_in"]
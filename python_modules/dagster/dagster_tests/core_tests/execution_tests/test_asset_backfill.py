@@ -1610,6 +1610,93 @@ def downstream(upstream):
     )
 
 
+def test_asset_backfill_frontier():
+    instance = DagsterInstance.ephemeral()
+
+    @asset(partitions_def=StaticPartitionsDefinition(["x", "y"]))
+    def partitioned_root():
+        pass
+
+    @asset
+    def unpartitioned_root():
+        pass
+
+    @asset(deps=[partitioned_root, unpartitioned_root])
+    def downstream():
+        pass
+
+    assets = [partitioned_root, unpartitioned_root, downstream]
+    asset_graph = get_asset_graph({"repo": assets})
+    backfill_id = "frontier_backfill"
+
+    asset_backfill_data = AssetBackfillData.from_asset_partitions(
+        asset_graph=asset_graph,
+        partition_names=["x", "y"],
+        asset_selection=[asset.key for asset in assets],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=False,
+        backfill_start_timestamp=get_current_timestamp(),
+    )
+
+    def _iteration(backfill_data, keys_to_run):
+        # iterations should only look at the partitions materialized since the last iteration,
+        # not at the parents of every targeted asset
+        with patch.object(
+            CachingInstanceQueryer,
+            "asset_partitions_with_newly_updated_parents_and_new_cursor",
+            side_effect=Exception("should not be called"),
+        ):
+            result = execute_asset_backfill_iteration_consume_generator(
+                backfill_id, backfill_data, asset_graph, instance
+            )
+        for run_request in result.run_requests:
+            assert run_request.asset_selection
+            if run_request.asset_selection[0] in keys_to_run:
+                do_run(
+                    all_assets=assets,
+                    asset_keys=run_request.asset_selection,
+                    partition_key=run_request.partition_key,
+                    instance=instance,
+                    tags={**run_request.tags, BACKFILL_ID_TAG: backfill_id},
+                )
+        return result.backfill_data.with_run_requests_submitted(
+            result.run_requests,
+            asset_graph,
+            instance_queryer=_get_instance_queryer(
+                instance, asset_graph, backfill_data.backfill_start_datetime
+            ),
+        )
+
+    # request both roots, but only materialize the partitioned one
+    asset_backfill_data = _iteration(asset_backfill_data, {partitioned_root.key})
+    assert asset_backfill_data.frontier_subset == AssetGraphSubset()
+
+    # the downstream asset can not be requested until the unpartitioned root is materialized
+    asset_backfill_data = _iteration(asset_backfill_data, set())
+    assert asset_backfill_data.frontier_subset == AssetGraphSubset(
+        non_partitioned_asset_keys={downstream.key}
+    )
+    assert (
+        deserialize_value(serialize_value(asset_backfill_data), AssetBackfillData)
+        == asset_backfill_data
+    )
+
+    # the downstream asset leaves the frontier once it is requested
+    do_run(
+        all_assets=assets,
+        asset_keys=[unpartitioned_root.key],
+        partition_key=None,
+        instance=instance,
+        tags={BACKFILL_ID_TAG: backfill_id},
+    )
+    asset_backfill_data = _iteration(asset_backfill_data, {downstream.key})
+    assert downstream.key in asset_backfill_data.requested_subset
+    assert asset_backfill_data.frontier_subset == AssetGraphSubset()
+
+    asset_backfill_data = _iteration(asset_backfill_data, set())
+    assert asset_backfill_data.is_complete()
+
+
 def test_asset_backfill_unpartitioned_root_turned_to_partitioned():
     @asset
     def first():
@@ -292,3 +292,45 @@ def test_run_step_priority(concurrency_instance):
         time.sleep(0.1)
 
         assert low_context.claim("foo", "low_run_low_step", step_priority=-1)  # -1001
+
+
+def test_claim_batch(concurrency_instance):
+    run = concurrency_instance.create_run_for_job(define_foo_job(), run_id=make_new_run_id())
+    concurrency_instance.event_log_storage.set_concurrency_slots("foo", 2)
+
+    with InstanceConcurrencyContext(concurrency_instance, run) as context:
+        claimed = context.claim_batch(
+            [("foo", "a", 0), ("foo", "b", 0), ("foo", "c", 0), ("unlimited", "d", 0)]
+        )
+        assert claimed == {"a", "b"}
+        assert context.pending_claim_steps() == ["c"]
+
+        # claims made in the batch are reported without checking the storage again
+        assert context.claim("foo", "a")
+        assert context.claim("foo", "b")
+        assert context.claim("unlimited", "d")
+        assert not context.claim("foo", "c")
+        assert concurrency_instance.event_log_storage.get_check_calls("c") == 0
+
+    foo_info = concurrency_instance.event_log_storage.get_concurrency_info("foo")
+    assert foo_info.active_slot_count == 2
+    assert foo_info.pending_step_count == 0
+
+
+def test_free_step_wakes_pending_claims(concurrency_instance):
+    run = concurrency_instance.create_run_for_job(define_foo_job(), run_id=make_new_run_id())
+    concurrency_instance.event_log_storage.set_concurrency_slots("foo", 1)
+    concurrency_instance.event_log_storage.set_concurrency_slots("bar", 1)
+
+    with InstanceConcurrencyContext(concurrency_instance, run) as context:
+        assert context.claim("foo", "a")
+        assert context.claim("bar", "b")
+        assert not context.claim("foo", "c")
+        assert not context.claim("bar", "d")
+
+        # freeing a slot lets pending steps of the same key claim it without waiting for their
+        # backoff interval, leaving the pending steps of other keys alone
+        context.free_step("a")
+        assert context.claim("foo", "c")
+        assert not context.claim("bar", "d")
+        assert context.pending_claim_steps() == ["d"]
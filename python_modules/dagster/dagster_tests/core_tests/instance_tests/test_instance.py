@@ -1,6 +1,8 @@
+import logging
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -31,9 +33,15 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
+from dagster._core.instance.event_buffer import (
+    EventWriteBuffer,
+    PartialEventWriteError,
+    is_bufferable_event,
+)
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.snap import (
@@ -58,6 +66,7 @@
     instance_for_test,
     new_cwd,
 )
+from dagster._core.utils import make_new_run_id
 from dagster._daemon.asset_daemon import AssetDaemon
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
@@ -778,3 +787,145 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+@op
+def chatty_op(context):
+    for i in range(20):
+        context.log.info(f"message {i}")
+
+
+@job
+def chatty_job():
+    chatty_op()
+
+
+def test_event_write_buffer():
+    with environ({"DAGSTER_EVENT_BUFFER_MAX_DELAY_MS": "60000", "DAGSTER_EVENT_BUFFER_SIZE": "50"}):
+        with instance_for_test() as instance:
+            with patch.object(
+                instance.event_log_storage,
+                "store_event_batch",
+                wraps=instance.event_log_storage.store_event_batch,
+            ) as store_event_batch:
+                result = chatty_job.execute_in_process(instance=instance)
+                assert result.success
+
+            # log messages were written in batches flushed at step and run boundaries
+            assert store_event_batch.call_count < 5
+
+            records = instance.get_records_for_run(result.run_id).records
+            messages = [record.event_log_entry.user_message for record in records]
+            assert [message for message in messages if message.startswith("message ")] == [
+                f"message {i}" for i in range(20)
+            ]
+            assert records[-1].event_log_entry.dagster_event.event_type_value == "PIPELINE_SUCCESS"
+
+            # step starts and ends flush the buffer
+            step_events = [
+                record.event_log_entry
+                for record in records
+                if record.event_log_entry.dagster_event
+                and record.event_log_entry.dagster_event.event_type_value
+                in ("STEP_START", "STEP_SUCCESS")
+            ]
+            assert len(step_events) == 2
+            assert not any(is_bufferable_event(event) for event in step_events)
+
+
+def test_event_write_buffer_partial_fallback_write():
+    with environ({"DAGSTER_EVENT_BUFFER_MAX_DELAY_MS": "60000", "DAGSTER_EVENT_BUFFER_SIZE": "3"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            storage = instance.event_log_storage
+            store_event = storage.store_event
+            stored_messages = []
+
+            def _store_event(event):
+                message = event.get_dagster_event().message
+                if message == "second" and "second" not in stored_messages:
+                    stored_messages.append(message)
+                    raise Exception("storage unavailable")
+                stored_messages.append(message)
+                store_event(event)
+
+            with patch.object(
+                storage, "store_event_batch", side_effect=Exception("batch failed")
+            ), patch.object(storage, "store_event", side_effect=_store_event):
+                instance.report_engine_event("first", dagster_run=run)
+                instance.report_engine_event("second", dagster_run=run)
+                # filling the buffer flushes it, and the fallback fails after storing one event
+                with pytest.raises(PartialEventWriteError):
+                    instance.report_engine_event("third", dagster_run=run)
+
+                write_buffer = check.not_none(instance._get_event_write_buffer())  # noqa: SLF001
+                assert write_buffer.num_buffered == 2
+                write_buffer.flush()
+
+            # every event is stored exactly once
+            records = instance.get_records_for_run(run.run_id).records
+            assert [record.event_log_entry.get_dagster_event().message for record in records] == [
+                "first",
+                "second",
+                "third",
+            ]
+
+
+def _log_entry(message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level=logging.INFO,
+        user_message=message,
+        run_id=make_new_run_id(),
+        timestamp=time.time(),
+    )
+
+
+def test_event_write_buffer_keeps_events_on_failed_write():
+    stored = []
+    notified = []
+    store_fails = True
+
+    def _store_events(events):
+        if store_fails:
+            raise Exception("storage unavailable")
+        stored.extend(events)
+
+    write_buffer = EventWriteBuffer(
+        _store_events,
+        notified.extend,
+        max_size=2,
+        max_delay_seconds=60,
+        logger=logging.getLogger("dagster.instance"),
+    )
+    write_buffer.add([_log_entry("first")])
+    with pytest.raises(Exception, match="storage unavailable"):
+        write_buffer.add([_log_entry("second")])
+
+    assert write_buffer.num_buffered == 2
+    assert not notified
+
+    store_fails = False
+    write_buffer.close()
+    assert [event.user_message for event in stored] == ["first", "second"]
+    assert notified == stored
+    assert write_buffer.num_buffered == 0
+
+
+def test_event_write_buffer_flushes_after_delay():
+    with environ({"DAGSTER_EVENT_BUFFER_MAX_DELAY_MS": "10"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            instance.report_engine_event("engine event", dagster_run=run)
+            # engine events are held in the buffer rather than written synchronously
+            write_buffer = instance._get_event_write_buffer()  # noqa: SLF001
+            assert write_buffer
+            for _ in range(100):
+                if instance.get_records_for_run(run.run_id).records:
+                    break
+                time.sleep(0.05)
+            assert len(instance.get_records_for_run(run.run_id).records) == 1
+
+            instance.report_engine_event("another engine event", dagster_run=run)
+        # flushed when the instance is disposed
+        assert write_buffer.num_buffered == 0
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Iterator
 
+import mock
 import pytest
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.selector import JobSubsetSelector
@@ -295,6 +296,35 @@ def test_priority_on_malformed_tag(self, instance, workspace_context, job_handle
 
         assert self.get_run_ids(instance.run_launcher.queue()) == [bad_pri_run_id]
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=2, dequeue_use_threads=False),
+        ],
+    )
+    def test_priority_stops_loading_queued_runs(
+        self, instance, workspace_context, job_handle, daemon
+    ):
+        default_run_ids = [make_new_run_id() for _ in range(5)]
+        hi_pri_run_id, lo_pri_run_id = [make_new_run_id() for _ in range(2)]
+        for run_id in default_run_ids:
+            self.create_queued_run(instance, job_handle, run_id=run_id)
+        self.create_queued_run(
+            instance, job_handle, run_id=lo_pri_run_id, tags={PRIORITY_TAG: "-1"}
+        )
+        self.create_queued_run(instance, job_handle, run_id=hi_pri_run_id, tags={PRIORITY_TAG: "3"})
+
+        with mock.patch.object(instance, "get_runs", wraps=instance.get_runs) as get_runs:
+            list(daemon.run_iteration(workspace_context))
+
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            hi_pri_run_id,
+            default_run_ids[0],
+        ]
+        # the runs with a lower priority than the launched runs are never loaded
+        for call in get_runs.call_args_list:
+            assert call.args[0].tags != {PRIORITY_TAG: ["-1"]}
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
@@ -1139,3 +1169,97 @@ def instance(self, run_coordinator_config):
     @pytest.fixture()
     def daemon(self, page_size):
         return QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=page_size)
+
+    @pytest.fixture()
+    def tracking_daemon(self, page_size):
+        return QueuedRunCoordinatorDaemon(
+            interval_seconds=1,
+            page_size=page_size,
+            in_progress_runs_reconcile_interval_seconds=60,
+        )
+
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=1, dequeue_use_threads=False),
+        ],
+    )
+    def test_in_progress_runs_not_tracked_by_default(
+        self, instance, workspace_context, job_handle, daemon
+    ):
+        run_id_1, run_id_2 = [make_new_run_id() for _ in range(2)]
+        self.create_queued_run(instance, job_handle, run_id=run_id_1)
+        self.create_queued_run(instance, job_handle, run_id=run_id_2)
+
+        # without a reconcile interval, the in-progress runs are reloaded on each iteration and
+        # the event log is not read, so storages that can't track status changes still work
+        with mock.patch.object(
+            instance.event_log_storage,
+            "get_maximum_record_id",
+            side_effect=NotImplementedError(),
+        ):
+            list(daemon.run_iteration(workspace_context))
+            assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1]
+
+            instance.report_dagster_event(
+                DagsterEvent(event_type_value=DagsterEventType.RUN_SUCCESS.value, job_name="foo"),
+                run_id=run_id_1,
+            )
+            list(daemon.run_iteration(workspace_context))
+            assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1, run_id_2]
+
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=1, dequeue_use_threads=False),
+        ],
+    )
+    def test_in_progress_runs_tracked_from_status_changes(
+        self, instance, workspace_context, job_handle, tracking_daemon
+    ):
+        run_id_1, run_id_2 = [make_new_run_id() for _ in range(2)]
+        self.create_queued_run(instance, job_handle, run_id=run_id_1)
+        self.create_queued_run(instance, job_handle, run_id=run_id_2)
+
+        list(tracking_daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1]
+
+        with mock.patch.object(
+            instance, "get_run_records", wraps=instance.get_run_records
+        ) as get_run_records:
+            list(tracking_daemon.run_iteration(workspace_context))
+            assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1]
+
+            instance.report_dagster_event(
+                DagsterEvent(event_type_value=DagsterEventType.RUN_SUCCESS.value, job_name="foo"),
+                run_id=run_id_1,
+            )
+            list(tracking_daemon.run_iteration(workspace_context))
+            assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1, run_id_2]
+
+            # only the records of the runs whose status changed are reloaded
+            for call in get_run_records.call_args_list:
+                assert call.kwargs["filters"].run_ids
+
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=1, dequeue_use_threads=False),
+        ],
+    )
+    def test_in_progress_runs_reconciled(
+        self, instance, workspace_context, job_handle, tracking_daemon
+    ):
+        freeze_datetime = create_datetime(year=2024, month=2, day=21)
+        with freeze_time(freeze_datetime):
+            list(tracking_daemon.run_iteration(workspace_context))
+
+        # in-progress runs that were created without a status change event are only found once the
+        # in-progress runs are reconciled
+        self.create_run(instance, job_handle, status=DagsterRunStatus.STARTED)
+        queued_run_id = make_new_run_id()
+        self.create_queued_run(instance, job_handle, run_id=queued_run_id)
+        with freeze_time(freeze_datetime + datetime.timedelta(minutes=5)):
+            list(tracking_daemon.run_iteration(workspace_context))
+
+        assert instance.run_launcher.queue() == []
@@ -0,0 +1,110 @@
+import logging
+
+from dagster import AutomationCondition, DagsterInstance, Definitions, asset
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition import AutomationResult
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._time import get_current_datetime
+
+
+class CountingCondition(AutomationCondition):
+    evaluated_keys = []
+
+    @property
+    def requires_cursor(self) -> bool:
+        return False
+
+    def evaluate(self, context: AutomationContext) -> AutomationResult:
+        CountingCondition.evaluated_keys.append(context.key)
+        return AutomationResult(context, true_subset=context.candidate_subset)
+
+
+def _get_evaluator(defs: Definitions, max_workers=None) -> AutomationConditionEvaluator:
+    asset_graph = defs.get_asset_graph()
+    return AutomationConditionEvaluator(
+        asset_graph=asset_graph,
+        instance=DagsterInstance.ephemeral(),
+        entity_keys={
+            key
+            for key in asset_graph.all_asset_keys
+            if asset_graph.get(key).automation_condition is not None
+        },
+        evaluation_time=get_current_datetime(),
+        logger=logging.getLogger("dagster.automation_condition_evaluator_test"),
+        cursor=AssetDaemonCursor.empty(),
+        max_workers=max_workers,
+    )
+
+
+def _build_defs(condition: AutomationCondition, num_downstream: int) -> Definitions:
+    @asset
+    def upstream() -> None: ...
+
+    def _downstream(i: int):
+        @asset(name=f"downstream_{i}", deps=[upstream], automation_condition=condition)
+        def _asset() -> None: ...
+
+        return _asset
+
+    return Definitions(assets=[upstream, *[_downstream(i) for i in range(num_downstream)]])
+
+
+def test_dep_operand_evaluated_once_per_dep() -> None:
+    CountingCondition.evaluated_keys = []
+    defs = _build_defs(AutomationCondition.any_deps_match(CountingCondition()), 5)
+
+    results, requested = _get_evaluator(defs).evaluate()
+
+    # the operand is evaluated over the shared dep once, rather than once per downstream asset
+    assert len(CountingCondition.evaluated_keys) == 1
+    assert {subset.key.to_user_string() for subset in requested} == {
+        f"downstream_{i}" for i in range(5)
+    }
+    assert all(result.true_subset.size == 1 for result in results)
+
+
+def test_conditions_with_cursor_not_memoized() -> None:
+    class CursoredCountingCondition(CountingCondition):
+        @property
+        def requires_cursor(self) -> bool:
+            return True
+
+    CountingCondition.evaluated_keys = []
+    defs = _build_defs(AutomationCondition.any_deps_match(CursoredCountingCondition()), 5)
+
+    _get_evaluator(defs).evaluate()
+    assert len(CountingCondition.evaluated_keys) == 5
+
+
+def test_parallel_evaluation_matches_sequential() -> None:
+    @asset(automation_condition=AutomationCondition.eager())
+    def a() -> None: ...
+
+    @asset(automation_condition=AutomationCondition.eager())
+    def b() -> None: ...
+
+    @asset(deps=[a, b], automation_condition=AutomationCondition.eager())
+    def c() -> None: ...
+
+    @asset(deps=[a], automation_condition=AutomationCondition.eager())
+    def d() -> None: ...
+
+    @asset(deps=[c, d], automation_condition=AutomationCondition.missing())
+    def e() -> None: ...
+
+    defs = Definitions(assets=[a, b, c, d, e])
+
+    def _evaluate(max_workers):
+        results, requested = _get_evaluator(defs, max_workers=max_workers).evaluate()
+        return (
+            {result.key: (result.true_subset.size, result.value_hash) for result in results},
+            {subset.key for subset in requested},
+        )
+
+    sequential = _evaluate(None)
+    parallel = _evaluate(4)
+    assert sequential == parallel
+    assert len(sequential[0]) == 5
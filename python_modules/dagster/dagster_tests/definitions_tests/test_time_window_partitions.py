@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from typing import Optional, Sequence, cast
 
+import dagster._check as check
 import pytest
 from dagster import (
     DagsterInvalidDefinitionError,
@@ -20,6 +21,7 @@
 from dagster._check import CheckError
 from dagster._core.definitions.time_window_partitions import (
     BaseTimeWindowPartitionsSubset,
+    FixedPeriodSchedule,
     PartitionKeysTimeWindowPartitionsSubset,
     PersistedTimeWindow,
     ScheduleType,
@@ -33,6 +35,7 @@
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, parse_time_string
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
+from dagster._utils.schedules import cron_string_iterator
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -1847,3 +1850,138 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, timezone",
+    [
+        ("* * * * *", "UTC"),
+        ("*/15 * * * *", "UTC"),
+        ("30 * * * *", "Etc/GMT+5"),
+        ("0 0 * * *", "UTC"),
+        ("30 2 * * *", "America/New_York"),
+        ("0 1 * * *", "Europe/Berlin"),
+        ("15 3 * * 2", "Australia/Lord_Howe"),
+    ],
+)
+def test_fixed_period_schedule_matches_cron_iteration(cron_schedule: str, timezone: str) -> None:
+    start = create_datetime(2020, 1, 1, tz=timezone)
+    ticks = cron_string_iterator(start.timestamp(), cron_schedule, timezone)
+    anchor = next(ticks)
+    schedule = check.not_none(
+        FixedPeriodSchedule.from_cron_schedule(cron_schedule, timezone, anchor)
+    )
+
+    assert schedule.tick(0) == anchor
+    for index, tick in enumerate(ticks, start=1):
+        if index > 800:
+            break
+        fast_tick = schedule.tick(index)
+        # ticks that fall on a DST transition are left to cron iteration
+        if fast_tick is not None:
+            assert fast_tick.timestamp() == tick.timestamp()
+        assert schedule.index_at_or_after(tick.timestamp()) in (index, None)
+        assert schedule.index_at_or_after(tick.timestamp() - 1) in (index, None)
+        assert schedule.index_at_or_before(tick.timestamp()) in (index, None)
+        assert schedule.index_at_or_before(tick.timestamp() + 1) in (index, None)
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, timezone",
+    [
+        ("0 0 1 * *", "UTC"),
+        ("*/7 * * * *", "UTC"),
+        ("*/15 3 * * *", "UTC"),
+        ("0 9-17 * * *", "UTC"),
+        ("0 * * * *", "America/New_York"),
+        ("*/15 * * * *", "Europe/Berlin"),
+    ],
+)
+def test_fixed_period_schedule_unsupported(cron_schedule: str, timezone: str) -> None:
+    anchor = next(cron_string_iterator(0, cron_schedule, timezone))
+    assert FixedPeriodSchedule.from_cron_schedule(cron_schedule, timezone, anchor) is None
+
+
+def test_fixed_period_partitions_many_partitions() -> None:
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="*/5 * * * *",
+        start="2020-01-01-00:00",
+        fmt="%Y-%m-%d-%H:%M",
+        end_offset=1,
+    )
+    current_time = create_datetime(2024, 1, 1, 0, 2)
+    # 4 years including one leap day, plus the in-progress partition
+    num_partitions = (365 * 4 + 1) * 24 * 12 + 1
+
+    assert partitions_def.get_num_partitions(current_time) == num_partitions
+    assert partitions_def.get_partition_keys_between_indexes(
+        num_partitions - 2, num_partitions + 10, current_time
+    ) == ["2023-12-31-23:55", "2024-01-01-00:00"]
+    assert partitions_def.get_last_partition_key(current_time) == "2024-01-01-00:00"
+    assert partitions_def.has_partition_key("2022-06-15-13:35", current_time)
+    assert not partitions_def.has_partition_key("2022-06-15-13:36", current_time)
+    assert not partitions_def.has_partition_key("2024-01-01-00:05", current_time)
+    assert partitions_def.get_partition_key_for_timestamp(
+        create_datetime(2022, 6, 15, 13, 39).timestamp()
+    ) == ("2022-06-15-13:35")
+    with freeze_time(current_time):
+        assert [
+            tw.start
+            for tw in partitions_def.time_windows_for_partition_keys(
+                frozenset(["2023-12-31-23:55", "2020-01-01-00:00", "2024-01-01-00:05"])
+            )
+        ] == [create_datetime(2020, 1, 1), create_datetime(2023, 12, 31, 23, 55)]
+
+
+def test_fixed_minute_interval_with_fixed_hour() -> None:
+    # the minute interval only applies within the 3 o'clock hour, so the partitions are not spaced
+    # 15 minutes apart
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="*/15 3 * * *",
+        start="2024-01-01-00:00",
+        fmt="%Y-%m-%d-%H:%M",
+    )
+    current_time = create_datetime(2024, 1, 2, 4)
+
+    assert partitions_def.get_partition_keys(current_time) == [
+        "2024-01-01-03:00",
+        "2024-01-01-03:15",
+        "2024-01-01-03:30",
+        "2024-01-01-03:45",
+        "2024-01-02-03:00",
+        "2024-01-02-03:15",
+        "2024-01-02-03:30",
+    ]
+    assert partitions_def.get_num_partitions(current_time) == 7
+    assert partitions_def.has_partition_key("2024-01-01-03:45", current_time)
+    assert not partitions_def.has_partition_key("2024-01-01-04:00", current_time)
+
+
+def test_fixed_period_partitions_dst_transitions() -> None:
+    # 02:30 does not exist on the day of the spring DST transition, so the partition keys around it
+    # come from cron iteration
+    partitions_def = DailyPartitionsDefinition(
+        start_date="2021-01-01-00:00",
+        hour_offset=2,
+        minute_offset=30,
+        timezone="America/New_York",
+        fmt="%Y-%m-%d-%H:%M",
+    )
+    current_time = create_datetime(2022, 1, 1, 3, tz="America/New_York")
+    partition_keys = partitions_def.get_partition_keys(current_time)
+
+    assert len(partition_keys) == 365
+    assert partitions_def.get_num_partitions(current_time) == 365
+    assert partition_keys[71:74] == ["2021-03-13-02:30", "2021-03-14-03:00", "2021-03-15-02:30"]
+    assert (
+        partitions_def.get_partition_keys_between_indexes(70, 75, current_time)
+        == (partition_keys[70:75])
+    )
+    for partition_key in partition_keys:
+        assert partitions_def.has_partition_key(partition_key, current_time)
+        assert (
+            partitions_def.time_window_for_partition_key(partition_key).start.strftime(
+                "%Y-%m-%d-%H:%M"
+            )
+            == partition_key
+        )
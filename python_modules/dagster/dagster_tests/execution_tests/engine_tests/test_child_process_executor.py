@@ -11,7 +11,11 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
+    ChildProcessWorkerRetiringEvent,
     execute_child_process_command,
+    execute_child_process_worker_command,
 )
 from dagster._utils import segfault
 
@@ -51,6 +55,74 @@ def execute(self):
         yield 1
 
 
+class DoubleAStringWorker(ChildProcessWorker):
+    def __init__(self, max_commands):
+        self.max_commands = max_commands
+        self.commands_executed = 0
+
+    def execute(self, command):
+        if command == "error":
+            raise AnError("Oh noes!")
+        self.commands_executed += 1
+        yield (os.getpid(), command + command)
+
+    def should_exit(self):
+        return self.commands_executed >= self.max_commands
+
+
+def _worker_results(handle, command):
+    return list(
+        filter(
+            lambda x: x and not isinstance(x, (ChildProcessEvent, BaseProcess)),
+            execute_child_process_worker_command(handle, command),
+        )
+    )
+
+
+def test_child_process_worker_pool():
+    with ChildProcessWorkerPool(
+        multiprocessing, lambda _term_event: DoubleAStringWorker(max_commands=2), max_workers=1
+    ) as pool:
+        handle = pool.acquire()
+        [(first_pid, first_result)] = _worker_results(handle, "aa")
+        assert first_result == "aaaa"
+        assert first_pid != os.getpid()
+        pool.release(handle)
+
+        # the idle worker is reused for the next command
+        handle = pool.acquire()
+        events = list(filter(lambda x: x, execute_child_process_worker_command(handle, "bb")))
+        assert (first_pid, "bbbb") in events
+        assert any(isinstance(event, ChildProcessWorkerRetiringEvent) for event in events)
+        pool.release(handle)
+        assert pool.num_workers == 0
+
+        # the retired worker is replaced by a new process
+        handle = pool.acquire()
+        [(second_pid, _)] = _worker_results(handle, "cc")
+        assert second_pid != first_pid
+        pool.release(handle)
+
+
+def test_child_process_worker_pool_uncaught_exception():
+    with ChildProcessWorkerPool(
+        multiprocessing, lambda _term_event: DoubleAStringWorker(max_commands=10), max_workers=1
+    ) as pool:
+        handle = pool.acquire()
+        results = list(
+            filter(
+                lambda x: x and isinstance(x, ChildProcessSystemErrorEvent),
+                execute_child_process_worker_command(handle, "error"),
+            )
+        )
+        assert len(results) == 1
+        assert "AnError" in str(results[0].error_info.message)
+
+        # workers are not reused after an error
+        pool.release(handle)
+        assert pool.num_workers == 0
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
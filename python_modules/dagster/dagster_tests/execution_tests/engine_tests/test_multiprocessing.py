@@ -107,6 +107,59 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def _worker_pids(result) -> list:
+    return [
+        event.event_specific_data.metadata["pid"].value
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    ]
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 1, "worker_pool": {}}}},
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            pids = _worker_pids(result)
+            assert len(pids) == 4
+            # a single worker process executed every step
+            assert len(set(pids)) == 1
+            assert pids[0] != str(os.getpid())
+
+
+def test_worker_pool_max_steps_per_worker():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            pids = _worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids)) == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -439,6 +492,21 @@ def test_crash_multiprocessing():
             # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            instance=instance,
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @op
 def segfault_op(context):
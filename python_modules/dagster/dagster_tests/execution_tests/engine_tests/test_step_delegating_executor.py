@@ -169,6 +169,33 @@ def test_execute_with_tailer_offset():
     assert TestStepHandler.verify_step_count == 0
 
 
+@pytest.mark.parametrize("event_channel", ["socket", "file"])
+def test_execute_with_event_channel(event_channel):
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start_time = time.time()
+        result = execute_job(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "event_channel": event_channel,
+                        # step completions are only picked up this quickly if the step workers
+                        # notify the executor
+                        "event_channel_fallback_poll_seconds": 60.0,
+                        "sleep_seconds": 0.5,
+                    }
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+    assert time.time() - start_time < 60
+
+
 def test_skip_execute():
     from dagster_tests.execution_tests.engine_tests.test_jobs import define_dynamic_skipping_job
 
@@ -0,0 +1,73 @@
+import pytest
+from dagster._core.executor.step_delegating.step_delegating_executor import _SeenStorageIds
+from dagster._core.executor.step_delegating.step_event_channel import (
+    FileStepEventChannel,
+    SocketStepEventChannel,
+    notify_step_event_channel,
+    open_step_event_channel,
+)
+from dagster._grpc.types import StepEventChannelAddress
+
+
+@pytest.mark.parametrize("transport", ["socket", "file"])
+def test_step_event_channel(transport):
+    with open_step_event_channel(transport) as channel:
+        assert channel.address.transport == transport
+        assert not channel.wait(0.1)
+
+        assert notify_step_event_channel(channel.address, "foo STEP_SUCCESS")
+        assert notify_step_event_channel(channel.address, "bar STEP_SUCCESS")
+
+        # a burst of notifications is consumed at once
+        assert channel.wait(5)
+        assert not channel.wait(0.1)
+
+
+def test_socket_step_event_channel_host():
+    with SocketStepEventChannel(host="127.0.0.1") as channel:
+        host, port = channel.address.location.split(":")
+        assert host == "127.0.0.1"
+        assert int(port) > 0
+
+
+def test_file_step_event_channel_cleanup(tmp_path):
+    with FileStepEventChannel() as channel:
+        location = channel.address.location
+    assert not (tmp_path / location).exists()
+
+    # directories that are passed in are left in place
+    with FileStepEventChannel(str(tmp_path)) as channel:
+        assert notify_step_event_channel(channel.address, "foo STEP_SUCCESS")
+    assert tmp_path.exists()
+
+
+def test_notify_unreachable_channel(tmp_path):
+    assert not notify_step_event_channel(
+        StepEventChannelAddress("file", str(tmp_path / "missing")), "foo STEP_SUCCESS"
+    )
+    assert not notify_step_event_channel(StepEventChannelAddress("unknown", ""), "foo")
+
+
+def test_seen_storage_ids():
+    seen = _SeenStorageIds(window=0)
+    assert 1 not in seen
+    seen.update([1, 2, 3])
+    assert 1 in seen
+    assert 3 in seen
+    assert 4 not in seen
+    assert len(seen) == 0
+
+    # with an offset cursor, events within the window can be read again and are tracked
+    seen = _SeenStorageIds(window=10)
+    seen.update(range(1, 101))
+    assert len(seen) == 10
+    assert 50 in seen
+    assert 95 in seen
+    assert 101 not in seen
+
+    # events committed out of order within the window are not considered seen
+    seen = _SeenStorageIds(window=10)
+    seen.update([1, 2, 4, 5])
+    assert 3 not in seen
+    seen.update([3])
+    assert 3 in seen
@@ -29,3 +29,32 @@ def test_import_perf():
 
     # one way to debug imports is to `pip install tuna` then run
     # python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="fails on windows, unix coverage sufficient")
+def test_api_cli_import_perf():
+    # `dagster api execute_run` / `execute_step` are launched once per run or step, so the api
+    # commands should not pay for importing the other CLI commands or the code server. The import
+    # time itself is measured by dagster_test/benchmarks/api_cli_import.py.
+    result = subprocess.run(
+        [
+            "python",
+            "-X",
+            "importtime",
+            "-c",
+            "import dagster; from dagster._cli import cli; cli.get_command(None, 'api')",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    import_profile = result.stderr.decode("utf-8")
+
+    for module in [
+        "dagster._cli.instance",
+        "dagster._cli.job",
+        "dagster._cli.project",
+        "dagster._cli.code_server",
+        "dagster._cli.workspace.cli_target",
+        "dagster._core.storage.migration",
+    ]:
+        assert not any(line.endswith(f" {module}") for line in import_profile.splitlines()), module
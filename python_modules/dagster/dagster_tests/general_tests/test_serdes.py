@@ -21,8 +21,12 @@
     WhitelistMap,
     _whitelist_for_serdes,
     deserialize_value,
+    deserialize_value_from_binary,
+    is_binary_serialized_value,
     pack_value,
     serialize_value,
+    serialize_value_to_binary,
+    serialize_value_to_binary_string,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -1127,3 +1131,122 @@ def foo(self):
     assert (
         deserialize_value(serialize_value(r, whitelist_map=test_env), whitelist_map=test_env) == r
     )
+
+
+def test_binary_round_trip() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+        BLUE = "BLUE"
+
+    @_whitelist_for_serdes(
+        test_env, storage_field_names={"color": "colour"}, old_fields={"x": None}
+    )
+    class Bar(NamedTuple):
+        color: Color
+        tags: AbstractSet[str]
+
+    @_whitelist_for_serdes(test_env, skip_when_empty_fields={"extra"})
+    class Foo(
+        NamedTuple(
+            "_Foo",
+            [
+                ("name", str),
+                ("bars", Sequence[Bar]),
+                ("by_bar", Mapping[Bar, int]),
+                ("extra", Optional[List[str]]),
+            ],
+        )
+    ):
+        def __new__(cls, name, bars, by_bar, extra=None):
+            return super(Foo, cls).__new__(
+                cls, name, bars, SerializableNonScalarKeyMapping(by_bar), extra
+            )
+
+    bars = [Bar(Color.RED, frozenset({"a", "b"})), Bar(Color.BLUE, frozenset({"c"}))]
+    val = {
+        "foo": Foo("foo", bars, SerializableNonScalarKeyMapping({bars[0]: 1})),
+        "values": [None, True, False, 0, -1, 127, 2**70, -(2**70), 1.5, "", "\u00e9" * 200],
+        "nested": {"a": [{"b": {"c": "d"}}], "e": (1, 2)},
+        "sets": [set(), frozenset(), {1, 2}],
+    }
+
+    serialized = serialize_value_to_binary(val, whitelist_map=test_env)
+    assert is_binary_serialized_value(serialized)
+    assert not is_binary_serialized_value(serialize_value(val, whitelist_map=test_env).encode())
+
+    deserialized = deserialize_value_from_binary(serialized, whitelist_map=test_env)
+    assert deserialized == deserialize_value(
+        serialize_value(val, whitelist_map=test_env), whitelist_map=test_env
+    )
+    # the binary format is a different encoding of the same packed representation
+    assert serialize_value(deserialized, whitelist_map=test_env) == serialize_value(
+        val, whitelist_map=test_env
+    )
+
+
+def test_binary_string_round_trip() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+
+    val = [Foo("red"), Foo("blue"), Foo("red")]
+    serialized = serialize_value_to_binary_string(val, whitelist_map=test_env)
+    assert isinstance(serialized, str)
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+    assert deserialize_value(serialized, as_type=list, whitelist_map=test_env) == val
+
+    with pytest.raises(DeserializationError, match="was not expected type"):
+        deserialize_value(serialized, as_type=Foo, whitelist_map=test_env)
+
+
+def test_binary_custom_serializer() -> None:
+    test_env = WhitelistMap.create()
+
+    class FooSerializer(NamedTupleSerializer):
+        def pack_items(self, *args, **kwargs):
+            for k, v in super().pack_items(*args, **kwargs):
+                if k == "color":
+                    yield "colour", v
+                else:
+                    yield k, v
+
+        def before_unpack(self, context, unpacked_dict: Dict[str, Any]):
+            unpacked_dict["color"] = unpacked_dict["colour"]
+            del unpacked_dict["colour"]
+            return unpacked_dict
+
+    @_whitelist_for_serdes(whitelist_map=test_env, serializer=FooSerializer)
+    class Foo(NamedTuple):
+        color: str
+
+    val = Foo("red")
+    serialized = serialize_value_to_binary(val, whitelist_map=test_env)
+    assert deserialize_value_from_binary(serialized, Foo, whitelist_map=test_env) == val
+
+
+def test_binary_errors() -> None:
+    test_env = WhitelistMap.create()
+    blank_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+
+    serialized = serialize_value_to_binary(Foo("red"), whitelist_map=test_env)
+
+    with pytest.raises(
+        DeserializationError,
+        match='Attempted to deserialize class "Foo" which is not in the whitelist',
+    ):
+        deserialize_value_from_binary(serialized, whitelist_map=blank_env)
+
+    with pytest.raises(DeserializationError):
+        deserialize_value_from_binary(serialized[:-2], whitelist_map=test_env)
+
+    with pytest.raises(DeserializationError):
+        deserialize_value_from_binary(b'{"foo": "bar"}', whitelist_map=test_env)
@@ -0,0 +1,142 @@
+from typing import Optional
+
+import mock
+from dagster import AssetKey, DagsterInstance, DailyPartitionsDefinition, asset, materialize
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.storage.dagster_run import DagsterRunStatus
+from dagster._core.test_utils import create_run_for_test
+from dagster._time import get_current_datetime
+from dagster._utils.caching_instance_queryer import (
+    CachingInstanceQueryer,
+    InstanceQueryerCache,
+    InstanceQueryerCacheMetrics,
+)
+
+daily_partitions_def = DailyPartitionsDefinition(start_date="2024-01-01")
+
+
+@asset
+def unpartitioned():
+    pass
+
+
+@asset(partitions_def=daily_partitions_def)
+def partitioned():
+    pass
+
+
+asset_graph = AssetGraph.from_assets([unpartitioned, partitioned])
+
+
+def _get_queryer_for_tick(
+    instance: DagsterInstance, cache: Optional[InstanceQueryerCache]
+) -> CachingInstanceQueryer:
+    last_event_id = instance.event_log_storage.get_maximum_record_id()
+    if cache is not None:
+        cache.refresh(instance, last_event_id)
+    return AssetGraphView(
+        temporal_context=TemporalContext(
+            effective_dt=get_current_datetime(), last_event_id=last_event_id
+        ),
+        instance=instance,
+        asset_graph=asset_graph,
+        queryer_cache=cache,
+    ).get_inner_queryer_for_back_compat()
+
+
+def _query_assets(queryer: CachingInstanceQueryer):
+    return (
+        queryer.get_latest_materialization_or_observation_storage_id(
+            AssetKeyPartitionKey(unpartitioned.key)
+        ),
+        queryer.get_latest_materialization_or_observation_storage_id(
+            AssetKeyPartitionKey(partitioned.key, "2024-01-01")
+        ),
+        queryer.get_materialized_asset_subset(asset_key=partitioned.key).value,
+    )
+
+
+def test_queryer_cache_across_ticks():
+    with DagsterInstance.ephemeral() as instance:
+        materialize([unpartitioned], instance=instance)
+        materialize([partitioned], instance=instance, partition_key="2024-01-01")
+
+        cache = InstanceQueryerCache()
+        first_results = _query_assets(_get_queryer_for_tick(instance, cache))
+        assert first_results == _query_assets(_get_queryer_for_tick(instance, None))
+        assert cache.metrics.hits == 0
+
+        # no new events, so the next tick is served from the cache
+        with mock.patch.object(
+            instance,
+            "get_latest_storage_id_by_partition",
+            wraps=instance.get_latest_storage_id_by_partition,
+        ) as get_latest_storage_id_by_partition:
+            misses = cache.metrics.misses
+            assert _query_assets(_get_queryer_for_tick(instance, cache)) == first_results
+            assert cache.metrics.misses == misses
+            assert cache.metrics.hits > 0
+            assert get_latest_storage_id_by_partition.call_count == 0
+
+        # a new materialization of one asset only evicts that asset
+        materialize([partitioned], instance=instance, partition_key="2024-01-02")
+        assert cache.refresh(instance, instance.event_log_storage.get_maximum_record_id()) == {
+            partitioned.key
+        }
+        assert cache.metrics.invalidations == 1
+
+        queryer = _get_queryer_for_tick(instance, cache)
+        assert _query_assets(queryer) == _query_assets(_get_queryer_for_tick(instance, None))
+        assert set(
+            queryer.get_materialized_asset_subset(
+                asset_key=partitioned.key
+            ).value.get_partition_keys()
+        ) == {"2024-01-01", "2024-01-02"}
+
+
+def test_queryer_cache_finished_runs():
+    with DagsterInstance.ephemeral() as instance:
+        cache = InstanceQueryerCache()
+        in_progress_run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+        finished_run = create_run_for_test(instance, status=DagsterRunStatus.SUCCESS)
+
+        queryer = _get_queryer_for_tick(instance, cache)
+        assert queryer.run_has_tag(in_progress_run.run_id, "foo", None) is False
+        assert queryer.run_has_tag(finished_run.run_id, "foo", None) is False
+
+        # only the record of the finished run is cached
+        instance.add_run_tags(in_progress_run.run_id, {"foo": "bar"})
+        queryer = _get_queryer_for_tick(instance, cache)
+        assert queryer.run_has_tag(in_progress_run.run_id, "foo", "bar") is True
+        assert queryer.run_has_tag(finished_run.run_id, "foo", None) is False
+        assert len(cache) == 1
+
+
+def test_queryer_cache_lru_eviction():
+    cache = InstanceQueryerCache(max_entries=2)
+    cache.set(AssetKey("a"), "key", 1)
+    cache.set(AssetKey("b"), "key", 2)
+    assert cache.get_or_compute(AssetKey("a"), "key", lambda: 0) == 1
+    cache.set(AssetKey("c"), "key", 3)
+
+    # b is the least recently used
+    assert cache.get_or_compute(AssetKey("b"), "key", lambda: 0) == 0
+    assert cache.get_or_compute(AssetKey("c"), "key", lambda: 0) == 3
+    assert len(cache) == 2
+    assert cache.metrics == InstanceQueryerCacheMetrics(
+        hits=2, misses=1, evictions=2, invalidations=0
+    )
+
+
+def test_queryer_cache_cleared_after_wipe():
+    with DagsterInstance.ephemeral() as instance:
+        materialize([unpartitioned], instance=instance)
+        cache = InstanceQueryerCache()
+        cache.refresh(instance, instance.event_log_storage.get_maximum_record_id())
+        cache.set(unpartitioned.key, "key", 1)
+
+        # the event log storage ids went backwards, so nothing cached can be trusted
+        assert cache.refresh(instance, 0) == set()
+        assert len(cache) == 0
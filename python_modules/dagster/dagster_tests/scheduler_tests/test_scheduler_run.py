@@ -5,6 +5,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Dict, Optional, Sequence, cast
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -63,7 +64,11 @@
 from dagster._grpc.client import DagsterGrpcClient
 from dagster._grpc.server import open_server_process
 from dagster._record import copy
-from dagster._scheduler.scheduler import ScheduleIterationTimes, launch_scheduled_runs
+from dagster._scheduler.scheduler import (
+    ScheduleIterationTimes,
+    _get_schedule_tick_times,
+    launch_scheduled_runs,
+)
 from dagster._time import create_datetime, get_current_datetime, get_current_timestamp, get_timezone
 from dagster._utils import DebugCrashFlags
 from dagster._utils.error import SerializableErrorInfo
@@ -2151,6 +2156,104 @@ def test_bad_schedules_mixed_with_good_schedule(
             )
             assert len(unloadable_ticks) == 0
 
+    @pytest.mark.parametrize("executor", get_schedule_executors())
+    def test_schedules_evaluated_in_batch(
+        self,
+        scheduler_instance: DagsterInstance,
+        workspace_context: WorkspaceProcessContext,
+        external_repo: ExternalRepository,
+        executor: ThreadPoolExecutor,
+    ):
+        good_schedule = external_repo.get_external_schedule("simple_schedule")
+        skipped_schedule = external_repo.get_external_schedule("skip_schedule")
+        bad_schedule = external_repo.get_external_schedule("bad_should_execute_schedule")
+
+        original_batch = GrpcServerCodeLocation.get_external_schedule_execution_data_batch
+        batch_sizes = []
+
+        def _counting_batch(code_location, instance, schedule_execution_requests):
+            batch_sizes.append(len(schedule_execution_requests))
+            return original_batch(code_location, instance, schedule_execution_requests)
+
+        freeze_datetime = feb_27_2019_start_of_day()
+        with freeze_time(freeze_datetime):
+            scheduler_instance.start_schedule(good_schedule)
+            scheduler_instance.start_schedule(skipped_schedule)
+            scheduler_instance.start_schedule(bad_schedule)
+
+            with mock.patch.object(
+                GrpcServerCodeLocation,
+                "get_external_schedule_execution_data_batch",
+                _counting_batch,
+            ), mock.patch.object(
+                GrpcServerCodeLocation,
+                "get_external_schedule_execution_data",
+                side_effect=Exception("Schedule should have been evaluated in a batch"),
+            ), mock.patch(
+                "dagster._scheduler.scheduler._get_schedule_tick_times",
+                wraps=_get_schedule_tick_times,
+            ) as get_tick_times_mock:
+                evaluate_schedules(workspace_context, executor, get_current_datetime())
+
+            assert batch_sizes == [3]
+            # the tick times computed for the batch are reused when each schedule is launched
+            assert get_tick_times_mock.call_count == 3
+
+            assert scheduler_instance.get_runs_count() == 1
+            wait_for_all_runs_to_start(scheduler_instance)
+            good_ticks = scheduler_instance.get_ticks(
+                good_schedule.get_external_origin_id(), good_schedule.selector_id
+            )
+            assert len(good_ticks) == 1
+            validate_tick(
+                good_ticks[0],
+                good_schedule,
+                freeze_datetime,
+                TickStatus.SUCCESS,
+                [run.run_id for run in scheduler_instance.get_runs()],
+            )
+            assert good_ticks[0].log_key == [
+                good_schedule.handle.repository_name,
+                good_schedule.name,
+                str(good_ticks[0].tick_id),
+            ]
+
+            skipped_ticks = scheduler_instance.get_ticks(
+                skipped_schedule.get_external_origin_id(), skipped_schedule.selector_id
+            )
+            assert len(skipped_ticks) == 1
+            assert skipped_ticks[0].status == TickStatus.SKIPPED
+
+            bad_ticks = scheduler_instance.get_ticks(
+                bad_schedule.get_external_origin_id(), bad_schedule.selector_id
+            )
+            assert len(bad_ticks) == 1
+            assert bad_ticks[0].status == TickStatus.FAILURE
+            assert "bananas" in str(bad_ticks[0].error)
+
+        freeze_datetime = freeze_datetime + relativedelta(days=1)
+        with freeze_time(freeze_datetime):
+            # code servers that can't evaluate schedules in batches evaluate them one at a time
+            with mock.patch.object(
+                GrpcServerCodeLocation,
+                "get_external_schedule_execution_data_batch",
+                return_value=iter([]),
+            ):
+                evaluate_schedules(workspace_context, executor, get_current_datetime())
+
+            assert scheduler_instance.get_runs_count() == 2
+            good_ticks = scheduler_instance.get_ticks(
+                good_schedule.get_external_origin_id(), good_schedule.selector_id
+            )
+            assert len(good_ticks) == 2
+            assert good_ticks[0].status == TickStatus.SUCCESS
+
+            skipped_ticks = scheduler_instance.get_ticks(
+                skipped_schedule.get_external_origin_id(), skipped_schedule.selector_id
+            )
+            assert len(skipped_ticks) == 2
+            assert skipped_ticks[0].status == TickStatus.SKIPPED
+
     @pytest.mark.parametrize("executor", get_schedule_executors())
     def test_run_scheduled_on_time_boundary(
         self,
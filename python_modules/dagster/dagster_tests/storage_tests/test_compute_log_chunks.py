@@ -0,0 +1,217 @@
+import os
+import sys
+import tempfile
+from typing import Optional, Sequence
+
+import pytest
+from dagster._core.execution.compute_logs import should_disable_io_stream_redirect
+from dagster._core.storage.cloud_storage_compute_log_manager import CloudStorageComputeLogManager
+from dagster._core.storage.compute_log_chunks import (
+    COMPUTE_LOG_CHUNK_INDEX_NAME,
+    ComputeLogChunkIndex,
+    read_chunked_log,
+    write_chunked_log,
+)
+from dagster._core.storage.compute_log_manager import ComputeIOType
+from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+
+
+class _RecordingChunkStore:
+    def __init__(self):
+        self.chunks = {}
+        self.writes = []
+        self.reads = []
+
+    def write(self, chunk_name: str, data: bytes) -> None:
+        self.writes.append(chunk_name)
+        self.chunks[chunk_name] = data
+
+    def read(self, chunk_name: str) -> Optional[bytes]:
+        self.reads.append(chunk_name)
+        return self.chunks.get(chunk_name)
+
+
+def test_write_chunked_log_only_writes_new_chunks():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "log.out")
+        store = _RecordingChunkStore()
+
+        with open(path, "wb") as f:
+            f.write(b"a" * 25)
+        index = write_chunked_log(path, None, store.write, chunk_size=10)
+        assert [(chunk.offset, chunk.length) for chunk in index.chunks] == [
+            (0, 10),
+            (10, 10),
+            (20, 5),
+        ]
+        assert not index.complete
+        assert store.writes == [
+            "00000000.gz",
+            "00000001.gz",
+            "00000002.gz",
+            COMPUTE_LOG_CHUNK_INDEX_NAME,
+        ]
+
+        store.writes = []
+        with open(path, "ab") as f:
+            f.write(b"b" * 20)
+        index = write_chunked_log(path, index, store.write, chunk_size=10, complete=True)
+        assert [(chunk.offset, chunk.length) for chunk in index.chunks] == [
+            (0, 10),
+            (10, 10),
+            (20, 10),
+            (30, 10),
+            (40, 5),
+        ]
+        assert index.complete
+        # the full chunks are not rewritten, only the partially filled one and the new ones
+        assert sorted(store.writes) == [
+            "00000002.gz",
+            "00000003.gz",
+            "00000004.gz",
+            COMPUTE_LOG_CHUNK_INDEX_NAME,
+        ]
+        assert store.writes[-1] == COMPUTE_LOG_CHUNK_INDEX_NAME
+
+        assert (
+            ComputeLogChunkIndex.from_json(
+                store.chunks[COMPUTE_LOG_CHUNK_INDEX_NAME].decode("utf-8")
+            )
+            == index
+        )
+
+
+def test_read_chunked_log_ranges():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "log.out")
+        content = bytes(range(256)) * 3
+        with open(path, "wb") as f:
+            f.write(content)
+
+        store = _RecordingChunkStore()
+        index = write_chunked_log(path, None, store.write, chunk_size=100)
+        assert index.total_length == len(content)
+
+        for offset in [0, 1, 99, 100, 101, 350, len(content) - 1, len(content), len(content) + 5]:
+            for max_bytes in [None, 0, 1, 50, 100, 250, 1000]:
+                data, new_offset = read_chunked_log(index, store.read, offset, max_bytes)
+                expected = content[offset:] if max_bytes is None else content[offset:][:max_bytes]
+                assert data == expected
+                assert new_offset == offset + len(expected)
+
+        # a cursor read only fetches the chunks that overlap the requested range
+        store.reads = []
+        data, new_offset = read_chunked_log(index, store.read, 450, 100)
+        assert data == content[450:550]
+        assert new_offset == 550
+        assert store.reads == ["00000004.gz", "00000005.gz"]
+
+
+class FilesystemChunkedComputeLogManager(CloudStorageComputeLogManager):
+    """Uploads logs in the chunked format to a second local directory, standing in for an object
+    store.
+    """
+
+    def __init__(self, local_dir: str, remote_dir: str, chunk_size: int):
+        self._local_manager = LocalComputeLogManager(local_dir)
+        self._remote_manager = LocalComputeLogManager(remote_dir)
+        self._chunk_size = chunk_size
+
+    @property
+    def local_manager(self) -> LocalComputeLogManager:
+        return self._local_manager
+
+    @property
+    def remote_manager(self) -> LocalComputeLogManager:
+        return self._remote_manager
+
+    @property
+    def upload_interval(self) -> Optional[int]:
+        return None
+
+    @property
+    def upload_chunk_size(self) -> Optional[int]:
+        return self._chunk_size
+
+    def delete_logs(
+        self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
+    ) -> None:
+        self._local_manager.delete_logs(log_key=log_key, prefix=prefix)
+        self._remote_manager.delete_logs(log_key=log_key, prefix=prefix)
+
+    def download_url_for_type(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        return self._remote_manager.get_captured_local_chunk_dir(log_key, io_type)
+
+    def display_path_for_type(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        return self._remote_manager.get_captured_local_chunk_dir(log_key, io_type)
+
+    def cloud_storage_has_logs(
+        self, log_key: Sequence[str], io_type: ComputeIOType, partial: bool = False
+    ) -> bool:
+        return self._remote_manager.get_log_chunk_index(log_key, io_type) is not None
+
+    def upload_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, partial: bool = False
+    ) -> None:
+        raise Exception("Whole log files should not be uploaded in the chunked format")
+
+    def upload_chunk_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ) -> None:
+        self._remote_manager.write_log_chunk(log_key, io_type, chunk_name, data)
+
+    def download_chunk_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> Optional[bytes]:
+        return self._remote_manager.read_log_chunk(log_key, io_type, chunk_name)
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_chunked_cloud_storage_compute_log_manager():
+    with tempfile.TemporaryDirectory() as local_dir, tempfile.TemporaryDirectory() as remote_dir:
+        manager = FilesystemChunkedComputeLogManager(local_dir, remote_dir, chunk_size=16)
+        log_key = ["arbitrary", "log", "key"]
+
+        with manager.capture_logs(log_key):
+            print("HELLO WORLD " * 10)  # noqa: T201
+            print("HELLO ERROR", file=sys.stderr)  # noqa: T201
+            manager.on_progress(log_key)
+            partial_index = manager.get_cloud_storage_chunk_index(log_key, ComputeIOType.STDOUT)
+            assert partial_index
+            assert not partial_index.complete
+            print("GOODBYE")  # noqa: T201
+
+        expected_stdout = ("HELLO WORLD " * 10 + "\n" + "GOODBYE\n").encode("utf-8")
+        stdout_index = manager.get_cloud_storage_chunk_index(log_key, ComputeIOType.STDOUT)
+        assert stdout_index
+        assert stdout_index.complete
+        assert stdout_index.total_length == len(expected_stdout)
+
+        # remove the local copy so that logs are read from the chunks in "cloud storage"
+        manager.local_manager.delete_logs(log_key=log_key)
+        assert not manager.local_manager.is_capture_complete(log_key)
+        assert manager.is_capture_complete(log_key)
+
+        log_data = manager.get_log_data(log_key)
+        assert log_data.stdout == expected_stdout
+        assert log_data.stderr == b"HELLO ERROR\n"
+
+        # tail the logs by cursor
+        stdout = b""
+        cursor = None
+        while True:
+            log_data = manager.get_log_data(log_key, cursor=cursor, max_bytes=20)
+            if not log_data.stdout:
+                break
+            stdout += log_data.stdout
+            cursor = log_data.cursor
+        assert stdout == expected_stdout
+
+        # the local compute log manager reads the same format
+        assert manager.remote_manager.get_log_data(log_key).stdout == expected_stdout
+
+        manager.delete_logs(log_key=log_key)
+        assert manager.get_cloud_storage_chunk_index(log_key, ComputeIOType.STDOUT) is None
+        assert not manager.is_capture_complete(log_key)
@@ -1,16 +1,21 @@
+import glob
 import multiprocessing
 import os
+import shutil
 import sys
 import tempfile
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
 
+import mock
 import pytest
 import sqlalchemy
 import sqlalchemy as db
 from dagster import DagsterInstance
 from dagster._core.errors import DagsterEventLogInvalidForRun
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
     SqlEventLogStorageMetadata,
@@ -28,7 +33,12 @@
 from sqlalchemy import __version__ as sqlalchemy_version
 from sqlalchemy.engine import Connection
 
-from dagster_tests.storage_tests.utils.event_log_storage import TestEventLogStorage
+from dagster_tests.storage_tests.utils.event_log_storage import (
+    TestEventLogStorage,
+    _event_record,
+    create_and_delete_test_runs,
+    create_test_event_log_record,
+)
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -134,6 +144,119 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
         assert not excs, excs
 
 
+class TestShardIndexedSqliteEventLogStorage(TestSqliteEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(name="instance", scope="function")
+    def instance(self):
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+            with instance_for_test(
+                temp_dir=tmpdir_path,
+                overrides={
+                    "event_log_storage": {
+                        "module": "dagster._core.storage.event_log",
+                        "class": "SqliteEventLogStorage",
+                        "config": {"base_dir": tmpdir_path, "use_shard_index": True},
+                    }
+                },
+            ) as instance:
+                yield instance
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self, instance):
+        event_log_storage = instance.event_log_storage
+        assert isinstance(event_log_storage, SqliteEventLogStorage)
+        assert event_log_storage.has_shard_index
+        yield event_log_storage
+
+    def test_shard_index_only_opens_matching_shards(self, storage, instance):
+        run_ids = [make_new_run_id() for _ in range(5)]
+        with create_and_delete_test_runs(instance, run_ids):
+            for run_id in run_ids:
+                storage.store_event(create_test_event_log_record("engine event", run_id))
+            storage.store_event(
+                _event_record(run_ids[2], "op", time.time(), DagsterEventType.STEP_START)
+            )
+
+            with mock.patch.object(
+                storage, "run_connection", wraps=storage.run_connection
+            ) as run_connection:
+                records = storage.get_event_records(
+                    EventRecordsFilter(event_type=DagsterEventType.STEP_START)
+                )
+            assert [record.event_log_entry.run_id for record in records] == [run_ids[2]]
+            assert [call.args[0] for call in run_connection.call_args_list] == [run_ids[2]]
+
+            records = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT), limit=2
+            )
+            assert [record.event_log_entry.run_id for record in records] == [
+                run_ids[4],
+                run_ids[3],
+            ]
+
+    def test_shard_index_rebuilt_from_existing_shards(self, storage, instance):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        with create_and_delete_test_runs(instance, run_ids):
+            for run_id in run_ids:
+                storage.store_event(create_test_event_log_record("engine event", run_id))
+
+            # a storage created with the shard index enabled indexes the events that were stored
+            # before the index existed
+            base_dir = storage._base_dir  # noqa: SLF001
+            shutil.rmtree(os.path.join(base_dir, "shard_index"))
+            storage = SqliteEventLogStorage(base_dir, use_shard_index=True)
+            storage.register_instance(instance)
+            records = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT), ascending=True
+            )
+            assert [record.event_log_entry.run_id for record in records] == run_ids
+
+            storage.delete_events(run_ids[0])
+            records = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT), ascending=True
+            )
+            assert [record.event_log_entry.run_id for record in records] == run_ids[1:]
+
+    def test_shard_index_caught_up_after_being_disabled(self, storage, instance):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        with create_and_delete_test_runs(instance, run_ids):
+            storage.store_event(create_test_event_log_record("engine event", run_ids[0]))
+
+            # events stored while the shard index is disabled are not indexed
+            base_dir = storage._base_dir  # noqa: SLF001
+            unindexed_storage = SqliteEventLogStorage(base_dir, use_shard_index=False)
+            unindexed_storage.register_instance(instance)
+            for run_id in run_ids:
+                unindexed_storage.store_event(create_test_event_log_record("engine event", run_id))
+
+            records = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT), ascending=True
+            )
+            assert [record.event_log_entry.run_id for record in records] == [run_ids[0]]
+
+            # re-enabling the index catches up with the events stored in the meantime
+            storage = SqliteEventLogStorage(base_dir, use_shard_index=True)
+            storage.register_instance(instance)
+            records = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT), ascending=True
+            )
+            assert [record.event_log_entry.run_id for record in records] == [
+                run_ids[0],
+                *run_ids,
+            ]
+
+            # shards that were not modified since the index was last caught up are not opened
+            an_hour_ago = time.time() - 3600
+            for path in glob.glob(os.path.join(base_dir, "*.db*")):
+                os.utime(path, (an_hour_ago, an_hour_ago))
+            with mock.patch.object(
+                SqliteEventLogStorage, "run_connection", autospec=True
+            ) as run_connection:
+                SqliteEventLogStorage(base_dir, use_shard_index=True)
+            assert not run_connection.called
+
+
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
 
@@ -8,6 +8,7 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -146,3 +147,83 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_multiple_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = [make_new_run_id() for _ in range(5)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(event)
+
+            return _callback
+
+        for run_id in run_ids:
+            storage.watch(run_id, None, _make_callback(run_id))
+
+        # a single polling thread is used for all of the watched runs
+        watcher = check.not_none(storage._watcher)  # noqa: SLF001
+        assert all(watcher.has_run_id(run_id) for run_id in run_ids)
+
+        for count in range(3):
+            for run_id in run_ids:
+                storage.store_event(create_event(count, run_id=run_id))
+        watcher.notify()
+
+        attempts = 20
+        while any(len(events) < 3 for events in watched.values()) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        for run_id in run_ids:
+            assert [int(evt.message) for evt in watched[run_id]] == [0, 1, 2]
+            assert all(evt.run_id == run_id for evt in watched[run_id])
+
+
+def test_notify_polls_immediately():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_id = make_new_run_id()
+        watched = []
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+        watcher = check.not_none(storage._watcher)  # noqa: SLF001
+
+        # let the watcher back off while the run is idle
+        time.sleep(2)
+        storage.store_event(create_event(1, run_id=run_id))
+        watcher.notify(run_id)
+
+        attempts = 10
+        while not watched and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched] == [1]
+
+
+def test_invalid_event_log_does_not_block_other_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        bad_run_id = make_new_run_id()
+        good_run_id = make_new_run_id()
+        storage.store_event(create_event(1, run_id=bad_run_id))
+        with storage.run_connection(bad_run_id) as conn:
+            conn.execute(SqlEventLogStorageTable.update().values(event="not json"))
+
+        watched = {bad_run_id: [], good_run_id: []}
+        storage.watch(bad_run_id, None, lambda event, _cursor: watched[bad_run_id].append(event))
+        storage.watch(good_run_id, None, lambda event, _cursor: watched[good_run_id].append(event))
+        watcher = check.not_none(storage._watcher)  # noqa: SLF001
+
+        storage.store_event(create_event(1, run_id=good_run_id))
+        watcher.notify()
+
+        attempts = 20
+        while not watched[good_run_id] and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched[good_run_id]] == [1]
+        assert watched[bad_run_id] == []
+        assert not watcher.has_run_id(bad_run_id)
+        assert watcher.has_run_id(good_run_id)
@@ -0,0 +1,174 @@
+import os
+import tempfile
+import time
+
+from dagster import job, op
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.snap import snapshot_from_execution_plan
+from dagster._core.storage.runs import SqliteRunStorage
+from dagster._core.storage.runs.snapshot_cache import (
+    SNAPSHOT_CACHE_MAX_BYTES_ENV_VAR,
+    SNAPSHOT_CACHE_SPILL_DIR_ENV_VAR,
+    SnapshotCache,
+    SnapshotIdPresence,
+    get_snapshot_cache,
+    reset_snapshot_cache,
+)
+from dagster._core.test_utils import environ, instance_for_test
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+def _job_snapshot():
+    return noop_job.get_job_snapshot()
+
+
+def test_lru_eviction_by_size():
+    cache = SnapshotCache(max_bytes=100)
+    snapshot = _job_snapshot()
+
+    cache.put("a", snapshot, 40)
+    cache.put("b", snapshot, 40)
+    assert cache.get("a") is snapshot  # a is now the most recently used
+    cache.put("c", snapshot, 40)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+    # too large to ever be cached
+    cache.put("d", snapshot, 101)
+    assert "d" not in cache
+
+    metrics = cache.metrics
+    assert metrics.entries == 2
+    assert metrics.size_bytes == 80
+    assert metrics.evictions == 1
+
+
+def test_metrics():
+    cache = SnapshotCache(max_bytes=100)
+    assert cache.metrics.hit_rate == 0.0
+
+    cache.put("a", _job_snapshot(), 10)
+    assert cache.get("a")
+    assert cache.get("a")
+    assert cache.get("a")
+    assert cache.get("b") is None
+    cache.record_negative_hit()
+
+    metrics = cache.metrics
+    assert metrics.hits == 3
+    assert metrics.misses == 1
+    assert metrics.negative_hits == 1
+    assert metrics.hit_rate == 0.75
+
+
+def test_presence_negative_ttl():
+    presence = SnapshotIdPresence(negative_ttl_seconds=0.1)
+    assert presence.is_present("a") is None
+
+    presence.mark_missing("a")
+    assert presence.is_present("a") is False
+    time.sleep(0.2)
+    assert presence.is_present("a") is None
+
+    presence.mark_missing("a")
+    presence.mark_present("a")
+    assert presence.is_present("a") is True
+
+    presence.clear()
+    assert presence.is_present("a") is None
+
+    no_negative_caching = SnapshotIdPresence(negative_ttl_seconds=0)
+    no_negative_caching.mark_missing("a")
+    assert no_negative_caching.is_present("a") is None
+
+
+def test_spill():
+    with tempfile.TemporaryDirectory() as tempdir:
+        cache = SnapshotCache(max_bytes=100, spill_dir=tempdir)
+        assert cache.has_spill
+
+        cache.spill("abc123", b"body")
+        assert cache.get_spilled_body("abc123") == b"body"
+        assert cache.get_spilled_body("missing") is None
+        assert cache.metrics.spill_hits == 1
+
+        # ids that are not safe to use as file names are never spilled
+        cache.spill("../escape", b"body")
+        assert not os.path.exists(os.path.join(tempdir, "..", "escape"))
+        assert cache.get_spilled_body("../escape") is None
+
+
+def test_run_storage_snapshot_cache():
+    reset_snapshot_cache()
+    try:
+        with instance_for_test() as instance:
+            snapshot = _job_snapshot()
+            snapshot_id = instance.run_storage.add_job_snapshot(snapshot)
+            assert instance.has_job_snapshot(snapshot_id)
+            assert instance.get_job_snapshot(snapshot_id) is snapshot
+
+            metrics = instance.get_snapshot_cache_metrics()
+            assert metrics
+            assert metrics.hits == 1
+
+            assert not instance.has_job_snapshot("missing")
+            assert not instance.has_job_snapshot("missing")
+            metrics = instance.get_snapshot_cache_metrics()
+            assert metrics
+            assert metrics.negative_hits == 1
+
+            # snapshots that are cached from another run storage are not visible in this one
+            with instance_for_test() as other_instance:
+                assert not other_instance.has_job_snapshot(snapshot_id)
+                assert other_instance.get_job_snapshot(snapshot_id) is None
+
+            instance.wipe()
+            assert not instance.has_job_snapshot(snapshot_id)
+            assert instance.get_job_snapshot(snapshot_id) is None
+    finally:
+        reset_snapshot_cache()
+
+
+def test_run_storage_snapshot_spill():
+    reset_snapshot_cache()
+    try:
+        with tempfile.TemporaryDirectory() as spill_dir, tempfile.TemporaryDirectory() as tempdir:
+            with environ({SNAPSHOT_CACHE_SPILL_DIR_ENV_VAR: spill_dir}):
+                storage = SqliteRunStorage.from_local(tempdir)
+                plan_snapshot = snapshot_from_execution_plan(
+                    create_execution_plan(noop_job), noop_job.get_job_snapshot_id()
+                )
+                snapshot_id = storage.add_execution_plan_snapshot(plan_snapshot)
+
+                snapshot_cache = get_snapshot_cache()
+                assert snapshot_cache
+                snapshot_cache.clear()
+
+                assert storage.get_execution_plan_snapshot(snapshot_id) == plan_snapshot
+                assert snapshot_cache.metrics.spill_hits == 1
+                assert snapshot_id in snapshot_cache
+    finally:
+        reset_snapshot_cache()
+
+
+def test_run_storage_snapshot_cache_disabled():
+    reset_snapshot_cache()
+    try:
+        with environ({SNAPSHOT_CACHE_MAX_BYTES_ENV_VAR: "0"}):
+            with instance_for_test() as instance:
+                snapshot_id = instance.run_storage.add_job_snapshot(_job_snapshot())
+                assert instance.get_job_snapshot(snapshot_id) == _job_snapshot()
+                assert instance.get_snapshot_cache_metrics() is None
+    finally:
+        reset_snapshot_cache()
@@ -5,6 +5,7 @@
 import string
 import sys
 import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from typing import List, Optional, Sequence, Tuple, cast
@@ -107,7 +108,7 @@
     ASSET_PARTITION_RANGE_START_TAG,
     MULTIDIMENSIONAL_PARTITION_PREFIX,
 )
-from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._core.test_utils import create_run_for_test, environ, instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._loggers import colored_console_logger
@@ -571,6 +572,46 @@ def test_event_log_storage_store_with_multiple_runs(
             for run in runs:
                 instance.delete_run(run)
 
+    def test_get_records_for_runs(
+        self,
+        instance: DagsterInstance,
+        storage: EventLogStorage,
+    ):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not support batched run queries")
+
+        runs = [make_new_run_id() for _ in range(3)]
+        with create_and_delete_test_runs(instance, runs):
+            for i in range(3):
+                for run_id in runs:
+                    storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+            storage_ids_by_run_id = {
+                run_id: [
+                    record.storage_id for record in storage.get_records_for_run(run_id).records
+                ]
+                for run_id in runs
+            }
+
+            records = storage.get_records_for_runs(
+                {
+                    runs[0]: -1,
+                    runs[1]: storage_ids_by_run_id[runs[1]][0],
+                    runs[2]: storage_ids_by_run_id[runs[2]][-1],
+                }
+            )
+            messages_by_run_id = defaultdict(list)
+            for record in records:
+                messages_by_run_id[record.event_log_entry.run_id].append(
+                    record.event_log_entry.user_message
+                )
+            assert messages_by_run_id == {runs[0]: ["0", "1", "2"], runs[1]: ["1", "2"]}
+
+            records = storage.get_records_for_runs({runs[0]: -1}, limit=2)
+            assert [record.storage_id for record in records] == storage_ids_by_run_id[runs[0]][:2]
+
+            assert storage.get_records_for_runs({}) == []
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_log_storage_watch(
@@ -1093,6 +1134,33 @@ def test_event_watcher_single_run_event(self, storage, test_run_id):
         assert len(event_list) == len(events)
         assert all([isinstance(event, EventLogEntry) for event in event_list])
 
+    # .watch() is async, there's a small chance they don't run before the asserts
+    @pytest.mark.flaky(reruns=1)
+    def test_event_watcher_event_batch(self, storage, test_run_id):
+        if not self.can_watch():
+            pytest.skip("storage cannot watch runs")
+
+        event_list = []
+        cursors = []
+
+        def _handler(event, cursor):
+            event_list.append(event)
+            cursors.append(cursor)
+
+        storage.watch(test_run_id, None, _handler)
+
+        events, _ = _synthesize_events(return_one_op_func, run_id=test_run_id)
+        storage.store_event_batch(events)
+
+        start = time.time()
+        while len(event_list) < len(events) and time.time() - start < self.watch_timeout():
+            time.sleep(0.01)
+
+        assert len(event_list) == len(events)
+        assert all([isinstance(event, EventLogEntry) for event in event_list])
+        storage_ids = [EventLogCursor.parse(cursor).storage_id() for cursor in cursors]
+        assert storage_ids == sorted(set(storage_ids))
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_watcher_filter_run_event(self, instance, storage):
@@ -3203,6 +3271,90 @@ def _assert_matches_not_including_event_id(result, expected):
                 {},
             )
 
+    def test_get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+        self, storage, instance
+    ):
+        a = AssetKey(["a"])
+        b = AssetKey(["b"])
+        c = AssetKey(["c"])
+
+        def _planned_event(run_id, asset_key, partition):
+            return EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                    "nonce",
+                    event_specific_data=AssetMaterializationPlannedData(asset_key, partition),
+                ),
+            )
+
+        def _materialization_event(run_id, asset_key, partition):
+            return EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION.value,
+                    "nonce",
+                    event_specific_data=StepMaterializationData(
+                        AssetMaterialization(asset_key=asset_key, partition=partition)
+                    ),
+                ),
+            )
+
+        run_id_1 = make_new_run_id()
+        run_id_2 = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+            assert (
+                storage.get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+                    {}
+                )
+                == {}
+            )
+
+            storage.store_event(_planned_event(run_id_1, a, "foo"))
+            storage.store_event(_planned_event(run_id_1, a, "bar"))
+            storage.store_event(_planned_event(run_id_1, b, "foo"))
+            storage.store_event(_materialization_event(run_id_1, a, "foo"))
+            cursor = storage.fetch_materializations(a, limit=1).records[0].storage_id
+            storage.store_event(_planned_event(run_id_2, b, "bar"))
+            storage.store_event(_planned_event(run_id_2, c, "baz"))
+
+            for after_storage_id_by_asset_key in [
+                {a: None, b: None, c: None},
+                {a: None, b: cursor, c: cursor},
+                {a: cursor, b: cursor},
+            ]:
+                result = storage.get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+                    after_storage_id_by_asset_key
+                )
+                assert result == {
+                    asset_key: storage.get_latest_asset_partition_materialization_attempts_without_materializations(
+                        asset_key, after_storage_id
+                    )
+                    for asset_key, after_storage_id in after_storage_id_by_asset_key.items()
+                }
+
+            result = storage.get_latest_asset_partition_materialization_attempts_without_materializations_for_assets(
+                {a: None, b: cursor, c: None}
+            )
+            assert {
+                asset_key: {
+                    partition: run_id for partition, (run_id, _event_id) in attempts.items()
+                }
+                for asset_key, attempts in result.items()
+            } == {
+                a: {"bar": run_id_1},
+                b: {"bar": run_id_2},
+                c: {"baz": run_id_2},
+            }
+
     def test_get_latest_asset_partition_materialization_attempts_without_materializations_external_asset(
         self, storage, instance
     ):
@@ -4367,6 +4519,90 @@ def my_op():
         asset_event_tags = storage.get_event_tags_for_asset(key)
         assert asset_event_tags == []
 
+    def test_store_event_batch(
+        self,
+        storage: EventLogStorage,
+        instance: DagsterInstance,
+    ):
+        key = AssetKey("batched")
+        other_key = AssetKey("other_batched")
+
+        @op
+        def my_op(context):
+            context.log.info("before")
+            for i in range(3):
+                yield AssetMaterialization(
+                    asset_key=key,
+                    partition=str(i),
+                    tags={"dagster/partition/country": f"country_{i}"},
+                )
+            yield AssetObservation(asset_key=other_key)
+            context.log.info("after")
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            check_events = [
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
+                        "nonce",
+                        event_specific_data=AssetCheckEvaluationPlanned(
+                            asset_key=key, check_name="my_check"
+                        ),
+                    ),
+                ),
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_CHECK_EVALUATION.value,
+                        "nonce",
+                        event_specific_data=AssetCheckEvaluation(
+                            asset_key=key, check_name="my_check", passed=True, metadata={}
+                        ),
+                    ),
+                ),
+            ]
+            storage.store_event_batch([*events, *check_events])
+
+            stored = storage.get_records_for_run(run_id).records
+            assert len(stored) == len(events) + len(check_events)
+            assert [record.event_log_entry.user_message for record in stored] == [
+                event.user_message for event in [*events, *check_events]
+            ]
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=key)
+            )
+            assert len(materializations) == 3
+
+            # the asset key row reflects the last materialization in the batch
+            [asset_record] = storage.get_asset_records([key])
+            last_materialization = asset_record.asset_entry.last_materialization_record
+            assert last_materialization
+            assert last_materialization.storage_id == max(
+                record.storage_id for record in materializations
+            )
+            assert other_key in storage.all_asset_keys()
+
+            if storage.supports_add_asset_event_tags():
+                asset_event_tags = storage.get_event_tags_for_asset(key)
+                assert len(asset_event_tags) == 3
+
+            check_key = AssetCheckKey(key, "my_check")
+            [execution] = storage.get_asset_check_execution_history(check_key, limit=10)
+            assert execution.status == AssetCheckExecutionRecordStatus.SUCCEEDED
+
     def test_add_asset_event_tags(
         self,
         storage: EventLogStorage,
@@ -4983,6 +5219,101 @@ def claim(key, run_id, step_key, priority=0):
         assert storage.check_concurrency_claim("foo", run_id, "d").assigned_timestamp is None
         assert storage.check_concurrency_claim("foo", run_id, "e").assigned_timestamp is None
 
+    def test_concurrency_batch_claim(self, storage: EventLogStorage):
+        if not storage.supports_global_concurrency_limits:
+            pytest.skip("storage does not support global op concurrency")
+
+        run_id = make_new_run_id()
+        other_run_id = make_new_run_id()
+
+        storage.set_concurrency_slots("foo", 3)
+        assert (
+            storage.claim_concurrency_slot("foo", other_run_id, "other").slot_status
+            == ConcurrencySlotStatus.CLAIMED
+        )
+
+        # only the remaining slots are claimed, by the highest priority steps
+        claim_statuses = storage.claim_concurrency_slots(
+            "foo", run_id, {"a": 0, "b": 2, "c": 1, "d": None}
+        )
+        assert set(claim_statuses.keys()) == {"a", "b", "c", "d"}
+        claimed = {step_key for step_key, status in claim_statuses.items() if status.is_claimed}
+        assert claimed == {"b", "c"}
+        assert claim_statuses["b"].priority == 2
+        assert not claim_statuses["a"].is_assigned
+        assert claim_statuses["a"].enqueued_timestamp is not None
+
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 3
+        assert foo_info.pending_step_count == 2
+        assert foo_info.assigned_step_count == 3
+
+        # claiming again is idempotent
+        claim_statuses = storage.claim_concurrency_slots("foo", run_id, {"a": 0, "b": 2})
+        assert claim_statuses["b"].is_claimed
+        assert not claim_statuses["a"].is_claimed
+        assert storage.get_concurrency_info("foo").active_slot_count == 3
+
+        # freeing slots assigns them to the pending steps in priority order, which claim them on
+        # their next batch claim
+        storage.free_concurrency_slot_for_step(run_id, "b")
+        storage.free_concurrency_slot_for_step(other_run_id, "other")
+        claim_statuses = storage.claim_concurrency_slots("foo", run_id, {"a": 0, "d": None})
+        assert claim_statuses["a"].is_claimed
+        assert claim_statuses["d"].is_claimed
+
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 3
+        assert foo_info.pending_step_count == 0
+        assert {slot.step_key for slot in foo_info.claimed_slots} == {"a", "c", "d"}
+
+        assert storage.claim_concurrency_slots("foo", run_id, {}) == {}
+
+    def test_concurrency_assignment_lease(self, storage: EventLogStorage):
+        if not storage.supports_global_concurrency_limits:
+            pytest.skip("storage does not support global op concurrency")
+
+        run_id = make_new_run_id()
+
+        storage.set_concurrency_slots("foo", 1)
+        assert storage.claim_concurrency_slot("foo", run_id, "a").is_claimed
+        assert not storage.claim_concurrency_slot("foo", run_id, "b").is_claimed
+        assert not storage.claim_concurrency_slot("foo", run_id, "c").is_claimed
+        assert not storage.claim_concurrency_slot("foo", run_id, "d").is_claimed
+
+        # the freed slot is assigned to b, which never comes back to claim it
+        storage.free_concurrency_slot_for_step(run_id, "a")
+        assert storage.check_concurrency_claim("foo", run_id, "b").is_assigned
+
+        # the lease is disabled by default, so the assignment is held indefinitely
+        time.sleep(0.01)
+        assert not storage.claim_concurrency_slot("foo", run_id, "c").is_claimed
+        assert not storage.claim_concurrency_slots("foo", run_id, {"c": 0})["c"].is_claimed
+        assert storage.check_concurrency_claim("foo", run_id, "b").is_assigned
+
+        # while the assignment is leased, c can not claim the slot
+        with environ({"DAGSTER_CONCURRENCY_ASSIGNMENT_LEASE_SECONDS": "300"}):
+            assert not storage.claim_concurrency_slot("foo", run_id, "c").is_claimed
+            assert not storage.claim_concurrency_slots("foo", run_id, {"c": 0})["c"].is_claimed
+        assert storage.check_concurrency_claim("foo", run_id, "b").is_assigned
+
+        # once the lease expires, the slot is assigned to the next pending step, for single claims
+        with environ({"DAGSTER_CONCURRENCY_ASSIGNMENT_LEASE_SECONDS": "0.001"}):
+            assert storage.claim_concurrency_slot("foo", run_id, "c").is_claimed
+        assert not storage.check_concurrency_claim("foo", run_id, "b").is_assigned
+
+        # ... and for batch claims
+        storage.free_concurrency_slot_for_step(run_id, "c")
+        assert storage.check_concurrency_claim("foo", run_id, "b").is_assigned
+        with environ({"DAGSTER_CONCURRENCY_ASSIGNMENT_LEASE_SECONDS": "0.001"}):
+            time.sleep(0.01)
+            assert storage.claim_concurrency_slots("foo", run_id, {"d": 0})["d"].is_claimed
+        assert not storage.check_concurrency_claim("foo", run_id, "b").is_assigned
+
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 1
+        assert {slot.step_key for slot in foo_info.claimed_slots} == {"d"}
+
     def test_invalid_concurrency_limit(self, storage: EventLogStorage):
         if not storage.supports_global_concurrency_limits:
             pytest.skip("storage does not support global op concurrency")
@@ -26,6 +26,7 @@
     RUN_FETCH_BATCH_SIZE,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
+    get_and_update_asset_status_cache_values,
     get_last_planned_storage_id,
 )
 from dagster._core.test_utils import create_run_for_test
@@ -828,6 +829,123 @@ def my_asset():
         )
         assert failed_subset.get_partition_keys() == set()
 
+    def test_get_and_update_cached_status_for_many_assets(self, instance):
+        static_partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
+        daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=static_partitions_def)
+        def static_asset(context):
+            if context.partition_key.startswith("fail"):
+                raise Exception()
+
+        @asset(partitions_def=daily_partitions_def)
+        def daily_asset():
+            return 1
+
+        @asset
+        def unpartitioned_asset():
+            return 1
+
+        asset_graph = AssetGraph.from_assets([static_asset, daily_asset, unpartitioned_asset])
+        partitions_defs_by_asset_key = {
+            asset_key: asset_graph.get(asset_key).partitions_def
+            for asset_key in asset_graph.all_asset_keys
+        }
+        static_job = define_asset_job("static_job", selection=[static_asset]).resolve(
+            asset_graph=asset_graph
+        )
+        daily_job = define_asset_job("daily_job", selection=[daily_asset]).resolve(
+            asset_graph=asset_graph
+        )
+        unpartitioned_job = define_asset_job(
+            "unpartitioned_job", selection=[unpartitioned_asset]
+        ).resolve(asset_graph=asset_graph)
+
+        for partition_key in ["good1", "fail1"]:
+            static_job.execute_in_process(
+                instance=instance, partition_key=partition_key, raise_on_error=False
+            )
+        daily_job.execute_in_process(instance=instance, partition_key="2022-01-01")
+        unpartitioned_job.execute_in_process(instance=instance)
+
+        in_progress_run = create_run_for_test(instance)
+        for asset_key, partition in [
+            (AssetKey("static_asset"), "good2"),
+            (AssetKey("daily_asset"), "2022-01-02"),
+        ]:
+            instance.event_log_storage.store_event(
+                _create_test_planned_materialization_record(
+                    in_progress_run.run_id, asset_key, partition
+                )
+            )
+
+        cached_statuses = get_and_update_asset_status_cache_values(
+            instance, partitions_defs_by_asset_key
+        )
+        assert set(cached_statuses.keys()) == set(partitions_defs_by_asset_key.keys())
+
+        static_status = cached_statuses[AssetKey("static_asset")]
+        assert static_status
+        assert static_status.deserialize_materialized_partition_subsets(
+            static_partitions_def
+        ).get_partition_keys() == {"good1"}
+        assert static_status.deserialize_failed_partition_subsets(
+            static_partitions_def
+        ).get_partition_keys() == {"fail1"}
+        assert static_status.deserialize_in_progress_partition_subsets(
+            static_partitions_def
+        ).get_partition_keys() == {"good2"}
+
+        daily_status = cached_statuses[AssetKey("daily_asset")]
+        assert daily_status
+        assert daily_status.deserialize_in_progress_partition_subsets(
+            daily_partitions_def
+        ).get_partition_keys() == ["2022-01-02"]
+
+        unpartitioned_status = cached_statuses[AssetKey("unpartitioned_asset")]
+        assert unpartitioned_status
+        assert unpartitioned_status.partitions_def_id is None
+
+        # the batch writes every updated value, so updating each asset on its own is a no-op
+        for asset_key, partitions_def in partitions_defs_by_asset_key.items():
+            asset_record = next(iter(instance.get_asset_records([asset_key])))
+            assert asset_record.asset_entry.cached_status == cached_statuses[asset_key]
+            assert (
+                get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+                == cached_statuses[asset_key]
+            )
+
+        # status changes are picked up incrementally from the stored values
+        static_job.execute_in_process(
+            instance=instance, partition_key="fail2", raise_on_error=False
+        )
+        instance.report_run_canceled(in_progress_run)
+
+        cached_statuses = get_and_update_asset_status_cache_values(
+            instance, partitions_defs_by_asset_key
+        )
+        static_status = cached_statuses[AssetKey("static_asset")]
+        assert static_status
+        assert static_status.deserialize_failed_partition_subsets(
+            static_partitions_def
+        ).get_partition_keys() == {"fail1", "fail2"}
+        assert (
+            static_status.deserialize_in_progress_partition_subsets(
+                static_partitions_def
+            ).get_partition_keys()
+            == set()
+        )
+        daily_status = cached_statuses[AssetKey("daily_asset")]
+        assert daily_status
+        assert (
+            list(
+                daily_status.deserialize_in_progress_partition_subsets(
+                    daily_partitions_def
+                ).get_partition_keys()
+            )
+            == []
+        )
+
     def test_batch_canceled_partitions(self, instance, delete_runs_instance):
         my_asset = AssetKey("my_asset")
 
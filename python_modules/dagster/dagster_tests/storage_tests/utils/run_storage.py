@@ -40,7 +40,7 @@
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
 )
-from dagster._core.test_utils import freeze_time
+from dagster._core.test_utils import environ, freeze_time
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
@@ -823,6 +823,64 @@ def _run_ids(records):
         assert _run_ids(storage.get_run_records(cursor=three, limit=1)) == [two]
         assert _run_ids(storage.get_run_records(cursor=one, limit=1, ascending=True)) == [two]
 
+    def test_get_run_summary_records(self, storage):
+        assert storage
+        [one, two] = [make_new_run_id() for _ in range(2)]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                job_name="some_pipeline",
+                status=DagsterRunStatus.STARTED,
+                tags={"foo": "bar", PARTITION_NAME_TAG: "a"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two, job_name="other_pipeline", status=DagsterRunStatus.STARTED
+            )
+        )
+        storage.add_run_tags(one, {"foo": "baz", "new": "tag"})
+        storage.handle_run_event(
+            two,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_FAILURE.value,
+                job_name="other_pipeline",
+            ),
+        )
+
+        summaries = storage.get_run_summary_records()
+        assert [summary.run_id for summary in summaries] == [two, one]
+        records_by_run_id = {
+            record.dagster_run.run_id: record for record in storage.get_run_records()
+        }
+        for summary in summaries:
+            record = records_by_run_id[summary.run_id]
+            assert summary.storage_id == record.storage_id
+            assert summary.job_name == record.dagster_run.job_name
+            assert summary.status == record.dagster_run.status
+            assert summary.tags == record.dagster_run.tags
+            assert summary.create_timestamp == record.create_timestamp
+            assert summary.update_timestamp == record.update_timestamp
+            assert summary.start_time == record.start_time
+            assert summary.end_time == record.end_time
+
+        [failed] = storage.get_run_summary_records(
+            filters=RunsFilter(statuses=[DagsterRunStatus.FAILURE])
+        )
+        assert failed.run_id == two
+        assert failed.tags == {}
+
+        [tagged] = storage.get_run_summary_records(filters=RunsFilter(tags={"foo": "baz"}))
+        assert tagged.run_id == one
+        assert tagged.partition == "a"
+        assert tagged.tags == {"foo": "baz", "new": "tag", PARTITION_NAME_TAG: "a"}
+
+        assert [
+            summary.run_id for summary in storage.get_run_summary_records(limit=1, ascending=True)
+        ] == [one]
+        assert [summary.run_id for summary in storage.get_run_summary_records(cursor=two)] == [one]
+
     def test_fetch_records_by_update_timestamp(self, storage, instance):
         assert storage
         self._skip_in_memory(storage)
@@ -1077,6 +1135,27 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_job_snapshot(job_snapshot_id)
 
+    def test_add_get_binary_snapshot(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("binary snapshots are only stored by sql run storages")
+
+        json_job_def = GraphDefinition(name="json_pipeline", node_defs=[]).to_job()
+        json_job_snapshot = json_job_def.get_job_snapshot()
+        json_job_snapshot_id = storage.add_job_snapshot(json_job_snapshot)
+
+        binary_job_def = GraphDefinition(name="binary_pipeline", node_defs=[]).to_job()
+        binary_job_snapshot = binary_job_def.get_job_snapshot()
+        with environ({"DAGSTER_SNAPSHOT_SERDES_FORMAT": "binary"}):
+            binary_job_snapshot_id = storage.add_job_snapshot(binary_job_snapshot)
+
+        # snapshots stored in either format can be read back, regardless of the configured format
+        assert serialize_pp(storage.get_job_snapshot(json_job_snapshot_id)) == serialize_pp(
+            json_job_snapshot
+        )
+        assert serialize_pp(storage.get_job_snapshot(binary_job_snapshot_id)) == serialize_pp(
+            binary_job_snapshot
+        )
+
     def test_single_write_read_with_snapshot(self, storage: RunStorage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
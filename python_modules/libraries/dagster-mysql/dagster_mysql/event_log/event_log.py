@@ -1,9 +1,8 @@
-from typing import ContextManager, Optional, cast
+from typing import Any, ContextManager, Mapping, Optional, cast
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
-import sqlalchemy.exc as db_exc
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.event_api import EventHandlerFn
@@ -149,26 +148,27 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
         with self.index_connection() as conn:
+            self._upsert_asset_key_rows(
+                conn,
+                {event.dagster_event.asset_key.to_string(): values},  # type: ignore  # (possible none)
+            )
+
+    def _upsert_asset_key_rows(
+        self, conn: Connection, values_by_asset_key: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        for asset_key_str, values in values_by_asset_key.items():
             if values:
                 conn.execute(
                     db_dialects.mysql.insert(AssetKeyTable)
-                    .values(
-                        asset_key=event.dagster_event.asset_key.to_string(),  # type: ignore  # (possible none)
-                        **values,
-                    )
-                    .on_duplicate_key_update(
-                        **values,
-                    )
+                    .values(asset_key=asset_key_str, **values)
+                    .on_duplicate_key_update(**values)
                 )
             else:
-                try:
-                    conn.execute(
-                        db_dialects.mysql.insert(AssetKeyTable).values(
-                            asset_key=event.dagster_event.asset_key.to_string(),  # type: ignore  # (possible none)
-                        )
-                    )
-                except db_exc.IntegrityError:
-                    pass
+                conn.execute(
+                    db_dialects.mysql.insert(AssetKeyTable)
+                    .values(asset_key=asset_key_str)
+                    .prefix_with("IGNORE")
+                )
 
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
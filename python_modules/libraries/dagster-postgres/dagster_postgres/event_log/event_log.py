@@ -1,3 +1,6 @@
+import logging
+import os
+import threading
 from contextlib import contextmanager
 from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, cast
 
@@ -8,7 +11,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -33,6 +36,7 @@
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
+from dagster_postgres.pynotify import await_pg_notifications
 from dagster_postgres.utils import (
     create_pg_connection,
     pg_alembic_config,
@@ -45,6 +49,29 @@
 CHANNEL_NAME = "run_events"
 
 
+def _should_listen_for_event_notifications() -> bool:
+    return os.getenv("DAGSTER_POSTGRES_EVENT_WATCHER_LISTEN_NOTIFY", "0") == "1"
+
+
+def _listen_for_event_notifications(
+    conn_string: str, event_watcher: SqlPollingEventWatcher, exit_event: threading.Event
+) -> None:
+    # Wakes the event watcher whenever events are written for a run, instead of waiting for its
+    # next poll. The watcher keeps polling on its own, so notifications that are missed (or a
+    # connection that does not support LISTEN, e.g. behind a transaction-pooling proxy) only delay
+    # the delivery of events.
+    try:
+        for notification in await_pg_notifications(
+            conn_string, channels=[CHANNEL_NAME], timeout=1.0, exit_event=exit_event
+        ):
+            run_id, _event_id = notification.payload.rsplit("_", 1)
+            event_watcher.notify(run_id)
+    except Exception:
+        logging.getLogger("dagster").warning(
+            "Unable to listen for event log notifications, falling back to polling.", exc_info=True
+        )
+
+
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """Postgres-backed event log storage.
 
@@ -91,6 +118,8 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
         self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_notification_thread: Optional[threading.Thread] = None
+        self._event_notification_exit_event = threading.Event()
 
         self._secondary_index_cache = {}
 
@@ -183,7 +212,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes up event watchers that LISTEN for notifications, and supports version skew
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -207,26 +236,45 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
-    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
-        check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[int]:
+        result = conn.execute(
+            self.prepare_insert_event_batch(events).returning(
+                SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            )
         )
+        rows = result.fetchall()
+        result.close()
 
-        insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
+        # wakes up event watchers that LISTEN for notifications, and supports version skew.
+        # Only the latest event for each run is sent, since watchers fetch all events after cursor.
+        latest_event_id_by_run_id = {row[0]: row[1] for row in rows}
+        for run_id, event_id in latest_event_id_by_run_id.items():
+            conn.execute(
+                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                {"notify_id": run_id + "_" + str(event_id)},
+            )
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+        return [cast(int, row[1]) for row in rows]
 
-        if any((event_id is None for event_id in event_ids)):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+    def _upsert_asset_key_rows(
+        self, conn: Connection, values_by_asset_key: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        for asset_key_str, values in values_by_asset_key.items():
+            conn.execute(self._get_upsert_asset_key_statement(asset_key_str, values))
 
-        self.store_asset_event_tags(events, event_ids)
+    def _get_upsert_asset_key_statement(self, asset_key_str: str, values: Mapping[str, Any]):
+        query = db_dialects.postgresql.insert(AssetKeyTable).values(
+            asset_key=asset_key_str,
+            **values,
+        )
+        if values:
+            return query.on_conflict_do_update(
+                index_elements=[AssetKeyTable.c.asset_key],
+                set_=dict(**values),
+            )
+        return query.on_conflict_do_nothing()
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -267,18 +315,11 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
         with self.index_connection() as conn:
-            query = db_dialects.postgresql.insert(AssetKeyTable).values(
-                asset_key=event.dagster_event.asset_key.to_string(),
-                **values,
-            )
-            if values:
-                query = query.on_conflict_do_update(
-                    index_elements=[AssetKeyTable.c.asset_key],
-                    set_=dict(**values),
+            conn.execute(
+                self._get_upsert_asset_key_statement(
+                    event.dagster_event.asset_key.to_string(), values
                 )
-            else:
-                query = query.on_conflict_do_nothing()
-            conn.execute(query)
+            )
 
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
@@ -345,6 +386,19 @@ def watch(
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
             self._event_watcher = SqlPollingEventWatcher(self)
+            if _should_listen_for_event_notifications():
+                self._event_notification_exit_event.clear()
+                self._event_notification_thread = threading.Thread(
+                    target=_listen_for_event_notifications,
+                    args=(
+                        self.postgres_url,
+                        self._event_watcher,
+                        self._event_notification_exit_event,
+                    ),
+                    name="postgres-event-watch-notifications",
+                    daemon=True,
+                )
+                self._event_notification_thread.start()
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
@@ -362,6 +416,10 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
             self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self) -> None:
+        if self._event_notification_thread:
+            self._event_notification_exit_event.set()
+            self._event_notification_thread.join()
+            self._event_notification_thread = None
         if self._event_watcher:
             self._event_watcher.close()
             self._event_watcher = None
@@ -0,0 +1,45 @@
+import select
+import threading
+from typing import Iterator, Optional, Sequence
+
+import psycopg2.extensions
+from dagster import _check as check
+
+from dagster_postgres.utils import get_conn
+
+
+def await_pg_notifications(
+    conn_string: str,
+    channels: Sequence[str],
+    timeout: float = 5.0,
+    exit_event: Optional[threading.Event] = None,
+) -> Iterator[psycopg2.extensions.Notify]:
+    """Subscribe to Postgres notifications on the given channels, and yield them as they arrive.
+
+    Args:
+        conn_string (str): The connection string for the database.
+        channels (Sequence[str]): The channels to LISTEN on.
+        timeout (float): How long to wait for a notification before checking whether the
+            `exit_event` has been set.
+        exit_event (Optional[threading.Event]): Stop listening once this event has been set.
+    """
+    check.str_param(conn_string, "conn_string")
+    check.sequence_param(channels, "channels", of_type=str)
+    check.numeric_param(timeout, "timeout")
+    check.opt_inst_param(exit_event, "exit_event", threading.Event)
+
+    conn = get_conn(conn_string)
+    try:
+        with conn.cursor() as cursor:
+            for channel in channels:
+                cursor.execute(f"LISTEN {channel};")
+
+        while not (exit_event and exit_event.is_set()):
+            if select.select([conn], [], [], timeout) == ([], [], []):
+                continue
+
+            conn.poll()
+            while conn.notifies:
+                yield conn.notifies.pop(0)
+    finally:
+        conn.close()
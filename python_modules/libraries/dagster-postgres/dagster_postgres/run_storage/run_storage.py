@@ -222,18 +222,24 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
             conn.execute(upsert_stmt)
 
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
+        serialized_snapshot = serialize_value(snapshot_obj).encode("utf-8")
+        snapshot_body = zlib.compress(serialized_snapshot)
         with self.connect() as conn:
             snapshot_insert = (
                 db_dialects.postgresql.insert(SnapshotsTable)
                 .values(
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                    snapshot_body=snapshot_body,
                     snapshot_type=snapshot_type.value,
                 )
                 .on_conflict_do_nothing()
             )
             conn.execute(snapshot_insert)
-            return snapshot_id
+
+        self._cache_added_snapshot(
+            snapshot_id, snapshot_obj, snapshot_body, len(serialized_snapshot)
+        )
+        return snapshot_id
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = pg_alembic_config(__file__)
@@ -6,7 +6,7 @@
 import pytest
 import yaml
 from dagster._core.storage.event_log.base import EventLogCursor
-from dagster._core.test_utils import ensure_dagster_tests_import, instance_for_test
+from dagster._core.test_utils import ensure_dagster_tests_import, environ, instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster_postgres.event_log import PostgresEventLogStorage
 
@@ -109,6 +109,27 @@ def watch_two(event, _cursor):
         gc.collect()
         assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
 
+    def test_event_log_storage_watch_with_notifications(self, conn_string):
+        with environ({"DAGSTER_POSTGRES_EVENT_WATCHER_LISTEN_NOTIFY": "1"}):
+            with _clean_storage(conn_string) as storage:
+                run_id = make_new_run_id()
+                watched = []
+                storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+
+                # let the watcher back off while the run is idle, so that events are only picked
+                # up promptly if the watcher is woken by the notification
+                time.sleep(4)
+                storage.store_event(create_test_event_log_record(str(1), run_id=run_id))
+
+                attempts = 10
+                while not watched and attempts > 0:
+                    time.sleep(0.1)
+                    attempts -= 1
+                assert [int(evt.message) for evt in watched] == [1]
+
+        gc.collect()
+        assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
+
     def test_load_from_config(self, hostname):
         url_cfg = f"""
         event_log_storage: